@@ -22,6 +22,7 @@
 #include "ImathNamespace.h"
 
 #include <math.h>
+#include <stdint.h>
 #include <stdlib.h>
 
 IMATH_INTERNAL_NAMESPACE_HEADER_ENTER
@@ -84,6 +85,61 @@ private:
     unsigned short int _state[3];
 };
 
+/// Counter-based random-number generator; generates a uniformly
+/// distributed sequence with a period length of 2^64.
+///
+/// The n-th value of the sequence depends only on the seed and on n,
+/// so the generator can skip ahead any number of values at once, and
+/// can hand out independent streams, for example one per element of
+/// an array, that can be used on separate threads without sharing
+/// any state.  The values are those of the SplitMix64 generator.
+class Rand64
+{
+public:
+    /// Constructor, given a seed
+    IMATH_HOSTDEVICE Rand64 (uint64_t seed = 0);
+
+    /// Re-initialize with a given seed
+    IMATH_HOSTDEVICE void init (uint64_t seed);
+
+    /// Get the next value in the sequence (range: [false, true])
+    IMATH_HOSTDEVICE bool nextb ();
+
+    /// Get the next value in the sequence (range: [0 ... 0xffffffffffffffff])
+    IMATH_HOSTDEVICE uint64_t nexti ();
+
+    /// Get the next value in the sequence (range: [0 ... 1[)
+    IMATH_HOSTDEVICE double nextf ();
+
+    /// Get the next value in the sequence (range [rangeMin ... rangeMax[)
+    IMATH_HOSTDEVICE double nextf (double rangeMin, double rangeMax);
+
+    /// Skip the next n values of the sequence
+    IMATH_HOSTDEVICE void skip (uint64_t n);
+
+    /// The position in the sequence: the number of values generated
+    /// or skipped since the generator was initialized
+    IMATH_HOSTDEVICE uint64_t counter () const;
+
+    /// Move to the given position in the sequence
+    IMATH_HOSTDEVICE void setCounter (uint64_t counter);
+
+    /// Return the value at the given position in the sequence,
+    /// without moving to it
+    IMATH_HOSTDEVICE uint64_t valueAt (uint64_t counter) const;
+
+    /// Return a generator, at the start of its sequence, for the
+    /// stream with the given index.  The streams of different
+    /// indices, and of different seeds, are independent.
+    IMATH_HOSTDEVICE Rand64 stream (uint64_t index) const;
+
+private:
+    IMATH_HOSTDEVICE static uint64_t mix (uint64_t x);
+
+    uint64_t _key;
+    uint64_t _counter;
+};
+
 /// Return random points uniformly distributed in a sphere with
 /// radius 1 around the origin (distance from origin <= 1).
 template <class Vec, class Rand>
@@ -199,6 +255,85 @@ Rand48::nextf (double rangeMin, double rangeMax)
     return rangeMin * (1 - f) + rangeMax * f;
 }
 
+IMATH_HOSTDEVICE inline uint64_t
+Rand64::mix (uint64_t x)
+{
+    x = (x ^ (x >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    x = (x ^ (x >> 27)) * 0x94d049bb133111ebULL;
+    return x ^ (x >> 31);
+}
+
+IMATH_HOSTDEVICE inline void
+Rand64::init (uint64_t seed)
+{
+    _key     = mix (seed ^ 0x5a5a5a5a5a5a5a5aULL);
+    _counter = 0;
+}
+
+IMATH_HOSTDEVICE inline Rand64::Rand64 (uint64_t seed)
+{
+    init (seed);
+}
+
+IMATH_HOSTDEVICE inline uint64_t
+Rand64::valueAt (uint64_t counter) const
+{
+    return mix (_key + (counter + 1) * 0x9e3779b97f4a7c15ULL);
+}
+
+IMATH_HOSTDEVICE inline bool
+Rand64::nextb ()
+{
+    return !!(nexti () & 0x8000000000000000ULL);
+}
+
+IMATH_HOSTDEVICE inline uint64_t
+Rand64::nexti ()
+{
+    return valueAt (_counter++);
+}
+
+IMATH_HOSTDEVICE inline double
+Rand64::nextf ()
+{
+    // The 53 most significant bits, scaled by 2^-53
+    return double (nexti () >> 11) * (1.0 / 9007199254740992.0);
+}
+
+IMATH_HOSTDEVICE inline double
+Rand64::nextf (double rangeMin, double rangeMax)
+{
+    double f = nextf ();
+    return rangeMin * (1 - f) + rangeMax * f;
+}
+
+IMATH_HOSTDEVICE inline void
+Rand64::skip (uint64_t n)
+{
+    _counter += n;
+}
+
+IMATH_HOSTDEVICE inline uint64_t
+Rand64::counter () const
+{
+    return _counter;
+}
+
+IMATH_HOSTDEVICE inline void
+Rand64::setCounter (uint64_t counter)
+{
+    _counter = counter;
+}
+
+IMATH_HOSTDEVICE inline Rand64
+Rand64::stream (uint64_t index) const
+{
+    Rand64 r;
+    r._key     = mix (_key ^ mix (index + 0x632be59bd9b4e019ULL));
+    r._counter = 0;
+    return r;
+}
+
 template <class Vec, class Rand>
 IMATH_HOSTDEVICE Vec
 solidSphereRand (Rand& rand)
@@ -19,6 +19,15 @@
 #include "half.h"
 #include <assert.h>
 
+#if (defined(__x86_64__) || defined(__i386__)) &&                              \
+    (defined(__GNUC__) || defined(__clang__))
+#    define IMATH_HALF_ARRAY_X86 1
+#    include <immintrin.h>
+#elif defined(__aarch64__) && (defined(__GNUC__) || defined(__clang__))
+#    define IMATH_HALF_ARRAY_NEON 1
+#    include <arm_neon.h>
+#endif
+
 using namespace std;
 
 #if defined(IMATH_DLL)
@@ -48,6 +57,245 @@ EXPORT_CONST const imath_half_uif_t *imath_half_to_float_table = imath_half_to_f
 
 // clang-format on
 
+//-------------------------------------------------------------
+// Conversion of arrays of halfs and floats.  Each loop converts
+// whole vectors at a time and finishes the remainder with
+// narrower instructions, or one value at a time.
+//-------------------------------------------------------------
+
+namespace
+{
+
+void
+halfToFloatScalar (const imath_half_bits_t* src, float* dst, size_t n)
+{
+#if !defined(IMATH_HALF_NO_LOOKUP_TABLE)
+    const imath_half_uif_t* table = imath_half_to_float_table;
+    for (size_t i = 0; i < n; ++i)
+        dst[i] = table[src[i]].f;
+#else
+    for (size_t i = 0; i < n; ++i)
+        dst[i] = imath_half_to_float (src[i]);
+#endif
+}
+
+void
+floatToHalfScalar (const float* src, imath_half_bits_t* dst, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        dst[i] = imath_float_to_half (src[i]);
+}
+
+//
+// Float to half, rounding toward zero: the bits below the half's
+// significand are dropped, and floats beyond HALF_MAX become HALF_MAX.
+//
+
+inline imath_half_bits_t
+floatToHalfTowardZero (float f)
+{
+    imath_half_uif_t v;
+    v.f = f;
+
+    uint32_t          ui  = (v.i & ~0x80000000);
+    imath_half_bits_t ret = ((v.i >> 16) & 0x8000);
+
+    if (ui >= 0x7f800000)
+    {
+        // inf or nan, as imath_float_to_half()
+        ret |= 0x7c00;
+        if (ui == 0x7f800000) return ret;
+        uint32_t m = (ui & 0x7fffff) >> 13;
+        return ret | (uint16_t) m | (uint16_t) (m == 0);
+    }
+
+    // too large, truncate to HALF_MAX
+    if (ui >= 0x47800000) return ret | 0x7bff;
+
+    // normalized half
+    if (ui >= 0x38800000) return ret | (uint16_t) ((ui - 0x38000000) >> 13);
+
+    // smaller than the smallest denormalized half
+    if (ui < 0x33800000) return ret;
+
+    // denormalized half
+    uint32_t shift = 0x7e - (ui >> 23);
+    return ret | (uint16_t) ((0x800000 | (ui & 0x7fffff)) >> shift);
+}
+
+void
+floatToHalfTowardZeroScalar (
+    const float* src, imath_half_bits_t* dst, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        dst[i] = floatToHalfTowardZero (src[i]);
+}
+
+#if IMATH_HALF_ARRAY_X86
+
+__attribute__ ((target ("avx,f16c"))) void
+halfToFloatF16C (const imath_half_bits_t* src, float* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8)
+        _mm256_storeu_ps (
+            dst + i,
+            _mm256_cvtph_ps (
+                _mm_loadu_si128 (reinterpret_cast<const __m128i*> (src + i))));
+    for (; i < n; ++i)
+        dst[i] = _cvtsh_ss (src[i]);
+}
+
+template <int Rounding>
+__attribute__ ((target ("avx,f16c"))) void
+floatToHalfF16C (const float* src, imath_half_bits_t* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 8 <= n; i += 8)
+        _mm_storeu_si128 (
+            reinterpret_cast<__m128i*> (dst + i),
+            _mm256_cvtps_ph (
+                _mm256_loadu_ps (src + i), Rounding | _MM_FROUND_NO_EXC));
+    for (; i < n; ++i)
+        dst[i] = _cvtss_sh (src[i], Rounding | _MM_FROUND_NO_EXC);
+}
+
+__attribute__ ((target ("avx512f,f16c"))) void
+halfToFloatAVX512 (const imath_half_bits_t* src, float* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16)
+        _mm512_storeu_ps (
+            dst + i,
+            _mm512_cvtph_ps (_mm256_loadu_si256 (
+                reinterpret_cast<const __m256i*> (src + i))));
+    halfToFloatF16C (src + i, dst + i, n - i);
+}
+
+template <int Rounding>
+__attribute__ ((target ("avx512f,f16c"))) void
+floatToHalfAVX512 (const float* src, imath_half_bits_t* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 16 <= n; i += 16)
+        _mm256_storeu_si256 (
+            reinterpret_cast<__m256i*> (dst + i),
+            _mm512_cvtps_ph (
+                _mm512_loadu_ps (src + i), Rounding | _MM_FROUND_NO_EXC));
+    floatToHalfF16C<Rounding> (src + i, dst + i, n - i);
+}
+
+#endif
+
+#if IMATH_HALF_ARRAY_NEON
+
+void
+halfToFloatNeon (const imath_half_bits_t* src, float* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4)
+        vst1q_f32 (
+            dst + i, vcvt_f32_f16 (vreinterpret_f16_u16 (vld1_u16 (src + i))));
+    halfToFloatScalar (src + i, dst + i, n - i);
+}
+
+// Rounds with the FPCR rounding mode, which is to nearest, ties to even
+void
+floatToHalfNeon (const float* src, imath_half_bits_t* dst, size_t n)
+{
+    size_t i = 0;
+    for (; i + 4 <= n; i += 4)
+        vst1_u16 (
+            dst + i, vreinterpret_u16_f16 (vcvt_f16_f32 (vld1q_f32 (src + i))));
+    floatToHalfScalar (src + i, dst + i, n - i);
+}
+
+#endif
+
+struct ConversionTable
+{
+    void (*toFloat) (const imath_half_bits_t*, float*, size_t);
+    void (*toHalfNearestEven) (const float*, imath_half_bits_t*, size_t);
+    void (*toHalfTowardZero) (const float*, imath_half_bits_t*, size_t);
+    const char* name;
+};
+
+//
+// The conversions are chosen once, by the instructions the processor
+// supports, rather than by the flags the library was compiled with.
+//
+
+const ConversionTable&
+conversionTable ()
+{
+    static const ConversionTable table = [] {
+        ConversionTable t = {
+            &halfToFloatScalar,
+            &floatToHalfScalar,
+            &floatToHalfTowardZeroScalar,
+            "none"};
+#if IMATH_HALF_ARRAY_X86
+        __builtin_cpu_init ();
+        if (__builtin_cpu_supports ("avx512f") &&
+            __builtin_cpu_supports ("f16c"))
+        {
+            t = {
+                &halfToFloatAVX512,
+                &floatToHalfAVX512<_MM_FROUND_TO_NEAREST_INT>,
+                &floatToHalfAVX512<_MM_FROUND_TO_ZERO>,
+                "avx512f"};
+        }
+        else if (
+            __builtin_cpu_supports ("avx") && __builtin_cpu_supports ("f16c"))
+        {
+            t = {
+                &halfToFloatF16C,
+                &floatToHalfF16C<_MM_FROUND_TO_NEAREST_INT>,
+                &floatToHalfF16C<_MM_FROUND_TO_ZERO>,
+                "f16c"};
+        }
+#elif IMATH_HALF_ARRAY_NEON
+        t.toFloat           = &halfToFloatNeon;
+        t.toHalfNearestEven = &floatToHalfNeon;
+        t.name              = "neon";
+#endif
+        return t;
+    }();
+
+    return table;
+}
+
+} // namespace
+
+extern "C" {
+
+IMATH_EXPORT void
+imath_half_to_float_array (const imath_half_bits_t* src, float* dst, size_t n)
+{
+    conversionTable ().toFloat (src, dst, n);
+}
+
+IMATH_EXPORT void
+imath_float_to_half_array (
+    const float*               src,
+    imath_half_bits_t*         dst,
+    size_t                     n,
+    imath_half_rounding_mode_t mode)
+{
+    if (mode == IMATH_HALF_ROUND_TOWARD_ZERO)
+        conversionTable ().toHalfTowardZero (src, dst, n);
+    else
+        conversionTable ().toHalfNearestEven (src, dst, n);
+}
+
+IMATH_EXPORT const char*
+imath_half_array_instruction_set (void)
+{
+    return conversionTable ().name;
+}
+
+} // extern "C"
+
 //---------------------
 // Stream I/O operators
 //---------------------
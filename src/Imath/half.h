@@ -159,6 +159,16 @@
 ///
 ///     #define IMATH_HALF_ENABLE_FP_EXCEPTIONS
 ///
+/// **Conversion of Arrays:**
+///
+/// ``imath_half_to_float_array()`` and ``imath_float_to_half_array()``
+/// convert whole arrays of values.  They choose, at run time, the
+/// widest conversion instructions the processor supports: AVX-512F or
+/// F16C on x86, and NEON on 64-bit ARM.  Otherwise they fall back to
+/// the lookup table and the bit-shifting algorithm.  This makes the
+/// fast path available even when the library is compiled without
+/// ``-mf16c``.
+///
 /// **Conversion Performance Comparison:**
 ///
 /// Testing on a Core i9, the timings are approximately:
@@ -187,6 +197,7 @@
 #    include <immintrin.h>
 #endif
 
+#include <stddef.h>
 #include <stdint.h>
 #include <stdio.h>
 
@@ -442,6 +453,53 @@ imath_float_to_half (float f)
 #endif
 }
 
+///
+/// Rounding modes for imath_float_to_half_array()
+///
+
+typedef enum imath_half_rounding_mode
+{
+    /// Round to the nearest half, ties to even, as imath_float_to_half()
+    IMATH_HALF_ROUND_NEAREST_EVEN = 0,
+    /// Round toward zero; finite floats never become infinities
+    IMATH_HALF_ROUND_TOWARD_ZERO = 1
+} imath_half_rounding_mode_t;
+
+#if defined(__cplusplus)
+extern "C" {
+#endif
+
+///
+/// Convert n halfs to floats.  The results are the same as those of
+/// imath_half_to_float(), apart from the bits of NaN significands.
+///
+
+IMATH_EXPORT void imath_half_to_float_array (
+    const imath_half_bits_t* src, float* dst, size_t n);
+
+///
+/// Convert n floats to halfs, rounded with the given mode.  Rounding
+/// to the nearest even gives the same results as
+/// imath_float_to_half(), apart from the bits of NaN significands.
+///
+
+IMATH_EXPORT void imath_float_to_half_array (
+    const float*               src,
+    imath_half_bits_t*         dst,
+    size_t                     n,
+    imath_half_rounding_mode_t mode);
+
+///
+/// The name of the instructions used by the array conversions:
+/// "avx512f", "f16c", "neon", or "none".
+///
+
+IMATH_EXPORT const char* imath_half_array_instruction_set (void);
+
+#if defined(__cplusplus)
+} // extern "C"
+#endif
+
 ////////////////////////////////////////
 
 #ifdef __cplusplus
@@ -0,0 +1,305 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+//---------------------------------------------------------------------------
+//
+//	halfFunctionCache and halfFunctionFill --
+//	implementation of the non-template parts of halfFunction
+//
+//---------------------------------------------------------------------------
+
+#include "halfFunction.h"
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <exception>
+#include <functional>
+#include <map>
+#include <mutex>
+#include <stdint.h>
+#include <stdio.h>
+#include <string.h>
+#include <system_error>
+#include <thread>
+#include <vector>
+
+using namespace std;
+
+//----------------------------------------------------------------
+// Cache files hold a header, the key and the table.  The byte
+// order mark rejects files written on machines of the other byte
+// order, and the key guards against collisions of the file names.
+//----------------------------------------------------------------
+
+namespace
+{
+
+const char     cacheMagic[8]  = {'I', 'M', 'H', 'F', 'L', 'U', 'T', '\n'};
+const uint32_t cacheVersion   = 1;
+const uint32_t cacheByteOrder = 0x01020304;
+
+//
+// The file name of a table: the 64-bit FNV-1a hash of its key
+//
+
+string
+cacheFileName (const string& directory, const string& key)
+{
+    uint64_t hash = 0xcbf29ce484222325ull;
+
+    for (size_t i = 0; i < key.size (); ++i)
+    {
+        hash ^= (unsigned char) key[i];
+        hash *= 0x100000001b3ull;
+    }
+
+    char name[32];
+    snprintf (
+        name,
+        sizeof (name),
+        "%016llx.hflut",
+        (unsigned long long) hash);
+
+    return directory + "/" + name;
+}
+
+bool
+readCacheFile (const string& path, const string& key, vector<char>& table)
+{
+    FILE* file = fopen (path.c_str (), "rb");
+
+    if (!file) return false;
+
+    char     magic[sizeof (cacheMagic)];
+    uint32_t version   = 0;
+    uint32_t byteOrder = 0;
+    uint64_t keySize   = 0;
+    uint64_t tableSize = 0;
+    string   fileKey;
+
+    bool ok = fread (magic, sizeof (magic), 1, file) == 1 &&
+              memcmp (magic, cacheMagic, sizeof (magic)) == 0 &&
+              fread (&version, sizeof (version), 1, file) == 1 &&
+              version == cacheVersion &&
+              fread (&byteOrder, sizeof (byteOrder), 1, file) == 1 &&
+              byteOrder == cacheByteOrder &&
+              fread (&keySize, sizeof (keySize), 1, file) == 1 &&
+              keySize == key.size ();
+
+    if (ok)
+    {
+        fileKey.resize (key.size ());
+        ok = fread (&fileKey[0], 1, key.size (), file) == key.size () &&
+             fileKey == key &&
+             fread (&tableSize, sizeof (tableSize), 1, file) == 1 &&
+             tableSize == table.size () &&
+             fread (table.data (), 1, table.size (), file) == table.size ();
+    }
+
+    fclose (file);
+    return ok;
+}
+
+//
+// Write the file under a temporary name and rename it, so that
+// other processes never read a partly written table.
+//
+
+void
+writeCacheFile (const string& path, const string& key, const vector<char>& table)
+{
+    char suffix[64];
+    snprintf (
+        suffix,
+        sizeof (suffix),
+        ".%llx.%llx.tmp",
+        (unsigned long long) hash<thread::id> () (this_thread::get_id ()),
+        (unsigned long long) chrono::steady_clock::now ()
+            .time_since_epoch ()
+            .count ());
+
+    string tmpPath = path + suffix;
+    FILE*  file    = fopen (tmpPath.c_str (), "wb");
+
+    if (!file) return;
+
+    uint64_t keySize   = key.size ();
+    uint64_t tableSize = table.size ();
+
+    bool ok = fwrite (cacheMagic, sizeof (cacheMagic), 1, file) == 1 &&
+              fwrite (&cacheVersion, sizeof (cacheVersion), 1, file) == 1 &&
+              fwrite (&cacheByteOrder, sizeof (cacheByteOrder), 1, file) ==
+                  1 &&
+              fwrite (&keySize, sizeof (keySize), 1, file) == 1 &&
+              fwrite (key.data (), 1, key.size (), file) == key.size () &&
+              fwrite (&tableSize, sizeof (tableSize), 1, file) == 1 &&
+              fwrite (table.data (), 1, table.size (), file) == table.size ();
+
+    ok = fclose (file) == 0 && ok;
+
+    if (!ok || rename (tmpPath.c_str (), path.c_str ()) != 0)
+        remove (tmpPath.c_str ());
+}
+
+} // namespace
+
+//-------------------
+// halfFunctionCache
+//-------------------
+
+struct halfFunctionCache::Data
+{
+    string                    directory;
+    mutable mutex             lock;
+    map<string, vector<char>> tables;
+};
+
+halfFunctionCache::halfFunctionCache (const string& directory)
+    : _data (new Data)
+{
+    _data->directory = directory;
+}
+
+halfFunctionCache::~halfFunctionCache ()
+{
+    delete _data;
+}
+
+const string&
+halfFunctionCache::directory () const
+{
+    return _data->directory;
+}
+
+bool
+halfFunctionCache::find (const string& key, void* table, size_t size) const
+{
+    {
+        lock_guard<mutex> lock (_data->lock);
+
+        map<string, vector<char>>::const_iterator i = _data->tables.find (key);
+
+        if (i != _data->tables.end () && i->second.size () == size)
+        {
+            memcpy (table, i->second.data (), size);
+            return true;
+        }
+    }
+
+    if (_data->directory.empty ()) return false;
+
+    vector<char> fileTable (size);
+
+    if (!readCacheFile (
+            cacheFileName (_data->directory, key), key, fileTable))
+        return false;
+
+    memcpy (table, fileTable.data (), size);
+
+    lock_guard<mutex> lock (_data->lock);
+    _data->tables[key].swap (fileTable);
+    return true;
+}
+
+void
+halfFunctionCache::insert (const string& key, const void* table, size_t size)
+{
+    const char*  bytes = static_cast<const char*> (table);
+    vector<char> copy (bytes, bytes + size);
+
+    if (!_data->directory.empty ())
+        writeCacheFile (cacheFileName (_data->directory, key), key, copy);
+
+    lock_guard<mutex> lock (_data->lock);
+    _data->tables[key].swap (copy);
+}
+
+void
+halfFunctionCache::clear (bool removeFiles)
+{
+    lock_guard<mutex> lock (_data->lock);
+
+    if (removeFiles && !_data->directory.empty ())
+    {
+        for (map<string, vector<char>>::const_iterator i =
+                 _data->tables.begin ();
+             i != _data->tables.end ();
+             ++i)
+        {
+            remove (cacheFileName (_data->directory, i->first).c_str ());
+        }
+    }
+
+    _data->tables.clear ();
+}
+
+//-------------------
+// halfFunctionFill
+//-------------------
+
+void
+halfFunctionFill (
+    void (*fill) (void* context, int begin, int end),
+    void*        context,
+    unsigned int numThreads)
+{
+    //
+    // The threads take slices of the bit patterns in turn, so that
+    // they share the work evenly even when the function is much
+    // slower in some parts of its domain than in others.
+    //
+
+    const int numValues = 1 << 16;
+    const int sliceSize = 1 << 10;
+
+    if (numThreads == 0) numThreads = max (thread::hardware_concurrency (), 1u);
+
+    numThreads = min (numThreads, unsigned (numValues / sliceSize));
+
+    atomic<int>   next (0);
+    atomic<bool>  failed (false);
+    exception_ptr error;
+    mutex         errorLock;
+
+    auto work = [&] () {
+        int begin;
+
+        while (!failed && (begin = next.fetch_add (sliceSize)) < numValues)
+        {
+            try
+            {
+                fill (context, begin, begin + sliceSize);
+            }
+            catch (...)
+            {
+                lock_guard<mutex> lock (errorLock);
+                if (!error) error = current_exception ();
+                failed = true;
+            }
+        }
+    };
+
+    vector<thread> threads;
+
+    for (unsigned int i = 1; i < numThreads; ++i)
+    {
+        try
+        {
+            threads.push_back (thread (work));
+        }
+        catch (const system_error&)
+        {
+            break; // carry on with the threads we have
+        }
+    }
+
+    work ();
+
+    for (size_t i = 0; i < threads.size (); ++i)
+        threads[i].join ();
+
+    if (error) rethrow_exception (error);
+}
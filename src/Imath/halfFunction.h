@@ -44,6 +44,30 @@
 //	    half x = hsin (1);
 //	    half y = hsqrt (3.5);
 //
+//	The table can be built on several threads, by passing the number
+//	of threads as the last constructor argument, or 0 for one thread
+//	per processor.  The function must then be safe to call from
+//	several threads at once.
+//
+//	    halfFunction<float> hexp (expf, -HALF_MAX, HALF_MAX,
+//				      0, HALF_MAX, 0, 0, 0);
+//
+//	Tables can also be shared through a halfFunctionCache, under a
+//	key that names the function.  The first halfFunction with a given
+//	key, domain and values builds the table and stores a copy in the
+//	cache; later ones copy the table from the cache instead of calling
+//	the function.  A cache that is given a directory also saves its
+//	tables there, so that they can be reused by other processes.
+//	Caching requires a trivially copyable T.
+//
+//	    static halfFunctionCache cache ("/var/tmp/luts");
+//
+//	    halfFunction<half> gamma (cache, "gamma 2.2", gamma22);
+//
+//	The table can be applied to a whole array of halfs at once:
+//
+//	    gamma (in, out, n);
+//
 //---------------------------------------------------------------------------
 
 #ifndef _HALF_FUNCTION_H_
@@ -59,24 +83,103 @@
 #else
 #endif
 
+#include "ImathExport.h"
+
 #include <float.h>
+#include <stddef.h>
+#include <string>
+#include <type_traits>
+#include <typeinfo>
+
+//-----------------------------------------------------------------
+// halfFunctionCache -- tables of halfFunctions, by key, in memory
+// and, if the cache has a directory, in files in that directory.
+// The cache may be used from several threads at once.  Failures to
+// read or write the files are ignored; the tables are then built
+// again.
+//-----------------------------------------------------------------
+
+class IMATH_EXPORT_TYPE halfFunctionCache
+{
+public:
+    IMATH_EXPORT explicit halfFunctionCache (
+        const std::string& directory = std::string ());
+    IMATH_EXPORT ~halfFunctionCache ();
+
+    halfFunctionCache (const halfFunctionCache&)            = delete;
+    halfFunctionCache& operator= (const halfFunctionCache&) = delete;
+
+    IMATH_EXPORT const std::string& directory () const;
+
+    //
+    // Copy the table with the given key, of the given size in
+    // bytes, into table.  Returns false if there is no such table.
+    //
+
+    IMATH_EXPORT bool
+    find (const std::string& key, void* table, size_t size) const;
+
+    //
+    // Store a copy of a table under the given key.
+    //
+
+    IMATH_EXPORT void
+    insert (const std::string& key, const void* table, size_t size);
+
+    //
+    // Remove the tables from memory and, if removeFiles is true, the
+    // files of those tables from the directory.
+    //
+
+    IMATH_EXPORT void clear (bool removeFiles = false);
+
+private:
+    struct Data;
+    Data* _data;
+};
+
+//------------------------------------------------------------------
+// Call fill (context, begin, end) for ranges of the 65536 half bit
+// patterns that together cover all of them, on up to numThreads
+// threads, or one thread per processor if numThreads is 0.  An
+// exception thrown by fill is rethrown once all threads are done.
+//------------------------------------------------------------------
+
+IMATH_EXPORT void halfFunctionFill (
+    void (*fill) (void* context, int begin, int end),
+    void*        context,
+    unsigned int numThreads);
 
 template <class T> class halfFunction
 {
 public:
-    //------------
-    // Constructor
-    //------------
+    //-------------
+    // Constructors
+    //-------------
 
     template <class Function>
     halfFunction (
-        Function f,
-        half     domainMin    = -HALF_MAX,
-        half     domainMax    = HALF_MAX,
-        T        defaultValue = 0,
-        T        posInfValue  = 0,
-        T        negInfValue  = 0,
-        T        nanValue     = 0);
+        Function     f,
+        half         domainMin    = -HALF_MAX,
+        half         domainMax    = HALF_MAX,
+        T            defaultValue = 0,
+        T            posInfValue  = 0,
+        T            negInfValue  = 0,
+        T            nanValue     = 0,
+        unsigned int numThreads   = 1);
+
+    template <class Function>
+    halfFunction (
+        halfFunctionCache& cache,
+        const std::string& key,
+        Function           f,
+        half               domainMin    = -HALF_MAX,
+        half               domainMax    = HALF_MAX,
+        T                  defaultValue = 0,
+        T                  posInfValue  = 0,
+        T                  negInfValue  = 0,
+        T                  nanValue     = 0,
+        unsigned int       numThreads   = 1);
 
 #ifndef IMATH_HAVE_LARGE_STACK
     ~halfFunction () { delete[] _lut; }
@@ -92,7 +195,26 @@ public:
 
     T operator() (half x) const;
 
+    //
+    // Evaluate the function for the n halfs in x, into y.
+    //
+
+    void operator() (const half* x, T* y, size_t n) const;
+
 private:
+    template <class Function> struct Fill;
+
+    template <class Function>
+    void fill (
+        Function&    f,
+        half         domainMin,
+        half         domainMax,
+        T            defaultValue,
+        T            posInfValue,
+        T            negInfValue,
+        T            nanValue,
+        unsigned int numThreads);
+
 #ifdef IMATH_HAVE_LARGE_STACK
     T _lut[1 << 16];
 #else
@@ -104,35 +226,171 @@ private:
 // Implementation
 //---------------
 
+template <class T> template <class Function> struct halfFunction<T>::Fill
+{
+    Function& f;
+    half      domainMin;
+    half      domainMax;
+    T         defaultValue;
+    T         posInfValue;
+    T         negInfValue;
+    T         nanValue;
+    T*        lut;
+
+    static void apply (void* context, int begin, int end)
+    {
+        const Fill& c = *static_cast<const Fill*> (context);
+
+        for (int i = begin; i < end; i++)
+        {
+            half x;
+            x.setBits (i);
+
+            if (x.isNan ())
+                c.lut[i] = c.nanValue;
+            else if (x.isInfinity ())
+                c.lut[i] = x.isNegative () ? c.negInfValue : c.posInfValue;
+            else if (x < c.domainMin || x > c.domainMax)
+                c.lut[i] = c.defaultValue;
+            else
+                c.lut[i] = c.f (x);
+        }
+    }
+};
+
+template <class T>
+template <class Function>
+void
+halfFunction<T>::fill (
+    Function&    f,
+    half         domainMin,
+    half         domainMax,
+    T            defaultValue,
+    T            posInfValue,
+    T            negInfValue,
+    T            nanValue,
+    unsigned int numThreads)
+{
+    Fill<Function> context = {
+        f,
+        domainMin,
+        domainMax,
+        defaultValue,
+        posInfValue,
+        negInfValue,
+        nanValue,
+        _lut};
+
+    if (numThreads == 1)
+        Fill<Function>::apply (&context, 0, 1 << 16);
+    else
+        halfFunctionFill (&Fill<Function>::apply, &context, numThreads);
+}
+
 template <class T>
 template <class Function>
 halfFunction<T>::halfFunction (
-    Function f,
-    half     domainMin,
-    half     domainMax,
-    T        defaultValue,
-    T        posInfValue,
-    T        negInfValue,
-    T        nanValue)
+    Function     f,
+    half         domainMin,
+    half         domainMax,
+    T            defaultValue,
+    T            posInfValue,
+    T            negInfValue,
+    T            nanValue,
+    unsigned int numThreads)
 {
 #ifndef IMATH_HAVE_LARGE_STACK
     _lut = new T[1 << 16];
+
+    try
+    {
+#endif
+        fill (
+            f,
+            domainMin,
+            domainMax,
+            defaultValue,
+            posInfValue,
+            negInfValue,
+            nanValue,
+            numThreads);
+#ifndef IMATH_HAVE_LARGE_STACK
+    }
+    catch (...)
+    {
+        delete[] _lut;
+        throw;
+    }
 #endif
+}
+
+template <class T>
+template <class Function>
+halfFunction<T>::halfFunction (
+    halfFunctionCache& cache,
+    const std::string& key,
+    Function           f,
+    half               domainMin,
+    half               domainMax,
+    T                  defaultValue,
+    T                  posInfValue,
+    T                  negInfValue,
+    T                  nanValue,
+    unsigned int       numThreads)
+{
+    static_assert (
+        std::is_trivially_copyable<T>::value,
+        "halfFunctionCache requires a trivially copyable type");
 
-    for (int i = 0; i < (1 << 16); i++)
+    //
+    // The key of the table in the cache is made of the given key, the
+    // type of the values, and the bytes of the domain and values, so
+    // that tables of the same function over different domains don't
+    // collide.
+    //
+
+    std::string fullKey = key;
+    fullKey += '\0';
+    fullKey += typeid (T).name ();
+    fullKey += '\0';
+
+    const half bounds[] = {domainMin, domainMax};
+    const T    values[] = {defaultValue, posInfValue, negInfValue, nanValue};
+    fullKey.append (reinterpret_cast<const char*> (bounds), sizeof (bounds));
+    fullKey.append (reinterpret_cast<const char*> (values), sizeof (values));
+
+    const size_t size = sizeof (T) << 16;
+
+#ifndef IMATH_HAVE_LARGE_STACK
+    _lut = new T[1 << 16];
+#endif
+
+#ifndef IMATH_HAVE_LARGE_STACK
+    try
     {
-        half x;
-        x.setBits (i);
-
-        if (x.isNan ())
-            _lut[i] = nanValue;
-        else if (x.isInfinity ())
-            _lut[i] = x.isNegative () ? negInfValue : posInfValue;
-        else if (x < domainMin || x > domainMax)
-            _lut[i] = defaultValue;
-        else
-            _lut[i] = f (x);
+#endif
+        if (!cache.find (fullKey, _lut, size))
+        {
+            fill (
+                f,
+                domainMin,
+                domainMax,
+                defaultValue,
+                posInfValue,
+                negInfValue,
+                nanValue,
+                numThreads);
+
+            cache.insert (fullKey, _lut, size);
+        }
+#ifndef IMATH_HAVE_LARGE_STACK
     }
+    catch (...)
+    {
+        delete[] _lut;
+        throw;
+    }
+#endif
 }
 
 template <class T>
@@ -142,6 +400,14 @@ halfFunction<T>::operator() (half x) const
     return _lut[x.bits ()];
 }
 
+template <class T>
+inline void
+halfFunction<T>::operator() (const half* x, T* y, size_t n) const
+{
+    for (size_t i = 0; i < n; i++)
+        y[i] = _lut[x[i].bits ()];
+}
+
 /// @endcond
 
 #endif
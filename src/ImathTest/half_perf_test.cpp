@@ -356,6 +356,59 @@ perf_test_float_to_half (uint16_t* halfs, const float* floats, int numentries)
         ((long long) (onanos - nnanos)));
 }
 
+void
+perf_test_half_to_float_array (
+    float* floats, const uint16_t* halfs, int numentries)
+{
+    int64_t st = get_ticks ();
+    for (int i = 0; i < numentries; ++i)
+        floats[i] = imath_half_to_float (halfs[i]);
+    int64_t et = get_ticks ();
+
+    int64_t ast = get_ticks ();
+    imath_half_to_float_array (halfs, floats, numentries);
+    int64_t aet = get_ticks ();
+
+    int64_t lnanos = (et - st);
+    int64_t ananos = (aet - ast);
+    fprintf (
+        stderr,
+        "half -> float Loop: %10lld (%g ns) Array (%s): %10lld (%g ns) (%10lld)\n",
+        (long long) lnanos,
+        (double) lnanos / ((double) numentries),
+        imath_half_array_instruction_set (),
+        (long long) ananos,
+        (double) ananos / ((double) numentries),
+        ((long long) (lnanos - ananos)));
+}
+
+void
+perf_test_float_to_half_array (
+    uint16_t* halfs, const float* floats, int numentries)
+{
+    int64_t st = get_ticks ();
+    for (int i = 0; i < numentries; ++i)
+        halfs[i] = imath_float_to_half (floats[i]);
+    int64_t et = get_ticks ();
+
+    int64_t ast = get_ticks ();
+    imath_float_to_half_array (
+        floats, halfs, numentries, IMATH_HALF_ROUND_NEAREST_EVEN);
+    int64_t aet = get_ticks ();
+
+    int64_t lnanos = (et - st);
+    int64_t ananos = (aet - ast);
+    fprintf (
+        stderr,
+        "float -> half Loop: %10lld (%g ns) Array (%s): %10lld (%g ns) (%10lld)\n",
+        (long long) lnanos,
+        (double) lnanos / ((double) numentries),
+        imath_half_array_instruction_set (),
+        (long long) ananos,
+        (double) ananos / ((double) numentries),
+        ((long long) (lnanos - ananos)));
+}
+
 int
 main (int argc, char* argv[])
 {
@@ -386,11 +439,13 @@ main (int argc, char* argv[])
                 floats[i] = imath_half_to_float (halfs[i]);
             }
             perf_test_half_to_float (floats, halfs, numentries);
+            perf_test_half_to_float_array (floats, halfs, numentries);
 
             // test float -> half with real-world values
             for (int i = 0; i < numentries; ++i)
                 floats[i] = float(r.nextf(-65504, 65504));
             perf_test_float_to_half (halfs, floats, numentries);
+            perf_test_float_to_half_array (halfs, floats, numentries);
         }
 
         delete[] halfs;
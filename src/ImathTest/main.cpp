@@ -20,6 +20,7 @@
 #include "testFrustumTest.h"
 #include "testFun.h"
 #include "testFunction.h"
+#include "testHalfArray.h"
 #include "testInterop.h"
 #include "testNoInterop.h"
 #include "testInterval.h"
@@ -53,6 +54,7 @@ main (int argc, char* argv[])
     // NB: If you add a test here, make sure to enumerate it in the
     // CMakeLists.txt so it runs as part of the test suite
     TEST (testToFloat);
+    TEST (testHalfArray);
     TEST (testSize);
     TEST (testArithmetic);
     TEST (testNormalizedConversionError);
@@ -10,7 +10,12 @@
 #include "testFunction.h"
 #include "halfFunction.h"
 #include <assert.h>
+#include <atomic>
 #include <iostream>
+#include <stdexcept>
+#include <stdlib.h>
+#include <string>
+#include <vector>
 
 using namespace std;
 
@@ -30,6 +35,219 @@ struct timesN
     float n;
 };
 
+struct counted
+{
+    counted (std::atomic<int>& calls, float n) : calls (calls), n (n) {}
+    float operator() (float x) const
+    {
+        ++calls;
+        return x * n;
+    }
+    std::atomic<int>& calls;
+    float             n;
+};
+
+struct throwsAbove
+{
+    float operator() (float x) const
+    {
+        if (x > 1000) throw std::domain_error ("x > 1000");
+        return x;
+    }
+};
+
+std::string
+tempDirectory ()
+{
+#ifdef _WIN32
+    const char* dir = getenv ("TEMP");
+    return dir ? dir : ".";
+#else
+    const char* dir = getenv ("TMPDIR");
+    return dir ? dir : "/tmp";
+#endif
+}
+
+//
+// Every half value, and the values of a function for all of them
+//
+
+std::vector<half>
+allHalfs ()
+{
+    std::vector<half> x (1 << 16);
+    for (int i = 0; i < (1 << 16); i++)
+        x[i].setBits (i);
+    return x;
+}
+
+template <class T>
+std::vector<T>
+values (const halfFunction<T>& f)
+{
+    std::vector<half> x = allHalfs ();
+    std::vector<T>    y (x.size ());
+    f (x.data (), y.data (), x.size ());
+    return y;
+}
+
+bool
+sameValues (const std::vector<half>& a, const std::vector<half>& b)
+{
+    for (size_t i = 0; i < a.size (); i++)
+        if (a[i].bits () != b[i].bits ()) return false;
+    return true;
+}
+
+void
+testParallel ()
+{
+    cout << "parallel construction\n";
+
+    halfFunction<half> serial (
+        timesN (3), -HALF_MAX / 4, HALF_MAX / 4, -1, 1, 2, 3);
+
+    for (unsigned int threads = 0; threads < 5; threads++)
+    {
+        halfFunction<half> parallel (
+            timesN (3), -HALF_MAX / 4, HALF_MAX / 4, -1, 1, 2, 3, threads);
+
+        assert (sameValues (values (serial), values (parallel)));
+    }
+
+    //
+    // An exception thrown by the function on any thread
+    // reaches the caller.
+    //
+
+    for (unsigned int threads = 1; threads < 5; threads++)
+    {
+        bool caught = false;
+
+        try
+        {
+            halfFunction<float> f (
+                throwsAbove (), -HALF_MAX, HALF_MAX, 0, 0, 0, 0, threads);
+        }
+        catch (const std::domain_error&)
+        {
+            caught = true;
+        }
+
+        assert (caught);
+    }
+}
+
+void
+testBatch ()
+{
+    cout << "batch evaluation\n";
+
+    halfFunction<float> d2 (divideByTwo);
+
+    std::vector<half>  x = allHalfs ();
+    std::vector<float> y = values (d2);
+
+    for (size_t i = 0; i < x.size (); i++)
+        assert (y[i] == d2 (x[i]) || (y[i] != y[i] && d2 (x[i]) != d2 (x[i])));
+
+    float z = -1;
+    d2 (x.data (), &z, 0);
+    assert (z == -1);
+}
+
+void
+testCache ()
+{
+    cout << "halfFunctionCache\n";
+
+    std::atomic<int> calls (0);
+
+    //
+    // In memory: a second function with the same key and domain
+    // copies the table, without calling the function.
+    //
+
+    halfFunctionCache cache;
+
+    halfFunction<half> a (cache, "times 5", counted (calls, 5), 0, HALF_MAX / 8);
+    assert (calls > 0);
+    assert (a (2) == 10);
+
+    calls = 0;
+    halfFunction<half> b (cache, "times 5", counted (calls, 5), 0, HALF_MAX / 8);
+    assert (calls == 0);
+    assert (sameValues (values (a), values (b)));
+
+    //
+    // A different domain, default value, key or type makes a
+    // different table.
+    //
+
+    halfFunction<half> c (cache, "times 5", counted (calls, 5), 0, HALF_MAX / 4);
+    assert (calls > 0);
+    assert (c (HALF_MAX / 5) != -1);
+
+    calls = 0;
+    halfFunction<half> d (
+        cache, "times 5", counted (calls, 5), 0, HALF_MAX / 8, -1);
+    assert (calls > 0);
+    assert (d (-2) == -1);
+
+    calls = 0;
+    halfFunction<half> e (cache, "times 6", counted (calls, 6), 0, HALF_MAX / 8);
+    assert (calls > 0);
+    assert (e (2) == 12);
+
+    calls = 0;
+    halfFunction<float> f (
+        cache, "times 5", counted (calls, 5), 0, HALF_MAX / 8);
+    assert (calls > 0);
+    assert (f (2) == 10);
+
+    cache.clear ();
+    calls = 0;
+    halfFunction<half> g (cache, "times 5", counted (calls, 5), 0, HALF_MAX / 8);
+    assert (calls > 0);
+
+    //
+    // On disk: a cache in another process, here another cache
+    // object, reads the table from the file.  The key alone
+    // identifies the table, so the function passed with it
+    // is not called.
+    //
+
+    std::string key = "testFunction divideByTwo";
+
+    halfFunctionCache written (tempDirectory ());
+    halfFunction<float> h (written, key, divideByTwo, -100, 100, 7);
+
+    calls = 0;
+    halfFunctionCache read (tempDirectory ());
+    halfFunction<float> i (read, key, counted (calls, 3), -100, 100, 7);
+    assert (calls == 0);
+    assert (i (4) == 2);
+    assert (i (200) == 7);
+
+    written.clear (true);
+    read.clear ();
+
+    halfFunctionCache removed (tempDirectory ());
+    halfFunction<float> j (removed, key, counted (calls, 3), -100, 100, 7);
+    assert (calls > 0);
+    assert (j (4) == 12);
+    removed.clear (true);
+
+    //
+    // Construction in parallel, through a cache
+    //
+
+    halfFunction<half> k (
+        cache, "times 3", timesN (3), -HALF_MAX / 4, HALF_MAX / 4, -1, 1, 2, 3, 4);
+    halfFunction<half> l (timesN (3), -HALF_MAX / 4, HALF_MAX / 4, -1, 1, 2, 3);
+    assert (sameValues (values (k), values (l)));
+}
+
 } // namespace
 
 void
@@ -71,5 +289,9 @@ testFunction ()
 
     assert (t5 (half::qNan ()).isNan ());
 
+    testParallel ();
+    testBatch ();
+    testCache ();
+
     cout << "ok\n\n" << flush;
 }
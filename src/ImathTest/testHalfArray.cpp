@@ -0,0 +1,185 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+#ifdef NDEBUG
+#    undef NDEBUG
+#endif
+
+#include "testHalfArray.h"
+#include <ImathRandom.h>
+#include <assert.h>
+#include <cmath>
+#include <half.h>
+#include <iostream>
+#include <vector>
+
+using namespace std;
+using namespace IMATH_INTERNAL_NAMESPACE;
+
+namespace
+{
+
+//
+// Compare bit patterns, treating any two NaNs as equal.
+//
+
+bool
+sameHalf (imath_half_bits_t a, imath_half_bits_t b)
+{
+    half ha (half::FromBits, a);
+    half hb (half::FromBits, b);
+    return a == b || (ha.isNan () && hb.isNan ());
+}
+
+bool
+sameFloat (float a, float b)
+{
+    return a == b || (isnan (a) && isnan (b));
+}
+
+//
+// Round toward zero by rounding to the nearest half, and stepping
+// back toward zero if that moved away from it.
+//
+
+imath_half_bits_t
+towardZero (float f)
+{
+    imath_half_bits_t h = imath_float_to_half (f);
+    half              x (half::FromBits, h);
+
+    if (x.isNan ()) return h;
+    if (x.isInfinity ()) return isinf (f) ? h : (h & 0x8000) | 0x7bff;
+    if (fabs (float (x)) > fabs (f)) return h - 1;
+    return h;
+}
+
+void
+testHalfToFloat ()
+{
+    cout << "half to float\n";
+
+    //
+    // Every half, at every offset within a vector, so that both
+    // the vector loops and the loops over the remainder are used.
+    //
+
+    vector<imath_half_bits_t> halfs (1 << 16);
+    for (size_t i = 0; i < halfs.size (); ++i)
+        halfs[i] = (imath_half_bits_t) i;
+
+    vector<float> floats (halfs.size ());
+    imath_half_to_float_array (halfs.data (), floats.data (), halfs.size ());
+
+    for (size_t i = 0; i < halfs.size (); ++i)
+        assert (sameFloat (floats[i], imath_half_to_float (halfs[i])));
+
+    for (size_t n = 0; n < 40; ++n)
+    {
+        for (size_t offset = 0; offset < 3; ++offset)
+        {
+            vector<float> part (n + 1, -1.0f);
+            imath_half_to_float_array (
+                halfs.data () + 0x3c00 + offset, part.data (), n);
+
+            for (size_t i = 0; i < n; ++i)
+                assert (part[i] == floats[0x3c00 + offset + i]);
+
+            assert (part[n] == -1.0f);
+        }
+    }
+}
+
+void
+testFloatToHalf (imath_half_rounding_mode_t mode)
+{
+    cout << "float to half, "
+         << (mode == IMATH_HALF_ROUND_TOWARD_ZERO ? "toward zero"
+                                                  : "nearest even")
+         << "\n";
+
+    //
+    // Every half, the values halfway between them, and just
+    // above and below those, plus random floats within and beyond
+    // the range of the halfs.
+    //
+
+    vector<float> floats;
+
+    for (int i = 0; i < (1 << 16) - 1; ++i)
+    {
+        float a = imath_half_to_float ((imath_half_bits_t) i);
+        float b = imath_half_to_float ((imath_half_bits_t) (i + 1));
+
+        floats.push_back (a);
+
+        if (isfinite (a) && isfinite (b) && (i & 0x7fff) != 0x7fff)
+        {
+            float m = (a + b) / 2;
+            floats.push_back (m);
+            floats.push_back (nextafterf (m, -INFINITY));
+            floats.push_back (nextafterf (m, INFINITY));
+        }
+    }
+
+    Rand48 r (1);
+
+    for (int i = 0; i < 100000; ++i)
+        floats.push_back (float (r.nextf (-70000, 70000)));
+
+    for (int i = 0; i < 10000; ++i)
+        floats.push_back (float (r.nextf (-1e-4, 1e-4)));
+
+    floats.push_back (1e10f);
+    floats.push_back (-1e10f);
+    floats.push_back (65520.0f);
+    floats.push_back (1e-10f);
+    floats.push_back (INFINITY);
+    floats.push_back (-INFINITY);
+    floats.push_back (NAN);
+
+    vector<imath_half_bits_t> halfs (floats.size ());
+    imath_float_to_half_array (
+        floats.data (), halfs.data (), floats.size (), mode);
+
+    for (size_t i = 0; i < floats.size (); ++i)
+    {
+        imath_half_bits_t expected = mode == IMATH_HALF_ROUND_TOWARD_ZERO
+                                         ? towardZero (floats[i])
+                                         : imath_float_to_half (floats[i]);
+
+        assert (sameHalf (halfs[i], expected));
+    }
+
+    for (size_t n = 0; n < 40; ++n)
+    {
+        for (size_t offset = 0; offset < 3; ++offset)
+        {
+            vector<imath_half_bits_t> part (n + 1, 0xffff);
+            imath_float_to_half_array (
+                floats.data () + offset, part.data (), n, mode);
+
+            for (size_t i = 0; i < n; ++i)
+                assert (part[i] == halfs[offset + i]);
+
+            assert (part[n] == 0xffff);
+        }
+    }
+}
+
+} // namespace
+
+void
+testHalfArray ()
+{
+    cout << "Testing array conversions between half and float, using "
+         << imath_half_array_instruction_set () << "\n";
+
+    testHalfToFloat ();
+    testFloatToHalf (IMATH_HALF_ROUND_NEAREST_EVEN);
+    testFloatToHalf (IMATH_HALF_ROUND_TOWARD_ZERO);
+
+    cout << "ok\n" << endl;
+}
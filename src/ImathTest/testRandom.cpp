@@ -240,6 +240,59 @@ testHollowSphere ()
     }
 }
 
+void
+testRand64 ()
+{
+    IMATH_INTERNAL_NAMESPACE::Rand64 a (17);
+    IMATH_INTERNAL_NAMESPACE::Rand64 b (17);
+    IMATH_INTERNAL_NAMESPACE::Rand64 c (18);
+
+    //
+    // Skipping ahead is the same as drawing the values,
+    // and valueAt() doesn't move the generator.
+    //
+
+    for (int i = 0; i < 1000; ++i)
+        a.nexti ();
+
+    b.skip (1000);
+    assert (a.counter () == 1000 && b.counter () == 1000);
+    assert (b.valueAt (1000) == a.nexti ());
+    assert (b.counter () == 1000);
+    assert (b.nexti () == b.valueAt (1000));
+
+    b.setCounter (1000);
+    assert (b.nexti () == b.valueAt (1000));
+
+    a.init (17);
+    assert (a.counter () == 0 && a.nexti () == b.valueAt (0));
+
+    //
+    // Different seeds and different streams give different
+    // sequences; the same stream gives the same sequence.
+    //
+
+    int same = 0;
+
+    for (uint64_t i = 0; i < 100; ++i)
+        if (b.valueAt (i) == c.valueAt (i)) ++same;
+
+    assert (same == 0);
+
+    IMATH_INTERNAL_NAMESPACE::Rand64 s0 = a.stream (0);
+    IMATH_INTERNAL_NAMESPACE::Rand64 s1 = a.stream (1);
+    IMATH_INTERNAL_NAMESPACE::Rand64 t0 = b.stream (0);
+
+    assert (s0.counter () == 0);
+
+    for (int i = 0; i < 100; ++i)
+    {
+        uint64_t x = s0.nexti ();
+        assert (x == t0.nexti ());
+        assert (x != s1.nexti ());
+    }
+}
+
 } // namespace
 
 void
@@ -262,12 +315,17 @@ testRandom ()
     cout << "Rand48" << endl;
     testGenerator<IMATH_INTERNAL_NAMESPACE::Rand48> ();
     
+    cout << "Rand64" << endl;
+    testGenerator<IMATH_INTERNAL_NAMESPACE::Rand64> ();
+    testRand64 ();
     
     cout << "solidSphereRand()" << endl;
     testSolidSphere<IMATH_INTERNAL_NAMESPACE::Rand32> ();
+    testSolidSphere<IMATH_INTERNAL_NAMESPACE::Rand64> ();
 
     cout << "hollowSphereRand()" << endl;
     testHollowSphere<IMATH_INTERNAL_NAMESPACE::Rand32> ();
+    testHollowSphere<IMATH_INTERNAL_NAMESPACE::Rand64> ();
 
     cout << "ok\n" << endl;
 }
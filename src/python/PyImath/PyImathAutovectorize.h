@@ -85,6 +85,28 @@ template <class T> struct op_precompute
     }
 };
 
+struct default_cost {
+    static const size_t cost = 1;
+};
+
+//
+// op_cost holds the runtime cost of an operation, initialized from the
+// static 'cost' member of operations derived from op_with_cost.  It is
+// registered under the python name of the operation by the generated
+// bindings so that it can be tuned from python.
+//
+template <class T> struct op_cost
+{
+    static std::atomic<size_t> &
+    value()
+    {
+        static std::atomic<size_t> cost (if_<is_base_of<op_with_cost,T>,
+                                             T,
+                                             default_cost>::type::cost);
+        return cost;
+    }
+};
+
 template <int N>
 struct possible_vectorizations
 {
@@ -127,10 +149,11 @@ bool any_masked(const T &value)
     return false;
 };
 
+// masked references to a contiguous range don't need masked access
 template <class T>
 bool any_masked(const PyImath::FixedArray<T> &value)
 {
-    return value.isMaskedReference();
+    return !value.hasDirectAccess();
 };
 
 template <class T1, class T2>
@@ -263,6 +286,37 @@ struct create_uninitalized_return_value<PyImath::FixedArray<T> >
     }
 };
 
+//
+// simd_kernel may be specialized for an operation to provide an
+// explicitly vectorized loop for unmasked, contiguous arrays (see
+// PyImathSimd.h).  apply() is passed the result, if any, followed by
+// the arguments, and returns false if it can't handle them, in which
+// case the generic loop is used.
+//
+template <class Op>
+struct simd_kernel
+{
+    template <class... Args>
+    static bool apply(const Args &...) { return false; }
+};
+
+//
+// check_output_array verifies that an array passed as the 'out'
+// argument of a vectorized function can hold a result of the given
+// length.
+//
+template <class T>
+void
+check_output_array(const PyImath::FixedArray<T> &out, size_t length)
+{
+    if (out.isMaskedReference())
+        throw std::invalid_argument("Output fixed array can't be masked.");
+    if (!out.writable())
+        throw std::invalid_argument("Output fixed array is read-only.");
+    if (size_t(out.len()) != length)
+        throw std::invalid_argument("Output fixed array length does not match the arguments.");
+}
+
 template <class T, class VectorizeArg>
 struct vectorized_result_type
 {
@@ -373,9 +427,11 @@ struct VectorizedOperation1 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<result_access_type>::type r (retAccess);
+        typename SequentialAccess<access_type>::type a (access);
         for (size_t i = start; i < end; ++i)
         {
-            retAccess[i] = Op::apply (access[i]);
+            r[i] = Op::apply (a[i]);
         }
     }
 };
@@ -392,9 +448,12 @@ struct VectorizedOperation2 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<result_access_type>::type r (retAccess);
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (argAccess);
         for (size_t i = start; i < end; ++i)
         {
-            retAccess[i] = Op::apply (access[i], argAccess[i]);
+            r[i] = Op::apply (a[i], a1[i]);
         }
     }
 };
@@ -414,9 +473,13 @@ struct VectorizedOperation3 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<result_access_type>::type r (retAccess);
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (arg1Access);
+        typename SequentialAccess<arg2_access_type>::type a2 (arg2Access);
         for (size_t i = start; i < end; ++i)
         {
-            retAccess[i] = Op::apply(access[i], arg1Access[i], arg2Access[i]);
+            r[i] = Op::apply(a[i], a1[i], a2[i]);
         }
     }
 };
@@ -437,9 +500,14 @@ struct VectorizedOperation4 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<result_access_type>::type r (retAccess);
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (arg1Access);
+        typename SequentialAccess<arg2_access_type>::type a2 (arg2Access);
+        typename SequentialAccess<arg3_access_type>::type a3 (arg3Access);
         for (size_t i = start; i < end; ++i)
         {
-            retAccess[i] = Op::apply(access[i], arg1Access[i], arg2Access[i], arg3Access[i]);
+            r[i] = Op::apply(a[i], a1[i], a2[i], a3[i]);
         }
     }
 };
@@ -461,9 +529,15 @@ struct VectorizedOperation5 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<result_access_type>::type r (retAccess);
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (arg1Access);
+        typename SequentialAccess<arg2_access_type>::type a2 (arg2Access);
+        typename SequentialAccess<arg3_access_type>::type a3 (arg3Access);
+        typename SequentialAccess<arg4_access_type>::type a4 (arg4Access);
         for (size_t i = start; i < end; ++i)
         {
-            retAccess[i] = Op::apply(access[i], arg1Access[i], arg2Access[i], arg3Access[i], arg4Access[i]);
+            r[i] = Op::apply(a[i], a1[i], a2[i], a3[i], a4[i]);
         }
     }
 };
@@ -493,8 +567,28 @@ struct VectorizedFunction1 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(arg1);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,arg1);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(arg1_type arg1, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(arg1);
+        check_output_array(out,len);
+        evaluate(out,len,arg1);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, arg1_type arg1)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type resultAccess = getArrayAccess<result_access_type> (retval);
 
@@ -505,7 +599,7 @@ struct VectorizedFunction1 {
 
             VectorizedOperation1<Op,result_access_type,arg1_masked_access_type>
                 vop (resultAccess, argAccess);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
         else
         {
@@ -514,11 +608,8 @@ struct VectorizedFunction1 {
 
             VectorizedOperation1<Op,result_access_type,arg1_direct_access_type>
                 vop (resultAccess, argAccess);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
-
-        PY_IMATH_RETURN_PYTHON;        
-        return retval;
     }
 
     static std::string
@@ -561,8 +652,28 @@ struct VectorizedFunction2 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(arg1,arg2);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,arg1,arg2);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(arg1_type arg1, arg2_type arg2, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(arg1,arg2);
+        check_output_array(out,len);
+        evaluate(out,len,arg1,arg2);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, arg1_type arg1, arg2_type arg2)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type resultAccess = getArrayAccess<result_access_type> (retval);
 
@@ -580,7 +691,7 @@ struct VectorizedFunction2 {
                                    arg1_masked_access_type,
                                    arg2_masked_access_type>
                     vop (resultAccess, arg1Access, arg2Access);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -591,7 +702,7 @@ struct VectorizedFunction2 {
                                    arg1_masked_access_type,
                                    arg2_direct_access_type>
                     vop (resultAccess, arg1Access, arg2Access);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
         else
@@ -608,7 +719,7 @@ struct VectorizedFunction2 {
                                    arg1_direct_access_type,
                                    arg2_masked_access_type>
                     vop (resultAccess, arg1Access, arg2Access);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -619,12 +730,9 @@ struct VectorizedFunction2 {
                                    arg1_direct_access_type,
                                    arg2_direct_access_type>
                     vop (resultAccess, arg1Access, arg2Access);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;        
-        return retval;
     }
 
     static std::string
@@ -674,8 +782,28 @@ struct VectorizedFunction3 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(arg1,arg2,arg3);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,arg1,arg2,arg3);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(arg1_type arg1, arg2_type arg2, arg3_type arg3, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(arg1,arg2,arg3);
+        check_output_array(out,len);
+        evaluate(out,len,arg1,arg2,arg3);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, arg1_type arg1, arg2_type arg2, arg3_type arg3)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type resultAccess = getArrayAccess<result_access_type> (retval);
 
@@ -699,7 +827,7 @@ struct VectorizedFunction3 {
                                        arg2_masked_access_type,
                                        arg3_masked_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -711,7 +839,7 @@ struct VectorizedFunction3 {
                                        arg2_masked_access_type,
                                        arg3_direct_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -729,7 +857,7 @@ struct VectorizedFunction3 {
                                        arg2_direct_access_type,
                                        arg3_masked_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -741,7 +869,7 @@ struct VectorizedFunction3 {
                                        arg2_direct_access_type,
                                        arg3_direct_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
@@ -765,7 +893,7 @@ struct VectorizedFunction3 {
                                        arg2_masked_access_type,
                                        arg3_masked_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -777,7 +905,7 @@ struct VectorizedFunction3 {
                                        arg2_masked_access_type,
                                        arg3_direct_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -795,7 +923,7 @@ struct VectorizedFunction3 {
                                        arg2_direct_access_type,
                                        arg3_masked_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -807,13 +935,10 @@ struct VectorizedFunction3 {
                                        arg2_direct_access_type,
                                        arg3_direct_access_type>
                         vop (resultAccess, arg1Access, arg2Access, arg3Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 
     static std::string
@@ -870,8 +995,28 @@ struct VectorizedFunction4 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(arg1,arg2,arg3,arg4);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,arg1,arg2,arg3,arg4);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(arg1_type arg1, arg2_type arg2, arg3_type arg3, arg4_type arg4, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(arg1,arg2,arg3,arg4);
+        check_output_array(out,len);
+        evaluate(out,len,arg1,arg2,arg3,arg4);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, arg1_type arg1, arg2_type arg2, arg3_type arg3, arg4_type arg4)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type resultAccess = getArrayAccess<result_access_type> (retval);
 
@@ -901,7 +1046,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -914,7 +1059,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
                 else
@@ -945,7 +1090,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
             }
@@ -970,7 +1115,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -983,7 +1128,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
                 else
@@ -1002,7 +1147,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -1015,7 +1160,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
             }
@@ -1046,7 +1191,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -1059,7 +1204,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
                 else
@@ -1078,7 +1223,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -1091,7 +1236,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
             }
@@ -1116,7 +1261,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -1129,7 +1274,7 @@ struct VectorizedFunction4 {
                                            arg3_masked_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
                 else
@@ -1148,7 +1293,7 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_masked_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                     else
                     {
@@ -1161,14 +1306,11 @@ struct VectorizedFunction4 {
                                            arg3_direct_access_type,
                                            arg4_direct_access_type>
                             vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access);
-                        dispatchTask(vop,len);
+                        dispatchTask(vop,len,op_cost<Op>::value());
                     }
                 }
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 
     static std::string
@@ -1232,8 +1374,28 @@ struct VectorizedFunction5 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(arg1,arg2,arg3,arg4,arg5);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,arg1,arg2,arg3,arg4,arg5);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(arg1_type arg1, arg2_type arg2, arg3_type arg3, arg4_type arg4, arg5_type arg5, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(arg1,arg2,arg3,arg4,arg5);
+        check_output_array(out,len);
+        evaluate(out,len,arg1,arg2,arg3,arg4,arg5);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, arg1_type arg1, arg2_type arg2, arg3_type arg3, arg4_type arg4, arg5_type arg5)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type resultAccess = getArrayAccess<result_access_type> (retval);
 
@@ -1269,7 +1431,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1283,7 +1445,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1303,7 +1465,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1317,7 +1479,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1343,7 +1505,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1357,7 +1519,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1377,7 +1539,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1391,7 +1553,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1423,7 +1585,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1437,7 +1599,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1457,7 +1619,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1471,7 +1633,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1497,7 +1659,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1511,7 +1673,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1531,7 +1693,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1545,7 +1707,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1583,7 +1745,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1597,7 +1759,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1617,7 +1779,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1631,7 +1793,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1657,7 +1819,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1671,7 +1833,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1691,7 +1853,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1705,7 +1867,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1737,7 +1899,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1751,7 +1913,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1771,7 +1933,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1785,7 +1947,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
@@ -1811,7 +1973,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1825,7 +1987,7 @@ struct VectorizedFunction5 {
                                                arg4_masked_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                     else
@@ -1845,7 +2007,7 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_masked_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                         else
                         {
@@ -1859,15 +2021,12 @@ struct VectorizedFunction5 {
                                                arg4_direct_access_type,
                                                arg5_direct_access_type>
                                 vop (resultAccess, arg1Access, arg2Access, arg3Access, arg4Access, arg5Access);
-                            dispatchTask(vop,len);
+                            dispatchTask(vop,len,op_cost<Op>::value());
                         }
                     }
                 }
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 
     static std::string
@@ -1878,6 +2037,16 @@ struct VectorizedFunction5 {
     }
 };
 
+//
+// Add the 'out' argument to an argument list made by format_arguments
+//
+static inline std::string
+output_arguments(std::string args)
+{
+    args.insert(args.rfind(')'),",out");
+    return args;
+}
+
 template <class Op, class Func, class Keywords>
 struct function_binding
 {
@@ -1903,7 +2072,26 @@ struct function_binding
             long_<function_traits<Func>::arity> >::type vectorized_function_type;
         std::string doc = _name + vectorized_function_type::format_arguments(_args) + _doc;
         boost::python::def(_name.c_str(),&vectorized_function_type::apply,doc.c_str(),_args);
+        def_out<vectorized_function_type>(typename vectorized_function_type::any_vectorized());
+        registerOperationCost(_name,op_cost<Op>::value());
+    }
+
+    //
+    // Vectorized forms are also bound with a trailing 'out' argument, an
+    // existing array of the result type and length that receives the
+    // result and is returned, so repeated calls don't allocate.
+    //
+    template <class VectorizedFunction>
+    void def_out(true_) const
+    {
+        std::string doc = _name + output_arguments(VectorizedFunction::format_arguments(_args)) + _doc;
+        boost::python::def(_name.c_str(),&VectorizedFunction::apply_out,doc.c_str(),
+                           (_args,boost::python::arg("out")),
+                           boost::python::return_arg<function_traits<Func>::arity+1>());
     }
+
+    template <class VectorizedFunction>
+    void def_out(false_) const {}
 };
 
 template <class Op,class Func,class Keywords>
@@ -1932,9 +2120,10 @@ struct VectorizedVoidOperation0 : public Task
 
     void execute (size_t start, size_t end)
     {
+        typename SequentialAccess<access_type>::type a (access);
         for (size_t i = start; i < end; ++i)
         {
-            Op::apply (access[i]);
+            Op::apply (a[i]);
         }
     }
 };
@@ -1949,9 +2138,11 @@ struct VectorizedVoidOperation1 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (arg1);
         for (size_t i = start; i < end; ++i)
         {
-            Op::apply (access[i], arg1[i]);
+            Op::apply (a[i], a1[i]);
         }
     }
 };
@@ -1968,10 +2159,11 @@ struct VectorizedMaskedVoidOperation1 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<access_type>::type a (access);
+        MaskIndices::Cursor raw (array.maskIndices());
         for (size_t i = start; i < end; ++i)
         {
-            const size_t ri = array.raw_ptr_index(i);
-            Op::apply (access[i], arg1[ri]);
+            Op::apply (a[i], arg1[raw[i]]);
         }
     }
 };
@@ -1988,9 +2180,12 @@ struct VectorizedVoidOperation2 : public Task
 
     void execute(size_t start, size_t end)
     {
+        typename SequentialAccess<access_type>::type a (access);
+        typename SequentialAccess<arg1_access_type>::type a1 (arg1);
+        typename SequentialAccess<arg2_access_type>::type a2 (arg2);
         for (size_t i = start; i < end; ++i)
         {
-            Op::apply (access[i], arg1[i], arg2[i]);
+            Op::apply (a[i], a1[i], a2[i]);
         }
     }
 };
@@ -2013,17 +2208,23 @@ struct VectorizedVoidMemberFunction0 {
         size_t len = measure_arguments(array);
         op_precompute<Op>::apply(len);
 
+        if (simd_kernel<Op>::apply(array))
+        {
+            PY_IMATH_RETURN_PYTHON;
+            return array;
+        }
+
         if (any_masked(array))
         {
             masked_access_type access (array);
             VectorizedVoidOperation0<Op,masked_access_type> vop (access);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
         else
         {
             direct_access_type access (array);
             VectorizedVoidOperation0<Op,direct_access_type> vop (access);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
 
         PY_IMATH_RETURN_PYTHON;
@@ -2066,7 +2267,7 @@ struct VectorizedVoidMemberFunction1 {
 
                 VectorizedVoidOperation1<Op,masked_access_type,arg1_masked_access_type>
                     vop (arrayAccess, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -2075,7 +2276,7 @@ struct VectorizedVoidMemberFunction1 {
 
                 VectorizedVoidOperation1<Op,masked_access_type,arg1_direct_access_type>
                     vop (arrayAccess, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
         else
@@ -2089,7 +2290,7 @@ struct VectorizedVoidMemberFunction1 {
 
                 VectorizedVoidOperation1<Op,direct_access_type,arg1_masked_access_type>
                     vop (arrayAccess, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -2098,7 +2299,7 @@ struct VectorizedVoidMemberFunction1 {
 
                 VectorizedVoidOperation1<Op,direct_access_type,arg1_direct_access_type>
                     vop (arrayAccess, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
 
@@ -2159,7 +2360,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
                                              arg1_masked_access_type,
                                                       reference_type>
                     vop (arrayAccess, argAccess, array);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -2170,7 +2371,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
                                              arg1_direct_access_type,
                                                       reference_type>
                     vop (arrayAccess, argAccess, array);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
         else
@@ -2188,7 +2389,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
 
                     VectorizedVoidOperation1<Op,masked_access_type,arg1_masked_access_type>
                         vop (arrayAccess, argAccess);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2197,7 +2398,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
 
                     VectorizedVoidOperation1<Op,masked_access_type,arg1_direct_access_type>
                         vop (arrayAccess, argAccess);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -2211,7 +2412,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
 
                     VectorizedVoidOperation1<Op,direct_access_type,arg1_masked_access_type>
                         vop (arrayAccess, argAccess);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2220,7 +2421,7 @@ struct VectorizedVoidMaskableMemberFunction1 {
 
                     VectorizedVoidOperation1<Op,direct_access_type,arg1_direct_access_type>
                         vop (arrayAccess, argAccess);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
@@ -2286,7 +2487,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_masked_access_type,
                                            arg2_masked_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2297,7 +2498,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_masked_access_type,
                                            arg2_direct_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -2314,7 +2515,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_direct_access_type,
                                            arg2_masked_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2325,7 +2526,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_direct_access_type,
                                            arg2_direct_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
@@ -2347,7 +2548,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_masked_access_type,
                                            arg2_masked_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2358,7 +2559,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_masked_access_type,
                                            arg2_direct_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -2375,7 +2576,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_direct_access_type,
                                            arg2_masked_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2386,7 +2587,7 @@ struct VectorizedVoidMemberFunction2 {
                                            arg1_direct_access_type,
                                            arg2_direct_access_type>
                           vop (arrayAccess, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
@@ -2425,8 +2626,31 @@ struct VectorizedMemberFunction0 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(array);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,array);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(reference_type array, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(array);
+        check_output_array(out,len);
+        evaluate(out,len,array);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, reference_type array)
+    {
+        op_precompute<Op>::apply(len);
+
+        if (simd_kernel<Op>::apply(retval,array))
+            return;
 
         result_access_type returnAccess (retval);
 
@@ -2434,17 +2658,14 @@ struct VectorizedMemberFunction0 {
         {
             masked_access_type access (array);
             VectorizedOperation1<Op,result_access_type,masked_access_type> vop(returnAccess,access);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
         else
         {
             direct_access_type access (array);
             VectorizedOperation1<Op,result_access_type,direct_access_type> vop(returnAccess,access);
-            dispatchTask(vop,len);
+            dispatchTask(vop,len,op_cost<Op>::value());
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 };
 
@@ -2476,8 +2697,31 @@ struct VectorizedMemberFunction1 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(array,arg1);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,array,arg1);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(reference_type array, arg1_type arg1, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(array,arg1);
+        check_output_array(out,len);
+        evaluate(out,len,array,arg1);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, reference_type array, arg1_type arg1)
+    {
+        op_precompute<Op>::apply(len);
+
+        if (simd_kernel<Op>::apply(retval,array,arg1))
+            return;
 
         result_access_type returnAccess (retval);
 
@@ -2493,7 +2737,7 @@ struct VectorizedMemberFunction1 {
                 VectorizedOperation2<Op,result_access_type,
                                         masked_access_type,
                                    arg1_masked_access_type> vop (returnAccess, access, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -2503,7 +2747,7 @@ struct VectorizedMemberFunction1 {
                 VectorizedOperation2<Op,result_access_type,
                                         masked_access_type,
                                    arg1_direct_access_type> vop (returnAccess, access, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
         else
@@ -2518,7 +2762,7 @@ struct VectorizedMemberFunction1 {
                 VectorizedOperation2<Op,result_access_type,
                                         direct_access_type,
                                    arg1_masked_access_type> vop (returnAccess, access, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
             else
             {
@@ -2528,12 +2772,9 @@ struct VectorizedMemberFunction1 {
                 VectorizedOperation2<Op,result_access_type,
                                         direct_access_type,
                                    arg1_direct_access_type> vop (returnAccess, access, argAccess);
-                dispatchTask(vop,len);
+                dispatchTask(vop,len,op_cost<Op>::value());
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 
     static std::string
@@ -2579,8 +2820,28 @@ struct VectorizedMemberFunction2 {
     {
         PY_IMATH_LEAVE_PYTHON;
         size_t len = measure_arguments(array,arg1,arg2);
-        op_precompute<Op>::apply(len);
         result_type retval = create_uninitalized_return_value<result_type>::apply(len);
+        evaluate(retval,len,array,arg1,arg2);
+        PY_IMATH_RETURN_PYTHON;
+        return retval;
+    }
+
+    // Variant writing the result into an existing array, bound with an
+    // additional 'out' argument.
+    static void
+    apply_out(reference_type array, arg1_type arg1, arg2_type arg2, result_type &out)
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        size_t len = measure_arguments(array,arg1,arg2);
+        check_output_array(out,len);
+        evaluate(out,len,array,arg1,arg2);
+        PY_IMATH_RETURN_PYTHON;
+    }
+
+    static void
+    evaluate(result_type &retval, size_t len, reference_type array, arg1_type arg1, arg2_type arg2)
+    {
+        op_precompute<Op>::apply(len);
 
         result_access_type returnAccess (retval);
 
@@ -2603,7 +2864,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_masked_access_type,
                                        arg2_masked_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2615,7 +2876,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_masked_access_type,
                                        arg2_direct_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -2633,7 +2894,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_direct_access_type,
                                        arg2_masked_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2645,7 +2906,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_direct_access_type,
                                        arg2_direct_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
@@ -2668,7 +2929,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_masked_access_type,
                                        arg2_masked_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2680,7 +2941,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_masked_access_type,
                                        arg2_direct_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
             else
@@ -2698,7 +2959,7 @@ struct VectorizedMemberFunction2 {
                                        arg1_direct_access_type,
                                        arg2_masked_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
                 else
                 {
@@ -2710,13 +2971,10 @@ struct VectorizedMemberFunction2 {
                                        arg1_direct_access_type,
                                        arg2_direct_access_type>
                         vop (returnAccess, access, arg1Access, arg2Access);
-                    dispatchTask(vop,len);
+                    dispatchTask(vop,len,op_cost<Op>::value());
                 }
             }
         }
-
-        PY_IMATH_RETURN_PYTHON;
-        return retval;
     }
 
     static std::string
@@ -2727,6 +2985,16 @@ struct VectorizedMemberFunction2 {
     }
 };
 
+//
+// Member operations are registered with the class name, e.g. "V3fArray.normalize"
+//
+template <class Cls>
+std::string
+member_operation_name(Cls &cls,const std::string &name)
+{
+    return boost::python::extract<std::string>(cls.attr("__name__"))() + "." + name;
+}
+
 template <class Op, class Cls, class Func, class Keywords>
 struct member_function_binding
 {
@@ -2765,7 +3033,23 @@ struct member_function_binding
             long_<function_traits<Func>::arity> >::type vectorized_function_type;
         std::string doc = _name + vectorized_function_type::format_arguments(_args) + _doc;
         _cls.def(_name.c_str(),&vectorized_function_type::apply,doc.c_str(),_args,call_policies());
+        def_out<vectorized_function_type>(typename if_<is_same<void,typename function_traits<Func>::result_type>,true_,false_>::type());
+        registerOperationCost(member_operation_name(_cls,_name),op_cost<Op>::value());
     }
+
+    // Methods returning a new array are also bound with an 'out' argument,
+    // see function_binding.
+    template <class VectorizedFunction>
+    void def_out(false_) const
+    {
+        std::string doc = _name + output_arguments(VectorizedFunction::format_arguments(_args)) + _doc;
+        _cls.def(_name.c_str(),&VectorizedFunction::apply_out,doc.c_str(),
+                 (_args,boost::python::arg("out")),
+                 boost::python::return_arg<function_traits<Func>::arity+1>());
+    }
+
+    template <class VectorizedFunction>
+    void def_out(true_) const {}
 };
 
 template <class Op,class Cls,class Func,class Keywords>
@@ -2784,6 +3068,21 @@ struct generate_member_bindings_struct
     }
 };
 
+template <class VectorizedFunction,class Func,class Cls>
+void
+generate_single_member_out_binding(Cls &cls,const std::string &name,const std::string &doc,false_)
+{
+    cls.def(name.c_str(),&VectorizedFunction::apply_out,(name + "(out) - " + doc).c_str(),
+            boost::python::arg("out"),
+            boost::python::return_arg<function_traits<Func>::arity+1>());
+}
+
+template <class VectorizedFunction,class Func,class Cls>
+void
+generate_single_member_out_binding(Cls &cls,const std::string &name,const std::string &doc,true_)
+{
+}
+
 template <class Op,class Cls,class Func>
 void
 generate_single_member_binding(Cls &cls,Func *func,const std::string &name,const std::string &doc)
@@ -2797,6 +3096,9 @@ generate_single_member_binding(Cls &cls,Func *func,const std::string &name,const
                          boost::python::default_call_policies>::type call_policies;
 
     cls.def(name.c_str(),&vectorized_function_type::apply,doc.c_str(),call_policies());
+    generate_single_member_out_binding<vectorized_function_type,Func>(
+        cls,name,doc,typename if_<is_same<void,typename function_traits<Func>::result_type>,true_,false_>::type());
+    registerOperationCost(member_operation_name(cls,name),op_cost<Op>::value());
 }
 
 } // namespace detail
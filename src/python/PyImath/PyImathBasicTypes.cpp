@@ -13,7 +13,9 @@
 #include "PyImathBasicTypes.h"
 #include "PyImathFixedArray.h"
 #include "PyImathFixedVArray.h"
+#include "PyImathHalf.h"
 #include "PyImathBufferProtocol.h"
+#include "PyImathSort.h"
 
 using namespace boost::python;
 
@@ -24,18 +26,24 @@ register_basicTypes()
 {
     class_<BoolArray> bclass = BoolArray::register_("Fixed length array of bool");
     add_comparison_functions(bclass);
+    bclass.def("any",&fa_any<bool>,"any() - whether any element is true");
+    bclass.def("all",&fa_all<bool>,"all() - whether every element is true");
 
     class_<SignedCharArray> scclass = SignedCharArray::register_("Fixed length array of signed chars");
     add_arithmetic_math_functions(scclass);
     add_mod_math_functions(scclass);
     add_comparison_functions(scclass);
     add_ordered_comparison_functions(scclass);
+    add_reduction_functions(scclass);
+    add_sort_functions(scclass);
 
     class_<UnsignedCharArray> ucclass = UnsignedCharArray::register_("Fixed length array of unsigned chars");
     add_arithmetic_math_functions(ucclass);
     add_mod_math_functions(ucclass);
     add_comparison_functions(ucclass);
     add_ordered_comparison_functions(ucclass);
+    add_reduction_functions(ucclass);
+    add_sort_functions(ucclass);
     add_buffer_protocol<UnsignedCharArray>(ucclass);
 
     class_<ShortArray> sclass = ShortArray::register_("Fixed length array of shorts");
@@ -43,18 +51,24 @@ register_basicTypes()
     add_mod_math_functions(sclass);
     add_comparison_functions(sclass);
     add_ordered_comparison_functions(sclass);
+    add_reduction_functions(sclass);
+    add_sort_functions(sclass);
 
     class_<UnsignedShortArray> usclass = UnsignedShortArray::register_("Fixed length array of unsigned shorts");
     add_arithmetic_math_functions(usclass);
     add_mod_math_functions(usclass);
     add_comparison_functions(usclass);
     add_ordered_comparison_functions(usclass);
+    add_reduction_functions(usclass);
+    add_sort_functions(usclass);
 
     class_<IntArray> iclass = IntArray::register_("Fixed length array of ints");
     add_arithmetic_math_functions(iclass);
     add_mod_math_functions(iclass);
     add_comparison_functions(iclass);
     add_ordered_comparison_functions(iclass);
+    add_reduction_functions(iclass);
+    add_sort_functions(iclass);
     add_explicit_construction_from_type<float>(iclass);
     add_explicit_construction_from_type<double>(iclass);
     add_buffer_protocol<IntArray>(iclass);
@@ -64,6 +78,8 @@ register_basicTypes()
     add_mod_math_functions(uiclass);
     add_comparison_functions(uiclass);
     add_ordered_comparison_functions(uiclass);
+    add_reduction_functions(uiclass);
+    add_sort_functions(uiclass);
     add_explicit_construction_from_type<float>(uiclass);
     add_explicit_construction_from_type<double>(uiclass);
 
@@ -72,6 +88,8 @@ register_basicTypes()
     add_pow_math_functions(fclass);
     add_comparison_functions(fclass);
     add_ordered_comparison_functions(fclass);
+    add_reduction_functions(fclass);
+    add_sort_functions(fclass);
     add_explicit_construction_from_type<int>(fclass);
     add_explicit_construction_from_type<double>(fclass);
     add_buffer_protocol<FloatArray>(fclass);
@@ -81,10 +99,19 @@ register_basicTypes()
     add_pow_math_functions(dclass);
     add_comparison_functions(dclass);
     add_ordered_comparison_functions(dclass);
+    add_reduction_functions(dclass);
+    add_sort_functions(dclass);
     add_explicit_construction_from_type<int>(dclass);
     add_explicit_construction_from_type<float>(dclass);
     add_buffer_protocol<DoubleArray>(dclass);
 
+    class_<HalfArray> hclass = HalfArray::register_("Fixed length array of halfs, whose elements are read and written as floats");
+    add_explicit_construction_from_type<float>(hclass);
+    add_explicit_construction_from_type<double>(hclass);
+    add_buffer_protocol<HalfArray>(hclass);
+    add_explicit_construction_from_type<half>(fclass);
+    add_explicit_construction_from_type<half>(dclass);
+
     class_<VIntArray>   ivclass = VIntArray::register_("Variable fixed length array of ints");
     class_<VFloatArray> fvclass = VFloatArray::register_("Variable fixed length array of floats");
     class_<VV2iArray> v2ivclass = VV2iArray::register_("Variable fixed length array of V2i");
@@ -7,6 +7,7 @@
 
 #include <boost/python/make_constructor.hpp>
 #include <vector>
+#include <mutex>
 #include <ImathBoxAlgo.h>
 #include "PyImathBox.h"
 #include "PyImathVec.h"
@@ -221,23 +222,29 @@ struct IntersectsTask : public Task
     }
 };
 
+//
+// Each chunk of points is accumulated into a local box which is then
+// merged into the result, so the task does not depend on the number of
+// workers, which may change while the GIL is released.
+//
 template <class T>
 struct ExtendByTask : public Task
 {
-    std::vector<IMATH_NAMESPACE::Box<T> >& boxes;
+    IMATH_NAMESPACE::Box<T>& box;
     const PyImath::FixedArray<T>& points;
+    std::mutex mutex;
 
-    ExtendByTask(std::vector<IMATH_NAMESPACE::Box<T> >& b, const PyImath::FixedArray<T> &p)
-        : boxes(b), points(p) {}
+    ExtendByTask(IMATH_NAMESPACE::Box<T>& b, const PyImath::FixedArray<T> &p)
+        : box(b), points(p) {}
 
-    void execute(size_t start, size_t end, int tid)
-    {
-        for(size_t p = start; p < end; ++p) 
-            boxes[tid].extendBy(points[p]);
-    }
     void execute(size_t start, size_t end)
     {
-        throw std::invalid_argument ("Box::ExtendBy execute requires a thread id");
+        IMATH_NAMESPACE::Box<T> local;
+        for(size_t p = start; p < end; ++p) 
+            local.extendBy(points[p]);
+
+        std::lock_guard<std::mutex> lock(mutex);
+        box.extendBy(local);
     }
 };
 
@@ -245,19 +252,16 @@ template <class T>
 static void
 box_extendBy(IMATH_NAMESPACE::Box<T> &box, const PyImath::FixedArray<T> &points)
 {
-    size_t numBoxes = workers();
-    std::vector<IMATH_NAMESPACE::Box<T> > boxes(numBoxes);
-    ExtendByTask<T> task(boxes,points);
+    PY_IMATH_LEAVE_PYTHON;
+    ExtendByTask<T> task(box,points);
     dispatchTask(task,points.len());
-    for (size_t i=0; i<numBoxes; ++i) {
-        box.extendBy(boxes[i]);
-    }
 }
 
 template <class T>
 PyImath::FixedArray<int>
 box_intersects(IMATH_NAMESPACE::Box<T>& box, const PyImath::FixedArray<T>& points)
 {
+    PY_IMATH_LEAVE_PYTHON;
     size_t numPoints = points.len();
     PyImath::FixedArray<int> mask(numPoints);
 
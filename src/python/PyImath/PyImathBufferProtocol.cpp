@@ -6,11 +6,14 @@
 // clang-format off
 
 #include <ImathVec.h>
+#include <ImathColor.h>
 #include "PyImathBufferProtocol.h"
 #include "PyImathExport.h"
 #include "PyImathFixedArray.h"
 #include "PyImathFixedArrayTraits.h"
 
+#include <boost/shared_ptr.hpp>
+#include <cstdint>
 #include <type_traits>
 
 namespace PyImath {
@@ -106,8 +109,10 @@ class SharedBufferAPI : public BufferAPI<ArrayT>
     bool readOnly() const override
      { return !_orig.writable(); }
 
+    //  A read-only array is exported as a read-only buffer, so the
+    // writable check of direct_index() doesn't apply.
     void *buffer() override
-     { return static_cast<void *> (&_orig.direct_index(0)); }
+     { return static_cast<void *> (&_orig.unchecked_direct_index(0)); }
 
   private:
 
@@ -318,6 +323,232 @@ PyBufferProcs FixedArrayBufferProcs<ArrayT>::procs =
 #endif
 };
 
+
+//  Holds the buffer of a python object for as long as a FixedArray refers
+// to its memory.  The last reference to the array may be dropped by a
+// thread that doesn't hold the python lock, so acquire it to release
+// the buffer.
+//
+class BufferHandle
+{
+  public:
+
+    explicit
+    BufferHandle (const Py_buffer &view)
+     : _view (view)
+    {}
+
+    ~BufferHandle()
+    {
+        PyAcquireLock pylock;
+        PyBuffer_Release (&_view);
+    }
+
+    //  NonCopyable
+    BufferHandle (const BufferHandle &rhs)            = delete;
+    BufferHandle &operator= (const BufferHandle &rhs) = delete;
+
+  private:
+
+    Py_buffer _view;
+};
+
+
+//  The kind of number described by a struct-module format character:
+// signed integer, unsigned integer or floating point.
+//
+inline char
+formatKind (char c)
+{
+    switch (c)
+    {
+      case 'b': case 'h': case 'i': case 'l': case 'q': case 'n':
+        return 'i';
+      case 'B': case 'H': case 'I': case 'L': case 'Q': case 'N':
+        return 'u';
+      case 'e': case 'f': case 'd':
+        return 'f';
+      default:
+        return '\0';
+    }
+}
+
+
+//  Check that the element type and dimensions of a buffer match the
+// elements of ArrayT, e.g. an (N,3) buffer of 4-byte floats for a
+// V3fArray.  Integer formats of the same size are interchangeable, so
+// that both 'l' and 'q' buffers are accepted for 64-bit integers.
+//
+template <class ArrayT>
+bool
+bufferMatches (const Py_buffer &view)
+{
+    using T = typename ArrayT::BaseType;
+    const Py_ssize_t width = FixedArrayWidth<T>::value;
+    const Py_ssize_t componentSize = sizeof(T) / width;
+
+    const char *format = view.format;
+    if (format == nullptr || view.strides == nullptr)
+        return false;
+
+    if (format[0] == '@' || format[0] == '<')
+        format++;
+
+    if (format[0] == '\0' || format[1] != '\0' ||
+        formatKind (format[0]) == '\0' ||
+        formatKind (format[0]) != formatKind (PyFormat<T>()[0]) ||
+        view.itemsize != componentSize)
+        return false;
+
+    if (view.ndim != FixedArrayDimension<T>::value)
+        return false;
+
+    return view.ndim == 1 || view.shape[1] == width;
+}
+
+
+//  The stride, in elements, at which ArrayT can address the buffer in
+// place, or 0 if the layout of the buffer can't be expressed by a
+// FixedArray and the data has to be copied.
+//
+template <class ArrayT>
+Py_ssize_t
+bufferStride (const Py_buffer &view)
+{
+    using T = typename ArrayT::BaseType;
+
+    if (reinterpret_cast<uintptr_t> (view.buf) % alignof(T) != 0)
+        return 0;
+
+    if (view.ndim == 2 && view.shape[0] > 0 && view.strides[1] != view.itemsize)
+        return 0;
+
+    if (view.shape[0] <= 1)
+        return 1;
+
+    if (view.strides[0] <= 0 || view.strides[0] % Py_ssize_t(sizeof(T)) != 0)
+        return 0;
+
+    return view.strides[0] / Py_ssize_t(sizeof(T));
+}
+
+
+//  The type of the individual numbers in an array element.
+//
+template <class T, bool = (FixedArrayWidth<T>::value == 1)>
+struct BufferComponent
+{
+    using type = T;
+};
+
+template <class T>
+struct BufferComponent<T, false>
+{
+    using type = typename T::BaseType;
+};
+
+
+//  Copy a buffer with an arbitrary layout into a new array.
+//
+template <class ArrayT>
+ArrayT
+copyBuffer (const Py_buffer &view)
+{
+    using T = typename ArrayT::BaseType;
+    using Component = typename BufferComponent<T>::type;
+    const Py_ssize_t width = FixedArrayWidth<T>::value;
+
+    const Py_ssize_t length = view.shape[0];
+    ArrayT array (length, PyImath::UNINITIALIZED);
+
+    const char *src = static_cast<const char *> (view.buf);
+    for (Py_ssize_t i = 0; i < length; ++i)
+    {
+        Component *dst = reinterpret_cast<Component *> (&array.direct_index (i));
+        for (Py_ssize_t c = 0; c < width; ++c)
+        {
+            const char *p = src + i * view.strides[0];
+            if (view.ndim == 2)
+                p += c * view.strides[1];
+            memcpy (&dst[c], p, sizeof(Component));
+        }
+    }
+
+    return array;
+}
+
+
+//  An array that refers to the memory of the buffer in place, with the
+// given stride in elements.  The array takes over the buffer and is
+// writable if the buffer is.
+//
+template <class ArrayT>
+ArrayT
+bufferView (const Py_buffer &view, Py_ssize_t stride)
+{
+    using T = typename ArrayT::BaseType;
+
+    boost::shared_ptr<BufferHandle> handle (new BufferHandle (view));
+    return ArrayT (static_cast<T *> (view.buf), view.shape[0], stride,
+                   boost::any (handle), !view.readonly);
+}
+
+
+//  Converts any python object that exposes a buffer with a compatible
+// element type and shape to a FixedArray.  When possible, the array
+// refers to the memory of the buffer directly, and it is writable if
+// the buffer is.  Buffers that FixedArray can't address in place, e.g.
+// with negative or misaligned strides, are copied.
+//
+template <class ArrayT>
+struct BufferToFixedArray
+{
+    static void *
+    convertible (PyObject *obj)
+    {
+        if (!PyObject_CheckBuffer (obj))
+            return nullptr;
+
+        Py_buffer view;
+        memset (&view, 0, sizeof(view));
+        if (PyObject_GetBuffer (obj, &view, PyBUF_RECORDS_RO) != 0)
+        {
+            PyErr_Clear();
+            return nullptr;
+        }
+
+        bool matches = bufferMatches<ArrayT> (view);
+        PyBuffer_Release (&view);
+
+        return matches ? obj : nullptr;
+    }
+
+    static void
+    construct (PyObject *obj, boost::python::converter::rvalue_from_python_stage1_data *data)
+    {
+        void *storage = reinterpret_cast<boost::python::converter::rvalue_from_python_storage<ArrayT> *>
+                            (data)->storage.bytes;
+
+        Py_buffer view;
+        memset (&view, 0, sizeof(view));
+        if (PyObject_GetBuffer (obj, &view, PyBUF_RECORDS_RO) != 0)
+            boost::python::throw_error_already_set();
+
+        Py_ssize_t stride = bufferStride<ArrayT> (view);
+        if (stride == 0)
+        {
+            new (storage) ArrayT (copyBuffer<ArrayT> (view));
+            PyBuffer_Release (&view);
+        }
+        else
+        {
+            new (storage) ArrayT (bufferView<ArrayT> (view, stride));
+        }
+
+        data->convertible = storage;
+    }
+};
+
 } // anonymous
 
 
@@ -330,6 +561,19 @@ add_buffer_protocol (boost::python::class_<ArrayT> &classObj)
 #if PY_MAJOR_VERSION == 2
     typeObj->tp_flags |= (Py_TPFLAGS_HAVE_NEWBUFFER | Py_TPFLAGS_HAVE_GETCHARBUFFER);
 #endif
+
+    boost::python::converter::registry::push_back (&BufferToFixedArray<ArrayT>::convertible,
+                                                   &BufferToFixedArray<ArrayT>::construct,
+                                                   boost::python::type_id<ArrayT>());
+
+    classObj.def ("view", &fixedArrayViewFromBuffer<ArrayT>,
+                  boost::python::return_value_policy<boost::python::manage_new_object>(),
+                  boost::python::args ("bufferObject"),
+                  "view(buffer) -- return an array that refers to the memory of the given "
+                  "buffer without copying it, e.g. a numpy array or a memoryview.  The "
+                  "buffer is kept alive by the array, and the array is read-only if the "
+                  "buffer is")
+            .staticmethod ("view");
 }
 
 
@@ -366,6 +610,35 @@ fixedArrayFromBuffer (PyObject *obj)
     return array;
 }
 
+
+template <class ArrayT>
+ArrayT *
+fixedArrayViewFromBuffer (PyObject *obj)
+{
+    if (!PyObject_CheckBuffer (obj))
+        throw std::invalid_argument ("Python object does not support the buffer protocol");
+
+    Py_buffer view;
+    memset (&view, 0, sizeof(view));
+    if (PyObject_GetBuffer (obj, &view, PyBUF_RECORDS_RO) != 0)
+        boost::python::throw_error_already_set();
+
+    if (!bufferMatches<ArrayT> (view))
+    {
+        PyBuffer_Release (&view);
+        throw std::invalid_argument ("Buffer element type or shape does not match the array type");
+    }
+
+    Py_ssize_t stride = bufferStride<ArrayT> (view);
+    if (stride == 0)
+    {
+        PyBuffer_Release (&view);
+        throw std::invalid_argument ("Buffer strides can't be represented by an array view");
+    }
+
+    return new ArrayT (bufferView<ArrayT> (view, stride));
+}
+
 ///////////////////////////////////////////////////////////////////////////////
 
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<short> >         &classObj);
@@ -374,6 +647,7 @@ template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArr
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<float> >         &classObj);
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<double> >        &classObj);
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<unsigned char> > &classObj);
+template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<half> >          &classObj);
 
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec2<short> > >   &classObj);
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec2<int> > >     &classObj);
@@ -390,6 +664,8 @@ template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArr
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec4<int64_t> > > &classObj);
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec4<float> > >   &classObj);
 template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec4<double> > >  &classObj);
+template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Vec3<half> > >    &classObj);
+template PYIMATH_EXPORT void add_buffer_protocol (boost::python::class_<FixedArray<IMATH_NAMESPACE::Color4<half> > >  &classObj);
 
 template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<short> >*   fixedArrayFromBuffer (PyObject *obj);
 template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<int> >*     fixedArrayFromBuffer (PyObject *obj);
@@ -412,4 +688,26 @@ template PYIMATH_EXPORT FixedArray<int64_t>*               fixedArrayFromBuffer
 template PYIMATH_EXPORT FixedArray<float>*                 fixedArrayFromBuffer (PyObject *obj);
 template PYIMATH_EXPORT FixedArray<double>*                fixedArrayFromBuffer (PyObject *obj);
 
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<short> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<int> >*     fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<int64_t> >* fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<float> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec2<double> >*  fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec3<short> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec3<int> >*     fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec3<int64_t> >* fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec3<float> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec3<double> >*  fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec4<short> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec4<int> >*     fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec4<int64_t> >* fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec4<float> >*   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<IMATH_NAMESPACE::Vec4<double> >*  fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<short>*                 fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<int>*                   fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<int64_t>*               fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<float>*                 fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<double>*                fixedArrayViewFromBuffer (PyObject *obj);
+template PYIMATH_EXPORT FixedArray<unsigned char>*         fixedArrayViewFromBuffer (PyObject *obj);
+
 }
@@ -18,12 +18,29 @@ namespace PyImath {
 //    https://docs.python.org/2.7/c-api/buffer.html
 //    https://docs.python.org/3.7.10/c-api/buffer.html
 
+//  Expose the memory of the array class through the buffer protocol, and
+// register a conversion that lets functions taking the array type accept
+// any python object exposing a buffer with the same element type and
+// shape, e.g. an (N,3) float32 numpy array for a V3fArray.  The converted
+// array refers to the memory of the buffer without copying it whenever
+// the strides of the buffer allow.
+//
 template <class T>
 void add_buffer_protocol (boost::python::class_<T> &classObj);
 
+//  Construct a new array with a copy of the contents of the buffer.
+//
 template <class ArrayT>
 ArrayT* fixedArrayFromBuffer (PyObject *obj);
 
+//  Construct an array that refers to the memory of the buffer in place,
+// honouring its strides and read-only flag.  The array holds on to the
+// buffer, and so keeps the exporting object alive.  Raises an exception
+// if the element type, shape or strides of the buffer don't allow that.
+//
+template <class ArrayT>
+ArrayT* fixedArrayViewFromBuffer (PyObject *obj);
+
 }
 
 #endif
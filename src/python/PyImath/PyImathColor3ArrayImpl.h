@@ -22,6 +22,8 @@
 #include "PyImath.h"
 #include "PyImathMathExc.h"
 #include "PyImathDecorators.h"
+#include "PyImathOperators.h"
+#include "PyImathSort.h"
 
 namespace PyImath {
 using namespace boost::python;
@@ -38,6 +40,18 @@ Color3Array_get(FixedArray<IMATH_NAMESPACE::Color3<T> > &ca)
                          ca.len(),3*ca.stride(),ca.handle(),ca.writable());
 }
 
+// Trick to register methods for float-only-based colors
+template <class T, IMATH_ENABLE_IF(!std::is_integral<T>::value)>
+void register_Color3Array_floatonly(class_<FixedArray<Color3<T>>>& color3Array_class)
+{
+    color3Array_class.def("mean", &fa_mean<IMATH_NAMESPACE::Color3<T>,T>, "mean() - the mean of the colors");
+}
+
+template <class T, IMATH_ENABLE_IF(std::is_integral<T>::value)>
+void register_Color3Array_floatonly(class_<FixedArray<Color3<T>>>& color3Array_class)
+{
+}
+
 // Currently we are only exposing the RGBA components.
 template <class T>
 class_<FixedArray<IMATH_NAMESPACE::Color3<T> > >
@@ -48,8 +62,14 @@ register_Color3Array()
         .add_property("r",&Color3Array_get<T,0>)
         .add_property("g",&Color3Array_get<T,1>)
         .add_property("b",&Color3Array_get<T,2>)
+        .def("sum", &fa_reduce<IMATH_NAMESPACE::Color3<T> >, "sum() - the sum of the colors")
+        .def("min", &fa_component_min<IMATH_NAMESPACE::Color3<T> >, "min() - the component-wise minimum of the colors")
+        .def("max", &fa_component_max<IMATH_NAMESPACE::Color3<T> >, "max() - the component-wise maximum of the colors")
         ;
 
+    register_Color3Array_floatonly(color3Array_class);
+    add_vector_sort_functions(color3Array_class);
+
     return color3Array_class;
 }
 
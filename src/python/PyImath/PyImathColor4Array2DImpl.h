@@ -142,9 +142,10 @@ Color4Array_mulT(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, T t)
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len);
-    for (size_t j = 0; j < len.y; ++j)
+    dispatchRows(len.y,len.x,[&](size_t j) {
         for (size_t i = 0; i < len.x; ++i)
-            f(i,j) = va(i,j) * t; 
+            f(i,j) = va(i,j) * t;
+    });
     return f; 
 }
 // 
@@ -167,9 +168,10 @@ Color4Array_mulArrayT(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j)
+    dispatchRows(len.y,len.x,[&](size_t j) {
         for (size_t i = 0; i < len.x; ++i)
             f(i,j) = va(i,j) * vb(i,j);
+    });
     return f; 
 }
 
@@ -179,9 +181,10 @@ Color4Array_imulT(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, T t)
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len(); 
-    for (size_t j = 0; j < len.y; ++j)
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) *= t; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) *= t;
+    });
     return va; 
 }
 
@@ -191,9 +194,10 @@ Color4Array_imulArrayT(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixe
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j)
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) *= vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) *= vb(i,j);
+    });
     return va; 
 }
 
@@ -204,9 +208,10 @@ Color4Array_divT(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, T t)
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len(); 
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) / t; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) / t;
+    });
     return f; 
 }
 
@@ -217,9 +222,10 @@ Color4Array_divArrayT(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) / vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) / vb(i,j);
+    });
     return f; 
 }
 
@@ -229,9 +235,10 @@ Color4Array_idivT(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, T t)
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len(); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) /= t; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) /= t;
+    });
     return va; 
 }
 
@@ -241,9 +248,10 @@ Color4Array_idivArrayT(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixe
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) /= vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) /= vb(i,j);
+    });
     return va; 
 }
 
@@ -254,9 +262,10 @@ Color4Array_add(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixed
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) + vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) + vb(i,j);
+    });
     return f; 
 }
 
@@ -267,9 +276,10 @@ Color4Array_addColor(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) + vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) + vb;
+    });
     return f; 
 }
 
@@ -280,9 +290,10 @@ Color4Array_sub(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixed
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) - vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) - vb(i,j);
+    });
     return f; 
 }
 
@@ -293,9 +304,10 @@ Color4Array_subColor(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) - vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) - vb;
+    });
     return f; 
 }
 
@@ -306,9 +318,10 @@ Color4Array_rsubColor(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = vb - va(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = vb - va(i,j);
+    });
     return f; 
 }
 
@@ -319,9 +332,10 @@ Color4Array_mul(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixed
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) * vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) * vb(i,j);
+    });
     return f; 
 }
 
@@ -332,9 +346,10 @@ Color4Array_mulColor(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) * vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) * vb;
+    });
     return f; 
 }
 
@@ -345,9 +360,10 @@ Color4Array_div(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const Fixed
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) / vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) / vb(i,j);
+    });
     return f; 
 }
 
@@ -358,9 +374,10 @@ Color4Array_divColor(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            f(i,j) = va(i,j) / vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            f(i,j) = va(i,j) / vb;
+    });
     return f; 
 }
 
@@ -371,9 +388,10 @@ Color4Array_neg(const FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va)
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
     FixedArray2D<IMATH_NAMESPACE::Color4<T> > f(len); 
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
             f(i,j) = -va(i,j);
+    });
     return f; 
 }
 
@@ -383,9 +401,10 @@ Color4Array_iadd(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const FixedArray
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) += vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) += vb(i,j);
+    });
     return va; 
 }
 
@@ -395,9 +414,10 @@ Color4Array_iaddColor(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const IMATH
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) += vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) += vb;
+    });
     return va; 
 }
 
@@ -407,9 +427,10 @@ Color4Array_isub(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const FixedArray
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) -= vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) -= vb(i,j);
+    });
     return va; 
 }
 
@@ -419,9 +440,10 @@ Color4Array_isubColor(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const IMATH
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) -= vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) -= vb;
+    });
     return va; 
 }
 
@@ -431,9 +453,10 @@ Color4Array_imul(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const FixedArray
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) *= vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) *= vb(i,j);
+    });
     return va; 
 }
 
@@ -443,9 +466,10 @@ Color4Array_imulColor(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const IMATH
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) *= vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) *= vb;
+    });
     return va; 
 }
 
@@ -455,9 +479,10 @@ Color4Array_idiv(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const FixedArray
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.match_dimension(vb);
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) /= vb(i,j); 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) /= vb(i,j);
+    });
     return va; 
 }
 
@@ -467,9 +492,10 @@ Color4Array_idivColor(FixedArray2D<IMATH_NAMESPACE::Color4<T> > &va, const IMATH
 { 
     PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Vec2<size_t> len = va.len();
-    for (size_t j = 0; j < len.y; ++j) 
-        for (size_t i = 0; i < len.x; ++i) 
-            va(i,j) /= vb; 
+    dispatchRows(len.y,len.x,[&](size_t j) {
+        for (size_t i = 0; i < len.x; ++i)
+            va(i,j) /= vb;
+    });
     return va; 
 }
 
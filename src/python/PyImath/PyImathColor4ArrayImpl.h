@@ -22,6 +22,8 @@
 #include "PyImath.h"
 #include "PyImathMathExc.h"
 #include "PyImathDecorators.h"
+#include "PyImathOperators.h"
+#include "PyImathSort.h"
 
 namespace PyImath {
 using namespace boost::python;
@@ -38,6 +40,18 @@ Color4Array_get(FixedArray<IMATH_NAMESPACE::Color4<T> > &ca)
                          ca.len(),4*ca.stride(),ca.handle(),ca.writable());
 }
 
+// Trick to register methods for float-only-based colors
+template <class T, IMATH_ENABLE_IF(!std::is_integral<T>::value)>
+void register_Color4Array_floatonly(class_<FixedArray<Color4<T>>>& color4Array_class)
+{
+    color4Array_class.def("mean", &fa_mean<IMATH_NAMESPACE::Color4<T>,T>, "mean() - the mean of the colors");
+}
+
+template <class T, IMATH_ENABLE_IF(std::is_integral<T>::value)>
+void register_Color4Array_floatonly(class_<FixedArray<Color4<T>>>& color4Array_class)
+{
+}
+
 // Currently we are only exposing the RGBA components.
 template <class T>
 class_<FixedArray<IMATH_NAMESPACE::Color4<T> > >
@@ -49,8 +63,14 @@ register_Color4Array()
         .add_property("g",&Color4Array_get<T,1>)
         .add_property("b",&Color4Array_get<T,2>)
         .add_property("a",&Color4Array_get<T,3>)
+        .def("sum", &fa_reduce<IMATH_NAMESPACE::Color4<T> >, "sum() - the sum of the colors")
+        .def("min", &fa_component_min<IMATH_NAMESPACE::Color4<T> >, "min() - the component-wise minimum of the colors")
+        .def("max", &fa_component_max<IMATH_NAMESPACE::Color4<T> >, "max() - the component-wise maximum of the colors")
         ;
 
+    register_Color4Array_floatonly(color4Array_class);
+    add_vector_sort_functions(color4Array_class);
+
     return color4Array_class;
 }
 
@@ -17,6 +17,7 @@
 #include "PyImathDecorators.h"
 #include "PyImathExport.h"
 #include "PyImathOperators.h"
+#include "PyImathTask.h"
 
 // XXX incomplete array wrapping, docstrings missing
 
@@ -178,116 +179,6 @@ setXYZTuple(Euler<T> &euler, const tuple &t)
         throw std::invalid_argument ("Euler expects tuple of length 3");
 }
 
-// needed to convert Eulerf::Order to Euler<T>::Order
-template <class T>
-static typename Euler<T>::Order interpretOrder(typename IMATH_NAMESPACE::Eulerf::Order order)
-{
-    typename Euler<T>::Order o = Euler<T>::XYZ;
-    switch(order)
-    {
-        case IMATH_NAMESPACE::Eulerf::XYZ:
-        {
-            o = Euler<T>::XYZ;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XZY:
-        {
-            o = Euler<T>::XZY;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YZX:
-        {
-            o = Euler<T>::YZX;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YXZ:
-        {
-            o = Euler<T>::YXZ;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZXY:
-        {
-            o = Euler<T>::ZXY;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZYX:
-        {
-            o = Euler<T>::ZYX;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XZX:
-        {
-            o = Euler<T>::XZX;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XYX:
-        {
-            o = Euler<T>::XYX;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YXY:
-        {
-            o = Euler<T>::YXY;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YZY:
-        {
-            o = Euler<T>::YZY;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZYZ:
-        {
-            o = Euler<T>::ZYZ;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZXZ:
-        {
-            o = Euler<T>::ZXZ;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XYZr:
-        {
-            o = Euler<T>::XYZr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XZYr:
-        {
-            o = Euler<T>::XZYr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YZXr:
-        {
-            o = Euler<T>::YZXr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YXZr:
-        {
-            o = Euler<T>::YXZr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZXYr:
-        {
-            o = Euler<T>::ZXYr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZYXr:
-        {
-            o = Euler<T>::ZYXr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XZXr:
-        {
-            o = Euler<T>::XZXr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::XYXr:
-        {
-            o = Euler<T>::XYXr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YXYr:
-        {
-            o = Euler<T>::YXYr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::YZYr:
-        {
-            o = Euler<T>::YZYr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZYZr:
-        {
-            o = Euler<T>::ZYZr;
-        }break;
-        case IMATH_NAMESPACE::Eulerf::ZXZr:
-        {
-            o = Euler<T>::ZXZr;
-        }break;            
-        default:
-            break;
-    }
-    
-    return o;
-}
-
 // needed to convert Eulerf::InputLayout to Euler<T>::InputLayout
 template <class T>
 static typename Euler<T>::InputLayout interpretInputLayout(typename IMATH_NAMESPACE::Eulerf::InputLayout layout)
@@ -777,16 +668,52 @@ EulerArray_get(FixedArray<IMATH_NAMESPACE::Euler<T> > &qa)
 }
 */
 
+//
+// The conversions between the Euler arrays and the quaternion, vector and
+// matrix arrays are dispatched across the worker threads.  Conversions to
+// Euler angles take the rotation order of the result; conversions from
+// Euler angles use the order of each element.
+//
+
 template <class T>
 static FixedArray<IMATH_NAMESPACE::Euler<T> > *
-EulerArray_eulerConstructor7a(const FixedArray<IMATH_NAMESPACE::Quat<T> > &q)
+EulerArray_eulerConstructor7(const FixedArray<IMATH_NAMESPACE::Quat<T> > &q, typename IMATH_NAMESPACE::Eulerf::Order order)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = q.len();
     FixedArray<IMATH_NAMESPACE::Euler<T> >* result = new FixedArray<IMATH_NAMESPACE::Euler<T> >(len);
-    for (size_t i = 0; i < len; ++i) {
-        (*result)[i].extract(q[i]);
-    }
+
+    typename Euler<T>::Order o = interpretOrder<T>(order);
+    FixedArray<IMATH_NAMESPACE::Euler<T> > &r = *result;
+    dispatchRows(len, 60, [&](size_t i) {
+        r[i] = Euler<T>(o);
+        r[i].extract(q[i]);
+    });
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Euler<T> > *
+EulerArray_eulerConstructor7a(const FixedArray<IMATH_NAMESPACE::Quat<T> > &q)
+{
+    return EulerArray_eulerConstructor7 (q, IMATH_NAMESPACE::Eulerf::Default);
+}
+
+template <class T, class M>
+static FixedArray<IMATH_NAMESPACE::Euler<T> > *
+EulerArray_matrixConstructor(const FixedArray<M> &m, typename IMATH_NAMESPACE::Eulerf::Order order)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = m.len();
+    FixedArray<IMATH_NAMESPACE::Euler<T> >* result = new FixedArray<IMATH_NAMESPACE::Euler<T> >(len);
+
+    typename Euler<T>::Order o = interpretOrder<T>(order);
+    FixedArray<IMATH_NAMESPACE::Euler<T> > &r = *result;
+    dispatchRows(len, 60, [&](size_t i) {
+        r[i] = Euler<T>(m[i], o);
+    });
     return result;
 }
 
@@ -795,12 +722,14 @@ static FixedArray<IMATH_NAMESPACE::Euler<T> > *
 EulerArray_eulerConstructor8a(const FixedArray<IMATH_NAMESPACE::Vec3<T> >& v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = v.len();
     FixedArray<IMATH_NAMESPACE::Euler<T> >* result = new FixedArray<IMATH_NAMESPACE::Euler<T> >(len);
 
-    for (size_t i = 0; i < len; ++i)
-        (*result)[i] = Euler<T>(v[i]);
-
+    FixedArray<IMATH_NAMESPACE::Euler<T> > &r = *result;
+    dispatchRows(len, 4, [&](size_t i) {
+        r[i] = Euler<T>(v[i]);
+    });
     return result;
 }
 
@@ -809,13 +738,15 @@ static FixedArray<IMATH_NAMESPACE::Euler<T> > *
 EulerArray_eulerConstructor9a(const FixedArray<IMATH_NAMESPACE::Vec3<T> >& v, typename IMATH_NAMESPACE::Eulerf::Order order)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = v.len();
     FixedArray<IMATH_NAMESPACE::Euler<T> >* result = new FixedArray<IMATH_NAMESPACE::Euler<T> >(len);
 
     typename Euler<T>::Order o = interpretOrder<T>(order);
-    for (size_t i = 0; i < len; ++i)
-        (*result)[i] = Euler<T>(v[i], o);
-
+    FixedArray<IMATH_NAMESPACE::Euler<T> > &r = *result;
+    dispatchRows(len, 4, [&](size_t i) {
+        r[i] = Euler<T>(v[i], o);
+    });
     return result;
 }
 
@@ -824,10 +755,12 @@ static FixedArray<IMATH_NAMESPACE::Vec3<T> >
 EulerArray_toXYZVector(const FixedArray<IMATH_NAMESPACE::Euler<T> >& e)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = e.len();
     FixedArray<IMATH_NAMESPACE::Vec3<T> > result(len, UNINITIALIZED);
-    for (size_t i = 0; i < len; ++i)
+    dispatchRows(len, 4, [&](size_t i) {
         result[i] = e[i].toXYZVector();
+    });
     return result;
 }
 
@@ -836,10 +769,40 @@ static FixedArray<IMATH_NAMESPACE::Quat<T> >
 EulerArray_toQuat(const FixedArray<IMATH_NAMESPACE::Euler<T> >& e)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = e.len();
     FixedArray<IMATH_NAMESPACE::Quat<T> > result(len, UNINITIALIZED);
-    for (size_t i = 0; i < len; ++i)
+    dispatchRows(len, 40, [&](size_t i) {
         result[i] = e[i].toQuat();
+    });
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix33<T> >
+EulerArray_toMatrix33(const FixedArray<IMATH_NAMESPACE::Euler<T> >& e)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = e.len();
+    FixedArray<IMATH_NAMESPACE::Matrix33<T> > result(len, UNINITIALIZED);
+    dispatchRows(len, 40, [&](size_t i) {
+        result[i] = e[i].toMatrix33();
+    });
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+EulerArray_toMatrix44(const FixedArray<IMATH_NAMESPACE::Euler<T> >& e)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = e.len();
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result(len, UNINITIALIZED);
+    dispatchRows(len, 40, [&](size_t i) {
+        result[i] = e[i].toMatrix44();
+    });
     return result;
 }
 
@@ -853,11 +816,22 @@ register_EulerArray()
         //.add_property("x",&EulerArray_get<T,1>)
         //.add_property("y",&EulerArray_get<T,2>)
         //.add_property("z",&EulerArray_get<T,3>)
+        .def("__init__", make_constructor(EulerArray_eulerConstructor7<T>))
         .def("__init__", make_constructor(EulerArray_eulerConstructor7a<T>))
         .def("__init__", make_constructor(EulerArray_eulerConstructor8a<T>))
         .def("__init__", make_constructor(EulerArray_eulerConstructor9a<T>))
+        .def("__init__", make_constructor(EulerArray_matrixConstructor<T, IMATH_NAMESPACE::Matrix33<T> >),
+             "EulerArray(M33Array, order) -- extract the rotations of the "
+             "matrices as Euler angles with the given order")
+        .def("__init__", make_constructor(EulerArray_matrixConstructor<T, IMATH_NAMESPACE::Matrix44<T> >),
+             "EulerArray(M44Array, order) -- extract the rotations of the "
+             "matrices as Euler angles with the given order")
         .def("toXYZVector", EulerArray_toXYZVector<T>)
         .def("toQuat", EulerArray_toQuat<T>)
+        .def("toMatrix33", EulerArray_toMatrix33<T>,
+             "e.toMatrix33() -- return the rotation matrices of the Euler angles")
+        .def("toMatrix44", EulerArray_toMatrix44<T>,
+             "e.toMatrix44() -- return the rotation matrices of the Euler angles")
         ;
 
     add_comparison_functions(eulerArray_class);
@@ -22,6 +22,118 @@ template <class T> boost::python::class_<PyImath::FixedArray<IMATH_NAMESPACE::Eu
 typedef FixedArray<IMATH_NAMESPACE::Eulerf>  EulerfArray;
 typedef FixedArray<IMATH_NAMESPACE::Eulerd>  EulerdArray;
 
+//
+// Converts the Eulerf::Order taken by the bindings to Euler<T>::Order.
+//
+template <class T>
+inline typename IMATH_NAMESPACE::Euler<T>::Order interpretOrder(typename IMATH_NAMESPACE::Eulerf::Order order)
+{
+    typename IMATH_NAMESPACE::Euler<T>::Order o = IMATH_NAMESPACE::Euler<T>::XYZ;
+    switch(order)
+    {
+        case IMATH_NAMESPACE::Eulerf::XYZ:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XYZ;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XZY:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XZY;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YZX:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YZX;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YXZ:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YXZ;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZXY:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZXY;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZYX:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZYX;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XZX:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XZX;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XYX:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XYX;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YXY:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YXY;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YZY:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YZY;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZYZ:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZYZ;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZXZ:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZXZ;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XYZr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XYZr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XZYr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XZYr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YZXr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YZXr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YXZr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YXZr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZXYr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZXYr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZYXr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZYXr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XZXr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XZXr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::XYXr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::XYXr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YXYr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YXYr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::YZYr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::YZYr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZYZr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZYZr;
+        }break;
+        case IMATH_NAMESPACE::Eulerf::ZXZr:
+        {
+            o = IMATH_NAMESPACE::Euler<T>::ZXZr;
+        }break;
+        default:
+            break;
+    }
+
+    return o;
+}
+
 //
 
 // Other code in the Zeno code base assumes the existance of a class with the
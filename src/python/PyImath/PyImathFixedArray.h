@@ -15,6 +15,9 @@
 #include <boost/any.hpp>
 #include <iostream>
 #include "PyImathUtil.h"
+#include "PyImathMaskIndices.h"
+#include "PyImathIndexList.h"
+#include "PyImathMappedFile.h"
 #include "ImathVec.h"
 
 //
@@ -83,8 +86,36 @@ struct FixedArrayDefaultValue
     static T value();
 };
 
+//
+// Whether the elements of a writable array are returned to python by
+// reference, so that they can be modified in place.  That needs a python
+// class for the element type, so element types without one, like half,
+// are returned by value, converted to the equivalent python type.
+//
+template <class T>
+struct FixedArrayReturnsReference : boost::is_class<T>
+{
+};
+
 enum Uninitialized {UNINITIALIZED};
 
+template <class T> class FixedArray;
+
+//
+// Converts the elements of an array to another element type, for the
+// converting constructor of FixedArray.  Specializations provide faster
+// conversions between particular types.
+//
+template <class T, class S>
+struct FixedArrayConversion
+{
+    static void apply (const FixedArray<S> &src, T *dst)
+    {
+        for (size_t i = 0; i < size_t(src.len()); ++i)
+            dst[i] = T(src[i]);
+    }
+};
+
 template <class T>
 class FixedArray
 {
@@ -97,7 +128,7 @@ class FixedArray
     // so that everything is freed properly on exit.
     boost::any _handle;
 
-    boost::shared_array<size_t> _indices; // non-NULL iff I'm a masked reference
+    MaskIndices                 _indices; // non-empty iff I'm a masked reference
     size_t                      _unmaskedLength;
 
 
@@ -215,24 +246,8 @@ class FixedArray
 
         size_t len = f.match_dimension(mask);
         _unmaskedLength = len;
-
-        size_t reduced_len = 0;
-        for (size_t i = 0; i < len; ++i)
-            if (mask[i])
-                reduced_len++;
-
-        _indices.reset(new size_t[reduced_len]);
-
-        for (size_t i = 0, j = 0; i < len; ++i)
-        {
-            if (mask[i])
-            {
-                _indices[j] = i;
-                j++;
-            }
-        }
-
-        _length = reduced_len;
+        _indices = MaskIndices(mask, len);
+        _length = _indices.size();
     }
 
     template <typename MaskArrayType>
@@ -246,24 +261,8 @@ class FixedArray
 
         size_t len = f.match_dimension(mask);
         _unmaskedLength = len;
-
-        size_t reduced_len = 0;
-        for (size_t i = 0; i < len; ++i)
-            if (mask[i])
-                reduced_len++;
-
-        _indices.reset(new size_t[reduced_len]);
-
-        for (size_t i = 0, j = 0; i < len; ++i)
-        {
-            if (mask[i])
-            {
-                _indices[j] = i;
-                j++;
-            }
-        }
-
-        _length = reduced_len;
+        _indices = MaskIndices(mask, len);
+        _length = _indices.size();
     }
 
     template <class S>
@@ -272,17 +271,12 @@ class FixedArray
           _handle(), _unmaskedLength(other.unmaskedLength())
     {
         boost::shared_array<T> a(new T[_length]);
-        for (size_t i=0; i<_length; ++i) a[i] = T(other[i]);
+        FixedArrayConversion<T,S>::apply(other, a.get());
         _handle = a;
         _ptr = a.get();
 
         if (_unmaskedLength)
-        {
-            _indices.reset(new size_t[_length]);
-
-            for (size_t i = 0; i < _length; ++i)
-                _indices[i] = other.raw_ptr_index(i);
-        }
+            _indices = other.maskIndices();
     }
 
     FixedArray(const FixedArray &other)
@@ -375,7 +369,7 @@ class FixedArray
 
     boost::python::object  getobjectTuple (Py_ssize_t index)
     {
-        typedef typename boost::mpl::if_<boost::is_class<T>,
+        typedef typename boost::mpl::if_<FixedArrayReturnsReference<T>,
                                          ReturnReference<T>,
                                          ReturnByValue<T> >::type convertType;
 
@@ -409,7 +403,7 @@ class FixedArray
 
     boost::python::object  getobjectTuple (Py_ssize_t index) const
     {
-        typedef typename boost::mpl::if_<boost::is_class<T>,
+        typedef typename boost::mpl::if_<FixedArrayReturnsReference<T>,
                                          ReturnReference<T>,
                                          ReturnByValue<T> >::type convertType;
 
@@ -449,6 +443,37 @@ class FixedArray
         return f;
     }
 
+    //
+    // Unlike getslice, getslice_view returns an array referring to the
+    // elements of the slice rather than a copy of them, with the start
+    // and step folded into the pointer and stride.  The step of the
+    // slice must be positive.
+    //
+    FixedArray getslice_view(::PyObject *index)
+    {
+        size_t start=0, end=0, slicelength=0;
+        Py_ssize_t step;
+        extract_slice_indices(index,start,end,step,slicelength);
+        if (slicelength < 2)
+            step = 1;
+        else if (step < 1)
+            throw std::invalid_argument("Views of slices with a negative step are not supported");
+
+        FixedArray f(*this);
+        f._length = slicelength;
+
+        if (isMaskedReference())
+        {
+            f._indices = MaskIndices(_indices, start, step, slicelength);
+        }
+        else
+        {
+            f._ptr = _ptr + start*_stride;
+            f._stride = _stride*step;
+        }
+        return f;
+    }
+
     template <typename MaskArrayType>
     FixedArray getslice_mask(const MaskArrayType& mask)
     {
@@ -457,6 +482,70 @@ class FixedArray
         return f;
     }
 
+    //
+    // take returns the elements at the given indices.  Strictly
+    // increasing indices select a masked reference to the elements, as a
+    // mask would, preserving the 'writable' state; other indices select
+    // a copy of the elements.
+    //
+    FixedArray take(const FixedArray<int> &indices)
+    {
+        IndexList idx(indices, len());
+        if (idx.increasing())
+        {
+            FixedArray f(*this);
+            f._length = idx.size();
+            if (isMaskedReference())
+            {
+                std::vector<size_t> raw(idx.size());
+                for (size_t k=0; k<raw.size(); ++k)
+                    raw[k] = raw_ptr_index(idx[k]);
+                f._indices = MaskIndices(raw, raw.size(), _unmaskedLength);
+            }
+            else
+            {
+                f._unmaskedLength = _length;
+                f._indices = MaskIndices(idx, idx.size(), _length);
+            }
+            return f;
+        }
+
+        FixedArray f(static_cast<Py_ssize_t>(idx.size()), UNINITIALIZED);
+        const FixedArray &self = *this;
+        T *dst = f._ptr;
+        PY_IMATH_LEAVE_PYTHON;
+        idx.gather(1, [&] (size_t k) { dst[k] = self[idx[k]]; });
+        return f;
+    }
+
+    //
+    // put and scatterAdd store values at the given indices.  When an
+    // index repeats, put stores the last of its values.
+    //
+    template <typename ArrayType>
+    void put_vector(const FixedArray<int> &indices, const ArrayType &values)
+    {
+        if (!_writable)
+            throw std::invalid_argument("Fixed array is read-only.");
+
+        IndexList idx(indices, len());
+        if (static_cast<size_t>(values.len()) != idx.size())
+            throw std::invalid_argument("Dimensions of source do not match destination");
+
+        PY_IMATH_LEAVE_PYTHON;
+        idx.scatter(1, [&] (size_t k) { unchecked_index(idx[k]) = values[k]; });
+    }
+
+    void put_scalar(const FixedArray<int> &indices, const T &value)
+    {
+        if (!_writable)
+            throw std::invalid_argument("Fixed array is read-only.");
+
+        IndexList idx(indices, len());
+        PY_IMATH_LEAVE_PYTHON;
+        idx.scatter(1, [&] (size_t k) { unchecked_index(idx[k]) = value; });
+    }
+
     void
     setitem_scalar(PyObject *index, const T &data)
     {
@@ -490,8 +579,7 @@ class FixedArray
 
         if (isMaskedReference())
         {
-            for (size_t i = 0; i < len; ++i)
-                _ptr[raw_ptr_index(i)*_stride] = data;
+            _indices.forEach (0, len, [&] (size_t, size_t index) { _ptr[index*_stride] = data; });
         }
         else
         {
@@ -625,8 +713,19 @@ class FixedArray
         return _ptr[i*_stride];
     }
 
-    bool isMaskedReference() const {return _indices.get() != 0;}
+    bool isMaskedReference() const {return bool(_indices);}
     size_t unmaskedLength() const {return _unmaskedLength;}
+    const MaskIndices &maskIndices() const {return _indices;}
+
+    const char *maskEncoding() const {return MaskIndices::encodingName(_indices.encoding());}
+
+    // Masked references to a contiguous range of the unmasked array are
+    // accessed like unmasked arrays, starting at the first element of
+    // the range.
+    bool hasDirectAccess() const
+    {
+        return !isMaskedReference() || _indices.encoding() == MaskIndices::RANGE;
+    }
 
     // Conversion of indices to raw pointer indices.
     // This should only be called when this is a masked reference.
@@ -635,10 +734,59 @@ class FixedArray
     {
         assert(isMaskedReference());
         assert(i < _length);
-        assert(_indices[i] >= 0 && _indices[i] < _unmaskedLength);
+        assert(_indices[i] < _unmaskedLength);
         return _indices[i];
     }
 
+    //
+    // Map the array stored in the file at 'path' into memory, in place.
+    // The file format is described in PyImathMappedFile.h, and the file
+    // must hold elements of this array type.  'offset' and 'length'
+    // select a range of elements, a negative length extends the range
+    // to the end of the file.  A writable array writes its changes
+    // through to the file.
+    //
+    static FixedArray<T> *mmap (const std::string &path, Py_ssize_t offset,
+                                Py_ssize_t length, bool writable)
+    {
+        MappedArrayLayout layout;
+        boost::shared_ptr<MappedFile> file =
+            mapArrayFile (path, name(), sizeof(T), writable, layout);
+
+        Py_ssize_t count = layout.count;
+        if (offset < 0 || offset > count)
+            throw std::out_of_range ("Array file offset out of range");
+        if (length < 0)
+            length = count - offset;
+        else if (length > count - offset)
+            throw std::out_of_range ("Array file range extends past the end of the file");
+
+        T *ptr = reinterpret_cast<T *> (file->data() + layout.dataOffset + offset * layout.stride);
+        Py_ssize_t stride = layout.stride / sizeof(T);
+        if (writable)
+            return new FixedArray<T> (ptr, length, stride, boost::any (file), true);
+        return new FixedArray<T> (const_cast<const T *> (ptr), length, stride, boost::any (file));
+    }
+
+    //
+    // Write the array to a file that can be mapped with mmap().
+    //
+    void save (const std::string &path) const
+    {
+        MappedArrayLayout layout;
+        boost::shared_ptr<MappedFile> file =
+            createArrayFile (path, name(), sizeof(T), _length, layout);
+        T *dst = reinterpret_cast<T *> (file->data() + layout.dataOffset);
+
+        PY_IMATH_LEAVE_PYTHON;
+        if (isMaskedReference())
+            _indices.forEach (0, _length, [&] (size_t i, size_t index) { dst[i] = _ptr[index*_stride]; });
+        else
+            for (size_t i = 0; i < _length; ++i)
+                dst[i] = _ptr[i*_stride];
+        commitArrayFile (file, path);
+    }
+
     static boost::python::class_<FixedArray<T> > register_(const char *doc)
     {
         // Depending on the data-type (class or fundamental) and the writable
@@ -675,9 +823,41 @@ class FixedArray
             .def("__setitem__", &FixedArray<T>::setitem_vector_mask<FixedArray<int>, FixedArray<T> >)
             .def("__len__",&FixedArray<T>::len)
             .def("writable",&FixedArray<T>::writable)
+            .def("maskEncoding",&FixedArray<T>::maskEncoding,
+                 "maskEncoding() - how a masked array stores the indices of its elements:\n"
+                 "'range', 'runs', 'bitmap' or 'indices', or 'none' if it isn't masked")
             .def("makeReadOnly", &FixedArray<T>::makeReadOnly)
             .def("ifelse",&FixedArray<T>::ifelse_scalar)
             .def("ifelse",&FixedArray<T>::ifelse_vector)
+            .def("sliceView",&FixedArray<T>::getslice_view,
+                 boost::python::with_custodian_and_ward_postcall<0,1>(),
+                 "sliceView(slice) - return an array referring to the elements of the\n"
+                 "slice of this array without copying them, unlike a[slice].  Changes\n"
+                 "made through either array are visible in the other.  The step of\n"
+                 "the slice must be positive.")
+            .def("take",&FixedArray<T>::take,
+                 boost::python::with_custodian_and_ward_postcall<0,1>(),
+                 boost::python::args("indices"),
+                 "take(indices) - return the elements at the given indices, which may be\n"
+                 "negative to count from the end.  Strictly increasing indices return an\n"
+                 "array referring to the elements, like a mask does, others a copy.")
+            .def("put",&FixedArray<T>::put_vector<FixedArray<T> >,boost::python::args("indices","values"),
+                 "put(indices, values) - set the elements at the given indices to the\n"
+                 "corresponding values.  When an index repeats the last value is kept.")
+            .def("put",&FixedArray<T>::put_scalar,boost::python::args("indices","value"),
+                 "put(indices, value) - set the elements at the given indices to value")
+            .def("save",&FixedArray<T>::save,boost::python::args("path"),
+                 "save(path) - write the array to a file that can be opened with mmap")
+            .def("mmap",&FixedArray<T>::mmap,
+                 (boost::python::arg("path"), boost::python::arg("offset")=0,
+                  boost::python::arg("length")=-1, boost::python::arg("writable")=false),
+                 boost::python::return_value_policy<boost::python::manage_new_object>(),
+                 "mmap(path, offset=0, length=-1, writable=False) - map an array file written\n"
+                 "by save() into memory without reading it.  Pages are loaded on demand and\n"
+                 "shared with other processes mapping the same file.  offset and length\n"
+                 "select a range of elements, a negative length reads to the end of the file.\n"
+                 "Changes to a writable array are written back to the file.")
+            .staticmethod("mmap")
             ;
         return c;
     }
@@ -725,6 +905,11 @@ class FixedArray
     // Instantiations of fixed ararys must implement this static member
     static const char *name();
 
+    T * directPtr() const
+    {
+        return isMaskedReference() ? _ptr + _indices.first() * _stride : _ptr;
+    }
+
     // Various 'Accessor' classes used in performance-critical areas while also
     // managing the writable/read-only state efficiently.
 
@@ -732,9 +917,9 @@ class FixedArray
     {
       public:
         ReadOnlyDirectAccess (const FixedArray<T>& array)
-            : _ptr (array._ptr), _stride (array._stride)
+            : _ptr (array.directPtr()), _stride (array._stride)
         {
-            if (array.isMaskedReference())
+            if (!array.hasDirectAccess())
                 throw std::invalid_argument ("Fixed array is masked. ReadOnlyDirectAccess not granted.");
         }
 
@@ -754,7 +939,7 @@ class FixedArray
     {
       public:
         WritableDirectAccess (FixedArray<T>& array)
-            : ReadOnlyDirectAccess (array), _ptr (array._ptr)
+            : ReadOnlyDirectAccess (array), _ptr (array.directPtr())
         {
             if (!array.writable())
                 throw std::invalid_argument ("Fixed array is read-only.  WritableDirectAccess not granted.");
@@ -791,12 +976,28 @@ class FixedArray
         // No index-range check here.
         const T&  operator[] (size_t i) const { return _ptr[_indices[i]*_stride]; }
 
+        // For loops over consecutive elements, see SequentialAccess.
+        class Sequential
+        {
+          public:
+            Sequential (const ReadOnlyMaskedAccess& access)
+                : _ptr (access._ptr), _stride (access._stride),
+                  _cursor (access._indices) {}
+
+            const T&  operator[] (size_t i) { return _ptr[_cursor[i]*_stride]; }
+
+          private:
+            const T*              _ptr;
+            const size_t          _stride;
+            MaskIndices::Cursor   _cursor;
+        };
+
       private:
         const T*  _ptr;
 
       protected:
-        const size_t                 _stride;
-        boost::shared_array<size_t>  _indices;
+        const size_t  _stride;
+        MaskIndices   _indices;
     };
 
     class WritableMaskedAccess : public ReadOnlyMaskedAccess
@@ -815,6 +1016,21 @@ class FixedArray
         // No index-range check here.
         T&  operator[] (size_t i) { return _ptr[_indices[i]*_stride]; }
 
+        class Sequential
+        {
+          public:
+            Sequential (WritableMaskedAccess& access)
+                : _ptr (access._ptr), _stride (access._stride),
+                  _cursor (access._indices) {}
+
+            T&  operator[] (size_t i) { return _ptr[_cursor[i]*_stride]; }
+
+          private:
+            T*                    _ptr;
+            const size_t          _stride;
+            MaskIndices::Cursor   _cursor;
+        };
+
       private:
         T*  _ptr;
 
@@ -824,6 +1040,43 @@ class FixedArray
 
 };
 
+namespace detail {
+
+template <class T>
+struct void_type { typedef void type; };
+
+} // namespace detail
+
+//
+// SequentialAccess<Access>::type is the type to index the elements of
+// an accessor with in a loop over consecutive elements, such as the
+// loop of a task.  Masked accessors provide a Sequential class, which
+// follows the mask with a MaskIndices::Cursor rather than mapping each
+// index from scratch; other accessors are used as they are:
+//
+//    typename SequentialAccess<access_type>::type a (access);
+//    for (size_t i = start; i < end; ++i)
+//        ... a[i] ...
+//
+template <class Access, class Enable = void>
+struct SequentialAccess
+{
+    typedef Access & type;
+};
+
+template <class Access>
+struct SequentialAccess<Access, typename detail::void_type<typename Access::Sequential>::type>
+{
+    typedef typename Access::Sequential type;
+};
+
+template <class Access>
+inline typename SequentialAccess<Access>::type
+sequentialAccess (Access &access)
+{
+    return typename SequentialAccess<Access>::type (access);
+}
+
 //
 // Helper struct for arary indexing  with a known compile time length
 //
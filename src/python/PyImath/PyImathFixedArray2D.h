@@ -114,10 +114,11 @@ class FixedArray2D
     {
         initializeSize();
         boost::shared_array<T> a(new T[_size]);
-        size_t z = 0;
-        for (size_t j = 0; j < _length.y; ++j)
+        T *p = a.get();
+        dispatchRows(_length.y,_length.x,[&](size_t j) {
             for (size_t i = 0; i < _length.x; ++i)
-                a[z++] = T(other(i,j));
+                p[j*_length.x + i] = T(other(i,j));
+        });
         _handle = a;
         _ptr = a.get();
     }
@@ -434,18 +435,20 @@ class FixedArray2D
         IMATH_NAMESPACE::Vec2<size_t> len = match_dimension(choice);
         match_dimension(other);
         FixedArray2D<T> tmp(len); // should use default construction but V3f doens't initialize
-        for (size_t j = 0; j < len.y; ++j)
+        dispatchRows(len.y,len.x,[&](size_t j) {
             for (size_t i = 0; i < len.x; ++i)
                 tmp(i,j) = choice(i,j) ? (*this)(i,j) : other(i,j);
+        });
         return tmp;
     }
 
     FixedArray2D<T> ifelse_scalar(const FixedArray2D<int> &choice, const T &other) {
         IMATH_NAMESPACE::Vec2<size_t> len = match_dimension(choice);
         FixedArray2D<T> tmp(len); // should use default construction but V3f doens't initialize
-        for (size_t j = 0; j < len.y; ++j)
+        dispatchRows(len.y,len.x,[&](size_t j) {
             for (size_t i = 0; i < len.x; ++i)
                 tmp(i,j) = choice(i,j) ? (*this)(i,j) : other;
+        });
         return tmp;
     }
 
@@ -456,12 +459,13 @@ template <template <class,class> class Op, class T1, class Ret>
 FixedArray2D<Ret> apply_array2d_unary_op(const FixedArray2D<T1> &a1)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.len();
+    PY_IMATH_LEAVE_PYTHON;
     FixedArray2D<Ret> retval(len.x,len.y);
-    for (size_t j=0; j<len.y; ++j) {
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T1,Ret> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             retval(i,j) = Op<T1,Ret>::apply(a1(i,j));
         }
-    }
+    });
     return retval;
 }
 
@@ -470,12 +474,13 @@ template <template <class,class,class> class Op, class T1, class T2, class Ret>
 FixedArray2D<Ret> apply_array2d_array2d_binary_op(const FixedArray2D<T1> &a1, const FixedArray2D<T2> &a2)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.match_dimension(a2);
+    PY_IMATH_LEAVE_PYTHON;
     FixedArray2D<Ret> retval(len.x,len.y);
-    for (size_t j=0; j<len.y; ++j) {
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T1,T2,Ret> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             retval(i,j) = Op<T1,T2,Ret>::apply(a1(i,j),a2(i,j));
         }
-    }
+    });
     return retval;
 }
 
@@ -483,12 +488,13 @@ template <template <class,class,class> class Op, class T1, class T2, class Ret>
 FixedArray2D<Ret> apply_array2d_scalar_binary_op(const FixedArray2D<T1> &a1, const T2 &a2)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.len();
+    PY_IMATH_LEAVE_PYTHON;
     FixedArray2D<Ret> retval(len.x,len.y);
-    for (size_t j=0; j<len.y; ++j) {
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T1,T2,Ret> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             retval(i,j) = Op<T1,T2,Ret>::apply(a1(i,j),a2);
         }
-    }
+    });
     return retval;
 }
 
@@ -496,12 +502,13 @@ template <template <class,class,class> class Op, class T1, class T2, class Ret>
 FixedArray2D<Ret> apply_array2d_scalar_binary_rop(const FixedArray2D<T1> &a1, const T2 &a2)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.len();
+    PY_IMATH_LEAVE_PYTHON;
     FixedArray2D<Ret> retval(len.x,len.y);
-    for (size_t j=0; j<len.y; ++j) {
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T2,T1,Ret> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             retval(i,j) = Op<T2,T1,Ret>::apply(a2,a1(i,j));
         }
-    }
+    });
     return retval;
 }
 
@@ -510,11 +517,12 @@ template <template <class,class> class Op, class T1, class T2>
 FixedArray2D<T1> & apply_array2d_array2d_ibinary_op(FixedArray2D<T1> &a1, const FixedArray2D<T2> &a2)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.match_dimension(a2);
-    for (size_t j=0; j<len.y; ++j) {
+    PY_IMATH_LEAVE_PYTHON;
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T1,T2> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             Op<T1,T2>::apply(a1(i,j),a2(i,j));
         }
-    }
+    });
     return a1;
 }
 
@@ -523,11 +531,12 @@ template <template <class,class> class Op, class T1, class T2>
 FixedArray2D<T1> & apply_array2d_scalar_ibinary_op(FixedArray2D<T1> &a1, const T2 &a2)
 {
     IMATH_NAMESPACE::Vec2<size_t> len = a1.len();
-    for (size_t j=0; j<len.y; ++j) {
+    PY_IMATH_LEAVE_PYTHON;
+    dispatchRows(len.y,len.x*detail::op_cost<Op<T1,T2> >::value(),[&](size_t j) {
         for (size_t i=0;i<len.x;++i) {
             Op<T1,T2>::apply(a1(i,j),a2);
         }
-    }
+    });
     return a1;
 }
 
@@ -10,6 +10,7 @@
 
 #include <Python.h>
 #include <ImathVec.h>
+#include <ImathColor.h>
 #include <half.h>
 #include <string>
 
@@ -68,6 +69,8 @@ template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Vec4<int> >()      { re
 template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Vec4<int64_t> >()  { return PyFmtStr_long;   } 
 template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Vec4<float> >()    { return PyFmtStr_float;  } 
 template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Vec4<double> >()   { return PyFmtStr_double; } 
+template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Vec3<half> >()     { return PyFmtStr_half;   } 
+template <> constexpr  char*   PyFormat<IMATH_NAMESPACE::Color4<half> >()   { return PyFmtStr_half;   } 
 
 
 template <typename T> struct FixedArrayWidth { static const Py_ssize_t value; };
@@ -78,6 +81,7 @@ template <> struct FixedArrayWidth<int64_t>                          { static co
 template <> struct FixedArrayWidth<float>                            { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayWidth<double>                           { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayWidth<unsigned char>                    { static const Py_ssize_t value = 1; };
+template <> struct FixedArrayWidth<half>                             { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec2<short> >    { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec2<int> >      { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec2<int64_t> >  { static const Py_ssize_t value = 2; };
@@ -93,6 +97,8 @@ template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec4<int> >      { static co
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec4<int64_t> >  { static const Py_ssize_t value = 4; };
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec4<float> >    { static const Py_ssize_t value = 4; };
 template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec4<double> >   { static const Py_ssize_t value = 4; };
+template <> struct FixedArrayWidth<IMATH_NAMESPACE::Vec3<half> >     { static const Py_ssize_t value = 3; };
+template <> struct FixedArrayWidth<IMATH_NAMESPACE::Color4<half> >   { static const Py_ssize_t value = 4; };
 
 
 template <typename T> struct FixedArrayDimension { static const Py_ssize_t value; };
@@ -103,6 +109,7 @@ template <> struct FixedArrayDimension<int64_t>                          { stati
 template <> struct FixedArrayDimension<float>                            { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayDimension<double>                           { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayDimension<unsigned char>                    { static const Py_ssize_t value = 1; };
+template <> struct FixedArrayDimension<half>                             { static const Py_ssize_t value = 1; };
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec2<short> >    { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec2<int> >      { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec2<int64_t> >  { static const Py_ssize_t value = 2; };
@@ -118,6 +125,8 @@ template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec4<int> >      { stati
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec4<int64_t> >  { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec4<float> >    { static const Py_ssize_t value = 2; };
 template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec4<double> >   { static const Py_ssize_t value = 2; };
+template <> struct FixedArrayDimension<IMATH_NAMESPACE::Vec3<half> >     { static const Py_ssize_t value = 2; };
+template <> struct FixedArrayDimension<IMATH_NAMESPACE::Color4<half> >   { static const Py_ssize_t value = 2; };
 
 
 template <typename T> struct FixedArrayAtomicSize { static const Py_ssize_t value; };
@@ -128,6 +137,7 @@ template <> struct FixedArrayAtomicSize<int64_t>                          { stat
 template <> struct FixedArrayAtomicSize<float>                            { static const Py_ssize_t value = sizeof(float); };
 template <> struct FixedArrayAtomicSize<double>                           { static const Py_ssize_t value = sizeof(double); };
 template <> struct FixedArrayAtomicSize<unsigned char>                    { static const Py_ssize_t value = sizeof(unsigned char); };
+template <> struct FixedArrayAtomicSize<half>                             { static const Py_ssize_t value = sizeof(half); };
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec2<short> >    { static const Py_ssize_t value = sizeof(short); };
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec2<int> >      { static const Py_ssize_t value = sizeof(int); };
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec2<int64_t> >  { static const Py_ssize_t value = sizeof(int64_t); };
@@ -143,6 +153,8 @@ template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec4<int> >      { stat
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec4<int64_t> >  { static const Py_ssize_t value = sizeof(int64_t); };
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec4<float> >    { static const Py_ssize_t value = sizeof(float); };
 template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec4<double> >   { static const Py_ssize_t value = sizeof(double); };
+template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Vec3<half> >     { static const Py_ssize_t value = sizeof(half); };
+template <> struct FixedArrayAtomicSize<IMATH_NAMESPACE::Color4<half> >   { static const Py_ssize_t value = sizeof(half); };
 
 } // namespace
 
@@ -232,10 +232,13 @@ FixedMatrix<Ret> apply_matrix_unary_op(const FixedMatrix<T1> &a1)
 {
     int rows = a1.rows();
     int cols = a1.cols();
+    PY_IMATH_LEAVE_PYTHON;
     FixedMatrix<Ret> retval(rows,cols);
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        retval.element(i,j) = Op<T1,Ret>::apply(a1.element(i,j));
-    }
+    dispatchRows(rows,cols*detail::op_cost<Op<T1,Ret> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            retval.element(i,j) = Op<T1,Ret>::apply(a1.element(i,j));
+        }
+    });
     return retval;
 }
 
@@ -245,10 +248,13 @@ FixedMatrix<Ret> apply_matrix_matrix_binary_op(const FixedMatrix<T1> &a1, const
 {
     int rows = a1.match_dimension(a2);
     int cols = a1.cols();
+    PY_IMATH_LEAVE_PYTHON;
     FixedMatrix<Ret> retval(rows,cols);
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        retval.element(i,j) = Op<T1,T2,Ret>::apply(a1.element(i,j),a2.element(i,j));
-    }
+    dispatchRows(rows,cols*detail::op_cost<Op<T1,T2,Ret> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            retval.element(i,j) = Op<T1,T2,Ret>::apply(a1.element(i,j),a2.element(i,j));
+        }
+    });
     return retval;
 }
 
@@ -257,10 +263,13 @@ FixedMatrix<Ret> apply_matrix_scalar_binary_op(const FixedMatrix<T1> &a1, const
 {
     int rows = a1.rows();
     int cols = a1.cols();
+    PY_IMATH_LEAVE_PYTHON;
     FixedMatrix<Ret> retval(rows,cols);
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        retval.element(i,j) = Op<T1,T2,Ret>::apply(a1.element(i,j),a2);
-    }
+    dispatchRows(rows,cols*detail::op_cost<Op<T1,T2,Ret> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            retval.element(i,j) = Op<T1,T2,Ret>::apply(a1.element(i,j),a2);
+        }
+    });
     return retval;
 }
 
@@ -269,10 +278,13 @@ FixedMatrix<Ret> apply_matrix_scalar_binary_rop(const FixedMatrix<T1> &a1, const
 {
     int rows = a1.rows();
     int cols = a1.cols();
+    PY_IMATH_LEAVE_PYTHON;
     FixedMatrix<Ret> retval(rows,cols);
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        retval.element(i,j) = Op<T2,T1,Ret>::apply(a2,a1.element(i,j));
-    }
+    dispatchRows(rows,cols*detail::op_cost<Op<T2,T1,Ret> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            retval.element(i,j) = Op<T2,T1,Ret>::apply(a2,a1.element(i,j));
+        }
+    });
     return retval;
 }
 
@@ -282,9 +294,12 @@ FixedMatrix<T1> & apply_matrix_matrix_ibinary_op(FixedMatrix<T1> &a1, const Fixe
 {
     int rows = a1.match_dimension(a2);
     int cols = a1.cols();
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        Op<T1,T2>::apply(a1.element(i,j),a2.element(i,j));
-    }
+    PY_IMATH_LEAVE_PYTHON;
+    dispatchRows(rows,cols*detail::op_cost<Op<T1,T2> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            Op<T1,T2>::apply(a1.element(i,j),a2.element(i,j));
+        }
+    });
     return a1;
 }
 
@@ -294,9 +309,12 @@ FixedMatrix<T1> & apply_matrix_scalar_ibinary_op(FixedMatrix<T1> &a1, const T2 &
 {
     int rows = a1.rows();
     int cols = a1.cols();
-    for (int i=0;i<rows;++i) for (int j=0; j<cols; ++j) {
-        Op<T1,T2>::apply(a1.element(i,j),a2);
-    }
+    PY_IMATH_LEAVE_PYTHON;
+    dispatchRows(rows,cols*detail::op_cost<Op<T1,T2> >::value(),[&](size_t i) {
+        for (int j=0; j<cols; ++j) {
+            Op<T1,T2>::apply(a1.element(i,j),a2);
+        }
+    });
     return a1;
 }
 
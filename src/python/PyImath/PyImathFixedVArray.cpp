@@ -350,6 +350,51 @@ FixedVArray<T>::getslice_mask (const FixedArray<int>& mask)
     return FixedVArray<T> (*this, mask);
 }
 
+//
+// Strictly increasing indices select a masked reference to the
+// elements, as a mask would; other indices select a copy of them.
+//
+template <class T>
+FixedVArray<T>
+FixedVArray<T>::take (const FixedArray<int>& indices)
+{
+    IndexList idx (indices, _length);
+    if (idx.increasing())
+    {
+        FixedVArray<T> f (*this);
+        f._length = idx.size();
+        f._indices.reset (new size_t[idx.size()]);
+        for (size_t k = 0; k < idx.size(); ++k)
+            f._indices[k] = _indices ? raw_ptr_index (idx[k]) : idx[k];
+        if (!_indices)
+            f._unmaskedLength = _length;
+        return f;
+    }
+
+    FixedVArray<T> f (static_cast<Py_ssize_t> (idx.size()));
+    const FixedVArray<T>& self = *this;
+    std::vector<T>* dst = f._ptr;
+    PY_IMATH_LEAVE_PYTHON;
+    idx.gather (1, [&] (size_t k) { dst[k] = self[idx[k]]; });
+    return f;
+}
+
+// When an index repeats, the last of its elements of 'data' is kept.
+template <class T>
+void
+FixedVArray<T>::put (const FixedArray<int>& indices, const FixedVArray<T>& data)
+{
+    if (!_writable)
+        throw std::invalid_argument ("Fixed V-array is read-only.");
+
+    IndexList idx (indices, _length);
+    if (static_cast<size_t> (data.len()) != idx.size())
+        throw std::invalid_argument ("Dimensions of source do not match destination");
+
+    PY_IMATH_LEAVE_PYTHON;
+    idx.scatter (1, [&] (size_t k) { (*this)[idx[k]] = data[k]; });
+}
+
 template <class T>
 void
 FixedVArray<T>::setitem_scalar (PyObject* index, const FixedArray<T>& data)
@@ -832,6 +877,15 @@ FixedVArray<T>::register_(const char* doc)
         .def("__setitem__", &FixedVArray<T>::setitem_vector)
         .def("__setitem__", &FixedVArray<T>::setitem_vector_mask)
 
+        .def("take",        &FixedVArray<T>::take, boost::python::with_custodian_and_ward_postcall<0,1>(),
+             boost::python::args("indices"),
+             "take(indices) - return the elements at the given indices, which may be negative\n"
+             "to count from the end.  Strictly increasing indices return an array referring\n"
+             "to the elements, like a mask does, others a copy.")
+        .def("put",         &FixedVArray<T>::put, boost::python::args("indices", "data"),
+             "put(indices, data) - set the elements at the given indices to the\n"
+             "corresponding elements of data.  When an index repeats the last one is kept.")
+
         .def("__len__",     &FixedVArray<T>::len)
         .def("writable",    &FixedVArray<T>::writable)
         .def("makeReadOnly",&FixedVArray<T>::makeReadOnly)
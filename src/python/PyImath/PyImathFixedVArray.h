@@ -97,6 +97,9 @@ class FixedVArray
     void            setitem_vector (PyObject* index, const FixedVArray<T>& data);
     void            setitem_vector_mask (const FixedArray<int>& mask, const FixedVArray<T>& data);
 
+    FixedVArray<T>  take (const FixedArray<int>& indices);
+    void            put (const FixedArray<int>& indices, const FixedVArray<T>& data);
+
     struct SizeHelper
     {
         SizeHelper(FixedVArray &a) : _a(a) {}
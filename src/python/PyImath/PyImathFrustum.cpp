@@ -456,6 +456,7 @@ template <class T,class T2>
 PyImath::FixedArray<int>
 frustumTest_isVisible(IMATH_NAMESPACE::FrustumTest<T>& ft, const PyImath::FixedArray<T2>& points)
 {
+    PY_IMATH_LEAVE_PYTHON;
     size_t numPoints = points.len();
     PyImath::FixedArray<int> mask(numPoints);
 
@@ -13,12 +13,15 @@
 #include <ImathColorAlgo.h>
 #include <ImathFun.h>
 #include <cmath>
+#include "PyImathTask.h"
 
 namespace PyImath {
 
 template <class T>
-struct rotationXYZWithUpDir_op
+struct rotationXYZWithUpDir_op : public op_with_cost
 {
+    static const size_t cost = 100;
+
     static IMATH_NAMESPACE::Vec3<T>
     apply(const IMATH_NAMESPACE::Vec3<T> &from, const IMATH_NAMESPACE::Vec3<T> &to, 
           const IMATH_NAMESPACE::Vec3<T> &up)
@@ -50,8 +53,10 @@ struct sign_op
 };
 
 template <class T>
-struct log_op
+struct log_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static T
     apply(T value)
     {
@@ -60,8 +65,10 @@ struct log_op
 };
 
 template <class T>
-struct log10_op
+struct log10_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static T
     apply(T value)
     {
@@ -215,8 +222,10 @@ struct modp_op
     }
 };
 
-struct bias_op
+struct bias_op : public op_with_cost
 {
+    static const size_t cost = 40;
+
     static inline float
     apply(float x, float b)
     {
@@ -230,8 +239,10 @@ struct bias_op
     }
 };
 
-struct gain_op
+struct gain_op : public op_with_cost
 {
+    static const size_t cost = 40;
+
     static inline float
     apply(float x, float g)
     {
@@ -243,8 +254,10 @@ struct gain_op
 };
 
 template <class T>
-struct rgb2hsv_op
+struct rgb2hsv_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static inline IMATH_NAMESPACE::Vec3<T>
     apply(const IMATH_NAMESPACE::Vec3<T> &rgb)
     {
@@ -253,8 +266,10 @@ struct rgb2hsv_op
 };
 
 template <class T>
-struct hsv2rgb_op
+struct hsv2rgb_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static inline IMATH_NAMESPACE::Vec3<T>
     apply(const IMATH_NAMESPACE::Vec3<T> &rgb)
     {
@@ -283,7 +298,9 @@ struct max_op
 };
 
 template <class T>
-struct sin_op {
+struct sin_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T theta)
     {
@@ -292,7 +309,9 @@ struct sin_op {
 };
 
 template <class T>
-struct cos_op {
+struct cos_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T theta)
     {
@@ -301,7 +320,9 @@ struct cos_op {
 };
 
 template <class T>
-struct tan_op {
+struct tan_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T theta)
     {
@@ -310,7 +331,9 @@ struct tan_op {
 };
 
 template <class T>
-struct asin_op {
+struct asin_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T x)
     {
@@ -319,7 +342,9 @@ struct asin_op {
 };
 
 template <class T>
-struct acos_op {
+struct acos_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T x)
     {
@@ -328,7 +353,9 @@ struct acos_op {
 };
 
 template <class T>
-struct atan_op {
+struct atan_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline float
     apply(T x)
     {
@@ -337,7 +364,9 @@ struct atan_op {
 };
 
 template <class T>
-struct atan2_op {
+struct atan2_op : public op_with_cost {
+    static const size_t cost = 20;
+
     static inline T
     apply(T y, T x)
     {
@@ -346,7 +375,9 @@ struct atan2_op {
 };
 
 template <class T>
-struct sqrt_op {
+struct sqrt_op : public op_with_cost {
+    static const size_t cost = 4;
+
     static inline T
     apply(T x)
     {
@@ -355,7 +386,9 @@ struct sqrt_op {
 };
 
 template <class T>
-struct pow_op {
+struct pow_op : public op_with_cost {
+    static const size_t cost = 40;
+
     static inline T
     apply(T x, T y)
     {
@@ -364,8 +397,10 @@ struct pow_op {
 };
 
 template <class T>
-struct exp_op
+struct exp_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static inline T
     apply(T x)
     {
@@ -374,8 +409,10 @@ struct exp_op
 };
 
 template <class T>
-struct sinh_op
+struct sinh_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static inline T
     apply(T x)
     {
@@ -384,8 +421,10 @@ struct sinh_op
 };
 
 template <class T>
-struct cosh_op
+struct cosh_op : public op_with_cost
 {
+    static const size_t cost = 20;
+
     static inline T
     apply(T x)
     {
@@ -0,0 +1,170 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <algorithm>
+#include "PyImathHalf.h"
+#include "PyImathBufferProtocol.h"
+#include "PyImathOperators.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+template <> PYIMATH_EXPORT const char *HalfArray::name() { return "HalfArray"; }
+template <> PYIMATH_EXPORT const char *V3hArray::name()  { return "V3hArray"; }
+template <> PYIMATH_EXPORT const char *C4hArray::name()  { return "C4hArray"; }
+
+template <> PYIMATH_EXPORT half FixedArrayDefaultValue<half>::value() { return half (0.0f); }
+template <> PYIMATH_EXPORT IMATH_NAMESPACE::Vec3<half> FixedArrayDefaultValue<IMATH_NAMESPACE::Vec3<half> >::value()
+    { return IMATH_NAMESPACE::Vec3<half> (half (0.0f)); }
+template <> PYIMATH_EXPORT IMATH_NAMESPACE::Color4<half> FixedArrayDefaultValue<IMATH_NAMESPACE::Color4<half> >::value()
+    { return IMATH_NAMESPACE::Color4<half> (half (0.0f)); }
+
+namespace {
+
+static_assert (sizeof (half) == sizeof (imath_half_bits_t), "half must be 16 bits wide");
+
+// The number of values converted by each task
+const size_t conversionBlock = 16384;
+
+template <class S, class T, class Convert>
+void
+convertBlocks (const S *src, T *dst, size_t n, Convert convert)
+{
+    dispatchRows ((n + conversionBlock - 1) / conversionBlock, conversionBlock, [&] (size_t b)
+    {
+        size_t start = b * conversionBlock;
+        convert (src + start, dst + start, std::min (conversionBlock, n - start));
+    });
+}
+
+//
+// Python conversions of half values, and of vectors and colors of halfs,
+// which python sees as floats, V3f and Color4f.
+//
+
+struct HalfToPython
+{
+    static PyObject *convert (const half &h)
+    {
+        return PyFloat_FromDouble (float (h));
+    }
+};
+
+struct HalfFromPython
+{
+    // Accepts the same objects as a float argument
+    static void *convertible (PyObject *obj)
+    {
+        PyNumberMethods *number = Py_TYPE (obj)->tp_as_number;
+        return number && number->nb_float ? obj : nullptr;
+    }
+
+    static void construct (PyObject *obj, boost::python::converter::rvalue_from_python_stage1_data *data)
+    {
+        double value = PyFloat_AsDouble (obj);
+        if (value == -1.0 && PyErr_Occurred())
+            boost::python::throw_error_already_set();
+
+        void *storage = reinterpret_cast<boost::python::converter::rvalue_from_python_storage<half> *>
+                            (data)->storage.bytes;
+        new (storage) half (float (value));
+        data->convertible = storage;
+    }
+};
+
+// Converts Vec3<half> and Color4<half> through Vec3<float> and Color4<float>
+template <class H, class F>
+struct HalfTypeToPython
+{
+    static PyObject *convert (const H &h)
+    {
+        return boost::python::incref (boost::python::object (F (h)).ptr());
+    }
+};
+
+template <class H, class F>
+struct HalfTypeFromPython
+{
+    static void *convertible (PyObject *obj)
+    {
+        return boost::python::extract<F> (obj).check() ? obj : nullptr;
+    }
+
+    static void construct (PyObject *obj, boost::python::converter::rvalue_from_python_stage1_data *data)
+    {
+        F value = boost::python::extract<F> (obj);
+        void *storage = reinterpret_cast<boost::python::converter::rvalue_from_python_storage<H> *>
+                            (data)->storage.bytes;
+        new (storage) H (value);
+        data->convertible = storage;
+    }
+};
+
+template <class H, class F>
+void
+register_HalfTypeConversions()
+{
+    boost::python::to_python_converter<H, HalfTypeToPython<H,F> >();
+    boost::python::converter::registry::push_back (&HalfTypeFromPython<H,F>::convertible,
+                                                   &HalfTypeFromPython<H,F>::construct,
+                                                   boost::python::type_id<H>());
+}
+
+} // namespace
+
+void
+halfToFloat (const half *src, float *dst, size_t n)
+{
+    convertBlocks (reinterpret_cast<const imath_half_bits_t *> (src), dst, n,
+                   &imath_half_to_float_array);
+}
+
+void
+floatToHalf (const float *src, half *dst, size_t n)
+{
+    convertBlocks (src, reinterpret_cast<imath_half_bits_t *> (dst), n,
+                   [] (const float *s, imath_half_bits_t *d, size_t count)
+                   { imath_float_to_half_array (s, d, count, IMATH_HALF_ROUND_NEAREST_EVEN); });
+}
+
+const char *
+halfConversionInstructionSet()
+{
+    return imath_half_array_instruction_set();
+}
+
+using namespace boost::python;
+
+void
+register_Half()
+{
+    to_python_converter<half, HalfToPython>();
+    converter::registry::push_back (&HalfFromPython::convertible,
+                                    &HalfFromPython::construct,
+                                    type_id<half>());
+
+    register_HalfTypeConversions<IMATH_NAMESPACE::Vec3<half>, IMATH_NAMESPACE::Vec3<float> >();
+    register_HalfTypeConversions<IMATH_NAMESPACE::Color4<half>, IMATH_NAMESPACE::Color4<float> >();
+
+    class_<V3hArray> v3hClass = V3hArray::register_("Fixed length array of V3h, whose elements are read and written as V3f");
+    add_explicit_construction_from_type<IMATH_NAMESPACE::Vec3<float> >(v3hClass);
+    add_buffer_protocol<V3hArray>(v3hClass);
+
+    class_<C4hArray> c4hClass = C4hArray::register_("Fixed length array of Color4h, whose elements are read and written as Color4f");
+    add_explicit_construction_from_type<IMATH_NAMESPACE::Color4<float> >(c4hClass);
+    add_buffer_protocol<C4hArray>(c4hClass);
+
+    def("halfConversionInstructionSet", &halfConversionInstructionSet,
+        "halfConversionInstructionSet() -- return the name of the instruction set "
+        "used to convert arrays between half and float, e.g. 'avx512f', 'f16c', "
+        "'neon', or 'none'");
+}
+
+} // namespace PyImath
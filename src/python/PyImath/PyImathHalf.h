@@ -0,0 +1,102 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathHalf_h_
+#define _PyImathHalf_h_
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <half.h>
+#include <ImathVec.h>
+#include <ImathColor.h>
+#include "PyImathExport.h"
+#include "PyImathFixedArray.h"
+
+namespace PyImath {
+
+//
+// Arrays of half precision values.  Python has no half type, so the
+// elements of a HalfArray are python floats, and those of a V3hArray and
+// a C4hArray are V3f and Color4f.  They are converted on access, and so
+// are returned by value rather than by reference.
+//
+typedef FixedArray<half>                            HalfArray;
+typedef FixedArray<IMATH_NAMESPACE::Vec3<half> >    V3hArray;
+typedef FixedArray<IMATH_NAMESPACE::Color4<half> >  C4hArray;
+
+template <> struct FixedArrayReturnsReference<half>                            : boost::false_type {};
+template <> struct FixedArrayReturnsReference<IMATH_NAMESPACE::Vec3<half> >    : boost::false_type {};
+template <> struct FixedArrayReturnsReference<IMATH_NAMESPACE::Color4<half> >  : boost::false_type {};
+
+//
+// Convert n consecutive values between half and float, in parallel, with
+// imath_half_to_float_array and imath_float_to_half_array.  Floats are
+// rounded to the nearest half, with ties rounded to even, as by the half
+// constructor.
+//
+PYIMATH_EXPORT void halfToFloat (const half *src, float *dst, size_t n);
+PYIMATH_EXPORT void floatToHalf (const float *src, half *dst, size_t n);
+
+// The name of the instruction set used by the conversions, e.g. "avx512f",
+// "f16c", or "none".
+PYIMATH_EXPORT const char *halfConversionInstructionSet();
+
+namespace detail {
+
+inline void convertComponents (const half *src, float *dst, size_t n) { halfToFloat (src, dst, n); }
+inline void convertComponents (const float *src, half *dst, size_t n) { floatToHalf (src, dst, n); }
+
+//
+// Converts between arrays whose elements are made of half and float
+// components, TC and SC, with the bulk conversions when the source
+// elements are contiguous.
+//
+template <class T, class S, class TC, class SC>
+struct HalfConversion
+{
+    static void apply (const FixedArray<S> &src, T *dst)
+    {
+        static_assert (sizeof (T) / sizeof (TC) == sizeof (S) / sizeof (SC),
+                       "converted elements must have the same number of components");
+
+        if (src.isMaskedReference() || src.stride() != 1)
+        {
+            for (size_t i = 0; i < size_t (src.len()); ++i)
+                dst[i] = T (src[i]);
+            return;
+        }
+
+        PY_IMATH_LEAVE_PYTHON;
+        convertComponents (reinterpret_cast<const SC *> (src.directPtr()),
+                           reinterpret_cast<TC *> (dst),
+                           src.len() * (sizeof (S) / sizeof (SC)));
+    }
+};
+
+} // namespace detail
+
+template <> struct FixedArrayConversion<float, half>
+    : detail::HalfConversion<float, half, float, half> {};
+template <> struct FixedArrayConversion<half, float>
+    : detail::HalfConversion<half, float, half, float> {};
+template <> struct FixedArrayConversion<IMATH_NAMESPACE::Vec3<float>, IMATH_NAMESPACE::Vec3<half> >
+    : detail::HalfConversion<IMATH_NAMESPACE::Vec3<float>, IMATH_NAMESPACE::Vec3<half>, float, half> {};
+template <> struct FixedArrayConversion<IMATH_NAMESPACE::Vec3<half>, IMATH_NAMESPACE::Vec3<float> >
+    : detail::HalfConversion<IMATH_NAMESPACE::Vec3<half>, IMATH_NAMESPACE::Vec3<float>, half, float> {};
+template <> struct FixedArrayConversion<IMATH_NAMESPACE::Color4<float>, IMATH_NAMESPACE::Color4<half> >
+    : detail::HalfConversion<IMATH_NAMESPACE::Color4<float>, IMATH_NAMESPACE::Color4<half>, float, half> {};
+template <> struct FixedArrayConversion<IMATH_NAMESPACE::Color4<half>, IMATH_NAMESPACE::Color4<float> >
+    : detail::HalfConversion<IMATH_NAMESPACE::Color4<half>, IMATH_NAMESPACE::Color4<float>, half, float> {};
+
+// Registers the conversions of half, Vec3<half> and Color4<half> to and
+// from python, and the V3hArray and C4hArray classes.
+PYIMATH_EXPORT void register_Half();
+
+} // namespace PyImath
+
+#endif
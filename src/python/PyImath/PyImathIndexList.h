@@ -0,0 +1,114 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathIndexList_h_
+#define _PyImathIndexList_h_
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <cstddef>
+#include <vector>
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+//
+// IndexList holds the indices of a take(), put() or scatterAdd() on an
+// array of the given length.  Negative indices count from the end of
+// the array, as in python, and an index out of range raises an
+// IndexError, so construct the list before releasing the GIL.
+//
+class IndexList
+{
+  public:
+
+    template <class IndexArray>
+    IndexList (const IndexArray &indices, size_t length)
+        : _indices (indices.len()), _length (length), _increasing (true)
+    {
+        for (size_t k = 0; k < _indices.size(); ++k)
+        {
+            Py_ssize_t i = indices[k];
+            if (i < 0)
+                i += Py_ssize_t (length);
+            if (i < 0 || i >= Py_ssize_t (length))
+            {
+                PyErr_SetString (PyExc_IndexError, "Index out of range");
+                boost::python::throw_error_already_set();
+            }
+            _indices[k] = size_t (i);
+            if (k > 0 && _indices[k] <= _indices[k-1])
+                _increasing = false;
+        }
+    }
+
+    size_t size() const { return _indices.size(); }
+    size_t operator[] (size_t k) const { return _indices[k]; }
+
+    // Whether the indices are strictly increasing, i.e. sorted and unique
+    bool   increasing() const { return _increasing; }
+
+    //
+    // Calls f(k) for each position k of the list, in parallel.  'cost'
+    // is the cost of one call, as for dispatchTask.
+    //
+    template <class F>
+    void gather (size_t cost, const F &f) const
+    {
+        dispatchRows (_indices.size(), cost, f);
+    }
+
+    //
+    // Calls f(k) for each position k of the list, in parallel, where f
+    // writes to the element at index (*this)[k].  Calls that write to
+    // the same element are made by the same thread, in increasing order
+    // of k, so the result is the same as that of a serial loop even when
+    // indices repeat.
+    //
+    template <class F>
+    void scatter (size_t cost, const F &f) const
+    {
+        if (_increasing)
+        {
+            dispatchRows (_indices.size(), cost, f);
+            return;
+        }
+
+        // Group the positions by blocks of the indices they write to,
+        // keeping them in order within each block.
+        const size_t blocks = (_length >> _blockBits) + 1;
+        std::vector<size_t> start (blocks + 1, 0);
+        for (size_t k = 0; k < _indices.size(); ++k)
+            ++start[(_indices[k] >> _blockBits) + 1];
+        for (size_t b = 0; b < blocks; ++b)
+            start[b+1] += start[b];
+
+        std::vector<size_t> order (_indices.size());
+        std::vector<size_t> next (start.begin(), start.end() - 1);
+        for (size_t k = 0; k < _indices.size(); ++k)
+            order[next[_indices[k] >> _blockBits]++] = k;
+
+        dispatchRows (blocks, cost * (_indices.size() / blocks + 1), [&] (size_t b)
+        {
+            for (size_t j = start[b]; j < start[b+1]; ++j)
+                f (order[j]);
+        });
+    }
+
+  private:
+
+    static const int     _blockBits = 10;
+
+    std::vector<size_t>  _indices;
+    size_t               _length;
+    bool                 _increasing;
+};
+
+} // namespace PyImath
+
+#endif
@@ -0,0 +1,380 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <algorithm>
+#include <ImathVec.h>
+#include "PyImathLazyArray.h"
+#include "PyImathAutovectorize.h"
+#include "PyImathOperators.h"
+#include "PyImathVecOperators.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+using namespace boost::python;
+
+// Number of elements evaluated at a time.  Every node of an expression
+// holds a chunk of its operands on the stack, so the working set of a
+// whole expression stays in the L1 cache.
+static const size_t _chunkSize = 256;
+
+// The length of a constant, which matches an array of any length.
+static const size_t _broadcast = size_t (-1);
+
+//
+// A node of a lazy expression evaluates a range of elements of its
+// value, at most _chunkSize long, into 'result'.
+//
+template <class T>
+class LazyNode
+{
+  public:
+
+    virtual ~LazyNode() {}
+
+    virtual size_t len() const = 0;
+
+    // The cost per element of evaluating the node and its operands,
+    // in the units of op_cost.
+    virtual size_t cost() const = 0;
+
+    virtual void evaluate (size_t start, size_t end, T *result) const = 0;
+};
+
+namespace {
+
+template <class T>
+class DirectArrayNode : public LazyNode<T>
+{
+  public:
+
+    DirectArrayNode (const FixedArray<T> &array)
+        : _array (array), _access (array) {}
+
+    size_t len() const override  { return _array.len(); }
+    size_t cost() const override { return 1; }
+
+    void evaluate (size_t start, size_t end, T *result) const override
+    {
+        for (size_t i = start; i < end; ++i)
+            *result++ = _access[i];
+    }
+
+  private:
+
+    FixedArray<T>                                   _array;
+    typename FixedArray<T>::ReadOnlyDirectAccess    _access;
+};
+
+template <class T>
+class MaskedArrayNode : public LazyNode<T>
+{
+  public:
+
+    MaskedArrayNode (const FixedArray<T> &array)
+        : _array (array), _access (array) {}
+
+    size_t len() const override  { return _array.len(); }
+    size_t cost() const override { return 1; }
+
+    void evaluate (size_t start, size_t end, T *result) const override
+    {
+        for (size_t i = start; i < end; ++i)
+            *result++ = _access[i];
+    }
+
+  private:
+
+    FixedArray<T>                                   _array;
+    typename FixedArray<T>::ReadOnlyMaskedAccess    _access;
+};
+
+template <class T>
+class ConstantNode : public LazyNode<T>
+{
+  public:
+
+    ConstantNode (const T &value) : _value (value) {}
+
+    size_t len() const override  { return _broadcast; }
+    size_t cost() const override { return 0; }
+
+    void evaluate (size_t start, size_t end, T *result) const override
+    {
+        std::fill (result, result + (end - start), _value);
+    }
+
+  private:
+
+    T _value;
+};
+
+template <class Op, class R, class A>
+class UnaryNode : public LazyNode<R>
+{
+  public:
+
+    UnaryNode (const typename LazyArray<A>::NodePtr &a)
+        : _a (a) {}
+
+    size_t len() const override  { return _a->len(); }
+    size_t cost() const override { return _a->cost() + detail::op_cost<Op>::value(); }
+
+    void evaluate (size_t start, size_t end, R *result) const override
+    {
+        A a[_chunkSize];
+        _a->evaluate (start, end, a);
+        for (size_t i = 0; i < end - start; ++i)
+            result[i] = Op::apply (a[i]);
+    }
+
+  private:
+
+    typename LazyArray<A>::NodePtr _a;
+};
+
+template <class Op, class R, class A, class B>
+class BinaryNode : public LazyNode<R>
+{
+  public:
+
+    BinaryNode (const typename LazyArray<A>::NodePtr &a,
+                const typename LazyArray<B>::NodePtr &b)
+        : _a (a), _b (b), _len (a->len())
+    {
+        if (_len == _broadcast)
+            _len = b->len();
+        else if (b->len() != _broadcast && b->len() != _len)
+            throw std::invalid_argument ("Dimensions of source do not match destination");
+    }
+
+    size_t len() const override  { return _len; }
+    size_t cost() const override { return _a->cost() + _b->cost() + detail::op_cost<Op>::value(); }
+
+    void evaluate (size_t start, size_t end, R *result) const override
+    {
+        A a[_chunkSize];
+        B b[_chunkSize];
+        _a->evaluate (start, end, a);
+        _b->evaluate (start, end, b);
+        for (size_t i = 0; i < end - start; ++i)
+            result[i] = Op::apply (a[i], b[i]);
+    }
+
+  private:
+
+    typename LazyArray<A>::NodePtr _a;
+    typename LazyArray<B>::NodePtr _b;
+    size_t                         _len;
+};
+
+template <class T>
+struct LazyEvaluateTask : public Task
+{
+    const LazyNode<T> & node;
+    T *                 result;
+
+    LazyEvaluateTask (const LazyNode<T> &n, T *r) : node (n), result (r) {}
+
+    void execute (size_t start, size_t end) override
+    {
+        for (size_t i = start; i < end; i += _chunkSize)
+            node.evaluate (i, std::min (i + _chunkSize, end), result + i);
+    }
+};
+
+template <class T>
+LazyArray<T>
+constant (const T &value)
+{
+    return LazyArray<T> (typename LazyArray<T>::NodePtr (new ConstantNode<T> (value)));
+}
+
+template <class Op, class R, class A>
+LazyArray<R>
+lazy_unary (const LazyArray<A> &a)
+{
+    return LazyArray<R> (typename LazyArray<R>::NodePtr (new UnaryNode<Op,R,A> (a.node())));
+}
+
+template <class Op, class R, class A, class B>
+LazyArray<R>
+lazy_binary (const LazyArray<A> &a, const LazyArray<B> &b)
+{
+    return LazyArray<R> (typename LazyArray<R>::NodePtr (new BinaryNode<Op,R,A,B> (a.node(), b.node())));
+}
+
+// The reversed forms are bound to the __r*__ methods, which receive
+// the lazy array as their first argument.
+
+template <class Op, class R, class A, class B>
+LazyArray<R>
+lazy_rbinary (const LazyArray<B> &b, const LazyArray<A> &a)
+{
+    return lazy_binary<Op,R,A,B> (a, b);
+}
+
+template <class Op, class R, class A, class B>
+LazyArray<R>
+lazy_binary_constant (const LazyArray<A> &a, const B &b)
+{
+    return lazy_binary<Op,R,A,B> (a, constant (b));
+}
+
+template <class Op, class R, class A, class B>
+LazyArray<R>
+lazy_rbinary_constant (const LazyArray<B> &b, const A &a)
+{
+    return lazy_binary<Op,R,A,B> (constant (a), b);
+}
+
+template <class T>
+LazyArray<T>
+lazy (const FixedArray<T> &array)
+{
+    return LazyArray<T> (array);
+}
+
+// Arithmetic shared by the scalar and vector lazy arrays, with operands
+// of the same type.
+template <class T>
+class_<LazyArray<T> >
+register_LazyArray (const char *doc)
+{
+    class_<LazyArray<T> > c (LazyArray<T>::name(), doc, no_init);
+    c
+        .def ("__len__", &LazyArray<T>::len)
+        .def ("eval", &LazyArray<T>::eval,
+              "eval() - evaluate the expression into a new array")
+        .def ("__neg__", &lazy_unary<op_neg<T>,T,T>)
+        .def ("__add__", &lazy_binary<op_add<T>,T,T,T>)
+        .def ("__radd__", &lazy_rbinary<op_add<T>,T,T,T>)
+        .def ("__sub__", &lazy_binary<op_sub<T>,T,T,T>)
+        .def ("__rsub__", &lazy_rbinary<op_sub<T>,T,T,T>)
+        .def ("__mul__", &lazy_binary<op_mul<T>,T,T,T>)
+        .def ("__rmul__", &lazy_rbinary<op_mul<T>,T,T,T>)
+        .def ("__truediv__", &lazy_binary<op_div<T>,T,T,T>)
+        .def ("__rtruediv__", &lazy_rbinary<op_div<T>,T,T,T>)
+        .def ("__add__", &lazy_binary_constant<op_add<T>,T,T,T>)
+        .def ("__radd__", &lazy_rbinary_constant<op_add<T>,T,T,T>)
+        .def ("__sub__", &lazy_binary_constant<op_sub<T>,T,T,T>)
+        .def ("__rsub__", &lazy_rbinary_constant<op_sub<T>,T,T,T>)
+        .def ("__mul__", &lazy_binary_constant<op_mul<T>,T,T,T>)
+        .def ("__rmul__", &lazy_rbinary_constant<op_mul<T>,T,T,T>)
+        .def ("__truediv__", &lazy_binary_constant<op_div<T>,T,T,T>)
+        .def ("__rtruediv__", &lazy_rbinary_constant<op_div<T>,T,T,T>)
+        ;
+
+    implicitly_convertible<FixedArray<T>, LazyArray<T> >();
+
+    def ("lazy", &lazy<T>,
+         "lazy(array) - make a lazy array expression from the array.  Arithmetic\n"
+         "on the result is deferred until eval() is called, which computes the\n"
+         "whole expression in one pass without intermediate arrays.");
+
+    return c;
+}
+
+template <class T>
+void
+register_LazyVec3Array (const char *doc)
+{
+    typedef IMATH_NAMESPACE::Vec3<T> V;
+
+    class_<LazyArray<V> > c = register_LazyArray<V> (doc);
+    c
+        .def ("__mul__", &lazy_binary<op_mul<V,T,V>,V,V,T>)
+        .def ("__rmul__", &lazy_rbinary<op_mul<T,V,V>,V,T,V>)
+        .def ("__truediv__", &lazy_binary<op_div<V,T,V>,V,V,T>)
+        .def ("__mul__", &lazy_binary_constant<op_mul<V,T,V>,V,V,T>)
+        .def ("__rmul__", &lazy_rbinary_constant<op_mul<T,V,V>,V,T,V>)
+        .def ("__truediv__", &lazy_binary_constant<op_div<V,T,V>,V,V,T>)
+        .def ("dot", &lazy_binary<op_vecDot<V>,T,V,V>,
+              "dot(v) - lazy dot product with an array or a vector")
+        .def ("dot", &lazy_binary_constant<op_vecDot<V>,T,V,V>)
+        .def ("cross", &lazy_binary<op_vec3Cross<T>,V,V,V>,
+              "cross(v) - lazy cross product with an array or a vector")
+        .def ("cross", &lazy_binary_constant<op_vec3Cross<T>,V,V,V>)
+        .def ("length", &lazy_unary<op_vecLength<V>,T,V>,
+              "length() - lazy length of each vector")
+        .def ("length2", &lazy_unary<op_vecLength2<V>,T,V>,
+              "length2() - lazy squared length of each vector")
+        .def ("normalized", &lazy_unary<op_vecNormalized<V>,V,V>,
+              "normalized() - lazy normalized copy of each vector")
+        ;
+}
+
+} // namespace
+
+template <class T>
+LazyArray<T>::LazyArray (const NodePtr &node)
+    : _node (node)
+{
+}
+
+template <class T>
+LazyArray<T>::LazyArray (const FixedArray<T> &array)
+{
+    if (!array.hasDirectAccess())
+        _node.reset (new MaskedArrayNode<T> (array));
+    else
+        _node.reset (new DirectArrayNode<T> (array));
+}
+
+template <class T>
+Py_ssize_t
+LazyArray<T>::len() const
+{
+    return _node->len();
+}
+
+template <class T>
+FixedArray<T>
+LazyArray<T>::eval() const
+{
+    size_t len = _node->len();
+    FixedArray<T> result (len, UNINITIALIZED);
+    if (len == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    LazyEvaluateTask<T> task (*_node, &result.direct_index (0));
+    dispatchTask (task, len, _node->cost());
+    return result;
+}
+
+template <> const char *LazyArray<float>::name()                         { return "FloatLazyArray"; }
+template <> const char *LazyArray<double>::name()                        { return "DoubleLazyArray"; }
+template <> const char *LazyArray<IMATH_NAMESPACE::Vec3<float> >::name()  { return "V3fLazyArray"; }
+template <> const char *LazyArray<IMATH_NAMESPACE::Vec3<double> >::name() { return "V3dLazyArray"; }
+
+template class LazyArray<float>;
+template class LazyArray<double>;
+template class LazyArray<IMATH_NAMESPACE::Vec3<float> >;
+template class LazyArray<IMATH_NAMESPACE::Vec3<double> >;
+
+void
+register_LazyArrays()
+{
+    class_<LazyArray<float> > f =
+        register_LazyArray<float> ("Deferred expression producing a FloatArray");
+    class_<LazyArray<double> > d =
+        register_LazyArray<double> ("Deferred expression producing a DoubleArray");
+
+    register_LazyVec3Array<float> ("Deferred expression producing a V3fArray");
+    register_LazyVec3Array<double> ("Deferred expression producing a V3dArray");
+
+    // Scalar arrays scaling vector arrays, e.g. lazy(weights) * points
+    f.def ("__mul__", &lazy_binary<op_mul<float,IMATH_NAMESPACE::V3f,IMATH_NAMESPACE::V3f>,
+                                   IMATH_NAMESPACE::V3f,float,IMATH_NAMESPACE::V3f>);
+    d.def ("__mul__", &lazy_binary<op_mul<double,IMATH_NAMESPACE::V3d,IMATH_NAMESPACE::V3d>,
+                                   IMATH_NAMESPACE::V3d,double,IMATH_NAMESPACE::V3d>);
+}
+
+}
@@ -0,0 +1,57 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathLazyArray_h_
+#define _PyImathLazyArray_h_
+
+#include <boost/shared_ptr.hpp>
+#include "PyImathExport.h"
+#include "PyImathFixedArray.h"
+
+namespace PyImath {
+
+template <class T> class LazyNode;
+
+//
+// A LazyArray is an array expression whose evaluation is deferred until
+// eval() is called.  Arithmetic on lazy arrays records the operations
+// rather than computing them, and eval() then runs the whole expression
+// in a single pass, a chunk of elements at a time, without allocating
+// an intermediate array for each step.  The arrays referred to by the
+// expression are read when it is evaluated, not when it is built.
+//
+// FixedArrays convert implicitly to lazy arrays, so they may be mixed
+// freely with lazy arrays in an expression.
+//
+
+template <class T>
+class LazyArray
+{
+  public:
+
+    typedef boost::shared_ptr<const LazyNode<T> > NodePtr;
+
+    PYIMATH_EXPORT explicit LazyArray (const NodePtr &node);
+    PYIMATH_EXPORT LazyArray (const FixedArray<T> &array);
+
+    PYIMATH_EXPORT Py_ssize_t    len() const;
+    PYIMATH_EXPORT FixedArray<T> eval() const;
+
+    const NodePtr & node() const { return _node; }
+
+    static const char *name();
+
+  private:
+
+    NodePtr _node;
+};
+
+PYIMATH_EXPORT void register_LazyArrays();
+
+}
+
+#endif
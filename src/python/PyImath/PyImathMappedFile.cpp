@@ -0,0 +1,332 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#include "PyImathMappedFile.h"
+#include <chrono>
+#include <cstdio>
+#include <cstring>
+#include <cerrno>
+#include <functional>
+#include <stdexcept>
+#include <thread>
+
+#ifdef _WIN32
+#  ifndef NOMINMAX
+#    define NOMINMAX
+#  endif
+#  include <windows.h>
+#else
+#  include <fcntl.h>
+#  include <sys/mman.h>
+#  include <sys/stat.h>
+#  include <unistd.h>
+#endif
+
+namespace PyImath {
+
+namespace {
+
+struct FileHeader
+{
+    char     magic[8];
+    uint32_t version;
+    uint32_t elementSize;
+    uint64_t count;
+    uint64_t stride;
+    uint64_t dataOffset;
+    char     elementType[24];
+};
+
+static_assert (sizeof (FileHeader) == 64, "unexpected array file header size");
+
+const char     _magic[8] = "PYIMARR";
+const uint32_t _version = 1;
+
+// Offset of the first element in files we write, and the alignment
+// required of it in files we read.
+const size_t _dataOffset = 64;
+const size_t _dataAlignment = 8;
+
+std::runtime_error
+fileError (const char *what, const std::string &path)
+{
+#ifdef _WIN32
+    return std::runtime_error (std::string (what) + " '" + path + "' (error " +
+                               std::to_string (GetLastError()) + ")");
+#else
+    return std::runtime_error (std::string (what) + " '" + path + "': " +
+                               std::strerror (errno));
+#endif
+}
+
+//
+// Create a new file of the given size.  The file must not already
+// exist, so that two writers never share a temporary file.
+//
+void
+createFile (const std::string &path, size_t size)
+{
+#ifdef _WIN32
+    HANDLE file = CreateFileA (path.c_str(), GENERIC_READ | GENERIC_WRITE, 0, NULL,
+                               CREATE_NEW, FILE_ATTRIBUTE_NORMAL, NULL);
+    if (file == INVALID_HANDLE_VALUE)
+        throw fileError ("Unable to create", path);
+
+    LARGE_INTEGER end;
+    end.QuadPart = size;
+    bool ok = SetFilePointerEx (file, end, NULL, FILE_BEGIN) && SetEndOfFile (file);
+    CloseHandle (file);
+    if (!ok)
+    {
+        std::runtime_error error = fileError ("Unable to resize", path);
+        DeleteFileA (path.c_str());
+        throw error;
+    }
+#else
+    int fd = ::open (path.c_str(), O_RDWR | O_CREAT | O_EXCL, 0666);
+    if (fd < 0)
+        throw fileError ("Unable to create", path);
+
+    bool ok = ::ftruncate (fd, off_t (size)) == 0;
+    ::close (fd);
+    if (!ok)
+    {
+        std::runtime_error error = fileError ("Unable to resize", path);
+        ::unlink (path.c_str());
+        throw error;
+    }
+#endif
+}
+
+void
+removeFile (const std::string &path)
+{
+#ifdef _WIN32
+    DeleteFileA (path.c_str());
+#else
+    ::unlink (path.c_str());
+#endif
+}
+
+//
+// A name for a temporary file in the same directory as 'path', so
+// that it can be renamed over 'path' without copying.
+//
+std::string
+temporaryPath (const std::string &path)
+{
+    char suffix[64];
+    std::snprintf (suffix, sizeof (suffix), ".%llx.%llx.tmp",
+                   (unsigned long long) std::hash<std::thread::id>() (std::this_thread::get_id()),
+                   (unsigned long long) std::chrono::steady_clock::now().time_since_epoch().count());
+    return path + suffix;
+}
+
+} // namespace
+
+MappedFile::MappedFile (const std::string &path, bool writable)
+    : _path (path), _data (nullptr), _size (0), _writable (writable)
+#ifdef _WIN32
+    , _file (INVALID_HANDLE_VALUE), _mapping (NULL)
+#endif
+{
+#ifdef _WIN32
+    _file = CreateFileA (path.c_str(),
+                         writable ? GENERIC_READ | GENERIC_WRITE : GENERIC_READ,
+                         FILE_SHARE_READ | FILE_SHARE_WRITE, NULL,
+                         OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+    if (_file == INVALID_HANDLE_VALUE)
+        throw fileError ("Unable to open", path);
+
+    LARGE_INTEGER size;
+    if (!GetFileSizeEx (_file, &size))
+    {
+        CloseHandle (_file);
+        throw fileError ("Unable to read the size of", path);
+    }
+    _size = size_t (size.QuadPart);
+
+    if (_size > 0)
+    {
+        _mapping = CreateFileMappingA (_file, NULL,
+                                       writable ? PAGE_READWRITE : PAGE_READONLY,
+                                       0, 0, NULL);
+        if (_mapping)
+            _data = static_cast<char *> (MapViewOfFile (_mapping,
+                                                        writable ? FILE_MAP_WRITE : FILE_MAP_READ,
+                                                        0, 0, 0));
+        if (!_data)
+        {
+            std::runtime_error error = fileError ("Unable to map", path);
+            if (_mapping)
+                CloseHandle (_mapping);
+            CloseHandle (_file);
+            throw error;
+        }
+    }
+#else
+    int fd = ::open (path.c_str(), writable ? O_RDWR : O_RDONLY);
+    if (fd < 0)
+        throw fileError ("Unable to open", path);
+
+    struct stat st;
+    if (::fstat (fd, &st) != 0)
+    {
+        std::runtime_error error = fileError ("Unable to read the size of", path);
+        ::close (fd);
+        throw error;
+    }
+    _size = size_t (st.st_size);
+
+    if (_size > 0)
+    {
+        void *data = ::mmap (nullptr, _size,
+                             writable ? PROT_READ | PROT_WRITE : PROT_READ,
+                             MAP_SHARED, fd, 0);
+        if (data == MAP_FAILED)
+        {
+            std::runtime_error error = fileError ("Unable to map", path);
+            ::close (fd);
+            throw error;
+        }
+        _data = static_cast<char *> (data);
+    }
+
+    // The mapping stays valid after the descriptor is closed.
+    ::close (fd);
+#endif
+}
+
+MappedFile::~MappedFile()
+{
+#ifdef _WIN32
+    if (_data)
+        UnmapViewOfFile (_data);
+    if (_mapping)
+        CloseHandle (_mapping);
+    CloseHandle (_file);
+#else
+    if (_data)
+        ::munmap (_data, _size);
+#endif
+}
+
+boost::shared_ptr<MappedFile>
+mapArrayFile (const std::string &path, const char *elementType,
+              size_t elementSize, bool writable, MappedArrayLayout &layout)
+{
+    boost::shared_ptr<MappedFile> file (new MappedFile (path, writable));
+
+    FileHeader header;
+    if (file->size() < sizeof (header))
+        throw std::invalid_argument ("'" + path + "' is not an array file");
+
+    std::memcpy (&header, file->data(), sizeof (header));
+
+    if (std::memcmp (header.magic, _magic, sizeof (_magic)) != 0)
+        throw std::invalid_argument ("'" + path + "' is not an array file");
+
+    if (header.version != _version)
+        throw std::invalid_argument ("'" + path + "' has unsupported array file version " +
+                                     std::to_string (header.version));
+
+    std::string fileType (header.elementType,
+                          strnlen (header.elementType, sizeof (header.elementType)));
+    if (fileType != elementType || header.elementSize != elementSize)
+        throw std::invalid_argument ("'" + path + "' holds a " + fileType + " of " +
+                                     std::to_string (header.elementSize) +
+                                     " byte elements, not a " + elementType + " of " +
+                                     std::to_string (elementSize) + " byte elements");
+
+    if (header.stride < elementSize || header.stride % elementSize != 0)
+        throw std::invalid_argument ("'" + path + "' has an element stride of " +
+                                     std::to_string (header.stride) +
+                                     " bytes, which is not a multiple of the element size");
+
+    if (header.dataOffset < sizeof (header) || header.dataOffset % _dataAlignment != 0)
+        throw std::invalid_argument ("'" + path + "' has a misaligned data offset");
+
+    // Check the extent of the data without overflowing for corrupt counts.
+    uint64_t available = header.dataOffset <= file->size() ? file->size() - header.dataOffset : 0;
+    if (header.count > 0 &&
+        (available < elementSize ||
+         (header.count - 1) > (available - elementSize) / header.stride))
+        throw std::invalid_argument ("'" + path + "' is too short for its " +
+                                     std::to_string (header.count) + " elements");
+
+    layout.elementType = fileType;
+    layout.elementSize = header.elementSize;
+    layout.count = header.count;
+    layout.stride = header.stride;
+    layout.dataOffset = header.dataOffset;
+    return file;
+}
+
+boost::shared_ptr<MappedFile>
+createArrayFile (const std::string &path, const char *elementType,
+                 size_t elementSize, size_t count, MappedArrayLayout &layout)
+{
+    FileHeader header;
+    std::memset (&header, 0, sizeof (header));
+
+    if (std::strlen (elementType) >= sizeof (header.elementType))
+        throw std::invalid_argument (std::string ("Array type name '") + elementType +
+                                     "' is too long for an array file");
+
+    std::memcpy (header.magic, _magic, sizeof (_magic));
+    header.version = _version;
+    header.elementSize = uint32_t (elementSize);
+    header.count = count;
+    header.stride = elementSize;
+    header.dataOffset = _dataOffset;
+    std::strncpy (header.elementType, elementType, sizeof (header.elementType) - 1);
+
+    std::string tmpPath = temporaryPath (path);
+    createFile (tmpPath, _dataOffset + count * elementSize);
+
+    boost::shared_ptr<MappedFile> file;
+    try
+    {
+        file.reset (new MappedFile (tmpPath, true));
+    }
+    catch (...)
+    {
+        removeFile (tmpPath);
+        throw;
+    }
+    std::memcpy (file->data(), &header, sizeof (header));
+
+    layout.elementType = elementType;
+    layout.elementSize = elementSize;
+    layout.count = count;
+    layout.stride = elementSize;
+    layout.dataOffset = _dataOffset;
+    return file;
+}
+
+void
+commitArrayFile (boost::shared_ptr<MappedFile> &file, const std::string &path)
+{
+    std::string tmpPath = file->path();
+
+    // Unmap the file before renaming it; Windows won't rename a mapped file.
+    file.reset();
+
+#ifdef _WIN32
+    bool ok = MoveFileExA (tmpPath.c_str(), path.c_str(), MOVEFILE_REPLACE_EXISTING);
+#else
+    bool ok = std::rename (tmpPath.c_str(), path.c_str()) == 0;
+#endif
+    if (!ok)
+    {
+        std::runtime_error error = fileError ("Unable to replace", path);
+        removeFile (tmpPath);
+        throw error;
+    }
+}
+
+}
@@ -0,0 +1,109 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathMappedFile_h_
+#define _PyImathMappedFile_h_
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+#include <boost/shared_ptr.hpp>
+#include "PyImathExport.h"
+
+namespace PyImath {
+
+//
+// MappedFile maps an entire file into memory with a shared mapping, so
+// pages are only read from disk when they are first touched, and are
+// shared with any other process mapping the same file.  Changes made
+// through a writable mapping are written back to the file.  The file
+// is unmapped when the MappedFile is destroyed; FixedArrays referring
+// to the mapping hold a shared pointer to it in their handle.
+//
+
+class MappedFile
+{
+  public:
+
+    PYIMATH_EXPORT MappedFile (const std::string &path, bool writable);
+    PYIMATH_EXPORT ~MappedFile();
+
+    MappedFile (const MappedFile &) = delete;
+    MappedFile & operator = (const MappedFile &) = delete;
+
+    char *              data() const     { return _data; }
+    size_t              size() const     { return _size; }
+    bool                writable() const { return _writable; }
+    const std::string & path() const     { return _path; }
+
+  private:
+
+    std::string _path;
+    char *      _data;
+    size_t      _size;
+    bool        _writable;
+#ifdef _WIN32
+    void *      _file;
+    void *      _mapping;
+#endif
+};
+
+//
+// Array files start with a 64 byte header, in native byte order:
+//
+//    char     magic[8]        "PYIMARR\0"
+//    uint32_t version         1
+//    uint32_t elementSize     sizeof the array element type, in bytes
+//    uint64_t count           number of elements
+//    uint64_t stride          distance between elements, in bytes
+//    uint64_t dataOffset      position of the first element, in bytes
+//    char     elementType[24] name of the array type, e.g. "V3fArray"
+//
+// followed by the element data.  The stride may be larger than the
+// element size, but it must be a multiple of it.
+//
+
+struct MappedArrayLayout
+{
+    std::string elementType;
+    size_t      elementSize;
+    size_t      count;
+    size_t      stride;
+    size_t      dataOffset;
+};
+
+//
+// Map an array file and check that its header matches the given
+// element type and size.  The layout of the data is returned in
+// 'layout'.
+//
+PYIMATH_EXPORT boost::shared_ptr<MappedFile>
+mapArrayFile (const std::string &path, const char *elementType,
+              size_t elementSize, bool writable, MappedArrayLayout &layout);
+
+//
+// Create a temporary array file, in the same directory as 'path', with
+// room for 'count' contiguous elements, and map it writable so the
+// caller can fill in the data.  Pass the result to commitArrayFile()
+// to move it to 'path'.
+//
+PYIMATH_EXPORT boost::shared_ptr<MappedFile>
+createArrayFile (const std::string &path, const char *elementType,
+                 size_t elementSize, size_t count, MappedArrayLayout &layout);
+
+//
+// Unmap a file returned by createArrayFile() and rename it over
+// 'path'.  Existing mappings of the file being replaced keep the
+// old contents, rather than having the pages pulled out from under
+// them.  'file' must hold the only reference to the mapping.
+//
+PYIMATH_EXPORT void
+commitArrayFile (boost::shared_ptr<MappedFile> &file, const std::string &path);
+
+}
+
+#endif
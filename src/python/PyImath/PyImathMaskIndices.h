@@ -0,0 +1,441 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathMaskIndices_h_
+#define _PyImathMaskIndices_h_
+
+#include <boost/shared_array.hpp>
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+
+namespace PyImath {
+
+//
+// MaskIndices maps the elements of a masked reference array to the
+// indices of the elements of the unmasked array they refer to.  The
+// indices are stored in whichever of these encodings takes the least
+// memory, preferring INDICES unless another takes half as much:
+//
+//   RANGE    a single contiguous range, which takes no memory at all
+//   RUNS     the start of each run of consecutive indices, for masks
+//            made of a few long runs
+//   BITMAP   one bit per element of the unmasked array, for dense,
+//            scattered masks
+//   INDICES  one index per element, 32 bits wide if the unmasked array
+//            is small enough, for sparse, scattered masks
+//
+// Every encoding maps an index in constant time or, for RUNS and
+// BITMAP, with a directory lookup followed by a short search.  Loops
+// over consecutive elements should use a Cursor, which steps from one
+// run or set bit to the next instead.  The indices are immutable and
+// shared between copies.
+//
+class MaskIndices
+{
+  public:
+
+    enum Encoding { NONE, RANGE, RUNS, BITMAP, INDICES };
+
+    MaskIndices()
+        : _encoding (NONE), _size (0), _length (0), _first (0), _count (0),
+          _memory (0), _a (0), _b (0), _c (0), _narrow (0)
+    {
+    }
+
+    // The indices i for which mask[i] is true, 0 <= i < length
+    template <class Mask>
+    MaskIndices (const Mask &mask, size_t length)
+        : MaskIndices()
+    {
+        build (length, [&] (auto f) { for (size_t i = 0; i < length; ++i) if (mask[i]) f (i); });
+    }
+
+    // The strictly increasing indices indices[0], ..., indices[count-1],
+    // all less than length
+    template <class Indices>
+    MaskIndices (const Indices &indices, size_t count, size_t length)
+        : MaskIndices()
+    {
+        build (length, [&] (auto f) { for (size_t k = 0; k < count; ++k) f (size_t (indices[k])); });
+    }
+
+    // The indices at start, start+step, ... of other
+    MaskIndices (const MaskIndices &other, size_t start, size_t step, size_t count)
+        : MaskIndices()
+    {
+        if (other._encoding == RANGE)
+        {
+            if (step == 1 || count < 2)
+            {
+                setRange (other._first + start, count, other._length);
+                return;
+            }
+        }
+
+        build (other._length,
+               [&] (auto f) { for (size_t i = 0; i < count; ++i) f (other[start + i*step]); });
+    }
+
+    explicit operator bool() const { return _encoding != NONE; }
+
+    Encoding encoding() const { return _encoding; }
+    size_t   size()     const { return _size; }
+
+    // The length of the unmasked array
+    size_t   length()   const { return _length; }
+
+    // For the RANGE encoding, the first index of the range
+    size_t   first()    const { return _first; }
+
+    // No index-range check here.
+    size_t operator[] (size_t i) const
+    {
+        switch (_encoding)
+        {
+          case RANGE:
+            return _first + i;
+          case INDICES:
+            return _narrow ? size_t (_narrow[i]) : size_t (_a[i]);
+          case RUNS:
+            return runIndex (i);
+          case BITMAP:
+            return bitmapIndex (i);
+          default:
+            return i;
+        }
+    }
+
+    //
+    // A Cursor maps indices like operator[], but remembers the run or
+    // bitmap word of the last index it mapped, so that moving on to the
+    // next element takes constant time.  Other indices are searched for
+    // as by operator[].  A cursor is meant for the loop of one task over
+    // a range of elements, and must not be shared between threads.
+    //
+    class Cursor
+    {
+      public:
+
+        explicit Cursor (const MaskIndices &indices)
+            : _indices (indices), _i (0), _index (0), _k (0), _end (0), _word (0),
+              _valid (false)
+        {
+        }
+
+        // No index-range check here.
+        size_t operator[] (size_t i)
+        {
+            if (_indices._encoding != RUNS && _indices._encoding != BITMAP)
+                return _indices[i];
+            if (!_valid || i != _i + 1)
+            {
+                if (!_valid || i != _i)
+                    seek (i);
+                return _index;
+            }
+
+            _i = i;
+            if (_indices._encoding == RUNS)
+            {
+                if (i == _end)
+                {
+                    ++_k;
+                    _index = _indices._a[_k];
+                    _end = _indices.runEnd (_k);
+                }
+                else
+                    ++_index;
+            }
+            else
+            {
+                _word &= _word - 1;
+                while (_word == 0)
+                    _word = _indices._a[++_k];
+                _index = (_k << 6) + countTrailingZeros (_word);
+            }
+            return _index;
+        }
+
+      private:
+
+        void seek (size_t i)
+        {
+            _i = i;
+            _valid = true;
+            if (_indices._encoding == RUNS)
+            {
+                _k = _indices.findRun (i);
+                _end = _indices.runEnd (_k);
+                _index = _indices._a[_k] + (i - _indices._b[_k]);
+            }
+            else
+            {
+                _k = _indices.findWord (i, _word);
+                _index = (_k << 6) + countTrailingZeros (_word);
+            }
+        }
+
+        const MaskIndices & _indices;
+        size_t              _i;      // the element last mapped
+        size_t              _index;  // and its index
+        size_t              _k;      // its run or bitmap word
+        size_t              _end;    // the element after its run
+        uint64_t            _word;   // its bitmap word, less the bits before it
+        bool                _valid;
+    };
+
+    // Calls f(i, index) for each element i in [start,end), in order
+    template <class F>
+    void forEach (size_t start, size_t end, const F &f) const
+    {
+        Cursor cursor (*this);
+        for (size_t i = start; i < end; ++i)
+            f (i, cursor[i]);
+    }
+
+    static const char *encodingName (Encoding encoding)
+    {
+        switch (encoding)
+        {
+          case RANGE:   return "range";
+          case RUNS:    return "runs";
+          case BITMAP:  return "bitmap";
+          case INDICES: return "indices";
+          default:      return "none";
+        }
+    }
+
+    // The number of bytes used by the encoded indices
+    size_t memoryUsage() const { return _memory; }
+
+  private:
+
+    static const int _runBlockBits = 8;
+    static const int _selectBits = 6;
+
+    static size_t blocks (size_t n, int bits) { return (n + (size_t (1) << bits) - 1) >> bits; }
+
+    // The memory used by each of the encodings
+    static size_t runsMemory (size_t size, size_t runs)
+        { return (2 * runs + blocks (size, _runBlockBits)) * sizeof (uint64_t); }
+    static size_t bitmapMemory (size_t size, size_t length)
+        { return (2 * blocks (length, 6) + blocks (size, _selectBits)) * sizeof (uint64_t); }
+    static size_t indicesMemory (size_t size, size_t length)
+        { return size * (length <= std::numeric_limits<uint32_t>::max() ? sizeof (uint32_t) : sizeof (uint64_t)); }
+
+    void setRange (size_t first, size_t size, size_t length)
+    {
+        _encoding = RANGE;
+        _size = size;
+        _length = length;
+        _first = first;
+        _count = 0;
+        _memory = 0;
+    }
+
+    //
+    // Encode the indices enumerated by 'each', which calls its argument
+    // with each index in increasing order and must produce the same
+    // indices every time it is called.  All indices are less than
+    // 'length'.
+    //
+    template <class Each>
+    void build (size_t length, const Each &each)
+    {
+        size_t size = 0, runs = 0, first = 0, next = 0;
+        each ([&] (size_t i)
+        {
+            if (size == 0)
+                first = i;
+            if (size == 0 || i != next)
+                ++runs;
+            next = i + 1;
+            ++size;
+        });
+
+        if (runs <= 1)
+        {
+            setRange (first, size, length);
+            return;
+        }
+
+        size_t memory[3] = { indicesMemory (size, length),
+                             runsMemory (size, runs),
+                             bitmapMemory (size, length) };
+        // Loops use a Cursor, but random access to RUNS and BITMAP
+        // still searches, so they must at least halve the memory.
+        size_t best = std::min_element (memory + 1, memory + 3) - memory;
+        if (2 * memory[best] > memory[0])
+            best = 0;
+
+        _size = size;
+        _length = length;
+        _first = 0;
+        _memory = memory[best];
+        _storage.reset (new uint64_t[(_memory + sizeof (uint64_t) - 1) / sizeof (uint64_t)]);
+
+        if (best == 0)
+        {
+            _encoding = INDICES;
+            _count = size;
+            size_t n = 0;
+            if (length <= std::numeric_limits<uint32_t>::max())
+            {
+                uint32_t *indices = reinterpret_cast<uint32_t *> (_storage.get());
+                each ([&] (size_t i) { indices[n++] = uint32_t (i); });
+                _narrow = indices;
+            }
+            else
+            {
+                uint64_t *indices = _storage.get();
+                each ([&] (size_t i) { indices[n++] = i; });
+                _a = indices;
+            }
+        }
+        else if (best == 1)
+        {
+            // _a is the first index of each run, _b the number of
+            // elements before each run, and _c the run containing every
+            // 2^_runBlockBits-th element
+            _encoding = RUNS;
+            _count = runs;
+            uint64_t *start = _storage.get();
+            uint64_t *offset = start + runs;
+            uint64_t *block = offset + runs;
+            size_t n = 0, k = 0;
+            each ([&] (size_t i)
+            {
+                if (n == 0 || i != next)
+                {
+                    start[k] = i;
+                    offset[k] = n;
+                    ++k;
+                }
+                if ((n & ((size_t (1) << _runBlockBits) - 1)) == 0)
+                    block[n >> _runBlockBits] = k - 1;
+                next = i + 1;
+                ++n;
+            });
+            _a = start;
+            _b = offset;
+            _c = block;
+        }
+        else
+        {
+            // _a is the bitmap, _b the number of elements before each
+            // word of the bitmap, and _c the word containing every
+            // 2^_selectBits-th element
+            _encoding = BITMAP;
+            size_t words = blocks (length, 6);
+            _count = words;
+            uint64_t *bits = _storage.get();
+            uint64_t *rank = bits + words;
+            uint64_t *select = rank + words;
+            std::fill (bits, bits + words, uint64_t (0));
+            size_t n = 0;
+            each ([&] (size_t i)
+            {
+                bits[i >> 6] |= uint64_t (1) << (i & 63);
+                if ((n & ((size_t (1) << _selectBits) - 1)) == 0)
+                    select[n >> _selectBits] = i >> 6;
+                ++n;
+            });
+            for (size_t w = 0, r = 0; w < words; ++w)
+            {
+                rank[w] = r;
+                r += popcount (bits[w]);
+            }
+            _a = bits;
+            _b = rank;
+            _c = select;
+        }
+    }
+
+    // The run containing element i
+    size_t findRun (size_t i) const
+    {
+        size_t block = i >> _runBlockBits;
+        size_t lo = _c[block];
+        size_t hi = (block + 1 < blocks (_size, _runBlockBits)) ? _c[block + 1] : _count - 1;
+        const uint64_t *run = std::upper_bound (_b + lo + 1, _b + hi + 1, uint64_t (i)) - 1;
+        return run - _b;
+    }
+
+    // The element after the last one in run k
+    size_t runEnd (size_t k) const
+    {
+        return k + 1 < _count ? _b[k + 1] : _size;
+    }
+
+    size_t runIndex (size_t i) const
+    {
+        size_t k = findRun (i);
+        return _a[k] + (i - _b[k]);
+    }
+
+    // The bitmap word containing element i, and in 'word' its bits
+    // from the one for element i up
+    size_t findWord (size_t i, uint64_t &word) const
+    {
+        size_t w = _c[i >> _selectBits];
+        while (w + 1 < _count && _b[w + 1] <= i)
+            ++w;
+        word = _a[w];
+        for (size_t r = i - _b[w]; r > 0; --r)
+            word &= word - 1;
+        return w;
+    }
+
+    size_t bitmapIndex (size_t i) const
+    {
+        uint64_t word;
+        size_t w = findWord (i, word);
+        return (w << 6) + countTrailingZeros (word);
+    }
+
+    static int popcount (uint64_t x)
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return __builtin_popcountll (x);
+#else
+        int n = 0;
+        for (; x; x &= x - 1)
+            ++n;
+        return n;
+#endif
+    }
+
+    static int countTrailingZeros (uint64_t x)
+    {
+#if defined(__GNUC__) || defined(__clang__)
+        return __builtin_ctzll (x);
+#else
+        int n = 0;
+        for (; !(x & 1); x >>= 1)
+            ++n;
+        return n;
+#endif
+    }
+
+    Encoding                     _encoding;
+    size_t                       _size;
+    size_t                       _length;
+    size_t                       _first;
+    size_t                       _count;   // indices, runs or bitmap words
+    size_t                       _memory;
+    const uint64_t *             _a;
+    const uint64_t *             _b;
+    const uint64_t *             _c;
+    const uint32_t *             _narrow;
+    boost::shared_array<uint64_t> _storage;
+};
+
+} // namespace PyImath
+
+#endif
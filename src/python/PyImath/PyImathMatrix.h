@@ -11,6 +11,8 @@
 #include <Python.h>
 #define BOOST_BIND_GLOBAL_PLACEHOLDERS
 #include <boost/python.hpp>
+#include <stdexcept>
+#include <string>
 #include <ImathMatrix.h>
 #include <ImathMatrixAlgo.h>
 #include "PyImath.h"
@@ -30,6 +32,45 @@ typedef FixedArray<IMATH_NAMESPACE::Matrix33<double> >  M33dArray;
 typedef FixedArray<IMATH_NAMESPACE::Matrix44<float> >  M44fArray;
 typedef FixedArray<IMATH_NAMESPACE::Matrix44<double> >  M44dArray;
 
+//
+// The inversion methods of the matrix arrays: "affine" for Imath's
+// inverse(), which is fastest for affine transforms, or "gj" for
+// Gauss-Jordan elimination, which is slower but more accurate.
+// gaussJordanInversion returns whether the method is "gj".
+//
+
+inline bool
+gaussJordanInversion (const std::string &method)
+{
+    if (method == "gj")
+        return true;
+    if (method != "affine")
+        throw std::invalid_argument ("Inversion method must be 'affine' or 'gj'");
+    return false;
+}
+
+//
+// invertMatrix sets r to the inverse of m and returns true, or sets r
+// to the identity and returns false if m is singular.  m and r may be
+// the same matrix.
+//
+
+template <class M>
+inline bool
+invertMatrix (const M &m, M &r, bool gj)
+{
+    try
+    {
+        r = gj ? m.gjInverse (true) : m.inverse (true);
+        return true;
+    }
+    catch (const std::invalid_argument &)
+    {
+        r = M();
+        return false;
+    }
+}
+
 //
 
 // Other code in the Zeno code base assumes the existance of a class with the
@@ -266,6 +266,7 @@ static FixedArray<Vec2<TV> >
 multDirMatrix22_array(Matrix22<TM> &mat, const FixedArray<Vec2<TV> >&src)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = src.len();
     FixedArray<Vec2<TV> > dst(len);
     for (size_t i=0; i<len; ++i) mat.multDirMatrix(src[i], dst[i]);    
@@ -688,6 +689,7 @@ static FixedArray<IMATH_NAMESPACE::Matrix22<T> >
 inverse22_array(FixedArray<IMATH_NAMESPACE::Matrix22<T> >&ma, bool singExc = true)
 {
   MATH_EXC_ON;
+  PY_IMATH_LEAVE_PYTHON;
   size_t len = ma.len();
   FixedArray<IMATH_NAMESPACE::Matrix22<T> > dst(len);
   for (size_t i=0; i<len; ++i) dst[i] = ma[i].inverse(singExc);    
@@ -699,6 +701,7 @@ static FixedArray<IMATH_NAMESPACE::Matrix22<T> > &
 invert22_array(FixedArray<IMATH_NAMESPACE::Matrix22<T> >&ma, bool singExc = true)
 {
   MATH_EXC_ON;
+  PY_IMATH_LEAVE_PYTHON;
   size_t len = ma.len();
   for (size_t i=0; i<len; ++i) ma[i].invert(singExc);    
   return ma;
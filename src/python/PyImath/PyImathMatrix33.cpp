@@ -23,6 +23,7 @@
 #include "PyImath.h"
 #include "PyImathVec.h"
 #include "PyImathMathExc.h"
+#include "PyImathAutovectorize.h"
 
 namespace PyImath {
 
@@ -339,12 +340,26 @@ static FixedArray<Vec2<TV> >
 multDirMatrix33_array(Matrix33<TM> &mat, const FixedArray<Vec2<TV> >&src)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = src.len();
     FixedArray<Vec2<TV> > dst(len);
     for (size_t i=0; i<len; ++i) mat.multDirMatrix(src[i], dst[i]);    
     return dst;
 }
 
+template <class TV,class TM>
+static void
+multDirMatrix33_array_dst(Matrix33<TM> &mat, const FixedArray<Vec2<TV> >&src, FixedArray<Vec2<TV> > dst)
+{
+    MATH_EXC_ON;
+    size_t len = dst.match_dimension(src);
+    if (!dst.writable())
+        throw std::invalid_argument ("Output fixed array is read-only.");
+
+    PY_IMATH_LEAVE_PYTHON;
+    for (size_t i=0; i<len; ++i) mat.multDirMatrix(src[i], dst[i]);
+}
+
 template <class TV,class TM>
 static void
 multVecMatrix33(Matrix33<TM> &mat, const Vec2<TV> &src, Vec2<TV> &dst)
@@ -368,12 +383,26 @@ static FixedArray<Vec2<TV> >
 multVecMatrix33_array(Matrix33<TM> &mat, const FixedArray<Vec2<TV> >&src)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = src.len();
     FixedArray<Vec2<TV> > dst(len);
     for (size_t i=0; i<len; ++i) mat.multVecMatrix(src[i], dst[i]);    
     return dst;
 }
 
+template <class TV,class TM>
+static void
+multVecMatrix33_array_dst(Matrix33<TM> &mat, const FixedArray<Vec2<TV> >&src, FixedArray<Vec2<TV> > dst)
+{
+    MATH_EXC_ON;
+    size_t len = dst.match_dimension(src);
+    if (!dst.writable())
+        throw std::invalid_argument ("Output fixed array is read-only.");
+
+    PY_IMATH_LEAVE_PYTHON;
+    for (size_t i=0; i<len; ++i) mat.multVecMatrix(src[i], dst[i]);
+}
+
 template <class T>
 static int
 removeScaling33(Matrix33<T> &mat, int exc = 1)
@@ -990,15 +1019,19 @@ register_Matrix33()
          .def("multDirMatrix", &multDirMatrix33<double,T>, "mult matrix")
          .def("multDirMatrix", &multDirMatrix33_return_value<double,T>, "mult matrix")
          .def("multDirMatrix", &multDirMatrix33_array<double,T>, "mult matrix")
+         .def("multDirMatrix", &multDirMatrix33_array_dst<double,T>, "mult matrix")
          .def("multDirMatrix", &multDirMatrix33<float,T>, "mult matrix")
          .def("multDirMatrix", &multDirMatrix33_return_value<float,T>, "mult matrix")
          .def("multDirMatrix", &multDirMatrix33_array<float,T>, "mult matrix")
+         .def("multDirMatrix", &multDirMatrix33_array_dst<float,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33<double,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33_return_value<double,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33_array<double,T>, "mult matrix")
+         .def("multVecMatrix", &multVecMatrix33_array_dst<double,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33<float,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33_return_value<float,T>, "mult matrix")
          .def("multVecMatrix", &multVecMatrix33_array<float,T>, "mult matrix")
+         .def("multVecMatrix", &multVecMatrix33_array_dst<float,T>, "mult matrix")
          .def("removeScaling", &removeScaling33<T>, removeScaling33_overloads("remove scaling"))
 
          .def("removeScalingAndShear", &removeScalingAndShear33<T>, removeScalingAndShear33_overloads("remove scaling"))
@@ -1093,6 +1126,7 @@ M33Array_constructor(const FixedArray<T> &a, const FixedArray<T> &b, const Fixed
                      const FixedArray<T> &g, const FixedArray<T> &h, const FixedArray<T> &i)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     Py_ssize_t len = a.len();
     if (!( a.len() == len && b.len() == len && c.len() == len && 
            d.len() == len && e.len() == len && f.len() == len && 
@@ -1116,35 +1150,84 @@ setM33ArrayItem(FixedArray<IMATH_NAMESPACE::Matrix33<T> > &ma,
 }
 
 
+// Inverts each matrix as M44Array_Inverse does, without the vectorized kernel
 template <class T>
 struct M33Array_Inverse : public Task
 {
     const FixedArray<IMATH_NAMESPACE::Matrix33<T> > &mats;
     FixedArray<IMATH_NAMESPACE::Matrix33<T> >       &result;
+    FixedArray<int>                                 *singular;
+    bool                                             gj;
 
     M33Array_Inverse (FixedArray<IMATH_NAMESPACE::Matrix33<T> >        &result,
-                       const FixedArray<IMATH_NAMESPACE::Matrix33<T> > &mats)
-        : mats (mats), result (result) {}
+                      const FixedArray<IMATH_NAMESPACE::Matrix33<T> > &mats,
+                      FixedArray<int>                                 *singular,
+                      bool                                             gj)
+        : mats (mats), result (result), singular (singular), gj (gj) {}
 
     void execute (size_t start, size_t end)
     {
         for (size_t i = start; i < end; ++i)
-            result[i] = mats[i].inverse();
+        {
+            IMATH_NAMESPACE::Matrix33<T> m;
+            bool ok = invertMatrix (mats[i], m, gj);
+            result[i] = m;
+            if (singular)
+                (*singular)[i] = !ok;
+        }
     } 
 };
 
+static FixedArray<int> *
+M33Array_singularMask (const object &singularMask, size_t len)
+{
+    if (singularMask.is_none())
+        return nullptr;
+
+    FixedArray<int> &mask = extract<FixedArray<int> &> (singularMask);
+    detail::check_output_array (mask, len);
+    return &mask;
+}
+
 template <class T>
-static FixedArray<IMATH_NAMESPACE::Matrix33<T> >
-M33Array_inverse(const FixedArray<IMATH_NAMESPACE::Matrix33<T> > &ma)
+static object
+M33Array_inverse(const FixedArray<IMATH_NAMESPACE::Matrix33<T> > &ma,
+                 const object &out, const object &singularMask, const std::string &method)
 {
     MATH_EXC_ON;
+    bool gj = gaussJordanInversion (method);
     size_t len = ma.len();
-    FixedArray<IMATH_NAMESPACE::Matrix33<T> > result (len);
 
-    M33Array_Inverse<T> task (result, ma);
-    dispatchTask (task, len);
+    FixedArray<IMATH_NAMESPACE::Matrix33<T> > result =
+        out.is_none() ? FixedArray<IMATH_NAMESPACE::Matrix33<T> > (Py_ssize_t(len), UNINITIALIZED)
+                      : extract<FixedArray<IMATH_NAMESPACE::Matrix33<T> > > (out)();
+    if (!out.is_none())
+        detail::check_output_array (result, len);
 
-    return result;
+    FixedArray<int> *singular = M33Array_singularMask (singularMask, len);
+
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M33Array_Inverse<T> task (result, ma, singular, gj);
+        dispatchTask (task, len, gj ? 60 : 20);
+    }
+
+    return out.is_none() ? object (result) : out;
+}
+
+template <class T>
+static void
+M33Array_invert (FixedArray<IMATH_NAMESPACE::Matrix33<T> > &m,
+                 const object &singularMask, const std::string &method)
+{
+    MATH_EXC_ON;
+    bool gj = gaussJordanInversion (method);
+    size_t len = m.len();
+    FixedArray<int> *singular = M33Array_singularMask (singularMask, len);
+
+    PY_IMATH_LEAVE_PYTHON;
+    M33Array_Inverse<T> task (m, m, singular, gj);
+    dispatchTask (task, len, gj ? 60 : 20);
 }
 
 template <class T>
@@ -1173,6 +1256,7 @@ static FixedArray< Vec3<T> >
 M33Array_rmulVec3 (const FixedArray< IMATH_NAMESPACE::Matrix33<T> > &a, const Vec3<T> &v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
     FixedArray< Vec3<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -1208,6 +1292,7 @@ M33Array_rmulVec3Array (const FixedArray< IMATH_NAMESPACE::Matrix33<T> > &a,
                         const FixedArray< Vec3<T> > &b)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.match_dimension(b);
     FixedArray< Vec3<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -1225,8 +1310,19 @@ register_M33Array()
          .def("__init__", make_constructor(M33Array_constructor<T>))
          .def("__setitem__", &setM33ArrayItem<T>)
          .def("inverse", &M33Array_inverse<T>,
-             "Return M^-1 for each element M.",
-             (args("vector")))
+             "M.inverse(out=None, singularMask=None, method='affine') -- "
+             "return M^-1 for each element M, written into the array 'out' "
+             "if it is given.  Singular matrices do not raise an exception: "
+             "their inverse is the identity, and their element of the IntArray "
+             "'singularMask', if it is given, is set to 1, and that of the "
+             "others to 0.  The method is 'affine' for Imath's inverse(), which "
+             "is fastest for affine transforms, or 'gj' for Gauss-Jordan "
+             "elimination, which is more accurate.",
+             (arg("out")=object(), arg("singularMask")=object(), arg("method")="affine"))
+         .def("invert", &M33Array_invert<T>,
+             "M.invert(singularMask=None, method='affine') -- perform M^-1 "
+             "in place for each element M, as M.inverse() does.",
+             (arg("singularMask")=object(), arg("method")="affine"))
          .def("__rmul__", &M33Array_rmulVec3<T>)
          .def("__rmul__", &M33Array_rmulVec3Array<T>)
         ;
@@ -15,15 +15,19 @@
 #include <boost/python/tuple.hpp>
 #include <boost/python/dict.hpp>
 #include <boost/python/raw_function.hpp>
+#include <algorithm>
+#include <vector>
 #include <ImathVec.h>
 #include <ImathMatrixAlgo.h>
 #include "PyImath.h"
 #include "PyImathVec.h"
 #include "PyImathMathExc.h"
 #include "PyImathMatrix.h"
+#include "PyImathEuler.h"
 #include "PyImathExport.h"
 #include "PyImathDecorators.h"
 #include "PyImathTask.h"
+#include "PyImathSimd.h"
 
 namespace PyImath {
 template<> const char PYIMATH_EXPORT *PyImath::M44fArray::name() { return "M44fArray"; }
@@ -362,15 +366,30 @@ static FixedArray<Vec3<TV> >
 multDirMatrix44_array(Matrix44<TM> &mat, const FixedArray<Vec3<TV> >&src)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = src.len();
     FixedArray<Vec3<TV> > dst(len);
 
     MatrixVecTask<TV,TM,op_multDirMatrix<TV,TM> > task(mat,src,dst);
-    dispatchTask(task,len);
+    dispatchTask(task,len,8);
 
     return dst;
 }
 
+template <class TV,class TM>
+static void
+multDirMatrix44_array_dst(Matrix44<TM> &mat, const FixedArray<Vec3<TV> >&src, FixedArray<Vec3<TV> > dst)
+{
+    MATH_EXC_ON;
+    size_t len = dst.match_dimension(src);
+    if (!dst.writable())
+        throw std::invalid_argument ("Output fixed array is read-only.");
+
+    PY_IMATH_LEAVE_PYTHON;
+    MatrixVecTask<TV,TM,op_multDirMatrix<TV,TM> > task(mat,src,dst);
+    dispatchTask(task,len,8);
+}
+
 template <class TV,class TM>
 static void
 multVecMatrix44(Matrix44<TM> &mat, const Vec3<TV> &src, Vec3<TV> &dst)
@@ -395,15 +414,30 @@ static FixedArray<Vec3<TV> >
 multVecMatrix44_array(Matrix44<TM> &mat, const FixedArray<Vec3<TV> >&src)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = src.len();
     FixedArray<Vec3<TV> > dst(len);
 
     MatrixVecTask<TV,TM,op_multVecMatrix<TV,TM> > task(mat,src,dst);
-    dispatchTask(task,len);
+    dispatchTask(task,len,8);
 
     return dst;
 }
 
+template <class TV,class TM>
+static void
+multVecMatrix44_array_dst(Matrix44<TM> &mat, const FixedArray<Vec3<TV> >&src, FixedArray<Vec3<TV> > dst)
+{
+    MATH_EXC_ON;
+    size_t len = dst.match_dimension(src);
+    if (!dst.writable())
+        throw std::invalid_argument ("Output fixed array is read-only.");
+
+    PY_IMATH_LEAVE_PYTHON;
+    MatrixVecTask<TV,TM,op_multVecMatrix<TV,TM> > task(mat,src,dst);
+    dispatchTask(task,len,8);
+}
+
 template <class T>
 static int
 removeScaling44(Matrix44<T> &mat, int exc = 1)
@@ -1095,15 +1129,19 @@ register_Matrix44()
         .def("multDirMatrix", &multDirMatrix44<double,T>, "mult matrix")
         .def("multDirMatrix", &multDirMatrix44_return_value<double,T>, "mult matrix")
         .def("multDirMatrix", &multDirMatrix44_array<double,T>, "mult matrix")
+        .def("multDirMatrix", &multDirMatrix44_array_dst<double,T>, "mult matrix")
         .def("multDirMatrix", &multDirMatrix44<float,T>, "mult matrix")
         .def("multDirMatrix", &multDirMatrix44_return_value<float,T>, "mult matrix")
         .def("multDirMatrix", &multDirMatrix44_array<float,T>, "mult matrix")
+        .def("multDirMatrix", &multDirMatrix44_array_dst<float,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44<double,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44_return_value<double,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44_array<double,T>, "mult matrix")
+        .def("multVecMatrix", &multVecMatrix44_array_dst<double,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44<float,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44_return_value<float,T>, "mult matrix")
         .def("multVecMatrix", &multVecMatrix44_array<float,T>, "mult matrix")
+        .def("multVecMatrix", &multVecMatrix44_array_dst<float,T>, "mult matrix")
         .def("removeScaling", &removeScaling44<T>, removeScaling44_overloads("remove scaling"))
         .def("removeScalingAndShear", &removeScalingAndShear44<T>, removeScalingAndShear44_overloads("remove scaling"))
         .def("sansScaling", &sansScaling44<T>, sansScaling44_overloads("sans scaling"))
@@ -1203,6 +1241,7 @@ M44Array_constructor(const FixedArray<T> &a, const FixedArray<T> &b, const Fixed
                      const FixedArray<T> &m, const FixedArray<T> &n, const FixedArray<T> &o, const FixedArray<T> &p)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     Py_ssize_t len = a.len();
     if (!( a.len() == len && b.len() == len && c.len() == len && d.len() == len && 
             e.len() == len && f.len() == len && g.len() == len && h.len() == len && 
@@ -1227,35 +1266,98 @@ setM44ArrayItem(FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma,
     ma[ma.canonical_index(index)] = m;
 }
 
+//
+// Inverts each matrix of 'mats' into 'result', which may be the same
+// array, with Imath's inverse() or, if 'gj' is set, gjInverse().
+// Singular matrices do not raise an exception: their inverse is the
+// identity, and their element of 'singular', if given, is set to 1.
+// Contiguous arrays are inverted with Imath's inverse() by the
+// vectorized kernel of PyImathSimd.h, when there is one.
+//
+
 template <class T>
 struct M44Array_Inverse : public Task
 {
     const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &mats;
     FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &result;
+    FixedArray<int>                                 *singular;
+    bool                                             gj;
 
     M44Array_Inverse (FixedArray<IMATH_NAMESPACE::Matrix44<T> >        &result,
-                       const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &mats)
-        : mats (mats), result (result) {}
+                      const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &mats,
+                      FixedArray<int>                                 *singular,
+                      bool                                             gj)
+        : mats (mats), result (result), singular (singular), gj (gj) {}
 
     void execute (size_t start, size_t end)
     {
-        for (size_t i = start; i < end; ++i)
-            result[i] = mats[i].inverse();
+        const simd::Kernels<T> *k = gj ? nullptr : simd::kernels<T>();
+
+        if (k && detail::simd_contiguous (mats) && detail::simd_contiguous (result))
+        {
+            const size_t blockSize = 256;
+            const IMATH_NAMESPACE::Matrix44<T> *a = detail::simd_data (mats);
+            IMATH_NAMESPACE::Matrix44<T> *r = detail::simd_writable_data (result);
+            int flags[blockSize];
+
+            for (size_t b = start; b < end; b += blockSize)
+            {
+                size_t n = std::min (blockSize, end - b);
+                k->inverse (a + b, r + b, flags, n);
+                if (singular)
+                    for (size_t i = 0; i < n; ++i)
+                        (*singular)[b + i] = flags[i];
+            }
+        }
+        else
+        {
+            for (size_t i = start; i < end; ++i)
+            {
+                IMATH_NAMESPACE::Matrix44<T> m;
+                bool ok = invertMatrix (mats[i], m, gj);
+                result[i] = m;
+                if (singular)
+                    (*singular)[i] = !ok;
+            }
+        }
     } 
 };
 
+static FixedArray<int> *
+M44Array_singularMask (const object &singularMask, size_t len)
+{
+    if (singularMask.is_none())
+        return nullptr;
+
+    FixedArray<int> &mask = extract<FixedArray<int> &> (singularMask);
+    detail::check_output_array (mask, len);
+    return &mask;
+}
+
 template <class T>
-static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
-M44Array_inverse(const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma)
+static object
+M44Array_inverse(const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma,
+                 const object &out, const object &singularMask, const std::string &method)
 {
     MATH_EXC_ON;
+    bool gj = gaussJordanInversion (method);
     size_t len = ma.len();
-    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result (len);
 
-    M44Array_Inverse<T> task (result, ma);
-    dispatchTask (task, len);
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result =
+        out.is_none() ? FixedArray<IMATH_NAMESPACE::Matrix44<T> > (Py_ssize_t(len), UNINITIALIZED)
+                      : extract<FixedArray<IMATH_NAMESPACE::Matrix44<T> > > (out)();
+    if (!out.is_none())
+        detail::check_output_array (result, len);
 
-    return result;
+    FixedArray<int> *singular = M44Array_singularMask (singularMask, len);
+
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Inverse<T> task (result, ma, singular, gj);
+        dispatchTask (task, len, gj ? 150 : 50);
+    }
+
+    return out.is_none() ? object (result) : out;
 }
 
 template <class T>
@@ -1284,6 +1386,7 @@ static FixedArray< Vec4<T> >
 M44Array_rmulVec4 (const FixedArray< IMATH_NAMESPACE::Matrix44<T> > &a, const Vec4<T> &v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
     FixedArray< Vec4<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -1319,6 +1422,7 @@ M44Array_rmulVec4Array (const FixedArray< IMATH_NAMESPACE::Matrix44<T> > &a,
                         const FixedArray< Vec4<T> > &b)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.match_dimension(b);
     FixedArray< Vec4<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -1352,6 +1456,7 @@ M44Array_rmulVec3ArrayT (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
                          const FixedArray<IMATH_NAMESPACE::Vec3<T> >     &b)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.match_dimension(b);
     FixedArray< IMATH_NAMESPACE::Vec3<T> > result (Py_ssize_t(len), UNINITIALIZED);
 
@@ -1361,30 +1466,19 @@ M44Array_rmulVec3ArrayT (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
     return result;
 }
 
-template <class T>
-struct M44Array_Invert : public Task
-{
-    FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m;
-
-    M44Array_Invert (FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m)
-      : m(m) {}
-
-    void execute(size_t start, size_t end)
-    {
-        for (size_t i = start; i < end; ++i)
-            m[i].invert();
-    }
-};
-
 template <class T>
 void
-M44Array_invert (FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m)
+M44Array_invert (FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m,
+                 const object &singularMask, const std::string &method)
 {
     MATH_EXC_ON;
+    bool gj = gaussJordanInversion (method);
     size_t len = m.len();
+    FixedArray<int> *singular = M44Array_singularMask (singularMask, len);
 
-    M44Array_Invert<T> task (m);
-    dispatchTask (task, len);
+    PY_IMATH_LEAVE_PYTHON;
+    M44Array_Inverse<T> task (m, m, singular, gj);
+    dispatchTask (task, len, gj ? 150 : 50);
 }
 
 template <class T>
@@ -1407,6 +1501,7 @@ void
 M44Array_transpose (FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = m.len();
 
     M44Array_Transpose<T> task (m);
@@ -1438,11 +1533,12 @@ M44Array_multDirMatrix (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m,
                         const FixedArray<IMATH_NAMESPACE::Vec3<T> >     &v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = m.match_dimension(v);
     FixedArray<IMATH_NAMESPACE::Vec3<T> > result (Py_ssize_t(len), UNINITIALIZED);
 
     M44Array_MultDirMatrix<T> task (m, v, result);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 8);
 
     return result;
 }
@@ -1472,15 +1568,387 @@ M44Array_multVecMatrix (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &m,
                         const FixedArray<IMATH_NAMESPACE::Vec3<T> >     &v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = m.match_dimension(v);
     FixedArray<IMATH_NAMESPACE::Vec3<T> > result (Py_ssize_t(len), UNINITIALIZED);
 
     M44Array_MultVecMatrix<T> task (m, v, result);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 8);
 
     return result;
 }
 
+template <class T>
+struct M44Array_MulArray : public Task
+{
+    const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a;
+    const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &b;
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &r;
+
+    M44Array_MulArray (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                       const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &b,
+                       FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &r)
+      : a(a), b(b), r(r) {}
+
+    void execute(size_t start, size_t end)
+    {
+        for (size_t i = start; i < end; ++i)
+            r[i] = a[i] * b[i];
+    }
+};
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+M44Array_mulArray (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                   const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &b)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.match_dimension(b);
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    M44Array_MulArray<T> task (a, b, result);
+    dispatchTask (task, len, 64);
+
+    return result;
+}
+
+template <class T>
+static const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &
+M44Array_imulArray (FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &a,
+                    const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &b)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.match_dimension(b);
+
+    M44Array_MulArray<T> task (a, b, a);
+    dispatchTask (task, len, 64);
+
+    return a;
+}
+
+// Multiplies each element by m, on the left or on the right
+template <class T>
+struct M44Array_MulMatrix : public Task
+{
+    const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a;
+    const IMATH_NAMESPACE::Matrix44<T>              &m;
+    bool                                             left;
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &r;
+
+    M44Array_MulMatrix (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                        const IMATH_NAMESPACE::Matrix44<T>              &m,
+                        bool                                             left,
+                        FixedArray<IMATH_NAMESPACE::Matrix44<T> >       &r)
+      : a(a), m(m), left(left), r(r) {}
+
+    void execute(size_t start, size_t end)
+    {
+        if (left)
+        {
+            for (size_t i = start; i < end; ++i)
+                r[i] = m * a[i];
+        }
+        else
+        {
+            for (size_t i = start; i < end; ++i)
+                r[i] = a[i] * m;
+        }
+    }
+};
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+M44Array_mulMatrix (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                    const IMATH_NAMESPACE::Matrix44<T>              &m)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    M44Array_MulMatrix<T> task (a, m, false, result);
+    dispatchTask (task, len, 64);
+
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+M44Array_rmulMatrix (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                     const IMATH_NAMESPACE::Matrix44<T>              &m)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    M44Array_MulMatrix<T> task (a, m, true, result);
+    dispatchTask (task, len, 64);
+
+    return result;
+}
+
+template <class T>
+static const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &
+M44Array_imulMatrix (FixedArray<IMATH_NAMESPACE::Matrix44<T> > &a,
+                     const IMATH_NAMESPACE::Matrix44<T>        &m)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+
+    M44Array_MulMatrix<T> task (a, m, false, a);
+    dispatchTask (task, len, 64);
+
+    return a;
+}
+
+//
+// composeHierarchy computes the world matrix of each node of a
+// hierarchy from its local matrix and the index of its parent, -1 for
+// the roots:
+//
+//     world[i] = local[i] * world[parent[i]]
+//
+// The nodes are sorted into levels by their depth in the hierarchy.
+// The nodes of a level depend only on the nodes of the levels above,
+// so the levels are computed one after the other, and the nodes of
+// each level in parallel.
+//
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+M44Array_composeHierarchy (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &local,
+                           const FixedArray<int>                           &parents)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = local.match_dimension(parents);
+
+    //
+    // Find the depth of each node, walking up to the first ancestor
+    // whose depth is known.  -1 marks a node whose depth is unknown, -2
+    // a node on the path being walked, which is a cycle if it is met
+    // again.
+    //
+
+    std::vector<int>    depth (len, -1);
+    std::vector<size_t> path;
+    int                 numLevels = 0;
+
+    for (size_t i = 0; i < len; ++i)
+    {
+        size_t node = i;
+
+        while (depth[node] == -1)
+        {
+            depth[node] = -2;
+            path.push_back (node);
+
+            int p = parents[node];
+            if (p < 0)
+                break;
+            if (size_t(p) >= len)
+                throw std::invalid_argument ("Parent index out of range");
+            if (depth[p] == -2)
+                throw std::invalid_argument ("Hierarchy contains a cycle");
+
+            node = p;
+        }
+
+        int d = depth[node] >= 0 ? depth[node] + 1 : 0;
+        while (!path.empty())
+        {
+            depth[path.back()] = d++;
+            path.pop_back();
+        }
+
+        numLevels = std::max (numLevels, d);
+    }
+
+    std::vector<size_t> levelStart (numLevels + 1, 0);
+    for (size_t i = 0; i < len; ++i)
+        ++levelStart[depth[i] + 1];
+    for (int l = 0; l < numLevels; ++l)
+        levelStart[l + 1] += levelStart[l];
+
+    std::vector<size_t> order (len);
+    std::vector<size_t> next (levelStart.begin(), levelStart.end() - 1);
+    for (size_t i = 0; i < len; ++i)
+        order[next[depth[i]]++] = i;
+
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > world (Py_ssize_t(len), UNINITIALIZED);
+
+    for (int l = 0; l < numLevels; ++l)
+    {
+        const size_t *nodes = &order[levelStart[l]];
+
+        dispatchRows (levelStart[l + 1] - levelStart[l], 64, [&] (size_t j)
+        {
+            size_t i = nodes[j];
+            int    p = parents[i];
+            world[i] = p < 0 ? local[i] : local[i] * world[p];
+        });
+    }
+
+    return world;
+}
+
+//
+// Decomposition of each matrix into scaling, shear, rotation and
+// translation.  The outputs that are not wanted are null.  Matrices
+// whose scaling cannot be removed do not raise an exception: their
+// element of the mask is 0, their scaling and shear are zero, and
+// their rotation is the identity.
+//
+
+template <class T>
+struct M44Array_Decompose : public Task
+{
+    const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &mats;
+    typename IMATH_NAMESPACE::Euler<T>::Order        order;
+    FixedArray<IMATH_NAMESPACE::Vec3<T> >            *scl;
+    FixedArray<IMATH_NAMESPACE::Vec3<T> >            *shr;
+    FixedArray<IMATH_NAMESPACE::Euler<T> >           *rot;
+    FixedArray<IMATH_NAMESPACE::Quat<T> >            *quat;
+    FixedArray<IMATH_NAMESPACE::Vec3<T> >            *tran;
+    FixedArray<int>                                  &ok;
+
+    M44Array_Decompose (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &mats,
+                        typename IMATH_NAMESPACE::Euler<T>::Order        order,
+                        FixedArray<IMATH_NAMESPACE::Vec3<T> >            *scl,
+                        FixedArray<IMATH_NAMESPACE::Vec3<T> >            *shr,
+                        FixedArray<IMATH_NAMESPACE::Euler<T> >           *rot,
+                        FixedArray<IMATH_NAMESPACE::Quat<T> >            *quat,
+                        FixedArray<IMATH_NAMESPACE::Vec3<T> >            *tran,
+                        FixedArray<int>                                  &ok)
+        : mats (mats), order (order), scl (scl), shr (shr), rot (rot), quat (quat), tran (tran), ok (ok) {}
+
+    void execute (size_t start, size_t end)
+    {
+        for (size_t i = start; i < end; ++i)
+        {
+            IMATH_NAMESPACE::Matrix44<T> m = mats[i];
+            IMATH_NAMESPACE::Vec3<T> s, h;
+
+            bool success = IMATH_NAMESPACE::extractAndRemoveScalingAndShear (m, s, h, false);
+
+            if (!success)
+            {
+                s = h = IMATH_NAMESPACE::Vec3<T> (0);
+                m.makeIdentity();
+            }
+
+            if (scl)
+                (*scl)[i] = s;
+            if (shr)
+                (*shr)[i] = h;
+            if (rot)
+            {
+                IMATH_NAMESPACE::Euler<T> e (order);
+                e.extract (m);
+                (*rot)[i] = e;
+            }
+            if (quat)
+                (*quat)[i] = IMATH_NAMESPACE::extractQuat (m);
+            if (tran)
+                (*tran)[i] = mats[i].translation();
+
+            ok[i] = success;
+        }
+    }
+};
+
+template <class T>
+static tuple
+M44Array_extractScaling (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma)
+{
+    MATH_EXC_ON;
+    size_t len = ma.len();
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > scl (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<int> ok (Py_ssize_t(len), UNINITIALIZED);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Decompose<T> task (ma, IMATH_NAMESPACE::Euler<T>::XYZ, &scl, 0, 0, 0, 0, ok);
+        dispatchTask (task, len, 50);
+    }
+    return make_tuple (scl, ok);
+}
+
+template <class T>
+static tuple
+M44Array_extractScalingAndShear (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma)
+{
+    MATH_EXC_ON;
+    size_t len = ma.len();
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > scl (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > shr (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<int> ok (Py_ssize_t(len), UNINITIALIZED);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Decompose<T> task (ma, IMATH_NAMESPACE::Euler<T>::XYZ, &scl, &shr, 0, 0, 0, ok);
+        dispatchTask (task, len, 50);
+    }
+    return make_tuple (scl, shr, ok);
+}
+
+template <class T>
+static tuple
+M44Array_extractEuler (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma,
+                       typename IMATH_NAMESPACE::Eulerf::Order order)
+{
+    MATH_EXC_ON;
+    typename IMATH_NAMESPACE::Euler<T>::Order o = interpretOrder<T> (order);
+    size_t len = ma.len();
+    FixedArray<IMATH_NAMESPACE::Euler<T> > rot (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<int> ok (Py_ssize_t(len), UNINITIALIZED);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Decompose<T> task (ma, o, 0, 0, &rot, 0, 0, ok);
+        dispatchTask (task, len, 80);
+    }
+    return make_tuple (rot, ok);
+}
+
+template <class T>
+static tuple
+M44Array_extractQuat (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma)
+{
+    MATH_EXC_ON;
+    size_t len = ma.len();
+    FixedArray<IMATH_NAMESPACE::Quat<T> > quat (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<int> ok (Py_ssize_t(len), UNINITIALIZED);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Decompose<T> task (ma, IMATH_NAMESPACE::Euler<T>::XYZ, 0, 0, 0, &quat, 0, ok);
+        dispatchTask (task, len, 60);
+    }
+    return make_tuple (quat, ok);
+}
+
+template <class T>
+static tuple
+M44Array_extractSHRT (const FixedArray<IMATH_NAMESPACE::Matrix44<T> > &ma,
+                      typename IMATH_NAMESPACE::Eulerf::Order order)
+{
+    MATH_EXC_ON;
+    typename IMATH_NAMESPACE::Euler<T>::Order o = interpretOrder<T> (order);
+    size_t len = ma.len();
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > scl (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > shr (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<IMATH_NAMESPACE::Euler<T> > rot (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > tran (Py_ssize_t(len), UNINITIALIZED);
+    FixedArray<int> ok (Py_ssize_t(len), UNINITIALIZED);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        M44Array_Decompose<T> task (ma, o, &scl, &shr, &rot, 0, &tran, ok);
+        dispatchTask (task, len, 80);
+    }
+    return make_tuple (scl, shr, rot, tran, ok);
+}
+
 template <class T>
 class_<FixedArray<IMATH_NAMESPACE::Matrix44<T> > >
 register_M44Array()
@@ -1491,10 +1959,19 @@ register_M44Array()
          .def("__init__", make_constructor(M44Array_constructor<T>))
          .def("__setitem__", &setM44ArrayItem<T>)
          .def("inverse", &M44Array_inverse<T>,
-             "Return M^-1 for each element M.",
-             (args("vector")))
+             "M.inverse(out=None, singularMask=None, method='affine') -- "
+             "return M^-1 for each element M, written into the array 'out' "
+             "if it is given.  Singular matrices do not raise an exception: "
+             "their inverse is the identity, and their element of the IntArray "
+             "'singularMask', if it is given, is set to 1, and that of the "
+             "others to 0.  The method is 'affine' for Imath's inverse(), which "
+             "is fastest for affine transforms, or 'gj' for Gauss-Jordan "
+             "elimination, which is more accurate.",
+             (arg("out")=object(), arg("singularMask")=object(), arg("method")="affine"))
          .def("invert", &M44Array_invert<T>,
-             "Perform M^-1 in place for each element M.")
+             "M.invert(singularMask=None, method='affine') -- perform M^-1 "
+             "in place for each element M, as M.inverse() does.",
+             (arg("singularMask")=object(), arg("method")="affine"))
          .def("transpose", &M44Array_transpose<T>,
              "Perform M^T in place for each element M.")
          .def("multDirMatrix", &M44Array_multDirMatrix<T>,
@@ -1503,11 +1980,51 @@ register_M44Array()
          .def("multVecMatrix", &M44Array_multVecMatrix<T>,
              "Multiply an array of normals element by element with the matrix array.",
              (args("vector")))
+         .def("extractScaling", &M44Array_extractScaling<T>,
+             "M.extractScaling() -- return a tuple (scl, mask) of the scaling of "
+             "each matrix, and an IntArray which is 0 where the scaling could not "
+             "be extracted.  The scaling of those matrices is zero.")
+         .def("extractScalingAndShear", &M44Array_extractScalingAndShear<T>,
+             "M.extractScalingAndShear() -- return a tuple (scl, shr, mask) of the "
+             "scaling and shear of each matrix, and an IntArray which is 0 where "
+             "they could not be extracted.  The scaling and shear of those "
+             "matrices are zero.")
+         .def("extractEuler", &M44Array_extractEuler<T>,
+             "M.extractEuler(order=EULER_XYZ) -- return a tuple (rot, mask) of an "
+             "Euler array with the rotation of each matrix, once its scaling and "
+             "shear are removed, and an IntArray which is 0 where the scaling "
+             "could not be removed.  The rotation of those matrices is the identity.",
+             (arg("order")=IMATH_NAMESPACE::Eulerf::XYZ))
+         .def("extractQuat", &M44Array_extractQuat<T>,
+             "M.extractQuat() -- return a tuple (quat, mask) of a Quat array with "
+             "the rotation of each matrix, once its scaling and shear are removed, "
+             "and an IntArray which is 0 where the scaling could not be removed.  "
+             "The rotation of those matrices is the identity.")
+         .def("extractSHRT", &M44Array_extractSHRT<T>,
+             "M.extractSHRT(order=EULER_XYZ) -- return a tuple (scl, shr, rot, tran, mask) "
+             "of the scaling, shear, rotation (as an Euler array) and translation "
+             "of each matrix, and an IntArray which is 0 where the matrix could "
+             "not be decomposed.  Those matrices have zero scaling and shear and "
+             "an identity rotation, and do not raise an exception.",
+             (arg("order")=IMATH_NAMESPACE::Eulerf::XYZ))
          .def("__rmul__", &M44Array_rmulVec4<T>)
          .def("__rmul__", &M44Array_rmulVec4Array<T>)
          .def("__rmul__", &M44Array_rmulVec3ArrayT<T>)
+         .def("__mul__", &M44Array_mulArray<T>)
+         .def("__mul__", &M44Array_mulMatrix<T>)
+         .def("__rmul__", &M44Array_rmulMatrix<T>)
+         .def("__imul__", &M44Array_imulArray<T>, return_internal_reference<>())
+         .def("__imul__", &M44Array_imulMatrix<T>, return_internal_reference<>())
         ;
 
+    def("composeHierarchy", &M44Array_composeHierarchy<T>,
+        "composeHierarchy(local, parents) -- return the world matrices of the "
+        "nodes of a hierarchy, local[i] * world[parents[i]], from their local "
+        "matrices and the IntArray of the indices of their parents, which is "
+        "-1 for the roots.  The levels of the hierarchy are computed in turn, "
+        "and the nodes of each level in parallel.",
+        (args("local"), args("parents")));
+
     add_comparison_functions(matrixArray_class);
 
     return matrixArray_class;
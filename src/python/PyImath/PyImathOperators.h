@@ -10,6 +10,7 @@
 
 #include "PyImathFixedArray.h"
 #include "PyImathAutovectorize.h"
+#include "PyImathReduce.h"
 
 namespace PyImath {
 
@@ -182,34 +183,234 @@ struct op_ne {
 
 template <class T>
 static T fa_reduce(const FixedArray<T> &a) {
-    T tmp(T(0)); // should use default construction but V3f doens't initialize
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
-    for (size_t i=0; i < len; ++i) tmp += a[i];
-    return tmp;
+    if (len == 0)
+        return T(0); // should use default construction but V3f doens't initialize
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<T>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                T tmp(elements[start]);
+                for (size_t i=start+1; i < end; ++i) tmp += elements[i];
+                return tmp;
+            },
+            [] (T &tmp, const T &other) { tmp += other; });
+    });
 }
 
+// The mean of an integer array is computed in double precision
 template <class T>
-static T fa_min(const FixedArray<T> &a) {
-    T tmp(T(0));
+struct fa_mean_type {
+    typedef typename std::conditional<std::is_integral<T>::value,double,T>::type type;
+};
+
+template <class T, class Divisor = typename fa_mean_type<T>::type>
+static typename fa_mean_type<T>::type fa_mean(const FixedArray<T> &a) {
+    typedef typename fa_mean_type<T>::type M;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    if (len == 0)
+        throw std::invalid_argument("mean of an empty array");
+    M sum = withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<M>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                M tmp(elements[start]);
+                for (size_t i=start+1; i < end; ++i) tmp += M(elements[i]);
+                return tmp;
+            },
+            [] (M &tmp, const M &other) { tmp += other; });
+    });
+    return sum / Divisor(len);
+}
+
+// The element that is better than all the others, or 0 for an empty array
+template <class T, class Better>
+static T fa_extreme(const FixedArray<T> &a, const Better &better) {
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-        if (a[i] < tmp)
-            tmp = a[i];
-    return tmp;
+    if (len == 0)
+        return T(0);
+    auto select = [&] (T &tmp, const T &other) { if (better(other, tmp)) tmp = other; };
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<T>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                T tmp(elements[start]);
+                for (size_t i=start+1; i < end; ++i) select(tmp, elements[i]);
+                return tmp;
+            },
+            select);
+    });
+}
+
+template <class T>
+static T fa_min(const FixedArray<T> &a) {
+    return fa_extreme(a, [] (const T &x, const T &y) { return x < y; });
 }
 
 template <class T>
 static T fa_max(const FixedArray<T> &a) {
-    T tmp(T(0));
+    return fa_extreme(a, [] (const T &x, const T &y) { return x > y; });
+}
+
+// The component-wise extreme of an array of vectors or colors
+template <class V, class Better>
+static V fa_component_extreme(const FixedArray<V> &a, const Better &better) {
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-        if (a[i] > tmp)
-            tmp = a[i];
-    return tmp;
+    if (len == 0)
+        return V(0);
+    auto select = [&] (V &tmp, const V &other) {
+        for (unsigned int k=0; k < V::dimensions(); ++k)
+            if (better(other[k], tmp[k]))
+                tmp[k] = other[k];
+    };
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<V>(len, V::dimensions(),
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                V tmp(elements[start]);
+                for (size_t i=start+1; i < end; ++i) select(tmp, elements[i]);
+                return tmp;
+            },
+            select);
+    });
+}
+
+template <class V>
+static V fa_component_min(const FixedArray<V> &a) {
+    typedef typename V::BaseType T;
+    return fa_component_extreme(a, [] (const T &x, const T &y) { return x < y; });
+}
+
+template <class V>
+static V fa_component_max(const FixedArray<V> &a) {
+    typedef typename V::BaseType T;
+    return fa_component_extreme(a, [] (const T &x, const T &y) { return x > y; });
+}
+
+// The index of the first element that is better than all the others
+template <class T, class Better>
+static size_t fa_arg_extreme(const FixedArray<T> &a, const Better &better, const char *name) {
+    typedef std::pair<T,size_t> Value;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    if (len == 0)
+        throw std::invalid_argument(std::string(name) + " of an empty array");
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<Value>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                Value tmp(elements[start], start);
+                for (size_t i=start+1; i < end; ++i)
+                    if (better(elements[i], tmp.first))
+                        tmp = Value(elements[i], i);
+                return tmp;
+            },
+            [&] (Value &tmp, const Value &other) {
+                if (better(other.first, tmp.first) ||
+                    (!better(tmp.first, other.first) && other.second < tmp.second))
+                    tmp = other;
+            });
+    }).second;
+}
+
+template <class T>
+static size_t fa_argmin(const FixedArray<T> &a) {
+    return fa_arg_extreme(a, [] (const T &x, const T &y) { return x < y; }, "argmin");
+}
+
+template <class T>
+static size_t fa_argmax(const FixedArray<T> &a) {
+    return fa_arg_extreme(a, [] (const T &x, const T &y) { return x > y; }, "argmax");
+}
+
+// Whether some element is non-zero
+template <class T>
+static bool fa_any(const FixedArray<T> &a) {
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    if (len == 0)
+        return false;
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<bool>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                for (size_t i=start; i < end; ++i)
+                    if (elements[i] != T(0))
+                        return true;
+                return false;
+            },
+            [] (bool &tmp, bool other) { tmp = tmp || other; });
+    });
+}
+
+// Whether every element is non-zero
+template <class T>
+static bool fa_all(const FixedArray<T> &a) {
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    if (len == 0)
+        return true;
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<bool>(len, 1,
+            [&] (size_t start, size_t end) {
+                auto elements = sequentialAccess(access);
+                for (size_t i=start; i < end; ++i)
+                    if (elements[i] == T(0))
+                        return false;
+                return true;
+            },
+            [] (bool &tmp, bool other) { tmp = tmp && other; });
+    });
+}
+
+template <class T>
+static T fa_dot(const FixedArray<T> &a, const FixedArray<T> &b) {
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.match_dimension(b);
+    if (len == 0)
+        return T(0);
+    return withReadAccess(a, [&] (const auto &aAccess) {
+        return withReadAccess(b, [&] (const auto &bAccess) {
+            return parallelReduce<T>(len, 2,
+                [&] (size_t start, size_t end) {
+                    auto aElements = sequentialAccess(aAccess);
+                    auto bElements = sequentialAccess(bAccess);
+                    T tmp(aElements[start] * bElements[start]);
+                    for (size_t i=start+1; i < end; ++i) tmp += aElements[i] * bElements[i];
+                    return tmp;
+                },
+                [] (T &tmp, const T &other) { tmp += other; });
+        });
+    });
+}
+
+// Adds the values to the elements at the given indices, accumulating
+// the values of repeated indices
+template <class T>
+static void fa_scatter_add_vector(FixedArray<T> &a, const FixedArray<int> &indices, const FixedArray<T> &values) {
+    if (!a.writable())
+        throw std::invalid_argument("Fixed array is read-only.");
+
+    IndexList idx(indices, a.len());
+    if (static_cast<size_t>(values.len()) != idx.size())
+        throw std::invalid_argument("Dimensions of source do not match destination");
+
+    PY_IMATH_LEAVE_PYTHON;
+    idx.scatter(1, [&] (size_t k) { a.unchecked_index(idx[k]) += values[k]; });
+}
+
+template <class T>
+static void fa_scatter_add_scalar(FixedArray<T> &a, const FixedArray<int> &indices, const T &value) {
+    if (!a.writable())
+        throw std::invalid_argument("Fixed array is read-only.");
+
+    IndexList idx(indices, a.len());
+    PY_IMATH_LEAVE_PYTHON;
+    idx.scatter(1, [&] (size_t k) { a.unchecked_index(idx[k]) += value; });
 }
 
 template <class T>
@@ -232,12 +433,27 @@ static void add_arithmetic_math_functions(boost::python::class_<FixedArray<T> >
     generate_member_bindings<op_idiv<T>,true_ >(c,"__itruediv__","self/=x",boost::python::args("x"));
 
     c.def("reduce",&fa_reduce<T>);
+    c.def("sum",&fa_reduce<T>,"sum() - the sum of the elements, or 0 if the array is empty");
+    c.def("scatterAdd",&fa_scatter_add_vector<T>,boost::python::args("indices","values"),
+          "scatterAdd(indices, values) - add the values to the elements at the given\n"
+          "indices.  The values of a repeated index are all added.");
+    c.def("scatterAdd",&fa_scatter_add_scalar<T>,boost::python::args("indices","value"),
+          "scatterAdd(indices, value) - add value to the elements at the given indices,\n"
+          "once for each time an index appears");
 }
 
+// Reductions for arrays of scalars
 template <class T>
 static void add_reduction_functions(boost::python::class_<FixedArray<T> > &c) {
-    c.def("min",&fa_min<T>);
-    c.def("max",&fa_max<T>);
+    c.def("min",&fa_min<T>,"min() - the smallest element, or 0 if the array is empty");
+    c.def("max",&fa_max<T>,"max() - the largest element, or 0 if the array is empty");
+    c.def("argmin",&fa_argmin<T>,"argmin() - the index of the first smallest element");
+    c.def("argmax",&fa_argmax<T>,"argmax() - the index of the first largest element");
+    c.def("mean",&fa_mean<T>,"mean() - the mean of the elements");
+    c.def("any",&fa_any<T>,"any() - whether any element is non-zero");
+    c.def("all",&fa_all<T>,"all() - whether every element is non-zero");
+    c.def("dot",&fa_dot<T>,"dot(b) - the sum of the products of the elements of self and b",
+          boost::python::args("b"));
 }
 
 template <class T>
@@ -13,6 +13,10 @@
 #include <ImathVec.h>
 #include <ImathMatrixAlgo.h>
 #include <ImathEuler.h>
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+#include <vector>
 #include "PyImathQuat.h"
 #include "PyImathExport.h"
 #include "PyImathDecorators.h"
@@ -392,6 +396,7 @@ static FixedArray< Vec3<T> >
 rmulVec3Array(Quat<T> &quat, const FixedArray< Vec3<T> > &a)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     Matrix44<T> m = quat.toMatrix44();
     size_t len = a.len();
     FixedArray< Vec3<T> > r(len);
@@ -595,6 +600,7 @@ QuatArray_setRotation (FixedArray<IMATH_NAMESPACE::Quat<T> > &va,
                        const FixedArray<IMATH_NAMESPACE::Vec3<T> > &to)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = va.match_dimension(from); 
     va.match_dimension(to); 
 
@@ -603,7 +609,7 @@ QuatArray_setRotation (FixedArray<IMATH_NAMESPACE::Quat<T> > &va,
         throw std::invalid_argument ("Input fixed array is read-only.");
 
     QuatArray_SetRotationTask<T> task (from, to, va);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 40);
 }
 
 template <class T>
@@ -655,6 +661,7 @@ QuatArray_orientToVectors (FixedArray<IMATH_NAMESPACE::Quat<T> >       &va,
                            bool alignForward)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = va.match_dimension(forward);
     va.match_dimension(up);
 
@@ -663,7 +670,7 @@ QuatArray_orientToVectors (FixedArray<IMATH_NAMESPACE::Quat<T> >       &va,
         throw std::invalid_argument ("Input fixed array is read-only.");
 
     QuatArray_OrientToVectors<T> task (forward, up, va, alignForward);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 40);
 }
 
 template <class T>
@@ -687,6 +694,7 @@ template <class T> static FixedArray<IMATH_NAMESPACE::Vec3<T> >
 QuatArray_axis(const FixedArray<IMATH_NAMESPACE::Quat<T> > &va)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = va.len(); 
     FixedArray<IMATH_NAMESPACE::Vec3<T> > retval (Py_ssize_t(len), UNINITIALIZED);
 
@@ -717,6 +725,7 @@ template <class T> static FixedArray<T>
 QuatArray_angle(const FixedArray<IMATH_NAMESPACE::Quat<T> > &va)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = va.len(); 
     FixedArray<T> retval (Py_ssize_t(len), UNINITIALIZED);
 
@@ -751,6 +760,7 @@ static FixedArray< Vec3<T> >
 QuatArray_rmulVec3 (const FixedArray< IMATH_NAMESPACE::Quat<T> > &a, const Vec3<T> &v)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.len();
     FixedArray< Vec3<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -787,6 +797,7 @@ QuatArray_rmulVec3Array (const FixedArray< IMATH_NAMESPACE::Quat<T> > &a,
                          const FixedArray< Vec3<T> > &b)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = a.match_dimension(b);
     FixedArray< Vec3<T> > r (Py_ssize_t(len), UNINITIALIZED);
 
@@ -823,6 +834,7 @@ QuatArray_setAxisAngle (FixedArray< IMATH_NAMESPACE::Quat<T> > &quats,
                         const FixedArray<T> &angles)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = quats.match_dimension(axis);
     quats.match_dimension(angles);
 
@@ -831,7 +843,7 @@ QuatArray_setAxisAngle (FixedArray< IMATH_NAMESPACE::Quat<T> > &quats,
         throw std::invalid_argument ("Input fixed array is read-only.");
 
     QuatArray_SetAxisAngle<T> task (axis, angles, quats);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 20);
     return quats;
 }
 
@@ -862,6 +874,7 @@ QuatArray_rotateVector (const FixedArray< IMATH_NAMESPACE::Quat<T> > &quats,
                         const FixedArray< IMATH_NAMESPACE::Vec3<T> > &vectors)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = quats.match_dimension(vectors);
     FixedArray< IMATH_NAMESPACE::Vec3<T> > result (len);
 
@@ -892,6 +905,7 @@ static FixedArray<IMATH_NAMESPACE::Quat<T> >
 QuatArray_inverse(const FixedArray<IMATH_NAMESPACE::Quat<T> > &quats)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = quats.len();
     FixedArray<IMATH_NAMESPACE::Quat<T> > result (len);
 
@@ -927,6 +941,7 @@ QuatArray_setEulerXYZ (FixedArray< IMATH_NAMESPACE::Quat<T> > &quats,
                        const FixedArray< IMATH_NAMESPACE::Vec3<T> > &rot)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = quats.match_dimension(rot);
 
     // Validate that 'va' is writable before entering the thread-task.
@@ -934,7 +949,7 @@ QuatArray_setEulerXYZ (FixedArray< IMATH_NAMESPACE::Quat<T> > &quats,
         throw std::invalid_argument ("Input fixed array is read-only.");
 
     QuatArray_SetEulerXYZ<T> task (rot, quats);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 40);
 }
 
 template <class T>
@@ -964,6 +979,7 @@ QuatArray_mul(const FixedArray< IMATH_NAMESPACE::Quat<T> > &q1,
               const FixedArray< IMATH_NAMESPACE::Quat<T> > &q2)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = q1.match_dimension(q2);
     FixedArray< IMATH_NAMESPACE::Quat<T> > result (Py_ssize_t(len), UNINITIALIZED);
 
@@ -996,6 +1012,7 @@ static FixedArray<IMATH_NAMESPACE::Quat<T> > *
 QuatArray_quatConstructor1(const FixedArray<IMATH_NAMESPACE::Euler<T> > &e)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = e.len();
     FixedArray<IMATH_NAMESPACE::Quat<T> >* result =
         new FixedArray<IMATH_NAMESPACE::Quat<T> > (Py_ssize_t(len), UNINITIALIZED);
@@ -1005,6 +1022,56 @@ QuatArray_quatConstructor1(const FixedArray<IMATH_NAMESPACE::Euler<T> > &e)
     return result;
 }
 
+template <class T, class M>
+static FixedArray<IMATH_NAMESPACE::Quat<T> > *
+QuatArray_matrixConstructor(const FixedArray<M> &m)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = m.len();
+    FixedArray<IMATH_NAMESPACE::Quat<T> >* result =
+        new FixedArray<IMATH_NAMESPACE::Quat<T> > (Py_ssize_t(len), UNINITIALIZED);
+
+    FixedArray<IMATH_NAMESPACE::Quat<T> > &r = *result;
+    dispatchRows (len, 100, [&] (size_t i)
+    {
+        r[i] = Euler<T>(m[i]).toQuat();
+    });
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix33<T> >
+QuatArray_toMatrix33(const FixedArray<IMATH_NAMESPACE::Quat<T> > &q)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = q.len();
+    FixedArray<IMATH_NAMESPACE::Matrix33<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    dispatchRows (len, 20, [&] (size_t i)
+    {
+        result[i] = q[i].toMatrix33();
+    });
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Matrix44<T> >
+QuatArray_toMatrix44(const FixedArray<IMATH_NAMESPACE::Quat<T> > &q)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = q.len();
+    FixedArray<IMATH_NAMESPACE::Matrix44<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    dispatchRows (len, 20, [&] (size_t i)
+    {
+        result[i] = q[i].toMatrix44();
+    });
+    return result;
+}
+
 template <class T>
 struct QuatArray_ExtractTask : public Task
 {
@@ -1030,10 +1097,179 @@ QuatArray_extract(FixedArray<IMATH_NAMESPACE::Quat<T> > &q,
                   const FixedArray<Matrix44<double> >   &m)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     const size_t len = q.match_dimension(m);
 
     QuatArray_ExtractTask<T> task (m, q);
-    dispatchTask (task, len);
+    dispatchTask (task, len, 40);
+}
+
+//
+// Keyframe resampling.  The key times are copied, so that the segment
+// containing each sample time can be found by binary search.  Samples
+// before the first key or after the last take the value of that key,
+// and samples at the time of a key take its value exactly.
+//
+
+template <class T>
+class KeyTimes
+{
+  public:
+
+    KeyTimes (const FixedArray<T> &keyTimes, size_t numKeys)
+    {
+        if (size_t(keyTimes.len()) != numKeys)
+            throw std::invalid_argument ("Key times and keys have different lengths");
+        if (numKeys == 0)
+            throw std::invalid_argument ("No keys to resample");
+
+        _times.resize (numKeys);
+        for (size_t i = 0; i < numKeys; ++i)
+        {
+            _times[i] = keyTimes[i];
+            if (i > 0 && !(_times[i] >= _times[i-1]))
+                throw std::invalid_argument ("Key times must be in increasing order");
+        }
+    }
+
+    // Sets i and j to the keys before and after time s, and t to the
+    // position of s between them, in [0,1).
+    void find (T s, size_t &i, size_t &j, T &t) const
+    {
+        if (!(s > _times.front()))
+        {
+            i = j = 0;
+            t = 0;
+        }
+        else if (s >= _times.back())
+        {
+            i = j = _times.size() - 1;
+            t = 0;
+        }
+        else
+        {
+            j = std::upper_bound (_times.begin(), _times.end(), s) - _times.begin();
+            i = j - 1;
+            t = (s - _times[i]) / (_times[j] - _times[i]);
+        }
+    }
+
+  private:
+
+    std::vector<T> _times;
+};
+
+template <class T>
+static std::vector<T>
+copyKeys (const FixedArray<T> &keys)
+{
+    std::vector<T> result (keys.len());
+    for (size_t i = 0; i < result.size(); ++i)
+        result[i] = keys[i];
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Quat<T> >
+QuatArray_resampleKeys (const FixedArray<T>                         &keyTimes,
+                        const FixedArray<IMATH_NAMESPACE::Quat<T> > &keys,
+                        const FixedArray<T>                         &sampleTimes,
+                        const std::string                           &method)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+
+    bool spline = method == "spline";
+    if (!spline && method != "slerp")
+        throw std::invalid_argument ("Quat resampling method must be 'slerp' or 'spline'");
+
+    KeyTimes<T> times (keyTimes, keys.len());
+    std::vector<IMATH_NAMESPACE::Quat<T> > q = copyKeys (keys);
+    size_t n = q.size();
+
+    //
+    // The spline between keys i and i+1 is the squad() of the keys and
+    // their intermediate quaternions, as computed by spline(), with the
+    // first and last keys repeated at the ends.
+    //
+
+    std::vector<IMATH_NAMESPACE::Quat<T> > a;
+    if (spline)
+    {
+        a.resize (n);
+        dispatchRows (n, 150, [&] (size_t k)
+        {
+            a[k] = IMATH_NAMESPACE::intermediate (q[k > 0 ? k - 1 : 0], q[k], q[k + 1 < n ? k + 1 : n - 1]);
+        });
+    }
+
+    size_t len = sampleTimes.len();
+    FixedArray<IMATH_NAMESPACE::Quat<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    dispatchRows (len, spline ? 200 : 80, [&] (size_t s)
+    {
+        size_t i, j;
+        T t;
+        times.find (sampleTimes[s], i, j, t);
+
+        if (t == 0)
+            result[s] = q[i];
+        else if (spline)
+            result[s] = IMATH_NAMESPACE::squad (q[i], a[i], a[j], q[j], t);
+        else
+            result[s] = IMATH_NAMESPACE::slerpShortestArc (q[i], q[j], t);
+    });
+
+    return result;
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Vec3<T> >
+V3Array_resampleKeys (const FixedArray<T>                         &keyTimes,
+                      const FixedArray<IMATH_NAMESPACE::Vec3<T> > &keys,
+                      const FixedArray<T>                         &sampleTimes,
+                      const std::string                           &method)
+{
+    MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
+
+    bool spline = method == "spline";
+    if (!spline && method != "linear")
+        throw std::invalid_argument ("Vector resampling method must be 'linear' or 'spline'");
+
+    KeyTimes<T> times (keyTimes, keys.len());
+    std::vector<IMATH_NAMESPACE::Vec3<T> > p = copyKeys (keys);
+    size_t n = p.size();
+
+    size_t len = sampleTimes.len();
+    FixedArray<IMATH_NAMESPACE::Vec3<T> > result (Py_ssize_t(len), UNINITIALIZED);
+
+    dispatchRows (len, spline ? 40 : 20, [&] (size_t s)
+    {
+        size_t i, j;
+        T t;
+        times.find (sampleTimes[s], i, j, t);
+
+        if (t == 0)
+            result[s] = p[i];
+        else if (spline)
+        {
+            // A uniform Catmull-Rom spline, with the end keys repeated
+            const IMATH_NAMESPACE::Vec3<T> &p0 = p[i > 0 ? i - 1 : 0];
+            const IMATH_NAMESPACE::Vec3<T> &p1 = p[i];
+            const IMATH_NAMESPACE::Vec3<T> &p2 = p[j];
+            const IMATH_NAMESPACE::Vec3<T> &p3 = p[j + 1 < n ? j + 1 : n - 1];
+
+            result[s] = T (0.5) * ((T (2) * p1) +
+                                   (p2 - p0) * t +
+                                   (T (2) * p0 - T (5) * p1 + T (4) * p2 - p3) * (t * t) +
+                                   (T (3) * (p1 - p2) + p3 - p0) * (t * t * t));
+        }
+        else
+            result[s] = IMATH_NAMESPACE::lerp (p[i], p[j], t);
+    });
+
+    return result;
 }
 
 template <class T>
@@ -1082,6 +1318,14 @@ register_QuatArray()
         .def("__rmul__", &QuatArray_rmulVec3<T>)
         .def("__rmul__", &QuatArray_rmulVec3Array<T>)
         .def("__init__", make_constructor(QuatArray_quatConstructor1<T>))
+        .def("__init__", make_constructor(QuatArray_matrixConstructor<T, IMATH_NAMESPACE::Matrix33<T> >),
+             "QuatArray(M33Array) -- return the rotations of the matrices as quaternions")
+        .def("__init__", make_constructor(QuatArray_matrixConstructor<T, IMATH_NAMESPACE::Matrix44<T> >),
+             "QuatArray(M44Array) -- return the rotations of the matrices as quaternions")
+        .def("toMatrix33", &QuatArray_toMatrix33<T>,
+             "q.toMatrix33() -- return the rotation matrices of the quaternions")
+        .def("toMatrix44", &QuatArray_toMatrix44<T>,
+             "q.toMatrix44() -- return the rotation matrices of the quaternions")
         ;
 
     generate_member_bindings<op_quatDot<QuatT>, true_>
@@ -1116,6 +1360,23 @@ register_QuatArray()
          "Return the element-by-element shortest arc spherical linear interpolation between self and B.",
          args("qB", "t"));
 
+    def("resampleKeys", &QuatArray_resampleKeys<T>,
+        "resampleKeys(keyTimes, keys, sampleTimes, method='spline') -- return "
+        "the rotations at sampleTimes of the animation channel with the given "
+        "increasing key times and QuatArray of keys, interpolated with spline() "
+        "(squad through the intermediate quaternions) or, for method 'slerp', "
+        "with slerpShortestArc().  Samples outside the keys take the value of the "
+        "first or last key.  The keys around each sample are found by binary "
+        "search, and the samples are computed in parallel.",
+        (args("keyTimes"), args("keys"), args("sampleTimes"), arg("method")="spline"));
+
+    def("resampleKeys", &V3Array_resampleKeys<T>,
+        "resampleKeys(keyTimes, keys, sampleTimes, method='linear') -- return "
+        "the values at sampleTimes of the animation channel with the given "
+        "increasing key times and V3Array of keys, interpolated linearly or, "
+        "for method 'spline', with a Catmull-Rom spline.",
+        (args("keyTimes"), args("keys"), args("sampleTimes"), arg("method")="linear"));
+
     add_comparison_functions(quatArray_class);
     decoratecopy(quatArray_class);
 
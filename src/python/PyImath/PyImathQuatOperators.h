@@ -9,6 +9,7 @@
 #define _PyImathQuatOperators_h_
 
 #include <ImathQuat.h>
+#include "PyImathTask.h"
 
 namespace PyImath {
 
@@ -19,19 +20,22 @@ struct op_quatDot {
 };
 
 template <class T>
-struct op_quatNormalize {
+struct op_quatNormalize : public op_with_cost {
+    static const size_t cost = 8;
     static inline void apply (T &self)
     { self.normalize(); }
 };
 
 template <class T>
-struct op_quatNormalized {
+struct op_quatNormalized : public op_with_cost {
+    static const size_t cost = 8;
     static inline T apply (const T &self)
     { return self.normalized(); }
 };
 
 template <class T>
-struct op_quatSlerp {
+struct op_quatSlerp : public op_with_cost {
+    static const size_t cost = 50;
     static inline T apply (const T &self, const T &qB, const typename T::BaseType t)
         { return IMATH_NAMESPACE::slerpShortestArc (self, qB, t); }
 };
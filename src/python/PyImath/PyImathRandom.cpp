@@ -15,6 +15,7 @@
 #include "PyImathFixedArray.h"
 #include "PyImathRandom.h"
 #include "PyImathDecorators.h"
+#include "PyImathTask.h"
 
 namespace PyImath{
 using namespace boost::python;
@@ -76,8 +77,8 @@ static IMATH_NAMESPACE::Vec2<T> nextSolidSphere(Rand &rand, const IMATH_NAMESPAC
     return IMATH_NAMESPACE::solidSphereRand<IMATH_NAMESPACE::Vec2<T>,Rand>(rand);
 }
 
-template <class Rand>
-static Rand *Rand_constructor1(unsigned long int seed)
+template <class Rand, class Seed = unsigned long int>
+static Rand *Rand_constructor1(Seed seed)
 {
     return new Rand(seed);
 }
@@ -115,6 +116,75 @@ solidSphereRand(Rand &rand, int num)
     return retval;
 }
 
+//
+// Arrays of values from a Rand64, filled in parallel.  Element i is made
+// from the generator's position counter()+i alone, either as the value
+// at that position or from the stream with that index, and the generator
+// then skips num values.  The arrays are therefore the same for any
+// number of threads.
+//
+
+template <class T, class Draw>
+static FixedArray<T>
+Rand64_array(IMATH_NAMESPACE::Rand64 &rand, int num, size_t cost, const Draw &draw)
+{
+    MATH_EXC_ON;
+    FixedArray<T> retval(num);
+    {
+        PY_IMATH_LEAVE_PYTHON;
+        const IMATH_NAMESPACE::Rand64 start(rand);
+        dispatchRows(num, cost, [&](size_t i) {
+            retval[i] = draw(start, start.counter() + i);
+        });
+    }
+    rand.skip(num);
+    return retval;
+}
+
+static FixedArray<double>
+Rand64_nextfArray2(IMATH_NAMESPACE::Rand64 &rand, int num, double rangeMin, double rangeMax)
+{
+    return Rand64_array<double>(rand, num, 2, [&](IMATH_NAMESPACE::Rand64 r, uint64_t i) {
+        r.setCounter(i);
+        return r.nextf(rangeMin, rangeMax);
+    });
+}
+
+static FixedArray<double>
+Rand64_nextfArray(IMATH_NAMESPACE::Rand64 &rand, int num)
+{
+    return Rand64_nextfArray2(rand, num, 0, 1);
+}
+
+static FixedArray<float>
+Rand64_gaussArray(IMATH_NAMESPACE::Rand64 &rand, int num)
+{
+    return Rand64_array<float>(rand, num, 50, [](const IMATH_NAMESPACE::Rand64 &r, uint64_t i) {
+        IMATH_NAMESPACE::Rand64 s = r.stream(i);
+        return IMATH_NAMESPACE::gaussRand(s);
+    });
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Vec3<T> >
+Rand64_solidSphereArray(IMATH_NAMESPACE::Rand64 &rand, int num)
+{
+    return Rand64_array<IMATH_NAMESPACE::Vec3<T> >(rand, num, 20, [](const IMATH_NAMESPACE::Rand64 &r, uint64_t i) {
+        IMATH_NAMESPACE::Rand64 s = r.stream(i);
+        return IMATH_NAMESPACE::solidSphereRand<IMATH_NAMESPACE::Vec3<T> >(s);
+    });
+}
+
+template <class T>
+static FixedArray<IMATH_NAMESPACE::Vec3<T> >
+Rand64_hollowSphereArray(IMATH_NAMESPACE::Rand64 &rand, int num)
+{
+    return Rand64_array<IMATH_NAMESPACE::Vec3<T> >(rand, num, 30, [](const IMATH_NAMESPACE::Rand64 &r, uint64_t i) {
+        IMATH_NAMESPACE::Rand64 s = r.stream(i);
+        return IMATH_NAMESPACE::hollowSphereRand<IMATH_NAMESPACE::Vec3<T> >(s);
+    });
+}
+
 PYIMATH_EXPORT
 class_<IMATH_NAMESPACE::Rand32>
 register_Rand32()
@@ -306,6 +376,149 @@ register_Rand48()
     return rand48_class;
 }
 
+PYIMATH_EXPORT
+class_<IMATH_NAMESPACE::Rand64>
+register_Rand64()
+{
+    double (IMATH_NAMESPACE::Rand64::*nextf1)(void) = &IMATH_NAMESPACE::Rand64::nextf;
+    
+    IMATH_NAMESPACE::Vec3<float> (*nextGaussSphere1)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<float> &v) = &nextGaussSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec3<double> (*nextGaussSphere2)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<double> &v) = &nextGaussSphere<double,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<float> (*nextGaussSphere3)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<float> &v) = &nextGaussSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<double> (*nextGaussSphere4)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<double> &v) = &nextGaussSphere<double,IMATH_NAMESPACE::Rand64>;
+    
+    IMATH_NAMESPACE::Vec3<float> (*nextHollowSphere1)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<float> &v) = &nextHollowSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec3<double> (*nextHollowSphere2)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<double> &v) = &nextHollowSphere<double,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<float> (*nextHollowSphere3)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<float> &v) = &nextHollowSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<double> (*nextHollowSphere4)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<double> &v) = &nextHollowSphere<double,IMATH_NAMESPACE::Rand64>;
+
+    IMATH_NAMESPACE::Vec3<float> (*nextSolidSphere1)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<float> &v) = &nextSolidSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec3<double> (*nextSolidSphere2)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec3<double> &v) = &nextSolidSphere<double,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<float> (*nextSolidSphere3)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<float> &v) = &nextSolidSphere<float,IMATH_NAMESPACE::Rand64>;
+    IMATH_NAMESPACE::Vec2<double> (*nextSolidSphere4)(IMATH_NAMESPACE::Rand64 &, const IMATH_NAMESPACE::Vec2<double> &v) = &nextSolidSphere<double,IMATH_NAMESPACE::Rand64>;
+   
+    class_< IMATH_NAMESPACE::Rand64 > rand64_class("Rand64");
+    rand64_class
+        .def(init<>("default construction"))
+        .def("__init__", make_constructor(Rand_constructor1<IMATH_NAMESPACE::Rand64,uint64_t>))
+        .def("__init__", make_constructor(Rand_constructor2<IMATH_NAMESPACE::Rand64>))
+        .def("init", &IMATH_NAMESPACE::Rand64::init,
+             "r.init(i) -- initialize with integer "
+			 "seed i")
+             
+        .def("nexti", &IMATH_NAMESPACE::Rand64::nexti,
+        	 "r.nexti() -- return the next integer "
+			 "value in the uniformly-distributed "
+			 "sequence")
+             
+        .def("nextf", nextf1,
+        	 "r.nextf() -- return the next double "
+			 "value in the uniformly-distributed "
+			 "sequence\n"
+             
+        	 "r.nextf(double,double) -- return the next double "
+			 "value in the uniformly-distributed "
+			 "sequence")             
+        .def("nextf", &nextf2 <IMATH_NAMESPACE::Rand64, double>)
+             
+        .def("nextb", &IMATH_NAMESPACE::Rand64::nextb,
+	 	     "r.nextb() -- return the next boolean "
+			 "value in the uniformly-distributed "
+			 "sequence")
+ 
+        .def("nextGauss", &nextGauss<IMATH_NAMESPACE::Rand64>,
+        	 "r.nextGauss() -- returns the next "
+			 "floating-point value in the normally "
+			 "(Gaussian) distributed sequence")
+             
+        .def("nextGaussSphere", nextGaussSphere1, 
+	 		 "r.nextGaussSphere(v) -- returns the next "
+			 "point whose distance from the origin "
+			 "has a normal (Gaussian) distribution with "
+			 "mean 0 and variance 1.  The vector "
+			 "argument, v, specifies the dimension "
+			 "and number type.")             
+        .def("nextGaussSphere", nextGaussSphere2)             
+        .def("nextGaussSphere", nextGaussSphere3)             
+        .def("nextGaussSphere", nextGaussSphere4)
+        
+        .def("nextHollowSphere", nextHollowSphere1,
+        	 "r.nextHollowSphere(v) -- return the next "
+	 		 "point uniformly distributed on the surface "
+	 		 "of a sphere of radius 1 centered at the "
+	 		 "origin.  The vector argument, v, specifies "
+			 "the dimension and number type.")             
+        .def("nextHollowSphere", nextHollowSphere2)             
+        .def("nextHollowSphere", nextHollowSphere3)             
+        .def("nextHollowSphere", nextHollowSphere4)
+
+        .def("nextSolidSphere", nextSolidSphere1,
+        	 "r.nextSolidSphere(v) -- return the next "
+			 "point uniformly distributed in a sphere "
+			 "of radius 1 centered at the origin.  The "
+			 "vector argument, v, specifies the "
+			 "dimension and number type.")             
+        .def("nextSolidSphere", nextSolidSphere2)             
+        .def("nextSolidSphere", nextSolidSphere3)             
+        .def("nextSolidSphere", nextSolidSphere4) 
+
+        .def("skip", &IMATH_NAMESPACE::Rand64::skip,
+             "r.skip(n) -- skip the next n values "
+             "of the sequence")
+        .def("counter", &IMATH_NAMESPACE::Rand64::counter,
+             "r.counter() -- return the position in the "
+             "sequence, the number of values generated or "
+             "skipped since initialization")
+        .def("setCounter", &IMATH_NAMESPACE::Rand64::setCounter,
+             "r.setCounter(i) -- move to position i "
+             "in the sequence")
+        .def("valueAt", &IMATH_NAMESPACE::Rand64::valueAt,
+             "r.valueAt(i) -- return the integer value at "
+             "position i in the sequence, without moving to it")
+        .def("stream", &IMATH_NAMESPACE::Rand64::stream,
+             "r.stream(i) -- return a new generator for the "
+             "independent stream with index i")
+
+        .def("nextfArray", &Rand64_nextfArray,
+             "r.nextfArray(n) -- return a DoubleArray of the "
+             "next n values in the uniformly-distributed "
+             "sequence, the same as n calls to r.nextf()\n"
+
+             "r.nextfArray(n,double,double) -- return a "
+             "DoubleArray of the next n values in the "
+             "uniformly-distributed sequence, in the given range")
+        .def("nextfArray", &Rand64_nextfArray2)
+        .def("gaussArray", &Rand64_gaussArray,
+             "r.gaussArray(n) -- return a FloatArray of n "
+             "normally (Gaussian) distributed values, generated "
+             "in parallel.  The values are the same for any "
+             "number of threads.")
+        .def("solidSphereArray", &Rand64_solidSphereArray<float>,
+             "r.solidSphereArray(n) -- return a V3fArray of n "
+             "points uniformly distributed in a sphere of radius "
+             "1 centered at the origin, generated in parallel.  "
+             "The points are the same for any number of threads.")
+        .def("hollowSphereArray", &Rand64_hollowSphereArray<float>,
+             "r.hollowSphereArray(n) -- return a V3fArray of n "
+             "points uniformly distributed on the surface of a "
+             "sphere of radius 1 centered at the origin, generated "
+             "in parallel.  The points are the same for any number "
+             "of threads.")
+        ;
+
+    def("hollowSphereRand",&Rand64_hollowSphereArray<float>,"hollowSphereRand(randObj,num) return XYZ vectors uniformly "
+        "distributed across the surface of a sphere generated in parallel from the given Rand64 object",
+        args("randObj","num"));
+        
+    def("solidSphereRand",&Rand64_solidSphereArray<float>,"solidSphereRand(randObj,num) return XYZ vectors uniformly "
+        "distributed through the volume of a sphere generated in parallel from the given Rand64 object",
+        args("randObj","num"));
+
+    decoratecopy(rand64_class);
+
+    return rand64_class;
+}
+
 //
 
 PyObject *
@@ -324,4 +537,12 @@ Rand48::wrap (const IMATH_NAMESPACE::Rand48 &r)
     return p;
 }
 
+PyObject *
+Rand64::wrap (const IMATH_NAMESPACE::Rand64 &r)
+{
+    boost::python::return_by_value::apply <IMATH_NAMESPACE::Rand64>::type converter;
+    PyObject *p = converter (r);
+    return p;
+}
+
 } //namespace PyIMath
@@ -18,6 +18,7 @@ namespace PyImath {
 
 PYIMATH_EXPORT boost::python::class_<IMATH_NAMESPACE::Rand32> register_Rand32();
 PYIMATH_EXPORT boost::python::class_<IMATH_NAMESPACE::Rand48> register_Rand48();
+PYIMATH_EXPORT boost::python::class_<IMATH_NAMESPACE::Rand64> register_Rand64();
 
 class PYIMATH_EXPORT Rand32
 {
@@ -31,6 +32,12 @@ class PYIMATH_EXPORT Rand48
     static PyObject *	wrap (const IMATH_NAMESPACE::Rand48 &r);
 };
 
+class PYIMATH_EXPORT Rand64
+{
+  public:
+    static PyObject *	wrap (const IMATH_NAMESPACE::Rand64 &r);
+};
+
 }
 
 #endif
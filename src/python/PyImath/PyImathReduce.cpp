@@ -0,0 +1,46 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <atomic>
+#include "PyImathReduce.h"
+
+namespace PyImath {
+
+using namespace boost::python;
+
+static std::atomic<bool> _deterministicReductions (false);
+
+bool
+deterministicReductions()
+{
+    return _deterministicReductions;
+}
+
+void
+setDeterministicReductions(bool deterministic)
+{
+    _deterministicReductions = deterministic;
+}
+
+void
+register_Reduce()
+{
+    def("setDeterministicReductions", &setDeterministicReductions, args("deterministic"),
+        "setDeterministicReductions(b) -- when b is true, reductions of arrays "
+        "such as sum() and mean() combine their partial results in a fixed "
+        "order, so that floating point results don't depend on the number of "
+        "threads or on timing.  Off by default");
+
+    def("deterministicReductions", &deterministicReductions,
+        "deterministicReductions() -- return whether reductions of arrays "
+        "combine their partial results in a fixed order");
+}
+
+} // namespace PyImath
@@ -0,0 +1,143 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathReduce_h_
+#define _PyImathReduce_h_
+
+#include <algorithm>
+#include <cstddef>
+#include <mutex>
+#include <vector>
+#include "PyImathExport.h"
+#include "PyImathFixedArray.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+//
+// Reductions of arrays, e.g. sums and means, normally combine the
+// partial results of the threads in whatever order the threads finish,
+// so floating point results can differ in the last bits from one run
+// to the next.  In deterministic mode the partial results are computed
+// over fixed blocks of the array and combined in order, so the results
+// depend only on the data, not on the number of threads or on timing.
+//
+PYIMATH_EXPORT bool deterministicReductions();
+PYIMATH_EXPORT void setDeterministicReductions(bool deterministic);
+
+PYIMATH_EXPORT void register_Reduce();
+
+namespace detail {
+
+// The number of elements in each block of a deterministic reduction
+static const size_t reduce_block_size = 4096;
+
+template <class Value>
+struct ReduceSlot
+{
+    Value value;
+    char  pad[64];  // keeps the slots of different blocks on different cache lines
+};
+
+// Combines the partial results of the ranges as they finish.  The
+// result is merged under a lock rather than kept per thread, because
+// the number of workers may change while the GIL is released.
+template <class Value, class Partial, class Combine>
+struct ReduceTask : public Task
+{
+    const Partial &partial;
+    const Combine &combine;
+    std::mutex mutex;
+    Value value = Value();
+    bool used = false;
+
+    ReduceTask(const Partial &p, const Combine &c) : partial(p), combine(c) {}
+
+    void execute(size_t start, size_t end) override
+    {
+        Value local = partial(start, end);
+        std::lock_guard<std::mutex> lock(mutex);
+        if (used)
+            combine(value, local);
+        else
+        {
+            value = local;
+            used = true;
+        }
+    }
+};
+
+// Evaluates the partial results of a range of blocks
+template <class Value, class Partial>
+struct BlockReduceTask : public Task
+{
+    const Partial &partial;
+    size_t length;
+    std::vector<ReduceSlot<Value> > blocks;
+
+    BlockReduceTask(const Partial &p, size_t len)
+        : partial(p), length(len),
+          blocks((len + reduce_block_size - 1) / reduce_block_size) {}
+
+    void execute(size_t start, size_t end) override
+    {
+        for (size_t b = start; b < end; ++b)
+            blocks[b].value = partial(b * reduce_block_size,
+                                      std::min(length, (b + 1) * reduce_block_size));
+    }
+};
+
+} // namespace detail
+
+//
+// parallelReduce reduces the elements [0,length) to a single value.
+// partial(start,end) returns the value of a non-empty range of elements,
+// and combine(value,other) updates value to include other.  The ranges
+// are evaluated on the current worker pool and their values combined
+// as they finish, so combine must give the same result, up to
+// rounding, whichever order it sees the ranges in.  In deterministic mode the
+// ranges are fixed blocks, combined in increasing order.
+//
+// 'cost' is the cost of one element, as for dispatchTask.  length must
+// be greater than zero.
+//
+template <class Value, class Partial, class Combine>
+Value
+parallelReduce(size_t length, size_t cost, const Partial &partial, const Combine &combine)
+{
+    if (deterministicReductions())
+    {
+        detail::BlockReduceTask<Value,Partial> task(partial, length);
+        dispatchTask(task, task.blocks.size(), cost * detail::reduce_block_size);
+        Value value = task.blocks[0].value;
+        for (size_t b = 1; b < task.blocks.size(); ++b)
+            combine(value, task.blocks[b].value);
+        return value;
+    }
+
+    detail::ReduceTask<Value,Partial,Combine> task(partial, combine);
+    dispatchTask(task, length, cost);
+    return task.value;
+}
+
+//
+// Calls f with a read only accessor for the elements of a, the direct
+// accessor if the array has direct access and the masked accessor
+// otherwise, and returns its result.
+//
+template <class T, class F>
+inline auto
+withReadAccess(const FixedArray<T> &a, const F &f)
+{
+    if (a.hasDirectAccess())
+        return f(typename FixedArray<T>::ReadOnlyDirectAccess(a));
+    return f(typename FixedArray<T>::ReadOnlyMaskedAccess(a));
+}
+
+} // namespace PyImath
+
+#endif
@@ -0,0 +1,451 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <atomic>
+#include <cmath>
+#include <cstddef>
+#include <limits>
+#include "PyImathSimd.h"
+#include "PyImathMatrix.h"
+
+#if defined(__x86_64__) || defined(_M_X64) || defined(__SSE2__)
+#  define PYIMATH_SIMD_SSE2 1
+#  include <emmintrin.h>
+#  if defined(__GNUC__) || defined(__clang__)
+#    define PYIMATH_SIMD_AVX 1
+#    include <immintrin.h>
+#  endif
+#elif defined(__aarch64__)
+#  define PYIMATH_SIMD_NEON 1
+#  include <arm_neon.h>
+#endif
+
+//
+// The kernels are compiled for the baseline instruction set of each
+// architecture, plus AVX on x86 with compilers that allow it to be
+// enabled for individual functions.  Fused multiply-add is deliberately
+// not used, so that the results are identical to the scalar code.
+//
+
+namespace PyImath {
+
+namespace simd {
+
+#if PYIMATH_SIMD_SSE2
+
+namespace sse2 {
+
+//
+// Transposes between 4 consecutive Vec3f, or 2 consecutive Vec3d, and
+// one register per component.
+//
+
+inline void
+load3 (const float *p, __m128 &x, __m128 &y, __m128 &z)
+{
+    __m128 m0 = _mm_loadu_ps (p);      // x0 y0 z0 x1
+    __m128 m1 = _mm_loadu_ps (p + 4);  // y1 z1 x2 y2
+    __m128 m2 = _mm_loadu_ps (p + 8);  // z2 x3 y3 z3
+
+    x = _mm_shuffle_ps (m0, _mm_shuffle_ps (m1, m2, _MM_SHUFFLE (1,1,2,2)), _MM_SHUFFLE (2,0,3,0));
+    y = _mm_shuffle_ps (_mm_shuffle_ps (m0, m1, _MM_SHUFFLE (0,0,1,1)),
+                        _mm_shuffle_ps (m1, m2, _MM_SHUFFLE (2,2,3,3)), _MM_SHUFFLE (2,0,2,0));
+    z = _mm_shuffle_ps (_mm_shuffle_ps (m0, m1, _MM_SHUFFLE (1,1,2,2)), m2, _MM_SHUFFLE (3,0,2,0));
+}
+
+inline void
+store3 (float *p, __m128 x, __m128 y, __m128 z)
+{
+    _mm_storeu_ps (p,     _mm_shuffle_ps (_mm_shuffle_ps (x, y, _MM_SHUFFLE (0,0,0,0)),
+                                          _mm_shuffle_ps (z, x, _MM_SHUFFLE (1,1,0,0)), _MM_SHUFFLE (2,0,2,0)));
+    _mm_storeu_ps (p + 4, _mm_shuffle_ps (_mm_shuffle_ps (y, z, _MM_SHUFFLE (1,1,1,1)),
+                                          _mm_shuffle_ps (x, y, _MM_SHUFFLE (2,2,2,2)), _MM_SHUFFLE (2,0,2,0)));
+    _mm_storeu_ps (p + 8, _mm_shuffle_ps (_mm_shuffle_ps (z, x, _MM_SHUFFLE (3,3,2,2)),
+                                          _mm_shuffle_ps (y, z, _MM_SHUFFLE (3,3,3,3)), _MM_SHUFFLE (2,0,2,0)));
+}
+
+inline void
+load3 (const double *p, __m128d &x, __m128d &y, __m128d &z)
+{
+    __m128d m0 = _mm_loadu_pd (p);      // x0 y0
+    __m128d m1 = _mm_loadu_pd (p + 2);  // z0 x1
+    __m128d m2 = _mm_loadu_pd (p + 4);  // y1 z1
+
+    x = _mm_shuffle_pd (m0, m1, 2);
+    y = _mm_shuffle_pd (m0, m2, 1);
+    z = _mm_shuffle_pd (m1, m2, 2);
+}
+
+inline void
+store3 (double *p, __m128d x, __m128d y, __m128d z)
+{
+    _mm_storeu_pd (p,     _mm_shuffle_pd (x, y, 0));
+    _mm_storeu_pd (p + 2, _mm_shuffle_pd (z, x, 2));
+    _mm_storeu_pd (p + 4, _mm_shuffle_pd (y, z, 3));
+}
+
+template <class T> struct Pack;
+
+template <>
+struct Pack<float>
+{
+    static const size_t size = 4;
+    __m128 v;
+
+    Pack() {}
+    Pack (__m128 x) : v (x) {}
+
+    static Pack load (const float *p)   { return _mm_loadu_ps (p); }
+    static Pack broadcast (float x)     { return _mm_set1_ps (x); }
+    void store (float *p) const         { _mm_storeu_ps (p, v); }
+};
+
+template <>
+struct Pack<double>
+{
+    static const size_t size = 2;
+    __m128d v;
+
+    Pack() {}
+    Pack (__m128d x) : v (x) {}
+
+    static Pack load (const double *p)  { return _mm_loadu_pd (p); }
+    static Pack broadcast (double x)    { return _mm_set1_pd (x); }
+    void store (double *p) const        { _mm_storeu_pd (p, v); }
+};
+
+inline Pack<float> operator + (Pack<float> a, Pack<float> b) { return _mm_add_ps (a.v, b.v); }
+inline Pack<float> operator - (Pack<float> a, Pack<float> b) { return _mm_sub_ps (a.v, b.v); }
+inline Pack<float> operator * (Pack<float> a, Pack<float> b) { return _mm_mul_ps (a.v, b.v); }
+inline Pack<float> operator / (Pack<float> a, Pack<float> b) { return _mm_div_ps (a.v, b.v); }
+inline Pack<float> sqrt (Pack<float> a)                      { return _mm_sqrt_ps (a.v); }
+inline bool anyLess (Pack<float> a, Pack<float> b)           { return _mm_movemask_ps (_mm_cmplt_ps (a.v, b.v)) != 0; }
+
+inline Pack<double> operator + (Pack<double> a, Pack<double> b) { return _mm_add_pd (a.v, b.v); }
+inline Pack<double> operator - (Pack<double> a, Pack<double> b) { return _mm_sub_pd (a.v, b.v); }
+inline Pack<double> operator * (Pack<double> a, Pack<double> b) { return _mm_mul_pd (a.v, b.v); }
+inline Pack<double> operator / (Pack<double> a, Pack<double> b) { return _mm_div_pd (a.v, b.v); }
+inline Pack<double> sqrt (Pack<double> a)                       { return _mm_sqrt_pd (a.v); }
+inline bool anyLess (Pack<double> a, Pack<double> b)            { return _mm_movemask_pd (_mm_cmplt_pd (a.v, b.v)) != 0; }
+
+inline void load3 (const float *p, Pack<float> &x, Pack<float> &y, Pack<float> &z)   { load3 (p, x.v, y.v, z.v); }
+inline void store3 (float *p, Pack<float> x, Pack<float> y, Pack<float> z)           { store3 (p, x.v, y.v, z.v); }
+inline void load3 (const double *p, Pack<double> &x, Pack<double> &y, Pack<double> &z) { load3 (p, x.v, y.v, z.v); }
+inline void store3 (double *p, Pack<double> x, Pack<double> y, Pack<double> z)        { store3 (p, x.v, y.v, z.v); }
+
+#include "PyImathSimdKernels.h"
+
+} // namespace sse2
+
+#endif
+
+#if PYIMATH_SIMD_AVX
+
+#if defined(__clang__)
+#  pragma clang attribute push (__attribute__((target("avx"))), apply_to = function)
+#else
+#  pragma GCC push_options
+#  pragma GCC target ("avx")
+#endif
+
+namespace avx {
+
+template <class T> struct Pack;
+
+template <>
+struct Pack<float>
+{
+    static const size_t size = 8;
+    __m256 v;
+
+    Pack() {}
+    Pack (__m256 x) : v (x) {}
+
+    static Pack load (const float *p)   { return _mm256_loadu_ps (p); }
+    static Pack broadcast (float x)     { return _mm256_set1_ps (x); }
+    void store (float *p) const         { _mm256_storeu_ps (p, v); }
+};
+
+template <>
+struct Pack<double>
+{
+    static const size_t size = 4;
+    __m256d v;
+
+    Pack() {}
+    Pack (__m256d x) : v (x) {}
+
+    static Pack load (const double *p)  { return _mm256_loadu_pd (p); }
+    static Pack broadcast (double x)    { return _mm256_set1_pd (x); }
+    void store (double *p) const        { _mm256_storeu_pd (p, v); }
+};
+
+inline Pack<float> operator + (Pack<float> a, Pack<float> b) { return _mm256_add_ps (a.v, b.v); }
+inline Pack<float> operator - (Pack<float> a, Pack<float> b) { return _mm256_sub_ps (a.v, b.v); }
+inline Pack<float> operator * (Pack<float> a, Pack<float> b) { return _mm256_mul_ps (a.v, b.v); }
+inline Pack<float> operator / (Pack<float> a, Pack<float> b) { return _mm256_div_ps (a.v, b.v); }
+inline Pack<float> sqrt (Pack<float> a)                      { return _mm256_sqrt_ps (a.v); }
+inline bool anyLess (Pack<float> a, Pack<float> b)           { return _mm256_movemask_ps (_mm256_cmp_ps (a.v, b.v, _CMP_LT_OQ)) != 0; }
+
+inline Pack<double> operator + (Pack<double> a, Pack<double> b) { return _mm256_add_pd (a.v, b.v); }
+inline Pack<double> operator - (Pack<double> a, Pack<double> b) { return _mm256_sub_pd (a.v, b.v); }
+inline Pack<double> operator * (Pack<double> a, Pack<double> b) { return _mm256_mul_pd (a.v, b.v); }
+inline Pack<double> operator / (Pack<double> a, Pack<double> b) { return _mm256_div_pd (a.v, b.v); }
+inline Pack<double> sqrt (Pack<double> a)                       { return _mm256_sqrt_pd (a.v); }
+inline bool anyLess (Pack<double> a, Pack<double> b)            { return _mm256_movemask_pd (_mm256_cmp_pd (a.v, b.v, _CMP_LT_OQ)) != 0; }
+
+// The AVX registers are transposed as two halves
+inline void
+load3 (const float *p, Pack<float> &x, Pack<float> &y, Pack<float> &z)
+{
+    __m128 x0, y0, z0, x1, y1, z1;
+    sse2::load3 (p, x0, y0, z0);
+    sse2::load3 (p + 12, x1, y1, z1);
+    x.v = _mm256_insertf128_ps (_mm256_castps128_ps256 (x0), x1, 1);
+    y.v = _mm256_insertf128_ps (_mm256_castps128_ps256 (y0), y1, 1);
+    z.v = _mm256_insertf128_ps (_mm256_castps128_ps256 (z0), z1, 1);
+}
+
+inline void
+store3 (float *p, Pack<float> x, Pack<float> y, Pack<float> z)
+{
+    sse2::store3 (p, _mm256_castps256_ps128 (x.v), _mm256_castps256_ps128 (y.v), _mm256_castps256_ps128 (z.v));
+    sse2::store3 (p + 12, _mm256_extractf128_ps (x.v, 1), _mm256_extractf128_ps (y.v, 1), _mm256_extractf128_ps (z.v, 1));
+}
+
+inline void
+load3 (const double *p, Pack<double> &x, Pack<double> &y, Pack<double> &z)
+{
+    __m128d x0, y0, z0, x1, y1, z1;
+    sse2::load3 (p, x0, y0, z0);
+    sse2::load3 (p + 6, x1, y1, z1);
+    x.v = _mm256_insertf128_pd (_mm256_castpd128_pd256 (x0), x1, 1);
+    y.v = _mm256_insertf128_pd (_mm256_castpd128_pd256 (y0), y1, 1);
+    z.v = _mm256_insertf128_pd (_mm256_castpd128_pd256 (z0), z1, 1);
+}
+
+inline void
+store3 (double *p, Pack<double> x, Pack<double> y, Pack<double> z)
+{
+    sse2::store3 (p, _mm256_castpd256_pd128 (x.v), _mm256_castpd256_pd128 (y.v), _mm256_castpd256_pd128 (z.v));
+    sse2::store3 (p + 6, _mm256_extractf128_pd (x.v, 1), _mm256_extractf128_pd (y.v, 1), _mm256_extractf128_pd (z.v, 1));
+}
+
+#include "PyImathSimdKernels.h"
+
+} // namespace avx
+
+#if defined(__clang__)
+#  pragma clang attribute pop
+#else
+#  pragma GCC pop_options
+#endif
+
+#endif
+
+#if PYIMATH_SIMD_NEON
+
+namespace neon {
+
+template <class T> struct Pack;
+
+template <>
+struct Pack<float>
+{
+    static const size_t size = 4;
+    float32x4_t v;
+
+    Pack() {}
+    Pack (float32x4_t x) : v (x) {}
+
+    static Pack load (const float *p)   { return vld1q_f32 (p); }
+    static Pack broadcast (float x)     { return vdupq_n_f32 (x); }
+    void store (float *p) const         { vst1q_f32 (p, v); }
+};
+
+template <>
+struct Pack<double>
+{
+    static const size_t size = 2;
+    float64x2_t v;
+
+    Pack() {}
+    Pack (float64x2_t x) : v (x) {}
+
+    static Pack load (const double *p)  { return vld1q_f64 (p); }
+    static Pack broadcast (double x)    { return vdupq_n_f64 (x); }
+    void store (double *p) const        { vst1q_f64 (p, v); }
+};
+
+inline Pack<float> operator + (Pack<float> a, Pack<float> b) { return vaddq_f32 (a.v, b.v); }
+inline Pack<float> operator - (Pack<float> a, Pack<float> b) { return vsubq_f32 (a.v, b.v); }
+inline Pack<float> operator * (Pack<float> a, Pack<float> b) { return vmulq_f32 (a.v, b.v); }
+inline Pack<float> operator / (Pack<float> a, Pack<float> b) { return vdivq_f32 (a.v, b.v); }
+inline Pack<float> sqrt (Pack<float> a)                      { return vsqrtq_f32 (a.v); }
+inline bool anyLess (Pack<float> a, Pack<float> b)           { return vmaxvq_u32 (vcltq_f32 (a.v, b.v)) != 0; }
+
+inline Pack<double> operator + (Pack<double> a, Pack<double> b) { return vaddq_f64 (a.v, b.v); }
+inline Pack<double> operator - (Pack<double> a, Pack<double> b) { return vsubq_f64 (a.v, b.v); }
+inline Pack<double> operator * (Pack<double> a, Pack<double> b) { return vmulq_f64 (a.v, b.v); }
+inline Pack<double> operator / (Pack<double> a, Pack<double> b) { return vdivq_f64 (a.v, b.v); }
+inline Pack<double> sqrt (Pack<double> a)                       { return vsqrtq_f64 (a.v); }
+inline bool anyLess (Pack<double> a, Pack<double> b)            { return vmaxvq_u32 (vreinterpretq_u32_u64 (vcltq_f64 (a.v, b.v))) != 0; }
+
+inline void
+load3 (const float *p, Pack<float> &x, Pack<float> &y, Pack<float> &z)
+{
+    float32x4x3_t v = vld3q_f32 (p);
+    x.v = v.val[0];
+    y.v = v.val[1];
+    z.v = v.val[2];
+}
+
+inline void
+store3 (float *p, Pack<float> x, Pack<float> y, Pack<float> z)
+{
+    float32x4x3_t v;
+    v.val[0] = x.v;
+    v.val[1] = y.v;
+    v.val[2] = z.v;
+    vst3q_f32 (p, v);
+}
+
+inline void
+load3 (const double *p, Pack<double> &x, Pack<double> &y, Pack<double> &z)
+{
+    float64x2x3_t v = vld3q_f64 (p);
+    x.v = v.val[0];
+    y.v = v.val[1];
+    z.v = v.val[2];
+}
+
+inline void
+store3 (double *p, Pack<double> x, Pack<double> y, Pack<double> z)
+{
+    float64x2x3_t v;
+    v.val[0] = x.v;
+    v.val[1] = y.v;
+    v.val[2] = z.v;
+    vst3q_f64 (p, v);
+}
+
+#include "PyImathSimdKernels.h"
+
+} // namespace neon
+
+#endif
+
+namespace {
+
+struct KernelTable
+{
+    Kernels<float>  floats;
+    Kernels<double> doubles;
+    const char *    name;
+    bool            available;
+
+    KernelTable() : name ("none"), available (false) {}
+
+    void set (const char *n,
+              void (*fillFloats) (Kernels<float> &),
+              void (*fillDoubles) (Kernels<double> &))
+    {
+        fillFloats (floats);
+        fillDoubles (doubles);
+        name = n;
+        available = true;
+    }
+};
+
+const KernelTable &
+kernelTable()
+{
+    static const KernelTable table = []
+    {
+        KernelTable t;
+
+#if PYIMATH_SIMD_AVX
+        __builtin_cpu_init();
+        if (__builtin_cpu_supports ("avx"))
+        {
+            t.set ("avx", &avx::fillKernels<float>, &avx::fillKernels<double>);
+            return t;
+        }
+#endif
+#if PYIMATH_SIMD_SSE2
+        t.set ("sse2", &sse2::fillKernels<float>, &sse2::fillKernels<double>);
+#elif PYIMATH_SIMD_NEON
+        t.set ("neon", &neon::fillKernels<float>, &neon::fillKernels<double>);
+#endif
+        return t;
+    }();
+
+    return table;
+}
+
+std::atomic<bool> _enabled (true);
+
+} // namespace
+
+const Kernels<float> *
+floatKernels()
+{
+    const KernelTable &t = kernelTable();
+    return t.available && _enabled.load (std::memory_order_relaxed) ? &t.floats : nullptr;
+}
+
+const Kernels<double> *
+doubleKernels()
+{
+    const KernelTable &t = kernelTable();
+    return t.available && _enabled.load (std::memory_order_relaxed) ? &t.doubles : nullptr;
+}
+
+const char *
+instructionSet()
+{
+    return kernelTable().name;
+}
+
+bool
+enabled()
+{
+    return _enabled.load();
+}
+
+void
+setEnabled (bool enable)
+{
+    _enabled.store (enable);
+}
+
+} // namespace simd
+
+using namespace boost::python;
+
+void
+register_Simd()
+{
+    def("simdInstructionSet", &simd::instructionSet,
+        "simdInstructionSet() -- return the name of the instruction set used "
+        "by the vectorized kernels for Vec3 and M44 arrays, e.g. 'avx', 'sse2', "
+        "'neon', or 'none'");
+
+    def("simdEnabled", &simd::enabled,
+        "simdEnabled() -- return whether the vectorized kernels for Vec3 and M44 "
+        "arrays are used");
+
+    def("setSimdEnabled", &simd::setEnabled, args("enable"),
+        "setSimdEnabled(b) -- enable or disable the vectorized kernels for "
+        "Vec3 and M44 arrays.  They are enabled by default when the processor "
+        "supports them");
+}
+
+} // namespace PyImath
@@ -0,0 +1,283 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathSimd_h_
+#define _PyImathSimd_h_
+
+#include <ImathVec.h>
+#include <ImathMatrix.h>
+#include "PyImathExport.h"
+#include "PyImathFixedArray.h"
+#include "PyImathAutovectorize.h"
+#include "PyImathOperators.h"
+#include "PyImathVecOperators.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+namespace simd {
+
+//
+// Explicitly vectorized loops for the most frequently used Vec3 array
+// operations, and for the inversion of M44 arrays.  The instruction set
+// is chosen at runtime: AVX when the processor supports it, otherwise
+// SSE2 on x86, NEON on 64-bit ARM, and no kernels elsewhere, in which
+// case the generic loops are used.  The kernels compute the same
+// operations in the same order as the Imath methods they replace.
+//
+// The kernels operate on 'n' consecutive elements.  A 'b' argument with
+// a stride of 0 is a single value that is used for every element.
+//
+// The ...Planes kernels operate on vectors stored as separate planes of
+// x, y and z components, as in a Vec3SoAArray.
+//
+// inverse computes Imath's inverse() of each matrix.  Where a matrix is
+// singular, its result is the identity and singular[i] is set to 1,
+// otherwise singular[i] is 0.  r may be a.
+//
+
+template <class T>
+struct Kernels
+{
+    typedef IMATH_NAMESPACE::Vec3<T>      V;
+    typedef IMATH_NAMESPACE::Matrix44<T>  M;
+    typedef const T * const               In[3];
+    typedef T * const                     Out[3];
+
+    void (*dot)           (const V *a, const V *b, size_t bStride, T *r, size_t n);
+    void (*cross)         (const V *a, const V *b, size_t bStride, V *r, size_t n);
+    void (*length)        (const V *a, T *r, size_t n);
+    void (*length2)       (const V *a, T *r, size_t n);
+    void (*normalized)    (const V *a, V *r, size_t n);
+    void (*multVecMatrix) (const M &m, const V *a, V *r, size_t n);
+    void (*inverse)       (const M *a, M *r, int *singular, size_t n);
+
+    void (*dotPlanes)           (In a, In b, size_t bStride, T *r, size_t n);
+    void (*crossPlanes)         (In a, In b, size_t bStride, Out r, size_t n);
+    void (*lengthPlanes)        (In a, T *r, size_t n);
+    void (*length2Planes)       (In a, T *r, size_t n);
+    void (*normalizedPlanes)    (In a, Out r, size_t n);
+    void (*multVecMatrixPlanes) (const M &m, In a, Out r, size_t n);
+};
+
+// The kernels for the current processor, or null if there are none or
+// they have been disabled.
+PYIMATH_EXPORT const Kernels<float> *  floatKernels();
+PYIMATH_EXPORT const Kernels<double> * doubleKernels();
+
+template <class T> inline const Kernels<T> * kernels() { return nullptr; }
+template <> inline const Kernels<float> *  kernels<float>()  { return floatKernels(); }
+template <> inline const Kernels<double> * kernels<double>() { return doubleKernels(); }
+
+// The name of the instruction set used by the kernels, e.g. "avx",
+// or "none".
+PYIMATH_EXPORT const char * instructionSet();
+
+PYIMATH_EXPORT bool enabled();
+PYIMATH_EXPORT void setEnabled (bool enable);
+
+} // namespace simd
+
+PYIMATH_EXPORT void register_Simd();
+
+namespace detail {
+
+template <class T>
+inline bool
+simd_contiguous (const FixedArray<T> &a)
+{
+    return !a.isMaskedReference() && a.stride() == 1 && a.len() > 0;
+}
+
+template <class T>
+inline const T *
+simd_data (const FixedArray<T> &a)
+{
+    return &a.direct_index (0);
+}
+
+template <class T>
+inline T *
+simd_writable_data (FixedArray<T> &a)
+{
+    return &a.direct_index (0);
+}
+
+// Runs a kernel over chunks of the arrays, in parallel if that pays off.
+template <class Kernel>
+struct SimdTask : public Task
+{
+    Kernel kernel;
+
+    SimdTask (const Kernel &k) : kernel (k) {}
+    void execute (size_t start, size_t end) override { kernel (start, end); }
+};
+
+template <class Op, class Kernel>
+inline void
+simd_dispatch (size_t len, const Kernel &kernel)
+{
+    SimdTask<Kernel> task (kernel);
+    dispatchTask (task, len, op_cost<Op>::value());
+}
+
+// The 'b' operand of a binary kernel is either an array or a single value.
+template <class V>
+inline bool simd_operand (const FixedArray<V> &b, const V *&ptr, size_t &stride)
+{
+    if (!simd_contiguous (b))
+        return false;
+    ptr = simd_data (b);
+    stride = 1;
+    return true;
+}
+
+template <class V>
+inline bool simd_operand (const V &b, const V *&ptr, size_t &stride)
+{
+    ptr = &b;
+    stride = 0;
+    return true;
+}
+
+template <class T>
+struct simd_kernel<op_vecDot<IMATH_NAMESPACE::Vec3<T> > >
+{
+    typedef IMATH_NAMESPACE::Vec3<T> V;
+    typedef op_vecDot<V> Op;
+
+    template <class B>
+    static bool apply (FixedArray<T> &r, const FixedArray<V> &a, const B &b)
+    {
+        const simd::Kernels<T> *k = simd::kernels<T>();
+        const V *pb;
+        size_t bStride;
+        if (!k || !simd_contiguous (r) || !simd_contiguous (a) || !simd_operand (b, pb, bStride))
+            return false;
+
+        const V *pa = simd_data (a);
+        T *pr = simd_writable_data (r);
+        simd_dispatch<Op> (r.len(), [=] (size_t s, size_t e)
+                           { k->dot (pa + s, pb + s*bStride, bStride, pr + s, e - s); });
+        return true;
+    }
+
+    template <class... Args>
+    static bool apply (const Args &...) { return false; }
+};
+
+template <class T>
+struct simd_kernel<op_vec3Cross<T> >
+{
+    typedef IMATH_NAMESPACE::Vec3<T> V;
+    typedef op_vec3Cross<T> Op;
+
+    template <class B>
+    static bool apply (FixedArray<V> &r, const FixedArray<V> &a, const B &b)
+    {
+        const simd::Kernels<T> *k = simd::kernels<T>();
+        const V *pb;
+        size_t bStride;
+        if (!k || !simd_contiguous (r) || !simd_contiguous (a) || !simd_operand (b, pb, bStride))
+            return false;
+
+        const V *pa = simd_data (a);
+        V *pr = simd_writable_data (r);
+        simd_dispatch<Op> (r.len(), [=] (size_t s, size_t e)
+                           { k->cross (pa + s, pb + s*bStride, bStride, pr + s, e - s); });
+        return true;
+    }
+
+    template <class... Args>
+    static bool apply (const Args &...) { return false; }
+};
+
+// length, length2 and normalized map an array to an array
+#define PYIMATH_SIMD_UNARY_KERNEL(OP,RESULT,KERNEL)                                 \
+template <class T>                                                                  \
+struct simd_kernel<OP<IMATH_NAMESPACE::Vec3<T> > >                                  \
+{                                                                                   \
+    typedef IMATH_NAMESPACE::Vec3<T> V;                                             \
+    typedef OP<V> Op;                                                               \
+                                                                                    \
+    static bool apply (FixedArray<RESULT> &r, const FixedArray<V> &a)               \
+    {                                                                               \
+        const simd::Kernels<T> *k = simd::kernels<T>();                             \
+        if (!k || !simd_contiguous (r) || !simd_contiguous (a))                     \
+            return false;                                                           \
+                                                                                    \
+        const V *pa = simd_data (a);                                                \
+        RESULT *pr = simd_writable_data (r);                                        \
+        simd_dispatch<Op> (r.len(), [=] (size_t s, size_t e)                        \
+                           { k->KERNEL (pa + s, pr + s, e - s); });                 \
+        return true;                                                                \
+    }                                                                               \
+                                                                                    \
+    template <class... Args>                                                        \
+    static bool apply (const Args &...) { return false; }                           \
+};
+
+PYIMATH_SIMD_UNARY_KERNEL(op_vecLength,T,length)
+PYIMATH_SIMD_UNARY_KERNEL(op_vecLength2,T,length2)
+PYIMATH_SIMD_UNARY_KERNEL(op_vecNormalized,V,normalized)
+
+#undef PYIMATH_SIMD_UNARY_KERNEL
+
+// in place normalize
+template <class T>
+struct simd_kernel<op_vecNormalize<IMATH_NAMESPACE::Vec3<T> > >
+{
+    typedef IMATH_NAMESPACE::Vec3<T> V;
+    typedef op_vecNormalize<V> Op;
+
+    static bool apply (FixedArray<V> &a)
+    {
+        const simd::Kernels<T> *k = simd::kernels<T>();
+        if (!k || !simd_contiguous (a) || !a.writable())
+            return false;
+
+        V *pa = simd_writable_data (a);
+        simd_dispatch<Op> (a.len(), [=] (size_t s, size_t e)
+                           { k->normalized (pa + s, pa + s, e - s); });
+        return true;
+    }
+
+    template <class... Args>
+    static bool apply (const Args &...) { return false; }
+};
+
+// point transforms, for matrices of the same base type as the vectors
+template <class T>
+struct simd_kernel<op_mul<IMATH_NAMESPACE::Vec3<T>,IMATH_NAMESPACE::Matrix44<T>,IMATH_NAMESPACE::Vec3<T> > >
+{
+    typedef IMATH_NAMESPACE::Vec3<T> V;
+    typedef IMATH_NAMESPACE::Matrix44<T> M;
+    typedef op_mul<V,M,V> Op;
+
+    static bool apply (FixedArray<V> &r, const FixedArray<V> &a, const M &m)
+    {
+        const simd::Kernels<T> *k = simd::kernels<T>();
+        if (!k || !simd_contiguous (r) || !simd_contiguous (a))
+            return false;
+
+        const V *pa = simd_data (a);
+        V *pr = simd_writable_data (r);
+        const M *pm = &m;
+        simd_dispatch<Op> (r.len(), [=] (size_t s, size_t e)
+                           { k->multVecMatrix (*pm, pa + s, pr + s, e - s); });
+        return true;
+    }
+
+    template <class... Args>
+    static bool apply (const Args &...) { return false; }
+};
+
+} // namespace detail
+
+} // namespace PyImath
+
+#endif
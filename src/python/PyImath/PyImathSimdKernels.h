@@ -0,0 +1,548 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+//
+// The vectorized kernels declared in PyImathSimd.h.  This file is
+// included by PyImathSimd.cpp once for each instruction set, inside a
+// namespace that defines Pack<T>, a vector of T with the arithmetic
+// operators, load(), broadcast(), store(), sqrt() and anyLess(), and
+// load3() and store3(), which transpose between Pack<T>::size
+// consecutive triples of T and one pack per component.  It therefore
+// has no include guard.
+//
+// Each kernel evaluates whole packs of elements, and falls back to the
+// Imath method for the remainder, and for any pack containing a vector
+// so short that Imath takes its slower, more careful path.
+//
+
+// Vec3 arrays are consecutive triples of components
+template <class T>
+inline void
+loadVec3 (const IMATH_NAMESPACE::Vec3<T> *v, Pack<T> &x, Pack<T> &y, Pack<T> &z)
+{
+    static_assert (sizeof (IMATH_NAMESPACE::Vec3<T>) == 3 * sizeof (T), "unexpected Vec3 layout");
+    load3 (&v->x, x, y, z);
+}
+
+template <class T>
+inline void
+storeVec3 (IMATH_NAMESPACE::Vec3<T> *v, const Pack<T> &x, const Pack<T> &y, const Pack<T> &z)
+{
+    store3 (&v->x, x, y, z);
+}
+
+// Imath's length() switches to lengthTiny() below this squared length.
+template <class T>
+inline Pack<T>
+tinyLength2 ()
+{
+    return Pack<T>::broadcast (T (2) * std::numeric_limits<T>::min());
+}
+
+template <class T>
+void
+dot (const IMATH_NAMESPACE::Vec3<T> *a, const IMATH_NAMESPACE::Vec3<T> *b,
+     size_t bStride, T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    if (bStride == 0)
+    {
+        Pack<T> bx = Pack<T>::broadcast (b->x);
+        Pack<T> by = Pack<T>::broadcast (b->y);
+        Pack<T> bz = Pack<T>::broadcast (b->z);
+
+        for (; i + N <= n; i += N)
+        {
+            Pack<T> ax, ay, az;
+            loadVec3 (a + i, ax, ay, az);
+            (ax * bx + ay * by + az * bz).store (r + i);
+        }
+    }
+    else
+    {
+        for (; i + N <= n; i += N)
+        {
+            Pack<T> ax, ay, az, bx, by, bz;
+            loadVec3 (a + i, ax, ay, az);
+            loadVec3 (b + i, bx, by, bz);
+            (ax * bx + ay * by + az * bz).store (r + i);
+        }
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i].dot (b[i * bStride]);
+}
+
+template <class T>
+void
+cross (const IMATH_NAMESPACE::Vec3<T> *a, const IMATH_NAMESPACE::Vec3<T> *b,
+       size_t bStride, IMATH_NAMESPACE::Vec3<T> *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    if (bStride == 0)
+    {
+        Pack<T> bx = Pack<T>::broadcast (b->x);
+        Pack<T> by = Pack<T>::broadcast (b->y);
+        Pack<T> bz = Pack<T>::broadcast (b->z);
+
+        for (; i + N <= n; i += N)
+        {
+            Pack<T> ax, ay, az;
+            loadVec3 (a + i, ax, ay, az);
+            storeVec3 (r + i, ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx);
+        }
+    }
+    else
+    {
+        for (; i + N <= n; i += N)
+        {
+            Pack<T> ax, ay, az, bx, by, bz;
+            loadVec3 (a + i, ax, ay, az);
+            loadVec3 (b + i, bx, by, bz);
+            storeVec3 (r + i, ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx);
+        }
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i].cross (b[i * bStride]);
+}
+
+template <class T>
+void
+length2 (const IMATH_NAMESPACE::Vec3<T> *a, T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadVec3 (a + i, ax, ay, az);
+        (ax * ax + ay * ay + az * az).store (r + i);
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i].length2();
+}
+
+template <class T>
+void
+length (const IMATH_NAMESPACE::Vec3<T> *a, T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    const Pack<T> tiny = tinyLength2<T>();
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadVec3 (a + i, ax, ay, az);
+        Pack<T> l2 = ax * ax + ay * ay + az * az;
+
+        if (anyLess (l2, tiny))
+        {
+            for (size_t k = i; k < i + N; ++k)
+                r[k] = a[k].length();
+        }
+        else
+            sqrt (l2).store (r + i);
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i].length();
+}
+
+template <class T>
+void
+normalized (const IMATH_NAMESPACE::Vec3<T> *a, IMATH_NAMESPACE::Vec3<T> *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    const Pack<T> tiny = tinyLength2<T>();
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadVec3 (a + i, ax, ay, az);
+        Pack<T> l2 = ax * ax + ay * ay + az * az;
+
+        if (anyLess (l2, tiny))
+        {
+            for (size_t k = i; k < i + N; ++k)
+                r[k] = a[k].normalized();
+        }
+        else
+        {
+            Pack<T> l = sqrt (l2);
+            storeVec3 (r + i, ax / l, ay / l, az / l);
+        }
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i].normalized();
+}
+
+template <class T>
+void
+multVecMatrix (const IMATH_NAMESPACE::Matrix44<T> &m,
+               const IMATH_NAMESPACE::Vec3<T> *a, IMATH_NAMESPACE::Vec3<T> *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    Pack<T> c[4][4];
+    for (int j = 0; j < 4; ++j)
+        for (int k = 0; k < 4; ++k)
+            c[j][k] = Pack<T>::broadcast (m.x[j][k]);
+
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadVec3 (a + i, ax, ay, az);
+
+        Pack<T> x = ax * c[0][0] + ay * c[1][0] + az * c[2][0] + c[3][0];
+        Pack<T> y = ax * c[0][1] + ay * c[1][1] + az * c[2][1] + c[3][1];
+        Pack<T> z = ax * c[0][2] + ay * c[1][2] + az * c[2][2] + c[3][2];
+        Pack<T> w = ax * c[0][3] + ay * c[1][3] + az * c[2][3] + c[3][3];
+
+        storeVec3 (r + i, x / w, y / w, z / w);
+    }
+
+    for (; i < n; ++i)
+        r[i] = a[i] * m;
+}
+
+//
+// Each pack of matrices is transposed into one pack per element of the
+// upper 3x3 and the translation, and inverted as Matrix44::inverse()
+// inverts an affine matrix.  A pack containing a matrix that is not
+// affine is inverted by Imath.  The singularity test, which depends on
+// the magnitudes of the cofactors, is made for each matrix.
+//
+
+template <class T>
+void
+inverse (const IMATH_NAMESPACE::Matrix44<T> *a, IMATH_NAMESPACE::Matrix44<T> *r,
+         int *singular, size_t n)
+{
+    typedef IMATH_NAMESPACE::Matrix44<T> M;
+    const size_t N = Pack<T>::size;
+    const Pack<T> negZero = Pack<T>::broadcast (-T (0));
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        T x[4][3][N];
+        bool affine = true;
+
+        for (size_t k = 0; k < N; ++k)
+        {
+            const M &e = a[i + k];
+            affine = affine && e.x[0][3] == 0 && e.x[1][3] == 0 &&
+                               e.x[2][3] == 0 && e.x[3][3] == 1;
+            for (int j = 0; j < 4; ++j)
+                for (int l = 0; l < 3; ++l)
+                    x[j][l][k] = e.x[j][l];
+        }
+
+        if (!affine)
+        {
+            for (size_t k = i; k < i + N; ++k)
+                singular[k] = !invertMatrix (a[k], r[k], false);
+            continue;
+        }
+
+        Pack<T> m[4][3];
+        for (int j = 0; j < 4; ++j)
+            for (int l = 0; l < 3; ++l)
+                m[j][l] = Pack<T>::load (x[j][l]);
+
+        Pack<T> s[3][3];
+        s[0][0] = m[1][1] * m[2][2] - m[2][1] * m[1][2];
+        s[0][1] = m[2][1] * m[0][2] - m[0][1] * m[2][2];
+        s[0][2] = m[0][1] * m[1][2] - m[1][1] * m[0][2];
+        s[1][0] = m[2][0] * m[1][2] - m[1][0] * m[2][2];
+        s[1][1] = m[0][0] * m[2][2] - m[2][0] * m[0][2];
+        s[1][2] = m[1][0] * m[0][2] - m[0][0] * m[1][2];
+        s[2][0] = m[1][0] * m[2][1] - m[2][0] * m[1][1];
+        s[2][1] = m[2][0] * m[0][1] - m[0][0] * m[2][1];
+        s[2][2] = m[0][0] * m[1][1] - m[1][0] * m[0][1];
+
+        Pack<T> det = m[0][0] * s[0][0] + m[0][1] * s[1][0] + m[0][2] * s[2][0];
+
+        T d[N];
+        T c[3][3][N];
+        det.store (d);
+        for (int j = 0; j < 3; ++j)
+            for (int l = 0; l < 3; ++l)
+            {
+                s[j][l].store (c[j][l]);
+                s[j][l] = s[j][l] / det;
+            }
+
+        // -x * s, evaluated as -0 - x * s, which is the same including
+        // the sign of zero
+        Pack<T> t[3];
+        for (int l = 0; l < 3; ++l)
+            t[l] = negZero - m[3][0] * s[0][l] - m[3][1] * s[1][l] - m[3][2] * s[2][l];
+
+        T q[4][3][N];
+        for (int j = 0; j < 3; ++j)
+            for (int l = 0; l < 3; ++l)
+                s[j][l].store (q[j][l]);
+        for (int l = 0; l < 3; ++l)
+            t[l].store (q[3][l]);
+
+        for (size_t k = 0; k < N; ++k)
+        {
+            bool invertible = true;
+            T    ad = IMATH_NAMESPACE::abs (d[k]);
+
+            if (!(ad >= 1))
+            {
+                T mr = ad / std::numeric_limits<T>::min();
+                for (int j = 0; j < 3; ++j)
+                    for (int l = 0; l < 3; ++l)
+                        invertible = invertible && mr > IMATH_NAMESPACE::abs (c[j][l][k]);
+            }
+
+            M &result = r[i + k];
+            if (invertible)
+            {
+                for (int j = 0; j < 4; ++j)
+                {
+                    for (int l = 0; l < 3; ++l)
+                        result.x[j][l] = q[j][l][k];
+                    result.x[j][3] = j == 3 ? 1 : 0;
+                }
+            }
+            else
+                result.makeIdentity();
+
+            singular[i + k] = !invertible;
+        }
+    }
+
+    for (; i < n; ++i)
+        singular[i] = !invertMatrix (a[i], r[i], false);
+}
+
+//
+// Kernels for vectors stored as planes of components.  An operand with
+// a stride of 0 refers to a single vector.
+//
+
+template <class T>
+inline void
+loadPlanes (const T * const p[3], size_t i, Pack<T> &x, Pack<T> &y, Pack<T> &z)
+{
+    x = Pack<T>::load (p[0] + i);
+    y = Pack<T>::load (p[1] + i);
+    z = Pack<T>::load (p[2] + i);
+}
+
+template <class T>
+inline void
+storePlanes (T * const p[3], size_t i, const Pack<T> &x, const Pack<T> &y, const Pack<T> &z)
+{
+    x.store (p[0] + i);
+    y.store (p[1] + i);
+    z.store (p[2] + i);
+}
+
+template <class T>
+inline IMATH_NAMESPACE::Vec3<T>
+planesVec3 (const T * const p[3], size_t i)
+{
+    return IMATH_NAMESPACE::Vec3<T> (p[0][i], p[1][i], p[2][i]);
+}
+
+template <class T>
+inline void
+setPlanes (T * const p[3], size_t i, const IMATH_NAMESPACE::Vec3<T> &v)
+{
+    p[0][i] = v.x;
+    p[1][i] = v.y;
+    p[2][i] = v.z;
+}
+
+template <class T>
+void
+dotPlanes (const T * const a[3], const T * const b[3], size_t bStride, T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    Pack<T> bx = Pack<T>::broadcast (b[0][0]);
+    Pack<T> by = Pack<T>::broadcast (b[1][0]);
+    Pack<T> bz = Pack<T>::broadcast (b[2][0]);
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+        if (bStride)
+            loadPlanes (b, i, bx, by, bz);
+        (ax * bx + ay * by + az * bz).store (r + i);
+    }
+
+    for (; i < n; ++i)
+        r[i] = planesVec3 (a, i).dot (planesVec3 (b, i * bStride));
+}
+
+template <class T>
+void
+crossPlanes (const T * const a[3], const T * const b[3], size_t bStride, T * const r[3], size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    Pack<T> bx = Pack<T>::broadcast (b[0][0]);
+    Pack<T> by = Pack<T>::broadcast (b[1][0]);
+    Pack<T> bz = Pack<T>::broadcast (b[2][0]);
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+        if (bStride)
+            loadPlanes (b, i, bx, by, bz);
+        storePlanes (r, i, ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx);
+    }
+
+    for (; i < n; ++i)
+        setPlanes (r, i, planesVec3 (a, i).cross (planesVec3 (b, i * bStride)));
+}
+
+template <class T>
+void
+length2Planes (const T * const a[3], T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+        (ax * ax + ay * ay + az * az).store (r + i);
+    }
+
+    for (; i < n; ++i)
+        r[i] = planesVec3 (a, i).length2();
+}
+
+template <class T>
+void
+lengthPlanes (const T * const a[3], T *r, size_t n)
+{
+    const size_t N = Pack<T>::size;
+    const Pack<T> tiny = tinyLength2<T>();
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+        Pack<T> l2 = ax * ax + ay * ay + az * az;
+
+        if (anyLess (l2, tiny))
+        {
+            for (size_t k = i; k < i + N; ++k)
+                r[k] = planesVec3 (a, k).length();
+        }
+        else
+            sqrt (l2).store (r + i);
+    }
+
+    for (; i < n; ++i)
+        r[i] = planesVec3 (a, i).length();
+}
+
+template <class T>
+void
+normalizedPlanes (const T * const a[3], T * const r[3], size_t n)
+{
+    const size_t N = Pack<T>::size;
+    const Pack<T> tiny = tinyLength2<T>();
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+        Pack<T> l2 = ax * ax + ay * ay + az * az;
+
+        if (anyLess (l2, tiny))
+        {
+            for (size_t k = i; k < i + N; ++k)
+                setPlanes (r, k, planesVec3 (a, k).normalized());
+        }
+        else
+        {
+            Pack<T> l = sqrt (l2);
+            storePlanes (r, i, ax / l, ay / l, az / l);
+        }
+    }
+
+    for (; i < n; ++i)
+        setPlanes (r, i, planesVec3 (a, i).normalized());
+}
+
+template <class T>
+void
+multVecMatrixPlanes (const IMATH_NAMESPACE::Matrix44<T> &m,
+                     const T * const a[3], T * const r[3], size_t n)
+{
+    const size_t N = Pack<T>::size;
+    Pack<T> c[4][4];
+    for (int j = 0; j < 4; ++j)
+        for (int k = 0; k < 4; ++k)
+            c[j][k] = Pack<T>::broadcast (m.x[j][k]);
+
+    size_t i = 0;
+
+    for (; i + N <= n; i += N)
+    {
+        Pack<T> ax, ay, az;
+        loadPlanes (a, i, ax, ay, az);
+
+        Pack<T> x = ax * c[0][0] + ay * c[1][0] + az * c[2][0] + c[3][0];
+        Pack<T> y = ax * c[0][1] + ay * c[1][1] + az * c[2][1] + c[3][1];
+        Pack<T> z = ax * c[0][2] + ay * c[1][2] + az * c[2][2] + c[3][2];
+        Pack<T> w = ax * c[0][3] + ay * c[1][3] + az * c[2][3] + c[3][3];
+
+        storePlanes (r, i, x / w, y / w, z / w);
+    }
+
+    for (; i < n; ++i)
+        setPlanes (r, i, planesVec3 (a, i) * m);
+}
+
+template <class T>
+void
+fillKernels (simd::Kernels<T> &k)
+{
+    k.dot = &dot<T>;
+    k.cross = &cross<T>;
+    k.length = &length<T>;
+    k.length2 = &length2<T>;
+    k.normalized = &normalized<T>;
+    k.multVecMatrix = &multVecMatrix<T>;
+    k.inverse = &inverse<T>;
+
+    k.dotPlanes = &dotPlanes<T>;
+    k.crossPlanes = &crossPlanes<T>;
+    k.lengthPlanes = &lengthPlanes<T>;
+    k.length2Planes = &length2Planes<T>;
+    k.normalizedPlanes = &normalizedPlanes<T>;
+    k.multVecMatrixPlanes = &multVecMatrixPlanes<T>;
+}
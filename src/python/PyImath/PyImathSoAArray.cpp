@@ -0,0 +1,520 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <algorithm>
+#include <stdexcept>
+#include "PyImathSoAArray.h"
+#include "PyImathAutovectorize.h"
+#include "PyImathOperators.h"
+#include "PyImathVecOperators.h"
+#include "PyImathSimd.h"
+#include "PyImathTask.h"
+#include "PyImathUtil.h"
+
+namespace PyImath {
+
+using namespace boost::python;
+
+//
+// The operations are computed by the ...Planes kernels of PyImathSimd.h
+// when the processor has them, and otherwise by the scalar versions
+// below, over chunks of the arrays dispatched to the thread pool like
+// the vectorized FixedArray operations.
+//
+
+namespace {
+
+template <class Loop>
+struct SoATask : public Task
+{
+    Loop loop;
+
+    SoATask (const Loop &l) : loop (l) {}
+    void execute (size_t start, size_t end) override { loop (start, end); }
+};
+
+template <class Op, class Loop>
+void
+parallelLoop (size_t len, const Loop &loop)
+{
+    SoATask<Loop> task (loop);
+    dispatchTask (task, len, detail::op_cost<Op>::value());
+}
+
+template <class T>
+inline IMATH_NAMESPACE::Vec3<T>
+get (const T * const p[3], size_t i)
+{
+    return IMATH_NAMESPACE::Vec3<T> (p[0][i], p[1][i], p[2][i]);
+}
+
+template <class T>
+inline void
+set (T * const p[3], size_t i, const IMATH_NAMESPACE::Vec3<T> &v)
+{
+    p[0][i] = v.x;
+    p[1][i] = v.y;
+    p[2][i] = v.z;
+}
+
+template <class T>
+void
+dotPlanes (const T * const a[3], const T * const b[3], size_t bStride, T *r, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        r[i] = get (a, i).dot (get (b, i * bStride));
+}
+
+template <class T>
+void
+crossPlanes (const T * const a[3], const T * const b[3], size_t bStride, T * const r[3], size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        set (r, i, get (a, i).cross (get (b, i * bStride)));
+}
+
+template <class T>
+void
+lengthPlanes (const T * const a[3], T *r, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        r[i] = get (a, i).length();
+}
+
+template <class T>
+void
+length2Planes (const T * const a[3], T *r, size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        r[i] = get (a, i).length2();
+}
+
+template <class T>
+void
+normalizedPlanes (const T * const a[3], T * const r[3], size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        set (r, i, get (a, i).normalized());
+}
+
+template <class T>
+void
+multVecMatrixPlanes (const IMATH_NAMESPACE::Matrix44<T> &m,
+                     const T * const a[3], T * const r[3], size_t n)
+{
+    for (size_t i = 0; i < n; ++i)
+        set (r, i, get (a, i) * m);
+}
+
+template <class T>
+const simd::Kernels<T> *
+planeKernels()
+{
+    if (const simd::Kernels<T> *k = simd::kernels<T>())
+        return k;
+
+    static const simd::Kernels<T> scalar = []
+    {
+        simd::Kernels<T> k = {};
+        k.dotPlanes = &dotPlanes<T>;
+        k.crossPlanes = &crossPlanes<T>;
+        k.lengthPlanes = &lengthPlanes<T>;
+        k.length2Planes = &length2Planes<T>;
+        k.normalizedPlanes = &normalizedPlanes<T>;
+        k.multVecMatrixPlanes = &multVecMatrixPlanes<T>;
+        return k;
+    }();
+
+    return &scalar;
+}
+
+// Pointers to the planes of an array, offset to a given element
+template <class T>
+struct Planes
+{
+    T *p[3];
+
+    Planes (T * const planes[3], size_t offset)
+    {
+        for (int c = 0; c < 3; ++c)
+            p[c] = planes[c] + offset;
+    }
+
+    operator T * const * () const { return p; }
+};
+
+template <class T>
+inline Planes<T>
+planes (T * const p[3], size_t offset)
+{
+    return Planes<T> (p, offset);
+}
+
+} // namespace
+
+template <class T>
+Vec3SoAArray<T>::Vec3SoAArray (size_t length, const boost::shared_array<T> &planes)
+    : _length (length),
+      _x (planes.get(), length, 1, boost::any (planes)),
+      _y (planes.get() + length, length, 1, boost::any (planes)),
+      _z (planes.get() + 2 * length, length, 1, boost::any (planes))
+{
+    _planes[0] = planes.get();
+    _planes[1] = planes.get() + length;
+    _planes[2] = planes.get() + 2 * length;
+}
+
+template <class T>
+Vec3SoAArray<T>::Vec3SoAArray (size_t length)
+    : Vec3SoAArray (length, boost::shared_array<T> (new T[3 * length]))
+{
+    std::fill (_planes[0], _planes[0] + 3 * length, T (0));
+}
+
+template <class T>
+Vec3SoAArray<T>::Vec3SoAArray (const FixedArray<V> &a)
+    : Vec3SoAArray (a.len(), boost::shared_array<T> (new T[3 * a.len()]))
+{
+    PY_IMATH_LEAVE_PYTHON;
+    T *x = _planes[0], *y = _planes[1], *z = _planes[2];
+    const FixedArray<V> *pa = &a;
+    parallelLoop<op_add<V> > (_length, [=] (size_t start, size_t end)
+    {
+        const FixedArray<V> &a = *pa;
+        for (size_t i = start; i < end; ++i)
+        {
+            const V &v = a[i];
+            x[i] = v.x;
+            y[i] = v.y;
+            z[i] = v.z;
+        }
+    });
+}
+
+template <class T>
+Vec3SoAArray<T>::Vec3SoAArray (const FixedArray<T> &x,
+                               const FixedArray<T> &y,
+                               const FixedArray<T> &z)
+    : Vec3SoAArray (x.len(), boost::shared_array<T> (new T[3 * x.len()]))
+{
+    x.match_dimension (y);
+    x.match_dimension (z);
+
+    PY_IMATH_LEAVE_PYTHON;
+    for (int c = 0; c < 3; ++c)
+    {
+        const FixedArray<T> &src = c == 0 ? x : c == 1 ? y : z;
+        T *dst = _planes[c];
+        for (size_t i = 0; i < _length; ++i)
+            dst[i] = src[i];
+    }
+}
+
+template <class T>
+size_t
+Vec3SoAArray<T>::match_dimension (const Vec3SoAArray &b) const
+{
+    if (_length != b._length)
+        throw std::invalid_argument ("Dimensions of source do not match destination");
+    return _length;
+}
+
+template <class T>
+typename Vec3SoAArray<T>::V
+Vec3SoAArray<T>::getitem (Py_ssize_t index) const
+{
+    size_t i = _x.canonical_index (index);
+    return V (_planes[0][i], _planes[1][i], _planes[2][i]);
+}
+
+template <class T>
+void
+Vec3SoAArray<T>::setitem (Py_ssize_t index, const V &v)
+{
+    size_t i = _x.canonical_index (index);
+    _planes[0][i] = v.x;
+    _planes[1][i] = v.y;
+    _planes[2][i] = v.z;
+}
+
+template <class T>
+FixedArray<typename Vec3SoAArray<T>::V>
+Vec3SoAArray<T>::toArray() const
+{
+    FixedArray<V> result (_length, UNINITIALIZED);
+    if (_length == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    const T *x = _planes[0], *y = _planes[1], *z = _planes[2];
+    V *r = &result.direct_index (0);
+    parallelLoop<op_add<V> > (_length, [=] (size_t start, size_t end)
+    {
+        for (size_t i = start; i < end; ++i)
+            r[i] = V (x[i], y[i], z[i]);
+    });
+    return result;
+}
+
+template <class T>
+FixedArray<T>
+Vec3SoAArray<T>::dot (const Vec3SoAArray &b) const
+{
+    size_t len = match_dimension (b);
+    FixedArray<T> result (len, UNINITIALIZED);
+    if (len == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this, *pb = &b;
+    T *r = &result.direct_index (0);
+    parallelLoop<op_vecDot<V> > (len, [=] (size_t s, size_t e)
+    {
+        k->dotPlanes (planes (a->_planes, s), planes (pb->_planes, s), 1, r + s, e - s);
+    });
+    return result;
+}
+
+template <class T>
+FixedArray<T>
+Vec3SoAArray<T>::dot (const V &b) const
+{
+    FixedArray<T> result (_length, UNINITIALIZED);
+    if (_length == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    const T * const pb[3] = { &b.x, &b.y, &b.z };
+    T *r = &result.direct_index (0);
+    parallelLoop<op_vecDot<V> > (_length, [&] (size_t s, size_t e)
+    {
+        k->dotPlanes (planes (a->_planes, s), pb, 0, r + s, e - s);
+    });
+    return result;
+}
+
+template <class T>
+Vec3SoAArray<T>
+Vec3SoAArray<T>::cross (const Vec3SoAArray &b) const
+{
+    size_t len = match_dimension (b);
+    Vec3SoAArray result (len, boost::shared_array<T> (new T[3 * len]));
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this, *pb = &b;
+    Vec3SoAArray *r = &result;
+    parallelLoop<op_vec3Cross<T> > (len, [=] (size_t s, size_t e)
+    {
+        k->crossPlanes (planes (a->_planes, s), planes (pb->_planes, s), 1,
+                        planes (r->_planes, s), e - s);
+    });
+    return result;
+}
+
+template <class T>
+Vec3SoAArray<T>
+Vec3SoAArray<T>::cross (const V &b) const
+{
+    Vec3SoAArray result (_length, boost::shared_array<T> (new T[3 * _length]));
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    const T * const pb[3] = { &b.x, &b.y, &b.z };
+    Vec3SoAArray *r = &result;
+    parallelLoop<op_vec3Cross<T> > (_length, [&] (size_t s, size_t e)
+    {
+        k->crossPlanes (planes (a->_planes, s), pb, 0, planes (r->_planes, s), e - s);
+    });
+    return result;
+}
+
+template <class T>
+FixedArray<T>
+Vec3SoAArray<T>::length() const
+{
+    FixedArray<T> result (_length, UNINITIALIZED);
+    if (_length == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    T *r = &result.direct_index (0);
+    parallelLoop<op_vecLength<V> > (_length, [=] (size_t s, size_t e)
+    {
+        k->lengthPlanes (planes (a->_planes, s), r + s, e - s);
+    });
+    return result;
+}
+
+template <class T>
+FixedArray<T>
+Vec3SoAArray<T>::length2() const
+{
+    FixedArray<T> result (_length, UNINITIALIZED);
+    if (_length == 0)
+        return result;
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    T *r = &result.direct_index (0);
+    parallelLoop<op_vecLength2<V> > (_length, [=] (size_t s, size_t e)
+    {
+        k->length2Planes (planes (a->_planes, s), r + s, e - s);
+    });
+    return result;
+}
+
+template <class T>
+void
+Vec3SoAArray<T>::normalize()
+{
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    Vec3SoAArray *a = this;
+    parallelLoop<op_vecNormalize<V> > (_length, [=] (size_t s, size_t e)
+    {
+        // Vec3::normalize() leaves a zero vector unchanged, which is
+        // what normalized() returns for it
+        k->normalizedPlanes (planes (a->_planes, s), planes (a->_planes, s), e - s);
+    });
+}
+
+template <class T>
+Vec3SoAArray<T>
+Vec3SoAArray<T>::normalized() const
+{
+    Vec3SoAArray result (_length, boost::shared_array<T> (new T[3 * _length]));
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    Vec3SoAArray *r = &result;
+    parallelLoop<op_vecNormalized<V> > (_length, [=] (size_t s, size_t e)
+    {
+        k->normalizedPlanes (planes (a->_planes, s), planes (r->_planes, s), e - s);
+    });
+    return result;
+}
+
+template <class T>
+Vec3SoAArray<T>
+Vec3SoAArray<T>::transform (const M &m) const
+{
+    Vec3SoAArray result (_length, boost::shared_array<T> (new T[3 * _length]));
+
+    PY_IMATH_LEAVE_PYTHON;
+    const simd::Kernels<T> *k = planeKernels<T>();
+    const Vec3SoAArray *a = this;
+    Vec3SoAArray *r = &result;
+    parallelLoop<op_mul<V,M,V> > (_length, [&] (size_t s, size_t e)
+    {
+        k->multVecMatrixPlanes (m, planes (a->_planes, s), planes (r->_planes, s), e - s);
+    });
+    return result;
+}
+
+template <class T>
+typename Vec3SoAArray<T>::B
+Vec3SoAArray<T>::bounds() const
+{
+    PY_IMATH_LEAVE_PYTHON;
+    B b;
+    for (int c = 0; c < 3; ++c)
+    {
+        const T *p = _planes[c];
+        T lo = b.min[c], hi = b.max[c];
+        for (size_t i = 0; i < _length; ++i)
+        {
+            lo = std::min (lo, p[i]);
+            hi = std::max (hi, p[i]);
+        }
+        b.min[c] = lo;
+        b.max[c] = hi;
+    }
+    return b;
+}
+
+template <> const char *Vec3SoAArray<float>::name()  { return "V3fSoAArray"; }
+template <> const char *Vec3SoAArray<double>::name() { return "V3dSoAArray"; }
+
+template class Vec3SoAArray<float>;
+template class Vec3SoAArray<double>;
+
+namespace {
+
+// Like the FixedArray methods, normalize() returns the array itself,
+// which refers to the same memory.
+template <class T>
+Vec3SoAArray<T>
+soa_normalize (Vec3SoAArray<T> &a)
+{
+    a.normalize();
+    return a;
+}
+
+template <class T>
+void
+register_Vec3SoAArray (const char *doc)
+{
+    typedef Vec3SoAArray<T>              A;
+    typedef typename A::V                V;
+
+    FixedArray<T> (A::*dotArray) (const A &) const = &A::dot;
+    FixedArray<T> (A::*dotVec) (const V &) const = &A::dot;
+    A (A::*crossArray) (const A &) const = &A::cross;
+    A (A::*crossVec) (const V &) const = &A::cross;
+
+    class_<A> c (A::name(), doc, no_init);
+    c
+        .def (init<size_t> ("construct an array of zero vectors of the given length"))
+        .def (init<const FixedArray<V> &> ("copy the vectors of an array"))
+        .def (init<const FixedArray<T> &, const FixedArray<T> &, const FixedArray<T> &>
+              ("construct from separate arrays of x, y and z components"))
+        .def ("__len__", &A::len)
+        .def ("__getitem__", &A::getitem)
+        .def ("__setitem__", &A::setitem)
+        .add_property ("x", make_function (&A::x, return_value_policy<copy_const_reference>()),
+                       "the plane of x components, referring to the memory of the array")
+        .add_property ("y", make_function (&A::y, return_value_policy<copy_const_reference>()),
+                       "the plane of y components, referring to the memory of the array")
+        .add_property ("z", make_function (&A::z, return_value_policy<copy_const_reference>()),
+                       "the plane of z components, referring to the memory of the array")
+        .def ("toArray", &A::toArray,
+              "toArray() - return the vectors as an array of structures, e.g. a V3fArray")
+        .def ("dot", dotArray, "dot(x) - return the inner products with an array or a vector")
+        .def ("dot", dotVec)
+        .def ("cross", crossArray, "cross(x) - return the cross products with an array or a vector")
+        .def ("cross", crossVec)
+        .def ("length", &A::length, "length() - return the length of each vector")
+        .def ("length2", &A::length2, "length2() - return the squared length of each vector")
+        .def ("normalize", &soa_normalize<T>,
+              "normalize() - normalize each vector in place")
+        .def ("normalized", &A::normalized, "normalized() - return a normalized copy of each vector")
+        .def ("bounds", &A::bounds, "bounds() - return the bounding box of the vectors")
+        .def ("__mul__", &A::transform)
+        ;
+}
+
+} // namespace
+
+void
+register_SoAArrays()
+{
+    register_Vec3SoAArray<float> ("Fixed length array of V3f, stored as separate planes of x, y and z");
+    register_Vec3SoAArray<double> ("Fixed length array of V3d, stored as separate planes of x, y and z");
+}
+
+}
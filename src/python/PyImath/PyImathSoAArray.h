@@ -0,0 +1,92 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathSoAArray_h_
+#define _PyImathSoAArray_h_
+
+#include <ImathVec.h>
+#include <ImathBox.h>
+#include <ImathMatrix.h>
+#include "PyImathExport.h"
+#include "PyImathFixedArray.h"
+
+namespace PyImath {
+
+//
+// A Vec3SoAArray stores an array of Vec3 as three separate, contiguous
+// planes of x, y and z components ("structure of arrays"), rather than
+// as consecutive vectors like a FixedArray<Vec3>.  Operations that treat
+// the components alike, such as dot products, lengths and matrix
+// transforms, then map directly onto the vector units of the processor.
+//
+// The planes are FixedArrays referring to the memory of the SoA array,
+// so they can be handed to other code, or viewed through the buffer
+// protocol, without copying.  Like FixedArray, copying a Vec3SoAArray
+// yields another reference to the same memory.
+//
+
+template <class T>
+class Vec3SoAArray
+{
+  public:
+
+    typedef IMATH_NAMESPACE::Vec3<T>      V;
+    typedef IMATH_NAMESPACE::Box<V>       B;
+    typedef IMATH_NAMESPACE::Matrix44<T>  M;
+
+    PYIMATH_EXPORT explicit Vec3SoAArray (size_t length);
+    PYIMATH_EXPORT explicit Vec3SoAArray (const FixedArray<V> &a);
+    PYIMATH_EXPORT Vec3SoAArray (const FixedArray<T> &x,
+                                 const FixedArray<T> &y,
+                                 const FixedArray<T> &z);
+
+    size_t len() const { return _length; }
+
+    // The component planes
+    const FixedArray<T> & x() const { return _x; }
+    const FixedArray<T> & y() const { return _y; }
+    const FixedArray<T> & z() const { return _z; }
+
+    T *       plane (int i)       { return _planes[i]; }
+    const T * plane (int i) const { return _planes[i]; }
+
+    PYIMATH_EXPORT V    getitem (Py_ssize_t index) const;
+    PYIMATH_EXPORT void setitem (Py_ssize_t index, const V &v);
+
+    PYIMATH_EXPORT FixedArray<V> toArray() const;
+
+    PYIMATH_EXPORT FixedArray<T> dot (const Vec3SoAArray &b) const;
+    PYIMATH_EXPORT FixedArray<T> dot (const V &b) const;
+    PYIMATH_EXPORT Vec3SoAArray  cross (const Vec3SoAArray &b) const;
+    PYIMATH_EXPORT Vec3SoAArray  cross (const V &b) const;
+    PYIMATH_EXPORT FixedArray<T> length() const;
+    PYIMATH_EXPORT FixedArray<T> length2() const;
+    PYIMATH_EXPORT void          normalize();
+    PYIMATH_EXPORT Vec3SoAArray  normalized() const;
+    PYIMATH_EXPORT Vec3SoAArray  transform (const M &m) const;
+    PYIMATH_EXPORT B             bounds() const;
+
+    static const char *name();
+
+  private:
+
+    Vec3SoAArray (size_t length, const boost::shared_array<T> &planes);
+
+    size_t match_dimension (const Vec3SoAArray &b) const;
+
+    size_t        _length;
+    FixedArray<T> _x;
+    FixedArray<T> _y;
+    FixedArray<T> _z;
+    T *           _planes[3];
+};
+
+PYIMATH_EXPORT void register_SoAArrays();
+
+}
+
+#endif
@@ -0,0 +1,301 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathSort_h_
+#define _PyImathSort_h_
+
+#include <algorithm>
+#include <cstdint>
+#include <type_traits>
+#include <utility>
+#include <vector>
+#include "PyImathFixedArray.h"
+#include "PyImathOperators.h"
+#include "PyImathReduce.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+//
+// parallelSort sorts the n elements at 'data' by 'less', stably.  When
+// the sort is worth doing in parallel the elements are split into one
+// run per worker, the runs are sorted in parallel, and then pairs of
+// runs are merged in parallel until a single run is left.  'cost' is
+// the cost of one comparison, as for dispatchTask.
+//
+template <class T, class Less>
+void
+parallelSort(T *data, size_t n, size_t cost, const Less &less)
+{
+    size_t depth = 1;
+    for (size_t m = n; m > 1; m >>= 1)
+        ++depth;
+
+    size_t runs = 1;
+    if (n > parallelThreshold() / std::max(cost * depth, size_t(1)))
+        runs = std::min(workers(), n);
+
+    if (runs <= 1)
+    {
+        std::stable_sort(data, data + n, less);
+        return;
+    }
+
+    std::vector<size_t> bounds(runs + 1);
+    for (size_t r = 0; r <= runs; ++r)
+        bounds[r] = n * r / runs;
+
+    // the cost of a row is that of the whole sort, so that every row
+    // is dispatched to a different worker
+    dispatchRows(runs, n * cost * depth, [&] (size_t r)
+    {
+        std::stable_sort(data + bounds[r], data + bounds[r+1], less);
+    });
+
+    std::vector<T> buffer(n);
+    T *src = data;
+    T *dst = buffer.data();
+    while (runs > 1)
+    {
+        size_t pairs = (runs + 1) / 2;
+        dispatchRows(pairs, n * cost, [&] (size_t p)
+        {
+            size_t lo  = bounds[2*p];
+            size_t mid = bounds[std::min(2*p + 1, runs)];
+            size_t hi  = bounds[std::min(2*p + 2, runs)];
+            std::merge(src + lo, src + mid, src + mid, src + hi, dst + lo, less);
+        });
+
+        for (size_t p = 0; p < pairs; ++p)
+            bounds[p] = bounds[2*p];
+        bounds[pairs] = n;
+        runs = pairs;
+        std::swap(src, dst);
+    }
+
+    if (src != data)
+        std::copy(src, src + n, data);
+}
+
+namespace detail {
+
+// Floating point NaNs are ordered after every other value, so that
+// arrays containing NaNs still sort consistently.
+template <class T>
+inline bool sort_less(const T &a, const T &b, std::true_type) { return a < b || (b != b && a == a); }
+
+template <class T>
+inline bool sort_less(const T &a, const T &b, std::false_type) { return a < b; }
+
+} // namespace detail
+
+// Orders scalars in increasing order
+template <class T>
+struct SortLess
+{
+    bool operator()(const T &a, const T &b) const
+    {
+        return detail::sort_less(a, b, std::is_floating_point<T>());
+    }
+};
+
+// Orders vectors and colors lexicographically by their components
+template <class V>
+struct LexicographicLess
+{
+    bool operator()(const V &a, const V &b) const
+    {
+        SortLess<typename V::BaseType> less;
+        for (unsigned int k = 0; k < V::dimensions(); ++k)
+        {
+            if (less(a[k], b[k]))
+                return true;
+            if (less(b[k], a[k]))
+                return false;
+        }
+        return false;
+    }
+};
+
+// The elements of an array, copied to contiguous memory
+template <class T>
+static std::vector<T> fa_sort_values(const FixedArray<T> &a) {
+    std::vector<T> values(a.len());
+    withReadAccess(a, [&] (const auto &access) {
+        dispatchRows(values.size(), 1, [&] (size_t i) { values[i] = access[i]; });
+    });
+    return values;
+}
+
+template <class T, class Less = SortLess<T> >
+static void fa_sort(FixedArray<T> &a) {
+    if (!a.writable())
+        throw std::invalid_argument("Fixed array is read-only.");
+
+    PY_IMATH_LEAVE_PYTHON;
+    std::vector<T> values = fa_sort_values(a);
+    parallelSort(values.data(), values.size(), 1, Less());
+    dispatchRows(values.size(), 1, [&] (size_t i) { a.unchecked_index(i) = values[i]; });
+}
+
+template <class T, class Less = SortLess<T> >
+static FixedArray<int> fa_argsort(const FixedArray<T> &a) {
+    PY_IMATH_LEAVE_PYTHON;
+    std::vector<T> values = fa_sort_values(a);
+    std::vector<int> order(values.size());
+    for (size_t i=0; i < order.size(); ++i)
+        order[i] = int(i);
+
+    Less less;
+    parallelSort(order.data(), order.size(), 1,
+                 [&] (int i, int j) { return less(values[i], values[j]); });
+
+    FixedArray<int> result(static_cast<Py_ssize_t>(order.size()), UNINITIALIZED);
+    for (size_t i=0; i < order.size(); ++i)
+        result.direct_index(i) = order[i];
+    return result;
+}
+
+// The sorted, distinct elements of an array
+template <class T>
+static FixedArray<T> fa_unique(const FixedArray<T> &a) {
+    PY_IMATH_LEAVE_PYTHON;
+    SortLess<T> less;
+    std::vector<T> values = fa_sort_values(a);
+    parallelSort(values.data(), values.size(), 1, less);
+    values.erase(std::unique(values.begin(), values.end(),
+                             [&] (const T &x, const T &y) { return !less(x, y) && !less(y, x); }),
+                 values.end());
+
+    FixedArray<T> result(static_cast<Py_ssize_t>(values.size()), UNINITIALIZED);
+    for (size_t i=0; i < values.size(); ++i)
+        result.direct_index(i) = values[i];
+    return result;
+}
+
+// The index at which value would be inserted into the sorted elements
+// to keep them sorted, before any equal elements or, if 'right' is
+// true, after them.
+template <class T, class Access>
+static size_t fa_search(const Access &access, size_t len, const T &value, bool right) {
+    SortLess<T> less;
+    size_t lo = 0, hi = len;
+    while (lo < hi)
+    {
+        size_t mid = lo + (hi - lo) / 2;
+        if (right ? !less(value, access[mid]) : less(access[mid], value))
+            lo = mid + 1;
+        else
+            hi = mid;
+    }
+    return lo;
+}
+
+template <class T>
+static size_t fa_searchsorted_scalar(const FixedArray<T> &a, const T &value, bool right) {
+    return withReadAccess(a, [&] (const auto &access) {
+        return fa_search(access, a.len(), value, right);
+    });
+}
+
+template <class T>
+static FixedArray<int> fa_searchsorted_vector(const FixedArray<T> &a, const FixedArray<T> &values, bool right) {
+    PY_IMATH_LEAVE_PYTHON;
+    FixedArray<int> result(values.len(), UNINITIALIZED);
+    size_t depth = 1;
+    for (size_t m = a.len(); m > 1; m >>= 1)
+        ++depth;
+    withReadAccess(a, [&] (const auto &access) {
+        dispatchRows(values.len(), depth, [&] (size_t i) {
+            result.direct_index(i) = int(fa_search(access, a.len(), values[i], right));
+        });
+    });
+    return result;
+}
+
+//
+// The order of the elements of an array of vectors along a Morton
+// (Z-order) curve through their bounding box, which keeps elements
+// that are close together in space close together in the array.  The
+// components are quantized to 64 / dimensions bits each.
+//
+template <class V>
+static FixedArray<int> fa_argsort_morton(const FixedArray<V> &a) {
+    const unsigned int dims = V::dimensions();
+    const unsigned int bits = 64 / dims;
+    const double maxCode = double((uint64_t(1) << bits) - 1);
+
+    PY_IMATH_LEAVE_PYTHON;
+    size_t len = a.len();
+    V lo = fa_component_min(a);
+    V hi = fa_component_max(a);
+    double scale[dims];
+    for (unsigned int k=0; k < dims; ++k)
+    {
+        double range = double(hi[k]) - double(lo[k]);
+        scale[k] = range > 0 ? maxCode / range : 0;
+    }
+
+    std::vector<std::pair<uint64_t,int> > keys(len);
+    withReadAccess(a, [&] (const auto &access) {
+        dispatchRows(len, 64, [&] (size_t i) {
+            uint64_t q[dims];
+            for (unsigned int k=0; k < dims; ++k)
+                q[k] = uint64_t(std::min(maxCode, std::max(0.0, (double(access[i][k]) - double(lo[k])) * scale[k])));
+
+            uint64_t code = 0;
+            for (int b = int(bits) - 1; b >= 0; --b)
+                for (unsigned int k=0; k < dims; ++k)
+                    code = (code << 1) | ((q[k] >> b) & 1);
+            keys[i] = std::make_pair(code, int(i));
+        });
+    });
+
+    parallelSort(keys.data(), len, 1,
+                 [] (const std::pair<uint64_t,int> &x, const std::pair<uint64_t,int> &y) { return x.first < y.first; });
+
+    FixedArray<int> result(static_cast<Py_ssize_t>(len), UNINITIALIZED);
+    for (size_t i=0; i < len; ++i)
+        result.direct_index(i) = keys[i].second;
+    return result;
+}
+
+// Ordering functions for arrays of scalars
+template <class T>
+static void add_sort_functions(boost::python::class_<FixedArray<T> > &c) {
+    using boost::python::arg;
+    c.def("sort",&fa_sort<T>,"sort() - sort the elements in increasing order, in place");
+    c.def("argsort",&fa_argsort<T>,
+          "argsort() - the indices that sort the array, keeping the order of equal elements");
+    c.def("unique",&fa_unique<T>,"unique() - the distinct elements, in increasing order");
+    c.def("searchsorted",&fa_searchsorted_vector<T>,(arg("values"),arg("right")=false),
+          "searchsorted(values, right=False) - for each value, the index at which it\n"
+          "would be inserted into this sorted array to keep it sorted, before any\n"
+          "equal elements or, if right is True, after them");
+    c.def("searchsorted",&fa_searchsorted_scalar<T>,(arg("value"),arg("right")=false),
+          "searchsorted(value, right=False) - the index at which value would be inserted\n"
+          "into this sorted array to keep it sorted, before any equal elements or, if\n"
+          "right is True, after them");
+}
+
+// Ordering functions for arrays of vectors and colors
+template <class V>
+static void add_vector_sort_functions(boost::python::class_<FixedArray<V> > &c) {
+    c.def("sort",&fa_sort<V,LexicographicLess<V> >,
+          "sort() - sort the elements lexicographically by their components, in place");
+    c.def("argsort",&fa_argsort<V,LexicographicLess<V> >,
+          "argsort() - the indices that sort the array lexicographically, keeping the\n"
+          "order of equal elements");
+    c.def("argsortMorton",&fa_argsort_morton<V>,
+          "argsortMorton() - the indices that order the elements along a Morton curve\n"
+          "through their bounds, so that elements close together in space end up close\n"
+          "together in the array, e.g. a.take(a.argsortMorton())");
+}
+
+} // namespace PyImath
+
+#endif
@@ -6,34 +6,57 @@
 // clang-format off
 
 #include "PyImathTask.h"
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <limits>
+#include <mutex>
+#include <vector>
 
 namespace PyImath {
 
-static WorkerPool *_currentPool = nullptr;
+// Read by dispatchTask on python threads that have released the GIL,
+// while setNumThreads() may be replacing it on another thread.
+static std::atomic<WorkerPool *> _currentPool (nullptr);
 
-// Its not worth dispatching parallel tasks unless the iteration count
-// is high enough.  The time to create and launch parallel tasks takes
-// longer than to just do the iterations directly.  This value of '200'
-// is actually very conservative; in some tests, this number should
-// probably be in the thousands.
-static const size_t _minIterations = 200;
+// Its not worth dispatching parallel tasks unless there is enough
+// work.  The time to create and launch parallel tasks takes longer
+// than to just do the iterations directly.  The threshold is measured
+// in units of a simple arithmetic operation, so an operation with
+// cost 20 goes parallel at 1/20th of the length of an addition.  The
+// default is replaced by calibrateParallelThreshold() when a thread
+// pool is installed from python.
+static const size_t _defaultParallelThreshold = 50000;
+static std::atomic<size_t> _parallelThreshold (_defaultParallelThreshold);
+
+// Bounds for the calibrated threshold, in case the measurements
+// are disturbed by other activity on the machine.
+static const size_t _minCalibratedThreshold = 1000;
+static const size_t _maxCalibratedThreshold = 10000000;
 
 WorkerPool *
 WorkerPool::currentPool()
 {
-    return _currentPool;
+    return _currentPool.load();
 }
 
 void
 WorkerPool::setCurrentPool(WorkerPool *pool)
 {
-    _currentPool = pool;
+    _currentPool.store(pool);
 }
 
 void
 dispatchTask(Task &task,size_t length)
 {
-    if (length > _minIterations)
+    dispatchTask(task,length,1);
+}
+
+void
+dispatchTask(Task &task,size_t length,size_t cost)
+{
+    cost = std::max(cost, size_t(1));
+    if (length > _parallelThreshold / cost)
     {
         WorkerPool *curpool = WorkerPool::currentPool();
         if (curpool && !curpool->inWorkerThread())
@@ -55,4 +78,151 @@ workers()
     return 1;
 }
 
+size_t
+parallelThreshold()
+{
+    return _parallelThreshold;
+}
+
+void
+setParallelThreshold(size_t threshold)
+{
+    _parallelThreshold = threshold;
+}
+
+namespace {
+
+struct CalibrationAddTask : public Task
+{
+    const std::vector<float> &a;
+    const std::vector<float> &b;
+    std::vector<float>       &result;
+
+    CalibrationAddTask(const std::vector<float> &a, const std::vector<float> &b, std::vector<float> &r)
+        : a(a), b(b), result(r) {}
+
+    void execute(size_t start, size_t end)
+    {
+        for (size_t i = start; i < end; ++i)
+            result[i] = a[i] + b[i];
+    }
+};
+
+struct CalibrationEmptyTask : public Task
+{
+    void execute(size_t start, size_t end) {}
+};
+
+template <class F>
+double
+bestTime(F f, int runs)
+{
+    double best = std::numeric_limits<double>::max();
+    for (int r = 0; r < runs; ++r)
+    {
+        std::chrono::steady_clock::time_point t0 = std::chrono::steady_clock::now();
+        f();
+        std::chrono::steady_clock::time_point t1 = std::chrono::steady_clock::now();
+        best = std::min(best, std::chrono::duration<double>(t1 - t0).count());
+    }
+    return best;
+}
+
+} // namespace
+
+size_t
+calibrateParallelThreshold()
+{
+    WorkerPool *curpool = WorkerPool::currentPool();
+    if (!curpool || curpool->inWorkerThread() || curpool->workers() <= 1)
+        return _parallelThreshold;
+
+    const size_t numWorkers = curpool->workers();
+    const size_t len = 1 << 16;
+    std::vector<float> a(len, 1.0f), b(len, 2.0f), r(len);
+
+    CalibrationAddTask addTask(a, b, r);
+    double serial = bestTime([&] { addTask.execute(0, len); }, 5) / len;
+
+    CalibrationEmptyTask emptyTask;
+    double overhead = bestTime([&] { curpool->dispatch(emptyTask, numWorkers * 16); }, 9);
+
+    // Serial time for n iterations is n*serial, parallel time is
+    // roughly overhead + n*serial/workers.  Break even is where the two
+    // are equal; use twice that since cheap operations are usually
+    // memory bound and don't scale with the number of workers.
+    double breakEven = overhead / (serial * (1.0 - 1.0 / double(numWorkers)));
+    double threshold = 2.0 * breakEven;
+
+    threshold = std::max(threshold, double(_minCalibratedThreshold));
+    threshold = std::min(threshold, double(_maxCalibratedThreshold));
+
+    _parallelThreshold = size_t(threshold);
+    return _parallelThreshold;
+}
+
+//
+// Registry of named operation costs
+//
+
+static std::mutex &
+costMutex()
+{
+    static std::mutex m;
+    return m;
+}
+
+static std::map<std::string, std::vector<std::atomic<size_t> *> > &
+costRegistry()
+{
+    static std::map<std::string, std::vector<std::atomic<size_t> *> > registry;
+    return registry;
+}
+
+void
+registerOperationCost(const std::string &name, std::atomic<size_t> &cost)
+{
+    std::lock_guard<std::mutex> lock(costMutex());
+    std::vector<std::atomic<size_t> *> &costs = costRegistry()[name];
+    if (std::find(costs.begin(), costs.end(), &cost) == costs.end())
+        costs.push_back(&cost);
+}
+
+bool
+setOperationCost(const std::string &name, size_t cost)
+{
+    std::lock_guard<std::mutex> lock(costMutex());
+    std::map<std::string, std::vector<std::atomic<size_t> *> >::iterator it = costRegistry().find(name);
+    if (it == costRegistry().end())
+        return false;
+
+    for (size_t i = 0; i < it->second.size(); ++i)
+        *it->second[i] = cost;
+    return true;
+}
+
+bool
+operationCost(const std::string &name, size_t &cost)
+{
+    std::lock_guard<std::mutex> lock(costMutex());
+    std::map<std::string, std::vector<std::atomic<size_t> *> >::iterator it = costRegistry().find(name);
+    if (it == costRegistry().end() || it->second.empty())
+        return false;
+
+    cost = *it->second.front();
+    return true;
+}
+
+std::map<std::string,size_t>
+operationCosts()
+{
+    std::lock_guard<std::mutex> lock(costMutex());
+    std::map<std::string,size_t> costs;
+    std::map<std::string, std::vector<std::atomic<size_t> *> >::iterator it;
+    for (it = costRegistry().begin(); it != costRegistry().end(); ++it)
+        if (!it->second.empty())
+            costs[it->first] = *it->second.front();
+    return costs;
+}
+
 }
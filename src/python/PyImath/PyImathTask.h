@@ -9,6 +9,9 @@
 #define _PyImathTask_h_
 
 #include <cstddef>
+#include <atomic>
+#include <string>
+#include <map>
 #include "PyImathExport.h"
 
 namespace PyImath {
@@ -31,9 +34,67 @@ struct WorkerPool
     PYIMATH_EXPORT static void setCurrentPool(WorkerPool *pool);
 };
 
+//
+// Operations that are much more expensive to evaluate than a simple
+// arithmetic operator derive from op_with_cost and declare a static
+// member 'cost', the approximate cost of one evaluation relative to
+// an addition.  Expensive operations are dispatched in parallel at
+// shorter array lengths than cheap ones.
+//
+struct op_with_cost {};
+
+//
+// dispatchTask runs the task in parallel on the current pool when the
+// estimated amount of work, length * cost, exceeds the parallel
+// threshold.  Otherwise the task is executed serially.
+//
 PYIMATH_EXPORT void dispatchTask(Task &task,size_t length);
+PYIMATH_EXPORT void dispatchTask(Task &task,size_t length,size_t cost);
 PYIMATH_EXPORT size_t workers();
 
+//
+// dispatchRows calls f(row) for each row of a two dimensional array,
+// dispatching ranges of rows like dispatchTask.  'rowCost' is the cost
+// of one row, i.e. the row length times the cost of the operation.
+//
+template <class F>
+struct RowTask : public Task
+{
+    const F &f;
+
+    RowTask(const F &func) : f(func) {}
+    void execute(size_t start,size_t end) override { for (size_t j=start; j<end; ++j) f(j); }
+};
+
+template <class F>
+inline void
+dispatchRows(size_t rows,size_t rowCost,const F &f)
+{
+    RowTask<F> task(f);
+    dispatchTask(task,rows,rowCost);
+}
+
+PYIMATH_EXPORT size_t parallelThreshold();
+PYIMATH_EXPORT void setParallelThreshold(size_t threshold);
+
+//
+// Measure the overhead of a parallel dispatch on the current pool
+// relative to the cost of a simple arithmetic operation, and set the
+// parallel threshold to the length at which a parallel dispatch starts
+// to pay off.  Returns the new threshold.
+//
+PYIMATH_EXPORT size_t calibrateParallelThreshold();
+
+//
+// The costs of the vectorized operations are registered by name so
+// they can be tuned at runtime.  Several operations, e.g. the float
+// and double versions of a function, may share the same name.
+//
+PYIMATH_EXPORT void registerOperationCost(const std::string &name, std::atomic<size_t> &cost);
+PYIMATH_EXPORT bool setOperationCost(const std::string &name, size_t cost);
+PYIMATH_EXPORT bool operationCost(const std::string &name, size_t &cost);
+PYIMATH_EXPORT std::map<std::string,size_t> operationCosts();
+
 }
 
 #endif
@@ -0,0 +1,386 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#include <Python.h>
+#define BOOST_BIND_GLOBAL_PLACEHOLDERS
+#include <boost/python.hpp>
+#include <algorithm>
+#include <exception>
+#include <atomic>
+#include <memory>
+#include <cstdlib>
+#include <string>
+#include "PyImathThreadPool.h"
+#include "PyImathUtil.h"
+
+namespace PyImath {
+
+using namespace boost::python;
+
+//
+// Each dispatched task is split into this many chunks per worker, so
+// that a worker which finishes early can pick up some of the remaining
+// iterations instead of idling.
+//
+static const size_t _chunksPerWorker = 4;
+
+//
+// Set for the threads owned by a ThreadPool, and for the dispatching
+// thread while it is running chunks of its own task, so that nested
+// calls to dispatchTask() execute serially.
+//
+static thread_local bool _inWorkerThread = false;
+
+struct ThreadPool::Job
+{
+    Task &                   task;
+    size_t                   length;
+    size_t                   numChunks;
+    std::atomic<size_t>      nextChunk;
+    size_t                   finishedChunks;
+    size_t                   users;
+    std::exception_ptr       error;
+    std::condition_variable  done;
+
+    Job (Task &t, size_t len, size_t chunks)
+        : task (t), length (len), numChunks (chunks), nextChunk (0),
+          finishedChunks (0), users (0) {}
+};
+
+ThreadPool::ThreadPool (size_t numWorkers)
+    : _numWorkers (1), _activeDispatches (0), _stopping (false)
+{
+    start (numWorkers);
+}
+
+ThreadPool::~ThreadPool()
+{
+    std::unique_lock<std::mutex> lock (_mutex);
+    _idle.wait (lock, [this] { return _activeDispatches == 0; });
+    lock.unlock();
+    stop();
+}
+
+size_t
+ThreadPool::workers() const
+{
+    std::lock_guard<std::mutex> lock (_mutex);
+    return _numWorkers;
+}
+
+bool
+ThreadPool::inWorkerThread() const
+{
+    return _inWorkerThread;
+}
+
+void
+ThreadPool::start (size_t numWorkers)
+{
+    // called with no threads running
+    std::lock_guard<std::mutex> lock (_mutex);
+    _numWorkers = std::max (numWorkers, size_t(1));
+    for (size_t i = 1; i < _numWorkers; ++i)
+        _threads.emplace_back (&ThreadPool::workerLoop, this, int(i));
+}
+
+void
+ThreadPool::stop ()
+{
+    {
+        std::lock_guard<std::mutex> lock (_mutex);
+        _stopping = true;
+    }
+    _wakeup.notify_all();
+
+    for (size_t i = 0; i < _threads.size(); ++i)
+        _threads[i].join();
+
+    std::lock_guard<std::mutex> lock (_mutex);
+    _threads.clear();
+    _stopping = false;
+}
+
+void
+ThreadPool::setWorkers (size_t numWorkers)
+{
+    numWorkers = std::max (numWorkers, size_t(1));
+    {
+        std::unique_lock<std::mutex> lock (_mutex);
+        _idle.wait (lock, [this] { return _activeDispatches == 0; });
+        if (numWorkers == _numWorkers)
+            return;
+    }
+    stop();
+    start (numWorkers);
+}
+
+bool
+ThreadPool::runChunk (Job &job, int tid)
+{
+    size_t chunk = job.nextChunk.fetch_add (1);
+    if (chunk >= job.numChunks)
+        return false;
+
+    size_t start = chunk * job.length / job.numChunks;
+    size_t end = (chunk + 1) * job.length / job.numChunks;
+
+    std::exception_ptr error;
+    try
+    {
+        job.task.execute (start, end, tid);
+    }
+    catch (...)
+    {
+        error = std::current_exception();
+    }
+
+    std::lock_guard<std::mutex> lock (_mutex);
+    if (error && !job.error)
+        job.error = error;
+    ++job.finishedChunks;
+    return true;
+}
+
+void
+ThreadPool::workerLoop (int tid)
+{
+    _inWorkerThread = true;
+
+    for (;;)
+    {
+        Job *job = nullptr;
+        {
+            std::unique_lock<std::mutex> lock (_mutex);
+            _wakeup.wait (lock, [this] { return _stopping || !_jobs.empty(); });
+            if (_jobs.empty())
+                return;
+            job = _jobs.front();
+            ++job->users;
+        }
+
+        while (runChunk (*job, tid))
+            ;
+
+        std::lock_guard<std::mutex> lock (_mutex);
+
+        // all chunks of the job have been handed out
+        if (!_jobs.empty() && _jobs.front() == job)
+            _jobs.pop_front();
+
+        if (--job->users == 0 && job->finishedChunks == job->numChunks)
+            job->done.notify_all();
+    }
+}
+
+void
+ThreadPool::dispatch (Task &task, size_t length)
+{
+    PyReleaseLock pyunlock;
+
+    size_t numChunks = 0;
+    {
+        std::lock_guard<std::mutex> lock (_mutex);
+        if (!_threads.empty())
+            numChunks = std::min (length, _numWorkers * _chunksPerWorker);
+        if (numChunks > 1)
+            ++_activeDispatches;
+    }
+
+    if (numChunks <= 1)
+    {
+        task.execute (0, length, 0);
+        return;
+    }
+
+    Job job (task, length, numChunks);
+    {
+        std::lock_guard<std::mutex> lock (_mutex);
+        _jobs.push_back (&job);
+    }
+    _wakeup.notify_all();
+
+    bool wasInWorker = _inWorkerThread;
+    _inWorkerThread = true;
+    while (runChunk (job, 0))
+        ;
+    _inWorkerThread = wasInWorker;
+
+    {
+        std::unique_lock<std::mutex> lock (_mutex);
+
+        std::deque<Job *>::iterator it = std::find (_jobs.begin(), _jobs.end(), &job);
+        if (it != _jobs.end())
+            _jobs.erase (it);
+
+        job.done.wait (lock, [&job] {
+            return job.users == 0 && job.finishedChunks == job.numChunks; });
+
+        if (--_activeDispatches == 0)
+            _idle.notify_all();
+    }
+
+    if (job.error)
+        std::rethrow_exception (job.error);
+}
+
+//
+// The pool shared by the python module, created on the first call to
+// setNumThreads() with more than one thread.
+//
+
+static std::mutex                  _sharedPoolMutex;
+static std::unique_ptr<ThreadPool> _sharedPool;
+
+void
+ThreadPool::setNumThreads (size_t numThreads)
+{
+    std::lock_guard<std::mutex> lock (_sharedPoolMutex);
+
+    if (numThreads <= 1)
+    {
+        if (WorkerPool::currentPool() == _sharedPool.get())
+            WorkerPool::setCurrentPool (nullptr);
+        if (_sharedPool)
+            _sharedPool->setWorkers (1);
+        return;
+    }
+
+    if (!_sharedPool)
+        _sharedPool.reset (new ThreadPool (numThreads));
+    else
+        _sharedPool->setWorkers (numThreads);
+
+    WorkerPool::setCurrentPool (_sharedPool.get());
+    calibrateParallelThreshold();
+}
+
+size_t
+ThreadPool::numThreads()
+{
+    WorkerPool *pool = WorkerPool::currentPool();
+    return pool ? pool->workers() : 1;
+}
+
+static void
+setNumThreads (int numThreads)
+{
+    if (numThreads < 0)
+        throw std::invalid_argument ("Number of threads must be non-negative");
+
+    // setWorkers() may wait on tasks dispatched by other python threads
+    PyReleaseLock pyunlock;
+    ThreadPool::setNumThreads (size_t(numThreads));
+}
+
+static int
+numThreads()
+{
+    return int(ThreadPool::numThreads());
+}
+
+static void
+setParallelThreshold_ (int threshold)
+{
+    if (threshold < 0)
+        throw std::invalid_argument ("Parallel threshold must be non-negative");
+    setParallelThreshold (size_t(threshold));
+}
+
+static size_t
+calibrateParallelThreshold_ ()
+{
+    PyReleaseLock pyunlock;
+    return calibrateParallelThreshold();
+}
+
+static void
+setOperationCost_ (const std::string &name, int cost)
+{
+    if (cost < 1)
+        throw std::invalid_argument ("Operation cost must be positive");
+
+    if (!setOperationCost (name, size_t(cost)))
+    {
+        PyErr_SetString (PyExc_KeyError, ("Unknown operation '" + name + "'").c_str());
+        throw_error_already_set();
+    }
+}
+
+static size_t
+operationCost_ (const std::string &name)
+{
+    size_t cost = 0;
+    if (!operationCost (name, cost))
+    {
+        PyErr_SetString (PyExc_KeyError, ("Unknown operation '" + name + "'").c_str());
+        throw_error_already_set();
+    }
+    return cost;
+}
+
+static dict
+operationCosts_ ()
+{
+    std::map<std::string,size_t> costs = operationCosts();
+
+    dict d;
+    for (std::map<std::string,size_t>::const_iterator it = costs.begin(); it != costs.end(); ++it)
+        d[it->first] = it->second;
+    return d;
+}
+
+void
+register_ThreadPool()
+{
+    def("setNumThreads", &setNumThreads, args("numThreads"),
+        "setNumThreads(n) -- use a pool of n threads to evaluate "
+        "operations on arrays.  A value of 0 or 1 disables threading.");
+
+    def("numThreads", &numThreads,
+        "numThreads() -- return the number of threads used to evaluate "
+        "operations on arrays");
+
+    def("setParallelThreshold", &setParallelThreshold_, args("threshold"),
+        "setParallelThreshold(n) -- evaluate an operation on an array in "
+        "parallel when the array length times the cost of the operation "
+        "exceeds n");
+
+    def("parallelThreshold", &parallelThreshold,
+        "parallelThreshold() -- return the threshold above which operations "
+        "on arrays are evaluated in parallel");
+
+    def("calibrateParallelThreshold", &calibrateParallelThreshold_,
+        "calibrateParallelThreshold() -- measure the overhead of a parallel "
+        "evaluation on the current thread pool, set the parallel threshold "
+        "accordingly and return it.  This is done automatically by setNumThreads()");
+
+    def("setOperationCost", &setOperationCost_, args("name", "cost"),
+        "setOperationCost(name, cost) -- set the cost of the named vectorized "
+        "operation, relative to an addition, e.g. setOperationCost('sin', 20) "
+        "or setOperationCost('V3fArray.normalize', 8)");
+
+    def("operationCost", &operationCost_, args("name"),
+        "operationCost(name) -- return the cost of the named vectorized "
+        "operation, relative to an addition");
+
+    def("operationCosts", &operationCosts_,
+        "operationCosts() -- return a dict of the costs of all vectorized "
+        "operations");
+
+    //
+    // PYIMATH_NUM_THREADS enables threading when the module is imported
+    //
+    if (const char *env = getenv ("PYIMATH_NUM_THREADS"))
+    {
+        int n = atoi (env);
+        if (n > 1)
+            setNumThreads (n);
+    }
+}
+
+}
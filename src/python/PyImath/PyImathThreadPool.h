@@ -0,0 +1,86 @@
+//
+// SPDX-License-Identifier: BSD-3-Clause
+// Copyright Contributors to the OpenEXR Project.
+//
+
+// clang-format off
+
+#ifndef _PyImathThreadPool_h_
+#define _PyImathThreadPool_h_
+
+#include <cstddef>
+#include <vector>
+#include <deque>
+#include <thread>
+#include <mutex>
+#include <condition_variable>
+#include "PyImathExport.h"
+#include "PyImathTask.h"
+
+namespace PyImath {
+
+//
+// ThreadPool is a std::thread-based implementation of the WorkerPool
+// interface.  A pool with N workers owns N-1 threads; the thread that
+// calls dispatch() participates in the work as worker 0, so the
+// thread id passed to Task::execute is always in [0, workers()).
+//
+// dispatch() splits the iteration range into chunks which are handed
+// out to whichever thread is free.  Several threads may call dispatch()
+// concurrently, each call blocks until its own task has completed.
+// An exception thrown by Task::execute is re-thrown from dispatch().
+//
+// The python global lock is released for the duration of dispatch().
+//
+
+class ThreadPool : public WorkerPool
+{
+  public:
+
+    PYIMATH_EXPORT explicit ThreadPool (size_t numWorkers);
+    PYIMATH_EXPORT ~ThreadPool();
+
+    ThreadPool (const ThreadPool &) = delete;
+    ThreadPool & operator = (const ThreadPool &) = delete;
+
+    PYIMATH_EXPORT size_t workers() const override;
+    PYIMATH_EXPORT void   dispatch (Task &task, size_t length) override;
+    PYIMATH_EXPORT bool   inWorkerThread() const override;
+
+    //
+    // Change the number of workers, waiting for any dispatched tasks
+    // to finish before the threads are restarted.
+    //
+    PYIMATH_EXPORT void   setWorkers (size_t numWorkers);
+
+    //
+    // Set the current pool to a shared ThreadPool with the given
+    // number of workers.  A value of 0 or 1 disables threading.
+    //
+    PYIMATH_EXPORT static void   setNumThreads (size_t numThreads);
+    PYIMATH_EXPORT static size_t numThreads();
+
+  private:
+
+    struct Job;
+
+    void start (size_t numWorkers);
+    void stop ();
+    void workerLoop (int tid);
+    bool runChunk (Job &job, int tid);
+
+    std::vector<std::thread>  _threads;
+    std::deque<Job *>         _jobs;
+    mutable std::mutex        _mutex;
+    std::condition_variable   _wakeup;
+    std::condition_variable   _idle;
+    size_t                    _numWorkers;
+    size_t                    _activeDispatches;
+    bool                      _stopping;
+};
+
+PYIMATH_EXPORT void register_ThreadPool();
+
+}
+
+#endif
@@ -28,6 +28,7 @@
 #include "PyImathVec.h"
 #include "PyImathDecorators.h"
 #include "PyImathOperators.h"
+#include "PyImathSort.h"
 #include "PyImathVecOperators.h"
 
 namespace PyImath {
@@ -1101,47 +1102,35 @@ template <class T>
 static IMATH_NAMESPACE::Vec2<T>
 Vec2Array_min(const FixedArray<IMATH_NAMESPACE::Vec2<T> > &a)
 {
-    Vec2<T> tmp(Vec2<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x < tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y < tmp.y)
-            tmp.y = a[i].y;
-    }
-    return tmp;
+    return fa_component_min(a);
 }
 
 template <class T>
 static IMATH_NAMESPACE::Vec2<T>
 Vec2Array_max(const FixedArray<IMATH_NAMESPACE::Vec2<T> > &a)
 {
-    Vec2<T> tmp(Vec2<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x > tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y > tmp.y)
-            tmp.y = a[i].y;
-    }
-    return tmp;
+    return fa_component_max(a);
 }
 
 template <class T>
 static IMATH_NAMESPACE::Box<IMATH_NAMESPACE::Vec2<T> >
 Vec2Array_bounds(const FixedArray<IMATH_NAMESPACE::Vec2<T> > &a)
 {
-    Box<Vec2<T> > tmp;
+    PY_IMATH_LEAVE_PYTHON;
+    typedef Box<Vec2<T> > B;
     size_t len = a.len();
-    for (size_t i=0; i < len; ++i)
-        tmp.extendBy(a[i]);
-    return tmp;
+    if (len == 0)
+        return B();
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<B>(len, 2,
+            [&] (size_t start, size_t end) {
+                B tmp;
+                for (size_t i=start; i < end; ++i)
+                    tmp.extendBy(access[i]);
+                return tmp;
+            },
+            [] (B &tmp, const B &other) { tmp.extendBy(other); });
+    });
 }
 
 
@@ -1149,6 +1138,7 @@ Vec2Array_bounds(const FixedArray<IMATH_NAMESPACE::Vec2<T> > &a)
 template <class T, IMATH_ENABLE_IF(!std::is_integral<T>::value)>
 void register_Vec2Array_floatonly(class_<FixedArray<Vec2<T>>>& vec2Array_class)
 {
+    vec2Array_class.def("mean", &fa_mean<IMATH_NAMESPACE::Vec2<T>,T>, "mean() - the mean of the vectors");
     generate_member_bindings<op_vecLength<IMATH_NAMESPACE::Vec2<T> >     >(vec2Array_class,"length","");
     generate_member_bindings<op_vecNormalize<IMATH_NAMESPACE::Vec2<T> >  >(vec2Array_class,"normalize","");
     generate_member_bindings<op_vecNormalized<IMATH_NAMESPACE::Vec2<T> > >(vec2Array_class,"normalized","");
@@ -1183,6 +1173,7 @@ register_Vec2Array()
 
     add_arithmetic_math_functions(vec2Array_class);
     add_comparison_functions(vec2Array_class);
+    add_vector_sort_functions(vec2Array_class);
 
     register_Vec2Array_floatonly(vec2Array_class);
     generate_member_bindings<op_vecLength2<IMATH_NAMESPACE::Vec2<T> >    >(vec2Array_class,"length2","");
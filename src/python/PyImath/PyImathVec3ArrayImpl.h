@@ -27,7 +27,9 @@
 #include "PyImathDecorators.h"
 #include "PyImathMathExc.h"
 #include "PyImathOperators.h"
+#include "PyImathSort.h"
 #include "PyImathVecOperators.h"
+#include "PyImathSimd.h"
 
 namespace PyImath {
 using namespace boost::python;
@@ -64,51 +66,35 @@ template <class T>
 static IMATH_NAMESPACE::Vec3<T>
 Vec3Array_min(const FixedArray<IMATH_NAMESPACE::Vec3<T> > &a)
 {
-    Vec3<T> tmp(Vec3<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x < tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y < tmp.y)
-            tmp.y = a[i].y;
-        if (a[i].z < tmp.z)
-            tmp.z = a[i].z;
-    }
-    return tmp;
+    return fa_component_min(a);
 }
 
 template <class T>
 static IMATH_NAMESPACE::Vec3<T>
 Vec3Array_max(const FixedArray<IMATH_NAMESPACE::Vec3<T> > &a)
 {
-    Vec3<T> tmp(Vec3<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x > tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y > tmp.y)
-            tmp.y = a[i].y;
-        if (a[i].z > tmp.z)
-            tmp.z = a[i].z;
-    }
-    return tmp;
+    return fa_component_max(a);
 }
 
 template <class T>
 static IMATH_NAMESPACE::Box<IMATH_NAMESPACE::Vec3<T> >
 Vec3Array_bounds(const FixedArray<IMATH_NAMESPACE::Vec3<T> > &a)
 {
-    Box<Vec3<T> > tmp;
+    PY_IMATH_LEAVE_PYTHON;
+    typedef Box<Vec3<T> > B;
     size_t len = a.len();
-    for (size_t i=0; i < len; ++i)
-        tmp.extendBy(a[i]);
-    return tmp;
+    if (len == 0)
+        return B();
+    return withReadAccess(a, [&] (const auto &access) {
+        return parallelReduce<B>(len, 3,
+            [&] (size_t start, size_t end) {
+                B tmp;
+                for (size_t i=start; i < end; ++i)
+                    tmp.extendBy(access[i]);
+                return tmp;
+            },
+            [] (B &tmp, const B &other) { tmp.extendBy(other); });
+    });
 }
 
 
@@ -116,6 +102,7 @@ Vec3Array_bounds(const FixedArray<IMATH_NAMESPACE::Vec3<T> > &a)
 template <class T, IMATH_ENABLE_IF(!std::is_integral<T>::value)>
 void register_Vec3Array_floatonly(class_<FixedArray<Vec3<T>>>& vec3Array_class)
 {
+    vec3Array_class.def("mean", &fa_mean<IMATH_NAMESPACE::Vec3<T>,T>, "mean() - the mean of the vectors");
     generate_member_bindings<op_vecLength<IMATH_NAMESPACE::Vec3<T> >     >(vec3Array_class,"length","");
     generate_member_bindings<op_vecNormalize<IMATH_NAMESPACE::Vec3<T> >  >(vec3Array_class,"normalize","");
     generate_member_bindings<op_vecNormalized<IMATH_NAMESPACE::Vec3<T> > >(vec3Array_class,"normalized","");
@@ -150,6 +137,7 @@ register_Vec3Array()
 
     add_arithmetic_math_functions(vec3Array_class);
     add_comparison_functions(vec3Array_class);
+    add_vector_sort_functions(vec3Array_class);
 
     register_Vec3Array_floatonly(vec3Array_class);
     generate_member_bindings<op_vecLength2<IMATH_NAMESPACE::Vec3<T> >    >(vec3Array_class,"length2","");
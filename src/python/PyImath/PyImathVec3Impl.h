@@ -327,6 +327,7 @@ static FixedArray<IMATH_NAMESPACE::Vec3<T> >
 Vec3_mulTArray (const Vec3<T> &v, const FixedArray<T> &t)
 {
     MATH_EXC_ON;
+    PY_IMATH_LEAVE_PYTHON;
     size_t len = t.len();
     FixedArray<IMATH_NAMESPACE::Vec3<T> > retval(len);
     for (size_t i=0; i<len; ++i) retval[i] = v*t[i];
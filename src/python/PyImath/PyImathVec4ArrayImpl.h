@@ -26,6 +26,7 @@
 #include "PyImathDecorators.h"
 #include "PyImathMathExc.h"
 #include "PyImathOperators.h"
+#include "PyImathSort.h"
 #include "PyImathVecOperators.h"
 
 namespace PyImath {
@@ -63,45 +64,16 @@ setItemTuple(FixedArray<IMATH_NAMESPACE::Vec4<T> > &va, Py_ssize_t index, const
 
 template <class T>
 static IMATH_NAMESPACE::Vec4<T>
-Vec4Array_min(const FixedArray<IMATH_NAMESPACE::Vec4<T> > &a) {
-    Vec4<T> tmp(Vec4<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x < tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y < tmp.y)
-            tmp.y = a[i].y;
-        if (a[i].z < tmp.z)
-            tmp.z = a[i].z;
-        if (a[i].w < tmp.w)
-            tmp.w = a[i].w;
-    }
-    return tmp;
+Vec4Array_min(const FixedArray<IMATH_NAMESPACE::Vec4<T> > &a)
+{
+    return fa_component_min(a);
 }
 
 template <class T>
 static IMATH_NAMESPACE::Vec4<T>
 Vec4Array_max(const FixedArray<IMATH_NAMESPACE::Vec4<T> > &a)
 {
-    Vec4<T> tmp(Vec4<T>(0));
-    size_t len = a.len();
-    if (len > 0)
-        tmp = a[0];
-    for (size_t i=1; i < len; ++i)
-    {
-        if (a[i].x > tmp.x)
-            tmp.x = a[i].x;
-        if (a[i].y > tmp.y)
-            tmp.y = a[i].y;
-        if (a[i].z > tmp.z)
-            tmp.z = a[i].z;
-        if (a[i].w > tmp.w)
-            tmp.w = a[i].w;
-    }
-    return tmp;
+    return fa_component_max(a);
 }
 
 
@@ -109,6 +81,7 @@ Vec4Array_max(const FixedArray<IMATH_NAMESPACE::Vec4<T> > &a)
 template <class T, IMATH_ENABLE_IF(!std::is_integral<T>::value)>
 void register_Vec4Array_floatonly(class_<FixedArray<Vec4<T>>>& vec4Array_class)
 {
+    vec4Array_class.def("mean", &fa_mean<IMATH_NAMESPACE::Vec4<T>,T>, "mean() - the mean of the vectors");
     generate_member_bindings<op_vecLength<IMATH_NAMESPACE::Vec4<T> >     >(vec4Array_class,"length","");
     generate_member_bindings<op_vecNormalize<IMATH_NAMESPACE::Vec4<T> >  >(vec4Array_class,"normalize","");
     generate_member_bindings<op_vecNormalized<IMATH_NAMESPACE::Vec4<T> > >(vec4Array_class,"normalized","");
@@ -142,6 +115,7 @@ register_Vec4Array()
 
     add_arithmetic_math_functions(vec4Array_class);
     add_comparison_functions(vec4Array_class);
+    add_vector_sort_functions(vec4Array_class);
 
     register_Vec4Array_floatonly(vec4Array_class);
     generate_member_bindings<op_vecLength2<IMATH_NAMESPACE::Vec4<T> >    >(vec4Array_class,"length2","");
@@ -8,6 +8,8 @@
 #ifndef _PyImathVecOperators_h_
 #define _PyImathVecOperators_h_
 
+#include "PyImathTask.h"
+
 namespace PyImath {
 
 template <class T>
@@ -17,7 +19,8 @@ struct op_vecDot {
 
 template <class T,
           IMATH_ENABLE_IF(!std::is_integral<typename T::BaseType>::value)>
-struct op_vecLength {
+struct op_vecLength : public op_with_cost {
+    static const size_t cost = 8;
     static inline typename T::BaseType apply(const T &v) { return v.length(); }
 };
 
@@ -28,25 +31,29 @@ struct op_vecLength2 {
 
 template <class T,
           IMATH_ENABLE_IF(!std::is_integral<typename T::BaseType>::value)>
-struct op_vecNormalize {
+struct op_vecNormalize : public op_with_cost {
+    static const size_t cost = 8;
     static inline void apply(T &v) { v.normalize(); }
 };
 
 template <class T,
           IMATH_ENABLE_IF(!std::is_integral<typename T::BaseType>::value)>
-struct op_vecNormalized {
+struct op_vecNormalized : public op_with_cost {
+    static const size_t cost = 8;
     static inline T apply(const T &v) { return v.normalized(); }
 };
 
 template <class T,
           IMATH_ENABLE_IF(!std::is_integral<typename T::BaseType>::value)>
-struct op_vecNormalizeExc {
+struct op_vecNormalizeExc : public op_with_cost {
+    static const size_t cost = 8;
     static inline void apply(T &v) { v.normalizeExc(); }
 };
 
 template <class T,
           IMATH_ENABLE_IF(!std::is_integral<typename T::BaseType>::value)>
-struct op_vecNormalizedExc {
+struct op_vecNormalizedExc : public op_with_cost {
+    static const size_t cost = 8;
     static inline T apply(const T &v) { return v.normalizedExc(); }
 };
   
@@ -24,6 +24,7 @@
 #include "PyImathMatrix.h"
 #include "PyImathBox.h"
 #include "PyImathFun.h"
+#include "PyImathHalf.h"
 #include "PyImathQuat.h"
 #include "PyImathEuler.h"
 #include "PyImathColor.h"
@@ -36,6 +37,11 @@
 #include "PyImathAutovectorize.h"
 #include "PyImathStringArrayRegister.h"
 #include "PyImathBufferProtocol.h"
+#include "PyImathThreadPool.h"
+#include "PyImathLazyArray.h"
+#include "PyImathSimd.h"
+#include "PyImathSoAArray.h"
+#include "PyImathReduce.h"
 
 using namespace boost::python;
 using namespace PyImath;
@@ -46,6 +52,7 @@ template <typename T>
 IMATH_NAMESPACE::Box<IMATH_NAMESPACE::Vec3<T> >
 computeBoundingBox(const FixedArray<IMATH_NAMESPACE::Vec3<T> >& position)
 {
+    PY_IMATH_LEAVE_PYTHON;
     IMATH_NAMESPACE::Box<IMATH_NAMESPACE::Vec3<T> > bounds;
     int len = position.len();
     for (int i = 0; i < len; ++i)
@@ -523,6 +530,13 @@ BOOST_PYTHON_MODULE(imath)
     class_<FixedArray<IMATH_NAMESPACE::Color4f> > c4f_class = register_Color4Array<float>();
     class_<FixedArray<IMATH_NAMESPACE::Color4c> > c4c_class = register_Color4Array<unsigned char>();
 
+    //
+    // Half precision arrays
+    //
+    register_Half();
+    add_explicit_construction_from_type<IMATH_NAMESPACE::Vec3<half> >(v3f_class);
+    add_explicit_construction_from_type<IMATH_NAMESPACE::Color4<half> >(c4f_class);
+
     //
     // Color4Array
     //
@@ -593,6 +607,28 @@ BOOST_PYTHON_MODULE(imath)
     //
     register_Rand32();
     register_Rand48();
+    register_Rand64();
+
+    //
+    // Threading
+    //
+    register_ThreadPool();
+    register_Reduce();
+
+    //
+    // Deferred array expressions
+    //
+    register_LazyArrays();
+
+    //
+    // Vectorized kernels
+    //
+    register_Simd();
+
+    //
+    // Structure-of-arrays vector arrays
+    //
+    register_SoAArrays();
     
     //
     // Initialize constants
@@ -10,6 +10,7 @@
 #include <PyImath.h>
 #include <PyImathVec.h>
 #include <PyImathColor.h>
+#include <PyImathHalf.h>
 #include <iostream>
 #include <boost/format.hpp>
 #define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
@@ -50,6 +51,7 @@ template <> struct NumpyTypeFromType<int>            { BOOST_STATIC_CONSTANT(int
 template <> struct NumpyTypeFromType<unsigned int>   { BOOST_STATIC_CONSTANT(int, typeEnum=NPY_UINT32); };
 template <> struct NumpyTypeFromType<float>          { BOOST_STATIC_CONSTANT(int, typeEnum=NPY_FLOAT);  };
 template <> struct NumpyTypeFromType<double>         { BOOST_STATIC_CONSTANT(int, typeEnum=NPY_DOUBLE); };
+template <> struct NumpyTypeFromType<half>           { BOOST_STATIC_CONSTANT(int, typeEnum=NPY_HALF);   };
 
 template <typename T> struct BaseTypeFrom2DArray       { typedef void type; };
 template <> struct BaseTypeFrom2DArray<IntArray2D>     { typedef int type; };
@@ -222,6 +224,7 @@ BOOST_PYTHON_MODULE(imathnumpy)
     WRAP_SCALAR_ARRAY(UnsignedIntArray)
     WRAP_SCALAR_ARRAY(FloatArray)
     WRAP_SCALAR_ARRAY(DoubleArray)
+    WRAP_SCALAR_ARRAY(HalfArray)
 
     WRAP_VECTOR_ARRAY(V2sArray)
     WRAP_VECTOR_ARRAY(V2iArray)
@@ -232,6 +235,7 @@ BOOST_PYTHON_MODULE(imathnumpy)
     WRAP_VECTOR_ARRAY(V3iArray)
     WRAP_VECTOR_ARRAY(V3fArray)
     WRAP_VECTOR_ARRAY(V3dArray)
+    WRAP_VECTOR_ARRAY(V3hArray)
 
     WRAP_VECTOR_ARRAY(V4sArray)
     WRAP_VECTOR_ARRAY(V4iArray)
@@ -242,6 +246,7 @@ BOOST_PYTHON_MODULE(imathnumpy)
     WRAP_VECTOR_ARRAY(C3fArray)
     WRAP_VECTOR_ARRAY(C4cArray)
     WRAP_VECTOR_ARRAY(C4fArray)
+    WRAP_VECTOR_ARRAY(C4hArray)
 
     WRAP_SCALAR_ARRAY_2D(IntArray2D)
     WRAP_SCALAR_ARRAY_2D(FloatArray2D)
@@ -26,6 +26,7 @@ def numpyType(ia):
         UnsignedIntArray :   np.uint32,
         FloatArray :         np.float32,
         DoubleArray :        np.float64,
+        HalfArray :          np.float16,
         V2sArray :           np.int16,
         V2iArray :           np.int32,
         V2fArray :           np.float32,
@@ -61,6 +62,7 @@ def baseTypeSize(ia):
         UnsignedIntArray :   1,
         FloatArray :         1,
         DoubleArray :        1,
+        HalfArray :          1,
         V2sArray :           2,
         V2iArray :           2,
         V2fArray :           2,
@@ -101,7 +103,8 @@ def testScalarArrayToNumpy():
         IntArray,
         UnsignedIntArray,
         FloatArray,
-        DoubleArray]
+        DoubleArray,
+        HalfArray]
 
     for arrayType in arrayTestTypes:
         print("\nTesting: %s conversion to numpy" % arrayType.__name__)
@@ -429,6 +432,89 @@ def testBufferProtocol():
 
 testList.append (testBufferProtocol)
 
+###############################################################################
+
+def testNumpyArguments():
+    '''
+    Tests passing numpy arrays directly to functions taking PyImath arrays.
+    '''
+    points = np.arange (30, dtype=np.float32).reshape (10, 3)
+    m = M44f().translate (V3f (1,2,3))
+
+    result = m.multVecMatrix (points)
+    for i in range(10):
+        assert (result[i] == V3f (3*i+1, 3*i+3, 3*i+5))
+
+    # strided input
+    result = m.multVecMatrix (points[::3])
+    assert (len(result) == 4)
+    assert (result[1] == V3f (10,12,14))
+
+    # output written in place into a numpy array
+    out = np.zeros ((10, 3), dtype=np.float32)
+    m.multVecMatrix (points, out)
+    assert ((out == points + np.array ([1,2,3], dtype=np.float32)).all())
+
+    box = Box3f()
+    box.extendBy (points)
+    assert (box == Box3f (V3f (0,1,2), V3f (27,28,29)))
+
+    values = np.linspace (0.0, 1.0, 5)
+    assert (abs (sin (values)[4] - np.sin (1.0)) < 1e-12)
+
+    # mismatched element types are rejected
+    try:
+        V3fArray.normalized (points.astype (np.float64))
+    except TypeError:
+        pass
+    else:
+        assert (False)
+
+testList.append (testNumpyArguments)
+
+###############################################################################
+
+def testHalfArrays():
+    '''
+    Tests exchanging half arrays with numpy float16 arrays.
+    '''
+    values = np.linspace (-2.0, 2.0, 41).astype (np.float16)
+
+    h = HalfArray (values)
+    assert (len(h) == 41)
+    assert (all (h[i] == float (values[i]) for i in range(41)))
+
+    hNP = np.asarray (h)
+    assert (hNP.dtype == np.float16)
+    assert ((hNP == values).all())
+
+    wrapped = imathnumpy.arrayToNumpy (h)
+    assert (wrapped.dtype == np.float16 and wrapped.shape == (41,))
+
+    # the view shares the memory of the numpy array
+    view = HalfArray.view (values)
+    view[0] = 0.5
+    assert (values[0] == np.float16 (0.5))
+
+    points = np.arange (30, dtype=np.float16).reshape (10, 3)
+    v = V3hArray (points)
+    assert (v[4] == V3f (12, 13, 14))
+    vNP = np.asarray (v)
+    assert (vNP.dtype == np.float16 and vNP.shape == (10, 3))
+    assert ((vNP == points).all())
+    assert (imathnumpy.arrayToNumpy (v).shape == (10, 3))
+
+    colors = np.ones ((5, 4), dtype=np.float16)
+    c = C4hArray (colors)
+    assert (c[2] == Color4f (1, 1, 1, 1))
+    assert (imathnumpy.arrayToNumpy (c).shape == (5, 4))
+
+    # float32 data converts to half with the same rounding as numpy
+    f = np.linspace (-1000.0, 1000.0, 10001).astype (np.float32)
+    assert ((np.asarray (HalfArray (FloatArray (f))) == f.astype (np.float16)).all())
+
+testList.append (testHalfArrays)
+
 # -------------------------------------------------------------------------
 # Main loop
 
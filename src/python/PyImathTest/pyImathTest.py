@@ -32,7 +32,11 @@ from imath import *
 from math import sqrt, pi, sin, cos
 import math
 import string, traceback
+import array
+import struct
 import random
+import threading
+import tempfile
 
 testList = []
 
@@ -93,6 +97,26 @@ def make_range(start, end):
 
     return retval
 
+# Returns compute() evaluated with the given number of worker threads.
+# With more than one thread the parallel threshold is 0, so every
+# operation is dispatched to the workers.  The previous thread count
+# and threshold are restored even if compute() raises.
+def runWithThreads(threads, compute):
+    previousThreads = numThreads()
+    previousThreshold = parallelThreshold()
+    setNumThreads(threads)
+    if threads > 1:
+        setParallelThreshold(0)
+    try:
+        return compute()
+    finally:
+        setNumThreads(previousThreads)
+        setParallelThreshold(previousThreshold)
+
+# Returns the results of compute() run serially and run in parallel.
+def runSerialAndParallel(compute):
+    return runWithThreads(1, compute), runWithThreads(4, compute)
+
 # We want to be able to use the test helper
 # functions generically with different array types
 # so we use hasattr to check if the arguments support
@@ -8698,9 +8722,87 @@ def testRandom ():
     testRandomx (Rand32)
     print ("Rand48")
     testRandomx (Rand48)
+    print ("Rand64")
+    testRandomx (Rand64)
     
 testList.append (('testRandom',testRandom))
 
+def testRand64Arrays ():
+
+    # Skipping ahead is the same as drawing the values.
+
+    r = Rand64(3)
+    s = Rand64(3)
+    values = [r.nexti() for i in range(100)]
+    s.skip(100)
+    assert r.counter() == 100 and s.counter() == 100
+    assert s.nexti() == r.nexti()
+    assert s.valueAt(5) == values[5] and s.counter() == 101
+    s.setCounter(7)
+    assert s.nexti() == values[7]
+
+    # Streams are reproducible, and independent of each other.
+
+    a = Rand64(3).stream(1)
+    b = Rand64(3).stream(1)
+    c = Rand64(3).stream(2)
+    x = [a.nexti() for i in range(10)]
+    assert x == [b.nexti() for i in range(10)]
+    assert x != [c.nexti() for i in range(10)]
+
+    # nextfArray gives the values of successive calls to nextf.
+
+    r = Rand64(5)
+    s = Rand64(5)
+    f = r.nextfArray(1000)
+    assert len(f) == 1000 and r.counter() == 1000
+    for i in range(len(f)):
+        assert f[i] == s.nextf()
+        assert 0 <= f[i] < 1
+    assert r.nexti() == s.nexti()
+
+    f = r.nextfArray(1000, -2.0, 3.0)
+    for i in range(len(f)):
+        assert -2 <= f[i] <= 3
+
+    # The arrays are the same for any number of threads.
+
+    n = 20000
+
+    def arrays (r):
+        return (r.nextfArray(n), r.gaussArray(n), r.solidSphereArray(n),
+                r.hollowSphereArray(n), solidSphereRand(r, n),
+                hollowSphereRand(r, n), r.counter())
+
+    serial, parallel = runSerialAndParallel(lambda: arrays(Rand64(11)))
+
+    assert serial[-1] == parallel[-1] == 6 * n
+    for a, b in zip(serial[:-1], parallel[:-1]):
+        assert len(a) == len(b) == n
+        for i in range(n):
+            assert a[i] == b[i]
+
+    g = serial[1]
+    mean = sum(g[i] for i in range(n)) / n
+    assert abs(mean) < 0.05
+
+    for points in (serial[2], serial[4]):
+        assert max(points[i].length() for i in range(n)) <= 1
+    for points in (serial[3], serial[5]):
+        for i in range(n):
+            assert equalWithAbsError(points[i].length(), 1, 1e-5)
+
+    # Successive arrays come from different parts of the sequence.
+
+    r = Rand64(11)
+    a = r.solidSphereArray(10)
+    b = r.solidSphereArray(10)
+    assert a[0] != b[0]
+
+    print ("ok")
+
+testList.append (('testRand64Arrays',testRand64Arrays))
+
 # -------------------------------------------------------------------------
 # Tests C4xArrays
 def testC4xArray(Array, Color, Arrayx):
@@ -9253,13 +9355,143 @@ def testM4Array(Array, Matrix, Vec, VecArray):
     assert a[1].multVecMatrix(v[1]) == V[1]
     assert a[2].multVecMatrix(v[2]) == V[2]
 
+def testM4ArrayProducts(Array, Matrix, Vec):
+
+    n = 100
+    a = Array(n)
+    b = Array(n)
+    for i in range(n):
+        a[i] = Matrix().rotate(Vec(.01*i, .2, .3)).translate(Vec(i, 1, 2))
+        b[i] = Matrix().scale(Vec(1 + i, 2, 3)).translate(Vec(0, -i, 1))
+    m = Matrix().rotate(Vec(.4, .5, .6)).translate(Vec(3, 2, 1))
+
+    def check():
+        ab = a * b
+        am = a * m
+        ma = m * a
+        for i in range(n):
+            assert ab[i] == a[i] * b[i]
+            assert am[i] == a[i] * m
+            assert ma[i] == m * a[i]
+
+        c = a[:]
+        c *= b
+        d = a[:]
+        d *= m
+        for i in range(n):
+            assert c[i] == ab[i] and d[i] == am[i]
+
+        try:
+            a * Array(n + 1)
+        except:
+            pass
+        else:
+            assert 0
+
+        # A hierarchy whose nodes are not listed in order: each node of the
+        # chain 7 -> 3 -> 5 -> 0 is the parent of the next, and 1, 2, 4 and 6
+        # are children of 3, 5, 0 and 1.
+
+        parents = IntArray(8)
+        for i, p in enumerate((5, 3, 5, 7, 0, 3, 1, -1)):
+            parents[i] = p
+        local = Array(8)
+        for i in range(8):
+            local[i] = Matrix().rotate(Vec(.1*i, .2, -.1*i)).translate(Vec(i, 2*i, 1))
+
+        world = composeHierarchy(local, parents)
+        for i in range(8):
+            expected = local[i]
+            p = parents[i]
+            while p >= 0:
+                expected = expected * local[p]
+                p = parents[p]
+            assert world[i].equalWithAbsError(expected, 1e-4)
+
+        parents[7] = 6
+        try:
+            composeHierarchy(local, parents)
+        except:
+            pass
+        else:
+            assert 0
+
+        parents[7] = 8
+        try:
+            composeHierarchy(local, parents)
+        except:
+            pass
+        else:
+            assert 0
+
+    runWithThreads(4, check)
+
+def testM4ArrayDecomposition(Array, Matrix, Vec, Euler):
+
+    n = 200
+    a = Array(n)
+    for i in range(n):
+        m = Matrix()
+        m.translate (Vec(i, -2*i, 3))
+        m.rotate (Vec(.01*i, .3, -.002*i))
+        m.shear (Vec(.1, .002*i, -.2))
+        m.scale (Vec(1 + .01*i, 2, -.5 if i % 3 == 0 else .5))
+        a[i] = m
+
+    # A zero and a rank-deficient matrix, which cannot be decomposed
+    a[5] = Matrix(0,0,0,0, 0,0,0,0, 0,0,0,0, 1,2,3,1)
+    a[7] = Matrix(1,0,0,0, 0,0,0,0, 0,0,1,0, 0,0,0,1)
+
+    e = 1e-4
+    def check():
+        s, h, r, t, mask = a.extractSHRT()
+        for i in range(n):
+            sInq, hInq, rInq, tInq = Vec(), Vec(), Vec(), Vec()
+            if i == 5 or i == 7:
+                assert mask[i] == 0
+                assert s[i] == Vec(0) and h[i] == Vec(0) and r[i] == Vec(0)
+                assert t[i] == a[i].translation()
+                continue
+            assert mask[i] == 1
+            assert a[i].extractSHRT(sInq, hInq, rInq, tInq) == 1
+            assert s[i].equalWithAbsError(sInq, e)
+            assert h[i].equalWithAbsError(hInq, e)
+            assert r[i].equalWithAbsError(rInq, e)
+            assert t[i] == tInq
+
+        s2, mask2 = a.extractScaling()
+        s3, h3, mask3 = a.extractScalingAndShear()
+        q, mask4 = a.extractQuat()
+        rZYX, mask5 = a.extractEuler(EULER_ZYX)
+        for i in range(n):
+            assert mask2[i] == mask[i] and mask3[i] == mask[i]
+            assert mask4[i] == mask[i] and mask5[i] == mask[i]
+            assert s2[i] == s[i] and s3[i] == s[i] and h3[i] == h[i]
+            rotation = r[i].toMatrix44()
+            assert q[i].toMatrix44().equalWithAbsError(rotation, e)
+            assert rZYX[i].order() == EULER_ZYX
+            assert rZYX[i].toMatrix44().equalWithAbsError(rotation, e)
+
+        try:
+            a.extractEuler(1000)
+        except:
+            pass
+        else:
+            assert 0
+
+    runWithThreads(4, check)
+
 def testMatrixArray ():
     print ("M44fArray")
     testMxArray (M44fArray, M44f)
     testM4Array (M44fArray, M44f, V3f, V3fArray)
+    testM4ArrayProducts (M44fArray, M44f, V3f)
+    testM4ArrayDecomposition (M44fArray, M44f, V3f, Eulerf)
     print ("M44dArray")
     testMxArray (M44dArray, M44d)
     testM4Array (M44dArray, M44d, V3d, V3dArray)
+    testM4ArrayProducts (M44dArray, M44d, V3d)
+    testM4ArrayDecomposition (M44dArray, M44d, V3d, Eulerd)
     print ("M33fArray")
     testMxArray (M33fArray, M33f)
     print ("M33dArray")
@@ -9271,6 +9503,84 @@ def testMatrixArray ():
 
 testList.append(("testMatrixArray",testMatrixArray))
 
+def testMxArrayInversion(Array, Matrix, d):
+
+    # Matrices of random elements, mostly affine, with some of them
+    # singular, some with small determinants, and some projective
+
+    r = Rand32(7)
+    n = 103
+    a = Array(n)
+    for i in range(n):
+        m = Matrix()
+        for j in range(d):
+            for k in range(d - 1):
+                m[j][k] = r.nextf(-2, 2)
+        if i % 7 == 2:
+            for j in range(d - 1):
+                for k in range(d - 1):
+                    m[j][k] *= 0.01
+        if i % 11 == 3:
+            m[0][d-1] = 0.5
+        if i % 5 == 1:
+            for k in range(d):
+                m[1][k] = 0
+        a[i] = m
+
+    def check():
+        for method in ("affine", "gj"):
+            mask = IntArray(n)
+            inverses = []
+            for simd in (True, False):
+                imath.setSimdEnabled(simd)
+                inverses.append(a.inverse(singularMask=mask, method=method))
+                for i in range(n):
+                    if i % 5 == 1:
+                        assert mask[i] == 1 and inverses[-1][i] == Matrix()
+                    else:
+                        expected = a[i].gjInverse() if method == "gj" else a[i].inverse()
+                        assert mask[i] == 0 and inverses[-1][i] == expected
+            imath.setSimdEnabled(True)
+            for i in range(n):
+                assert inverses[0][i] == inverses[1][i]
+
+            out = Array(n)
+            assert a.inverse(out=out, method=method) is out
+            b = a[:]
+            b.invert(singularMask=mask, method=method)
+            for i in range(n):
+                assert out[i] == inverses[0][i] and b[i] == inverses[0][i]
+                assert mask[i] == (i % 5 == 1)
+
+        # The result may be written over the matrices
+        c = a.inverse()
+        b = a[:]
+        b.inverse(out=b)
+        for i in range(n):
+            assert b[i] == c[i]
+
+        for bad in (lambda: a.inverse(method="lu"),
+                    lambda: a.inverse(out=Array(n + 1)),
+                    lambda: a.inverse(singularMask=IntArray(n - 1)),
+                    lambda: a.invert(singularMask=IntArray(n + 1))):
+            try:
+                bad()
+            except:
+                pass
+            else:
+                assert 0
+
+    runWithThreads(4, check)
+
+def testMatrixArrayInversion ():
+    testMxArrayInversion (M44fArray, M44f, 4)
+    testMxArrayInversion (M44dArray, M44d, 4)
+    testMxArrayInversion (M33fArray, M33f, 3)
+    testMxArrayInversion (M33dArray, M33d, 3)
+    print ("ok")
+
+testList.append(("testMatrixArrayInversion",testMatrixArrayInversion))
+
 # -------------------------------------------------------------------------
 # Tests BoxxArrays
 def testBoxxArray(Array, Box, Vec):
@@ -10645,6 +10955,129 @@ def testQuatArrays():
 testList.append(("testQuatArrays", testQuatArrays))
 
 
+def testResampleKeys():
+
+    keyTimes = FloatArray(4)
+    keys = QuatfArray(4)
+    tran = V3fArray(4)
+    for i in range(4):
+        keyTimes[i] = [0.0, 1.0, 1.5, 3.0][i]
+        keys[i].setAxisAngle (V3f (1, i, 2), 0.7 * i)
+        tran[i] = V3f (i, 2 * i, -i)
+
+    sampleTimes = FloatArray(13)
+    for i in range(13):
+        sampleTimes[i] = -0.5 + 0.3 * i
+    sampleTimes[5] = 1.0
+
+    def check():
+        q = resampleKeys (keyTimes, keys, sampleTimes, "slerp")
+        qs = resampleKeys (keyTimes, keys, sampleTimes)
+        v = resampleKeys (keyTimes, tran, sampleTimes)
+        vs = resampleKeys (keyTimes, tran, sampleTimes, "spline")
+        assert len(q) == len(qs) == len(v) == len(vs) == 13
+
+        for i in range(13):
+            s = sampleTimes[i]
+            if s <= 0:
+                assert q[i] == keys[0] and qs[i] == keys[0]
+                assert v[i] == tran[0] and vs[i] == tran[0]
+                continue
+            if s >= 3:
+                assert q[i] == keys[3] and qs[i] == keys[3]
+                assert v[i] == tran[3] and vs[i] == tran[3]
+                continue
+            k = 0 if s < 1 else 1 if s < 1.5 else 2
+            t = (s - keyTimes[k]) / (keyTimes[k+1] - keyTimes[k])
+            if t == 0:
+                assert q[i] == keys[k] and qs[i] == keys[k] and vs[i] == tran[k]
+            assert equalWithAbsError (qs[i].length(), 1, 1e-5)
+            r = keys[k].slerpShortestArc (keys[k+1], t)
+            assert equalWithAbsError (q[i].r(), r.r(), 1e-5) and q[i].v().equalWithAbsError (r.v(), 1e-5)
+            assert v[i].equalWithAbsError (tran[k] * (1 - t) + tran[k+1] * t, 1e-5)
+
+        # The keys are evenly spaced along a line, so away from the
+        # ends the Catmull-Rom spline is linear in the key index.
+        assert vs[5].equalWithAbsError (V3f (1, 2, -1), 1e-5)
+        assert vs[6].equalWithAbsError (V3f (1.6, 3.2, -1.6), 1e-5)
+
+    for threads in (1, 4):
+        runWithThreads (threads, check)
+
+    for bad in ((keyTimes, keys[:3], sampleTimes),
+                (FloatArray(0), QuatfArray(0), sampleTimes),
+                (keyTimes, keys, sampleTimes, "cubic"),
+                (keyTimes, tran, sampleTimes, "slerp")):
+        try:
+            resampleKeys (*bad)
+        except ValueError:
+            pass
+        else:
+            assert False
+
+    keyTimes[2] = 0.5
+    try:
+        resampleKeys (keyTimes, keys, sampleTimes)
+    except ValueError:
+        pass
+    else:
+        assert False
+
+    print ("ok")
+
+testList.append(("testResampleKeys", testResampleKeys))
+
+
+def testRotationArrayConversionsx (Vec, Euler, Quat, M33, M44, EulerArray, QuatArray, M33Array, M44Array):
+
+    n = 7
+    e = EulerArray(n)
+    for i in range(n):
+        e[i] = Euler (Vec (0.3 * i - 1, 0.5 - 0.2 * i, 0.1 * i * i),
+                      [EULER_XYZ, EULER_ZYX, EULER_YZX][i % 3])
+
+    q = e.toQuat()
+    m3 = e.toMatrix33()
+    m4 = e.toMatrix44()
+    for i in range(n):
+        assert q[i] == e[i].toQuat()
+        assert m3[i] == e[i].toMatrix33()
+        assert m4[i] == e[i].toMatrix44()
+
+    qm3 = q.toMatrix33()
+    qm4 = q.toMatrix44()
+    q3 = QuatArray (m3)
+    q4 = QuatArray (m4)
+    for i in range(n):
+        assert qm3[i] == q[i].toMatrix33()
+        assert qm4[i] == q[i].toMatrix44()
+        assert q3[i] == Quat (m3[i])
+        assert q4[i] == Quat (m4[i])
+
+    for order in (EULER_XYZ, EULER_XZY, EULER_YZX, EULER_YXZ, EULER_ZXY, EULER_ZYX):
+        e3 = EulerArray (m3, order)
+        e4 = EulerArray (m4, order)
+        eq = EulerArray (q, order)
+        for i in range(n):
+            assert e3[i] == Euler (m3[i], order) and e3[i].order() == order
+            assert e4[i] == Euler (m4[i], order) and e4[i].order() == order
+            assert eq[i] == Euler (q[i], order) and eq[i].order() == order
+            assert e4[i].toMatrix44().equalWithAbsError (m4[i], 1e-5)
+
+def testRotationArrayConversions():
+
+    def check():
+        testRotationArrayConversionsx (V3f, Eulerf, Quatf, M33f, M44f, EulerfArray, QuatfArray, M33fArray, M44fArray)
+        testRotationArrayConversionsx (V3d, Eulerd, Quatd, M33d, M44d, EulerdArray, QuatdArray, M33dArray, M44dArray)
+
+    for threads in (1, 4):
+        runWithThreads (threads, check)
+
+    print ("ok")
+
+testList.append(("testRotationArrayConversions", testRotationArrayConversions))
+
+
 def testBufferProtocol():
     '''
     The buffer protocol can be used to exchange array data between python modules.
@@ -10799,6 +11232,1074 @@ def testColor4Array2D():
 
 testList.append(("Color4fArray2D test", testColor4Array2D))
 
+def testThreadPool():
+
+    assert numThreads() == 1
+
+    n = 100000
+    a = V3fArray(n)
+    for i in range(0, n, 997):
+        a[i] = V3f(i, 2*i+1, 3*i+2)
+
+    m = M44f().translate(V3f(1,2,3)).scale(V3f(2,2,2))
+    b = FloatArray(n)
+    for i in range(0, n, 991):
+        b[i] = i * 0.001
+
+    serialNormalized = a.normalized()
+    serialTransformed = m.multVecMatrix(a)
+    serialLerp = lerp(b, 1.0, 0.25)
+    serialBounds = Box3f()
+    serialBounds.extendBy(a)
+
+    setNumThreads(4)
+    assert numThreads() == 4
+
+    assert (serialNormalized != a.normalized()).reduce() == 0
+    assert (serialTransformed != m.multVecMatrix(a)).reduce() == 0
+    assert (serialLerp != lerp(b, 1.0, 0.25)).reduce() == 0
+    bounds = Box3f()
+    bounds.extendBy(a)
+    assert bounds == serialBounds
+
+    # errors raised on a worker thread propagate to the caller
+    try:
+        a.normalizedExc()
+    except:
+        pass
+    else:
+        assert 0
+
+    setNumThreads(0)
+    assert numThreads() == 1
+    assert (serialNormalized != a.normalized()).reduce() == 0
+
+    print ("ok")
+
+testList.append(("testThreadPool", testThreadPool))
+
+def testParallelThreshold():
+
+    threshold = parallelThreshold()
+
+    assert operationCost("sin") == 20
+    assert operationCost("V3fArray.normalize") == 8
+    assert operationCosts()["sin"] == 20
+
+    setOperationCost("sin", 5)
+    assert operationCost("sin") == 5
+    setOperationCost("sin", 20)
+
+    for f in (lambda: operationCost("noSuchOperation"),
+              lambda: setOperationCost("noSuchOperation", 1)):
+        try:
+            f()
+        except KeyError:
+            pass
+        else:
+            assert 0
+
+    # results are the same whether or not the operation goes parallel
+    n = 20000
+    a = V3fArray(n)
+    for i in range(0, n, 97):
+        a[i] = V3f(i, 2*i+1, 3*i+2)
+    serialNormalized = a.normalized()
+
+    setNumThreads(4)
+    assert 1000 <= parallelThreshold() <= 10000000
+    setParallelThreshold(0)
+    assert parallelThreshold() == 0
+    assert (serialNormalized != a.normalized()).reduce() == 0
+
+    setNumThreads(0)
+    setParallelThreshold(threshold)
+    assert parallelThreshold() == threshold
+
+    print ("ok")
+
+testList.append(("testParallelThreshold", testParallelThreshold))
+
+def testConcurrentPythonThreads():
+
+    # array operations release the GIL, so python threads operating on
+    # different arrays run concurrently and produce the same results as
+    # when run one after another
+    n = 50000
+    m = M44f().translate(V3f(1,2,3)).scale(V3f(2,2,2))
+    inputs = []
+    for t in range(4):
+        a = V3fArray(n)
+        for i in range(0, n, 997):
+            a[i] = V3f(i+t, 2*i+1, 3*i+2)
+        inputs.append(a)
+
+    def transform(a):
+        b = m.multVecMatrix(a).normalized()
+        box = Box3f()
+        box.extendBy(b)
+        return (b, box, b.max())
+
+    expected = [transform(a) for a in inputs]
+
+    for threads in (0, 4):
+        setNumThreads(threads)
+        results = [None] * len(inputs)
+        def run(t):
+            for r in range(3):
+                results[t] = transform(inputs[t])
+        workers = [threading.Thread(target=run, args=(t,)) for t in range(len(inputs))]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        for t in range(len(inputs)):
+            assert (results[t][0] != expected[t][0]).reduce() == 0
+            assert results[t][1] == expected[t][1]
+            assert results[t][2] == expected[t][2]
+
+    setNumThreads(0)
+
+    print ("ok")
+
+testList.append(("testConcurrentPythonThreads", testConcurrentPythonThreads))
+
+def testBufferArguments():
+
+    # any object exposing a buffer with a matching element type and shape
+    # is accepted in place of an array, without copying
+    n = 8
+    data = array.array('f', [float(i) for i in range(3*n)])
+    points = memoryview(data).cast('B').cast('f', [n, 3])
+
+    m = M44f().translate(V3f(1,2,3))
+    result = m.multVecMatrix(points)
+    assert len(result) == n
+    for i in range(n):
+        assert result[i] == V3f(3*i+1, 3*i+3, 3*i+5)
+
+    box = Box3f()
+    box.extendBy(points)
+    assert box == Box3f(V3f(0,1,2), V3f(3*n-3, 3*n-2, 3*n-1))
+
+    normalized = V3fArray.normalized(points)
+    assert equalWithAbsError(normalized[1], V3f(3,4,5).normalized(), 1e-6)
+
+    # strided buffers
+    evenPoints = points[::2]
+    result = m.multVecMatrix(evenPoints)
+    assert len(result) == n//2
+    assert result[1] == V3f(7,9,11)
+
+    # scalar arrays and vectorized functions
+    values = memoryview(array.array('d', [0.0, 0.5, 1.0]))
+    assert equalWithAbsError(imath.sin(values)[1], math.sin(0.5), 1e-12)
+    assert equalWithAbsError(lerp(values, 1.0, 0.5)[2], 1.0, 1e-12)
+
+    # results written into a caller-supplied buffer
+    outData = array.array('f', [0.0] * (3*n))
+    out = memoryview(outData).cast('B').cast('f', [n, 3])
+    m.multVecMatrix(points, out)
+    assert list(outData[0:6]) == [1.0, 3.0, 5.0, 4.0, 6.0, 8.0]
+
+    outArray = V3fArray(n)
+    m.multDirMatrix(points, outArray)
+    assert outArray[2] == V3f(6,7,8)
+
+    # the output must be writable and match in length
+    readOnly = memoryview(outData.tobytes()).cast('f', [n, 3])
+    for dst in (readOnly, V3fArray(n-1)):
+        try:
+            m.multVecMatrix(points, dst)
+        except:
+            pass
+        else:
+            assert 0
+
+    # element type and shape must match
+    for mismatched in (memoryview(array.array('i', range(3*n))).cast('B').cast('i', [n, 3]),
+                       memoryview(data)):
+        try:
+            V3fArray.normalized(mismatched)
+        except TypeError:
+            pass
+        else:
+            assert 0
+
+    print ("ok")
+
+testList.append(("testBufferArguments", testBufferArguments))
+
+def testBufferView():
+
+    n = 6
+    data = array.array('f', [float(i) for i in range(3*n)])
+
+    # the view shares memory with the buffer in both directions
+    v = V3fArray.view(memoryview(data).cast('B').cast('f', [n, 3]))
+    assert len(v) == n
+    assert v.writable()
+    assert v[1] == V3f(3,4,5)
+    data[4] = 40.0
+    assert v[1] == V3f(3,40,5)
+    v[2] = V3f(-1,-2,-3)
+    assert list(data[6:9]) == [-1.0, -2.0, -3.0]
+
+    # the view keeps the buffer alive
+    scalars = FloatArray.view(array.array('f', [1.0, 2.0, 3.0]))
+    assert list(scalars) == [1.0, 2.0, 3.0]
+
+    # strides are honoured
+    every3rd = V3fArray.view(memoryview(data).cast('B').cast('f', [n, 3])[::3])
+    assert len(every3rd) == 2
+    assert every3rd[1] == V3f(9,10,11)
+    every3rd[0] = V3f(7,7,7)
+    assert list(data[0:3]) == [7.0, 7.0, 7.0]
+
+    # read-only buffers make read-only views
+    readOnly = DoubleArray.view(memoryview(array.array('d', [0.5, 1.5]).tobytes()).cast('d'))
+    assert not readOnly.writable()
+    assert readOnly[1] == 1.5
+    try:
+        readOnly[0] = 2.0
+    except:
+        pass
+    else:
+        assert 0
+
+    # views of other arrays
+    a = V3fArray(4)
+    a[3] = V3f(1,2,3)
+    b = V3fArray.view(a)
+    b[0] = V3f(4,5,6)
+    assert a[0] == V3f(4,5,6) and b[3] == V3f(1,2,3)
+
+    # buffers that can't be viewed in place are rejected
+    for buf in (memoryview(data),
+                memoryview(array.array('i', range(3*n))).cast('B').cast('i', [n, 3]),
+                memoryview(data).cast('B').cast('f', [n, 3])[::-1]):
+        try:
+            V3fArray.view(buf)
+        except ValueError:
+            pass
+        else:
+            assert 0
+
+    print ("ok")
+
+testList.append(("testBufferView", testBufferView))
+
+def testMappedFiles():
+
+    tmpdir = tempfile.mkdtemp()
+    path = os.path.join(tmpdir, "points.arr")
+
+    n = 10
+    a = V3fArray(n)
+    for i in range(n):
+        a[i] = V3f(i, 2*i, 3*i)
+    a.save(path)
+
+    # read-only by default
+    m = V3fArray.mmap(path)
+    assert len(m) == n
+    assert not m.writable()
+    assert (m != a).reduce() == 0
+    try:
+        m[0] = V3f(0)
+    except:
+        pass
+    else:
+        assert 0
+
+    # element ranges
+    r = V3fArray.mmap(path, 3, 4)
+    assert len(r) == 4
+    assert r[0] == V3f(3,6,9) and r[3] == V3f(6,12,18)
+    assert len(V3fArray.mmap(path, offset=n)) == 0
+    for offset, length in ((n+1, -1), (-1, -1), (2, n)):
+        try:
+            V3fArray.mmap(path, offset, length)
+        except IndexError:
+            pass
+        else:
+            assert 0
+
+    # writable arrays write through to the file
+    w = V3fArray.mmap(path, 5, writable=True)
+    assert w.writable()
+    w[0] = V3f(-1,-2,-3)
+    del w
+    assert V3fArray.mmap(path)[5] == V3f(-1,-2,-3)
+    assert m[5] == V3f(-1,-2,-3)
+
+    # saving replaces the file, and existing mappings keep the old contents
+    m.save(path)
+    assert (V3fArray.mmap(path) != m).reduce() == 0
+    big = V3fArray(100000)
+    big[50000] = V3f(1,2,3)
+    big.save(path)
+    old = V3fArray.mmap(path)
+    a.save(path)
+    assert old[50000] == V3f(1,2,3)
+    assert len(V3fArray.mmap(path)) == n
+    del big, old
+
+    # masked and strided arrays are saved contiguously
+    masked = a[a.x > 4]
+    path2 = os.path.join(tmpdir, "masked.arr")
+    masked.save(path2)
+    assert (V3fArray.mmap(path2) != a[5:]).reduce() == 0
+
+    # the header is checked on open
+    matrices = M44dArray(3)
+    matrices[1] = M44d().translate(V3d(1,2,3))
+    path3 = os.path.join(tmpdir, "matrices.arr")
+    matrices.save(path3)
+    assert M44dArray.mmap(path3)[1] == M44d().translate(V3d(1,2,3))
+    for arrayType, p in ((V3dArray, path), (M44fArray, path3), (IntArray, path3)):
+        try:
+            arrayType.mmap(p)
+        except ValueError:
+            pass
+        else:
+            assert 0
+
+    notArray = os.path.join(tmpdir, "text.arr")
+    with open(notArray, "w") as f:
+        f.write("not an array" * 10)
+    try:
+        FloatArray.mmap(notArray)
+    except ValueError:
+        pass
+    else:
+        assert 0
+
+    try:
+        FloatArray.mmap(os.path.join(tmpdir, "missing.arr"))
+    except RuntimeError:
+        pass
+    else:
+        assert 0
+
+    empty = IntArray(0)
+    path4 = os.path.join(tmpdir, "empty.arr")
+    empty.save(path4)
+    assert len(IntArray.mmap(path4)) == 0
+
+    del m, r
+    for f in os.listdir(tmpdir):
+        os.remove(os.path.join(tmpdir, f))
+    os.rmdir(tmpdir)
+
+    print ("ok")
+
+testList.append(("testMappedFiles", testMappedFiles))
+
+def testLazyArrays():
+
+    n = 1000
+    a = V3fArray(n)
+    b = V3fArray(n)
+    c = V3fArray(n)
+    w = FloatArray(n)
+    for i in range(n):
+        a[i] = V3f(i, 1, -i)
+        b[i] = V3f(0.5, i % 7, 2)
+        c[i] = V3f(1, 2, 3)
+        w[i] = i * 0.25
+
+    # the fused expression matches the eager one
+    expected = (a * 2.0 + b).normalized().dot(c)
+    e = (lazy(a) * 2.0 + b).normalized().dot(c)
+    assert isinstance(e, FloatLazyArray)
+    assert len(e) == n
+    result = e.eval()
+    assert isinstance(result, FloatArray)
+    for i in range(n):
+        assert equalWithAbsErrorScalar(result[i], expected[i], 1e-5)
+
+    # fixed arrays and constants on either side
+    r = (2.0 * lazy(a) - b / 4.0 + w * lazy(c) - V3f(1,1,1)).eval()
+    for i in range(n):
+        assert r[i].equalWithAbsError(2.0*a[i] - b[i]/4.0 + w[i]*c[i] - V3f(1,1,1), 1e-4)
+
+    r = (b - lazy(a)).cross(V3f(0,0,1)).eval()
+    for i in range(n):
+        assert r[i] == (b[i] - a[i]).cross(V3f(0,0,1))
+
+    l = (-lazy(a)).length2().eval()
+    assert l[3] == a[3].length2()
+    s = (lazy(w) * w + 1.0) / lazy(w + 1)
+    assert isinstance(s, FloatLazyArray)
+    assert equalWithAbsErrorScalar(s.eval()[5], (w[5]*w[5] + 1) / (w[5] + 1), 1e-5)
+
+    # masked arrays are read through their mask
+    m = a[a.x > 500]
+    r = (lazy(m) + V3f(0,1,0)).eval()
+    assert len(r) == len(m) and r[0] == m[0] + V3f(0,1,0)
+
+    # arrays are read when the expression is evaluated
+    d = DoubleArray(3)
+    e = lazy(d) + 1.0
+    d[1] = 5.0
+    assert e.eval()[1] == 6.0
+
+    try:
+        lazy(a) + V3fArray(n-1)
+    except ValueError:
+        pass
+    else:
+        assert 0
+
+    assert len((lazy(V3dArray(0)) * 2.0).eval()) == 0
+
+    print ("ok")
+
+testList.append(("testLazyArrays", testLazyArrays))
+
+def testOutputArguments():
+
+    n = 100
+    f = FloatArray(n)
+    g = FloatArray(n)
+    for i in range(n):
+        f[i] = i / float(n)
+        g[i] = 1.0 - f[i]
+
+    # the result is written into 'out', which is also returned
+    o = FloatArray(n)
+    r = imath.sin(f, out=o)
+    assert r is o
+    assert (o != imath.sin(f)).reduce() == 0
+
+    assert imath.lerp(f, g, 0.25, out=o) is o
+    assert (o != imath.lerp(f, g, 0.25)).reduce() == 0
+    imath.clamp(f, 0.2, 0.8, o)
+    assert (o != imath.clamp(f, 0.2, 0.8)).reduce() == 0
+
+    # in place
+    h = f[:]
+    imath.sin(h, out=h)
+    assert (h != imath.sin(f)).reduce() == 0
+
+    # generated methods
+    a = V3fArray(n)
+    b = V3fArray(n)
+    for i in range(n):
+        a[i] = V3f(i, 1, 2)
+        b[i] = V3f(0, i, 1)
+    o3 = V3fArray(n)
+    assert a.cross(b, out=o3) is o3
+    assert (o3 != a.cross(b)).reduce() == 0
+    assert a.normalized(out=o3) is o3
+    assert (o3 != a.normalized()).reduce() == 0
+    assert a.length(o) is o
+    assert (o != a.length()).reduce() == 0
+
+    # strided outputs
+    wide = V3fArray(2*n)
+    a.cross(b, out=V3fArray.view(memoryview(wide)[::2]))
+    assert wide[2] == a[1].cross(b[1])
+
+    # the output must be writable, unmasked, and of the right length and type
+    readOnly = FloatArray(n)
+    readOnly.makeReadOnly()
+    mask = IntArray(2*n)
+    for i in range(n):
+        mask[2*i] = 1
+    masked = FloatArray(2*n)[mask]
+    assert len(masked) == n
+    for bad in (FloatArray(n-1), readOnly, masked):
+        try:
+            imath.sin(f, out=bad)
+        except ValueError:
+            pass
+        else:
+            assert 0
+    try:
+        imath.sin(f, out=IntArray(n))
+    except TypeError:
+        pass
+    else:
+        assert 0
+
+    print ("ok")
+
+testList.append(("testOutputArguments", testOutputArguments))
+
+def testSimdKernels():
+
+    assert imath.simdInstructionSet() in ("avx", "sse2", "neon", "none")
+    assert imath.simdEnabled()
+
+    # the vectorized kernels give the same results as the generic loops,
+    # including for the leftover elements and for vectors short enough
+    # that Imath takes its careful path
+    n = 103
+    m = M44f().rotate(V3f(0.1, 0.2, 0.3)).translate(V3f(1, 2, 3))
+    m[0][3] = 0.01
+    for (Array, Vec, Mat) in ((V3fArray, V3f, M44f), (V3dArray, V3d, M44d)):
+        a = Array(n)
+        b = Array(n)
+        for i in range(n):
+            a[i] = Vec(i - 50, 0.5*i, 1.0/(i+1))
+            b[i] = Vec(1, -i, 0.25*i)
+        a[7] = Vec(0)
+        a[9] = Vec(1e-30, 0, 0) if Vec == V3f else Vec(1e-300, 0, 0)
+        mat = Mat(m)
+        v = Vec(1, 2, 3)
+
+        def results(x):
+            y = x[:]
+            y.normalize()
+            return (x.dot(b), x.dot(v), x.cross(b), x.cross(v), x.length(),
+                    x.length2(), x.normalized(), y, x * mat)
+
+        fast = results(a)
+        imath.setSimdEnabled(False)
+        try:
+            slow = results(a)
+        finally:
+            imath.setSimdEnabled(True)
+
+        for (f, s) in zip(fast, slow):
+            assert len(f) == n
+            assert (f != s).reduce() == 0
+
+        # masked arrays use the generic loop
+        mask = IntArray(n)
+        mask[3:60] = 1
+        am = a[:]
+        am = am[mask]
+        assert (am.length() != a.length()[mask]).reduce() == 0
+
+    print ("ok")
+
+testList.append(("testSimdKernels", testSimdKernels))
+
+def testSoAArrays():
+
+    n = 37
+    a = V3fArray(n)
+    b = V3fArray(n)
+    for i in range(n):
+        a[i] = V3f(i - 18, 0.5*i, 1.0/(i+1))
+        b[i] = V3f(1, -i, 0.25*i)
+    a[5] = V3f(0)
+    a[6] = V3f(1e-30, 0, 0)
+
+    s = V3fSoAArray(a)
+    t = V3fSoAArray(b)
+    assert len(s) == n
+    assert s[3] == a[3] and s[-1] == a[-1]
+    assert (s.toArray() != a).reduce() == 0
+
+    # the same results as the array of structures
+    v = V3f(1, 2, 3)
+    assert (s.dot(t) != a.dot(b)).reduce() == 0
+    assert (s.dot(v) != a.dot(v)).reduce() == 0
+    assert (s.cross(t).toArray() != a.cross(b)).reduce() == 0
+    assert (s.cross(v).toArray() != a.cross(v)).reduce() == 0
+    assert (s.length() != a.length()).reduce() == 0
+    assert (s.length2() != a.length2()).reduce() == 0
+    assert (s.normalized().toArray() != a.normalized()).reduce() == 0
+    m = M44f().rotate(V3f(0.1, 0.2, 0.3)).translate(V3f(1, 2, 3))
+    assert ((s * m).toArray() != a * m).reduce() == 0
+    assert s.bounds() == a.bounds()
+
+    u = V3fSoAArray(s.toArray())
+    u.normalize()
+    assert (u.toArray() != a.normalized()).reduce() == 0
+
+    # the component planes refer to the memory of the array
+    x = s.x
+    assert len(x) == n and x[3] == a[3].x
+    x[3] = 100
+    assert s[3].x == 100
+    s[4] = V3f(7, 8, 9)
+    assert s.y[4] == 8 and s.z[4] == 9
+    assert memoryview(s.z).tolist()[4] == 9
+
+    # construction from separate planes, and of zeros
+    w = V3fSoAArray(a.x, a.y, a.z)
+    assert (w.toArray() != a).reduce() == 0
+    z = V3dSoAArray(4)
+    assert z[2] == V3d(0)
+    assert V3dSoAArray(V3dArray(0)).bounds().isEmpty()
+
+    try:
+        s.dot(V3fSoAArray(n+1))
+    except ValueError:
+        pass
+    else:
+        assert 0
+    try:
+        s[n]
+    except IndexError:
+        pass
+    else:
+        assert 0
+
+    print ("ok")
+
+testList.append(("testSoAArrays", testSoAArrays))
+
+def testParallelArray2D():
+
+    # 2D arrays and matrices are split into rows across the thread pool,
+    # with the same results as when they are processed serially
+    w, h = 67, 45
+    x = FloatArray2D(rangeX(w, h))
+    y = FloatArray2D(rangeY(w, h))
+    c = Color4fArray2D(w, h)
+    m = FloatMatrix(h, w)
+    for j in range(h):
+        row = FloatArray(w)
+        for i in range(w):
+            c[(i,j)] = Color4f(i, j, i+j, 1)
+            row[i] = i*j
+        m[j] = row
+
+    def compute():
+        choice = rangeX(w, h) % 2
+        a = (x * 2 + y) / (y + 1)
+        a -= x
+        b = a.ifelse(choice, -1.0)
+        d = c * Color4f(1, 2, 3, 4) - c / 2
+        d += c
+        n = (m + 1) * m
+        n -= 2
+        return a, b, d, n
+
+    serial, parallel = runSerialAndParallel(compute)
+
+    for j in range(h):
+        for i in range(w):
+            for s, p in zip(serial[:3], parallel[:3]):
+                assert s.item(i,j) == p.item(i,j)
+        assert (serial[3][j] != parallel[3][j]).reduce() == 0
+
+    assert equalWithAbsError (parallel[0].item(3,4), (3*2+4)/5.0 - 3, 0.0001)
+    assert parallel[1].item(3,4) == parallel[0].item(3,4)
+    assert parallel[1].item(4,4) == -1.0
+    assert parallel[2].item(3,4) == Color4f(3+1.5, 8+2, 21+3.5, 4+0.5)
+    assert parallel[3][4][3] == (12+1)*12 - 2
+
+    print ("ok")
+
+testList.append(("testParallelArray2D", testParallelArray2D))
+
+
+def testSliceViews():
+
+    n = 10
+    a = FloatArray(n)
+    for i in range(n):
+        a[i] = i
+
+    # a[slice] copies the elements, sliceView refers to them
+    c = a[2:8:2]
+    v = a.sliceView(slice(2, 8, 2))
+    assert len(v) == 3
+    assert (v != c).reduce() == 0
+    v[1] = 100
+    assert a[4] == 100 and c[1] == 4
+    a[6] = 200
+    assert v[2] == 200
+
+    # views of views, and in-place operations through a view
+    w = v.sliceView(slice(1, None))
+    assert len(w) == 2 and w[0] == 100 and w[1] == 200
+    w *= 2
+    assert a[4] == 200 and a[6] == 400
+    assert len(a.sliceView(slice(20, 30))) == 0
+
+    # a view keeps the memory of the array alive
+    del a, c
+    assert w[1] == 400 and v[0] == 2
+
+    # vectorized operations on strided views
+    p = V3fArray(n)
+    for i in range(n):
+        p[i] = V3f(i, 2*i, 3)
+    q = p.sliceView(slice(1, None, 3))
+    assert len(q) == 3 and q[2] == V3f(7, 14, 3)
+    assert (q.length() != p[1::3].length()).reduce() == 0
+    q.normalize()
+    assert p[4] == V3f(4, 8, 3).normalized()
+    assert p[5] == V3f(5, 10, 3)
+
+    # views of masked arrays refer to the unmasked elements
+    b = IntArray(n)
+    mask = IntArray(n)
+    for i in range(n):
+        b[i] = i
+        mask[i] = i % 2
+    m = b[mask].sliceView(slice(1, 4))
+    assert len(m) == 3 and m[0] == 3
+    m[1] = -1
+    assert b[5] == -1
+
+    r = FloatArray(n)
+    r.makeReadOnly()
+    assert not r.sliceView(slice(0, 2)).writable()
+
+    try:
+        p.sliceView(slice(None, None, -1))
+    except ValueError:
+        pass
+    else:
+        assert 0
+
+    print ("ok")
+
+testList.append(("testSliceViews", testSliceViews))
+
+
+def testMaskEncodings():
+
+    # masked arrays store the indices of their elements in the most
+    # compact of several encodings, depending on the shape of the mask
+    n = 10000
+    cases = [(lambda i: 100 <= i < 5000, "range"),
+             (lambda i: (i // 100) % 2 == 0, "runs"),
+             (lambda i: i % 3 != 0, "bitmap"),
+             (lambda i: i % 37 == 0, "indices")]
+
+    for pred, encoding in cases:
+        a = FloatArray(n)
+        mask = IntArray(n)
+        for i in range(n):
+            a[i] = i
+            mask[i] = pred(i)
+        indices = [i for i in range(n) if pred(i)]
+
+        m = a[mask]
+        assert m.maskEncoding() == encoding
+        assert len(m) == len(indices)
+        assert all(m[k] == i for k, i in enumerate(indices))
+
+        # loops follow the encoded indices from wherever a task starts,
+        # which may be in the middle of a run or of a bitmap word
+        for threads in (1, 4):
+            b = runWithThreads(threads, lambda: m * 2 + m)
+            assert all(b[k] == 3*i for k, i in enumerate(indices))
+            assert runWithThreads(threads, m.max) == indices[-1]
+            assert runWithThreads(threads, m.argmin) == 0
+            total = runWithThreads(threads, m.sum)
+            assert equalWithAbsErrorScalar(total, sum(indices), 1e-4 * sum(indices))
+
+        runWithThreads(4, lambda: m.__iadd__(1))
+        m[-1] = -1
+        assert all(a[i] == i + 1 for i in indices[:-1]) and a[indices[-1]] == -1
+        u = next(i for i in range(n) if not pred(i))
+        assert a[u] == u
+
+        v = m.sliceView(slice(1, None, 2))
+        assert all(v[k] == a[i] for k, i in enumerate(indices[1::2]))
+
+    assert a.maskEncoding() == "none"
+    assert a[IntArray(n)].maskEncoding() == "range"
+    assert len(a[IntArray(n)]) == 0
+
+    print ("ok")
+
+testList.append(("testMaskEncodings", testMaskEncodings))
+
+def testReductions():
+
+    n = 20000
+    f = FloatArray(n)
+    i = IntArray(n)
+    v = V3fArray(n)
+    c = C4fArray(n)
+    for k in range(n):
+        f[k] = (k * 7919) % 1000 - 500
+        i[k] = (k * 104729) % 1000 - 500
+        v[k] = V3f(k % 10, -(k % 20), k % 30)
+        c[k] = Color4f(k % 4, k % 8, 1, 0.5)
+
+    def compute():
+        masked = f[i > 0]
+        return (f.sum(), f.mean(), f.min(), f.max(), f.argmin(), f.argmax(),
+                i.sum(), i.mean(), i.argmin(), i.argmax(), i.dot(i > 0), f.dot(FloatArray(2.0, n)),
+                masked.sum(), masked.min(), masked.argmax(),
+                v.sum(), v.mean(), v.min(), v.max(), v.bounds(),
+                c.sum(), c.mean(), c.min(), c.max())
+
+    serial = runWithThreads(1, compute)
+
+    fl = [f[k] for k in range(n)]
+    il = [i[k] for k in range(n)]
+    assert serial[0] == sum(fl)
+    assert equalWithAbsError (serial[1], sum(fl) / n, 1e-4)
+    assert serial[2] == min(fl) and serial[3] == max(fl)
+    assert serial[4] == fl.index(min(fl)) and serial[5] == fl.index(max(fl))
+    assert serial[6] == sum(il) and serial[7] == sum(il) / float(n)
+    assert serial[8] == il.index(min(il)) and serial[9] == il.index(max(il))
+    assert serial[10] == sum(x for x in il if x > 0)
+    assert serial[11] == 2 * sum(fl)
+    ml = [fl[k] for k in range(n) if il[k] > 0]
+    assert serial[12] == sum(ml) and serial[13] == min(ml)
+    assert serial[14] == ml.index(max(ml))
+    assert serial[17] == V3f(0, -19, 0) and serial[18] == V3f(9, 0, 29)
+    assert serial[19].min() == serial[17] and serial[19].max() == serial[18]
+    assert serial[20] == Color4f(1.5*n, 3.5*n, n, 0.5*n)
+    assert serial[21] == Color4f(1.5, 3.5, 1, 0.5)
+    assert serial[23] == Color4f(3, 7, 1, 0.5)
+
+    assert not IntArray(0, 10).any() and IntArray(1, 10).all()
+    assert FloatArray(0).all() and not FloatArray(0).any()
+    b = BoolArray(False, 10)
+    b[3] = True
+    assert b.any() and not b.all()
+    assert FloatArray(0).sum() == 0 and V3fArray(0).bounds().isEmpty()
+
+    for empty in (lambda: FloatArray(0).mean(), lambda: IntArray(0).argmin()):
+        try:
+            empty()
+        except:
+            pass
+        else:
+            assert False
+
+    # the parallel and deterministic reductions agree with the serial
+    # ones, exactly since the sums are small integers
+    assert runWithThreads(4, compute) == serial
+    assert not deterministicReductions()
+    setDeterministicReductions(True)
+    try:
+        deterministic = runWithThreads(4, compute)
+        assert deterministic == serial
+        assert runWithThreads(1, compute) == deterministic
+    finally:
+        setDeterministicReductions(False)
+
+    print ("ok")
+
+testList.append(("testReductions", testReductions))
+
+def testTakePut():
+
+    n = 5000
+    a = FloatArray(n)
+    v = V3fArray(n)
+    for k in range(n):
+        a[k] = k
+        v[k] = V3f(k, -k, 2*k)
+
+    # a permutation with repeats, and strictly increasing indices
+    perm = IntArray(2*n)
+    for k in range(2*n):
+        perm[k] = (k * 7919) % n
+    inc = IntArray(n // 3)
+    for k in range(n // 3):
+        inc[k] = 3*k + 1
+
+    def compute():
+        t = a.take(perm)
+        tv = v.take(perm)
+        s = FloatArray(0.0, n)
+        s.scatterAdd(perm, t)
+        p = FloatArray(-1.0, n)
+        p.put(perm, FloatArray(1.0, 2*n) * t)
+        c = IntArray(0, n)
+        c.scatterAdd(perm, 1)
+        return t, tv, s, p, c
+
+    serial, parallel = runSerialAndParallel(compute)
+
+    for s, p in zip(serial, parallel):
+        assert len(s) == len(p)
+        assert all(s[k] == p[k] for k in range(len(s)))
+
+    t, tv, s, p, c = parallel
+    assert all(t[k] == perm[k] and tv[k] == v[perm[k]] for k in range(2*n))
+    assert all(s[k] == 2*k and p[k] == k and c[k] == 2 for k in range(n))
+
+    # the copy doesn't refer to the array, increasing indices do
+    t[0] = -1
+    assert a[perm[0]] == perm[0]
+    view = a.take(inc)
+    assert view.maskEncoding() != "none" and len(view) == len(inc)
+    view[1] = -4
+    assert a[4] == -4
+    view += 1
+    assert a[1] == 2 and a[2] == 2
+    assert a.take(IntArray(-1, 1))[0] == n - 1
+
+    # taking from a masked reference
+    m = a[a < 100]
+    mt = m.take(inc[:10])
+    assert mt.maskEncoding() != "none" and mt[2] == m[7]
+    idx = IntArray(3)
+    idx[0], idx[1], idx[2] = 5, 2, 9
+    mt = m.take(idx)
+    assert mt.maskEncoding() == "none"
+    assert mt[0] == m[5] and mt[1] == m[2] and mt[2] == m[9]
+
+    v.put(inc, V3f(0))
+    assert v[4] == V3f(0) and v[3] == V3f(3, -3, 6)
+
+    for bad in (lambda: a.take(IntArray(n, 1)),
+                lambda: a.put(IntArray(-n-1, 1), 0.0),
+                lambda: a.put(perm, FloatArray(3))):
+        try:
+            bad()
+        except (IndexError, ValueError):
+            pass
+        else:
+            assert False
+
+    sizes = IntArray(4)
+    for k in range(4):
+        sizes[k] = k
+    va = VIntArray(sizes, 7)
+    vt = va.take(IntArray(3, 2))
+    assert len(vt) == 2 and len(vt[0]) == 3 and len(vt[1]) == 3
+    vb = VIntArray(4)
+    vb.put(IntArray(1, 2), vt)
+    assert len(vb[1]) == 3
+
+    print ("ok")
+
+testList.append(("testTakePut", testTakePut))
+
+def testSorting():
+
+    n = 10000
+    f = FloatArray(n)
+    i = IntArray(n)
+    v = V3fArray(n)
+    for k in range(n):
+        f[k] = ((k * 7919) % 1000) / 4.0
+        i[k] = (k * 104729) % 97 - 50
+        v[k] = V3f(k % 3, (k * 31) % 7, k % 5)
+    f[17] = float("nan")
+
+    def compute():
+        fs = f[:]
+        fs.sort()
+        vs = v[:]
+        vs.sort()
+        return (fs, f.argsort(), i.unique(), i.argsort(), vs, v.argsort(),
+                v.argsortMorton(), fs.searchsorted(f), fs.searchsorted(f, right=True))
+
+    serial, parallel = runSerialAndParallel(compute)
+
+    for s, p in zip(serial, parallel):
+        assert len(s) == len(p)
+        assert all(s[k] == p[k] or s[k] != s[k] for k in range(len(s)))
+
+    fs, fo, iu, io, vs, vo, vm, left, right = parallel
+    fl = sorted(f[k] for k in range(n) if k != 17)
+    assert all(fs[k] == fl[k] for k in range(n-1)) and fs[n-1] != fs[n-1]
+    assert fo[n-1] == 17
+    assert all(f[fo[k]] == fs[k] for k in range(n-1))
+    assert all(f[fo[k]] < f[fo[k+1]] or (f[fo[k]] == f[fo[k+1]] and fo[k] < fo[k+1])
+               for k in range(n-2))
+
+    il = sorted(set(i[k] for k in range(n)))
+    assert len(iu) == len(il) and all(iu[k] == il[k] for k in range(len(il)))
+    assert all(i[io[k]] < i[io[k+1]] or (i[io[k]] == i[io[k+1]] and io[k] < io[k+1])
+               for k in range(n-1))
+
+    vl = sorted((v[k] for k in range(n)), key=lambda x: (x.x, x.y, x.z))
+    assert all(vs[k] == vl[k] for k in range(n))
+    assert all(v[vo[k]] == vl[k] for k in range(n))
+    assert sorted(vm[k] for k in range(n)) == list(range(n))
+
+    for k in range(n):
+        if k != 17:
+            assert fs[left[k]] == f[k] and (left[k] == 0 or fs[left[k]-1] < f[k])
+            assert fs[right[k]-1] == f[k] and (right[k] == n or not fs[right[k]] <= f[k])
+    assert fs.searchsorted(-1.0) == 0 and fs.searchsorted(1000.0) == n - 1
+
+    # the Morton order visits the points of a grid one quadrant at a time
+    g = V2fArray(16)
+    for k in range(16):
+        g[k] = V2f(k % 4, k // 4)
+    gm = g.argsortMorton()
+    quadrants = [(int(g[gm[k]].x) // 2, int(g[gm[k]].y) // 2) for k in range(16)]
+    assert all(quadrants[4*q] == quadrants[4*q+r] for q in range(4) for r in range(4))
+
+    # sorting a masked reference sorts the selected elements in place
+    before = [i[k] for k in range(n)]
+    m = i[i > 0]
+    m.sort()
+    selected = [k for k in range(n) if before[k] > 0]
+    assert [i[k] for k in selected] == sorted(before[k] for k in selected)
+    assert all(i[k] == before[k] for k in range(n) if before[k] <= 0)
+
+    print ("ok")
+
+testList.append(("testSorting", testSorting))
+
+def testHalfArrays():
+
+    def toHalf(x):
+        return struct.unpack('e', struct.pack('e', x))[0]
+
+    n = 5000
+    f = FloatArray(n)
+    for k in range(n):
+        f[k] = (k - n // 2) * 0.37
+    f[0] = 65504.0
+    f[1] = -65504.0
+    f[2] = 1e-6
+    f[3] = 0.1
+    f[4] = 2049.0
+
+    def compute():
+        h = HalfArray(f)
+        return h, FloatArray(h)
+
+    h, g = compute()
+    assert len(h) == n and len(g) == n
+    assert all(h[k] == toHalf(f[k]) and g[k] == h[k] for k in range(n))
+    assert h[4] == 2048.0
+    assert halfConversionInstructionSet() in ("avx512f", "f16c", "neon", "none")
+
+    hp, gp = runWithThreads(4, compute)
+    assert all(hp[k] == h[k] and gp[k] == g[k] for k in range(n))
+
+    # elements are read and written as floats
+    h[0] = 1.5
+    h[1] = 3
+    assert h[0] == 1.5 and isinstance(h[0], float) and h[1] == 3.0
+    assert DoubleArray(h)[0] == 1.5
+    assert HalfArray(DoubleArray(0.5, 3))[2] == 0.5
+    assert HalfArray(0.25, 3)[2] == 0.25
+
+    m = memoryview(h)
+    assert m.format == 'e' and m.itemsize == 2 and m.shape == (n,)
+    assert m.tobytes()[:4] == struct.pack('2e', 1.5, 3.0)
+    view = HalfArray.view(h)
+    view[5] = -2.0
+    assert h[5] == -2.0
+
+    v = V3fArray(100)
+    for k in range(100):
+        v[k] = V3f(k, -k * 0.5, k * 0.1)
+    vh = V3hArray(v)
+    assert isinstance(vh[3], V3f)
+    assert all(vh[k] == V3f(toHalf(v[k].x), toHalf(v[k].y), toHalf(v[k].z)) for k in range(100))
+    vh[0] = V3f(1, 2, 3)
+    assert vh[0] == V3f(1, 2, 3) and V3fArray(vh)[0] == V3f(1, 2, 3)
+    assert memoryview(vh).shape == (100, 3)
+
+    c = C4hArray(C4fArray(10))
+    c[1] = Color4f(0.5, 0.25, 1, 2)
+    assert c[1] == Color4f(0.5, 0.25, 1, 2)
+    assert C4fArray(c)[1] == Color4f(0.5, 0.25, 1, 2)
+    assert memoryview(c).shape == (10, 4)
+
+    print ("ok")
+
+testList.append(("testHalfArrays", testHalfArrays))
+
+
 # -------------------------------------------------------------------------
 # Main loop
 